@@ -0,0 +1,50 @@
+"""
+Środowisko migracji Alembic.
+Adres bazy danych i metadane tabel pochodzą z aplikacji (app.models), więc migracje
+działają na tej samej bazie co API (zmienna środowiskowa DATABASE_URL).
+"""
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine
+
+from app.models.database import DATABASE_URL
+from app.models.models import Base
+
+config = context.config
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def run_migrations_offline():
+    """
+    Generuje skrypt SQL migracji bez połączenia z bazą (alembic upgrade head --sql).
+    """
+    context.configure(url=DATABASE_URL, target_metadata=target_metadata, literal_binds=True)
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online():
+    """
+    Wykonuje migracje na bazie danych.
+    """
+    engine = create_engine(DATABASE_URL)
+    with engine.connect() as connection:
+        # SQLite nie obsługuje ALTER TABLE dla większości zmian - tryb wsadowy przebudowuje tabelę
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            render_as_batch=connection.dialect.name == "sqlite"
+        )
+        with context.begin_transaction():
+            context.run_migrations()
+    engine.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,127 @@
+"""Schemat początkowy (tabele tworzone wcześniej przez scripts/init_db.py)
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 09:00:00
+
+Bazy utworzone przez create_all przed wprowadzeniem migracji należy oznaczyć tą wersją
+(alembic stamp 0001), a następnie zaktualizować: alembic upgrade head.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "analyses",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("cv_filename", sa.String(length=255), nullable=False),
+        sa.Column("job_description_filename", sa.String(length=255), nullable=False),
+        sa.Column("relevance_score", sa.Float(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id")
+    )
+    op.create_index("ix_analyses_id", "analyses", ["id"])
+
+    op.create_table(
+        "cv_data",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("analysis_id", sa.Integer(), nullable=False),
+        sa.Column("contact_info", sa.JSON(), nullable=True),
+        sa.Column("skills", sa.JSON(), nullable=True),
+        sa.Column("experience", sa.JSON(), nullable=True),
+        sa.Column("education", sa.JSON(), nullable=True),
+        sa.Column("full_text", sa.Text(), nullable=False),
+        sa.ForeignKeyConstraint(["analysis_id"], ["analyses.id"]),
+        sa.PrimaryKeyConstraint("id")
+    )
+    op.create_index("ix_cv_data_id", "cv_data", ["id"])
+
+    op.create_table(
+        "job_data",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("analysis_id", sa.Integer(), nullable=False),
+        sa.Column("job_title", sa.String(length=255), nullable=True),
+        sa.Column("company", sa.String(length=255), nullable=True),
+        sa.Column("required_skills", sa.JSON(), nullable=True),
+        sa.Column("responsibilities", sa.JSON(), nullable=True),
+        sa.Column("qualifications", sa.JSON(), nullable=True),
+        sa.Column("full_text", sa.Text(), nullable=False),
+        sa.ForeignKeyConstraint(["analysis_id"], ["analyses.id"]),
+        sa.PrimaryKeyConstraint("id")
+    )
+    op.create_index("ix_job_data_id", "job_data", ["id"])
+
+    op.create_table(
+        "skill_matches",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("analysis_id", sa.Integer(), nullable=False),
+        sa.Column("cv_skill", sa.String(length=255), nullable=False),
+        sa.Column("job_skill", sa.String(length=255), nullable=False),
+        sa.Column("similarity_score", sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(["analysis_id"], ["analyses.id"]),
+        sa.PrimaryKeyConstraint("id")
+    )
+    op.create_index("ix_skill_matches_id", "skill_matches", ["id"])
+
+    op.create_table(
+        "section_scores",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("analysis_id", sa.Integer(), nullable=False),
+        sa.Column("section_name", sa.String(length=50), nullable=False),
+        sa.Column("score", sa.Float(), nullable=False),
+        sa.Column("weight", sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(["analysis_id"], ["analyses.id"]),
+        sa.PrimaryKeyConstraint("id")
+    )
+    op.create_index("ix_section_scores_id", "section_scores", ["id"])
+
+    op.create_table(
+        "job_profiles",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("filename", sa.String(length=255), nullable=False),
+        sa.Column("job_title", sa.String(length=255), nullable=True),
+        sa.Column("company", sa.String(length=255), nullable=True),
+        sa.Column("required_skills", sa.JSON(), nullable=True),
+        sa.Column("responsibilities", sa.JSON(), nullable=True),
+        sa.Column("qualifications", sa.JSON(), nullable=True),
+        sa.Column("full_text", sa.Text(), nullable=False),
+        sa.Column("model_name", sa.String(length=255), nullable=False),
+        sa.Column("embeddings", sa.LargeBinary(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id")
+    )
+    op.create_index("ix_job_profiles_id", "job_profiles", ["id"])
+
+    op.create_table(
+        "analysis_jobs",
+        sa.Column("id", sa.String(length=36), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("analysis_id", sa.Integer(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["analysis_id"], ["analyses.id"]),
+        sa.PrimaryKeyConstraint("id")
+    )
+    op.create_index("ix_analysis_jobs_status", "analysis_jobs", ["status"])
+    op.create_index("ix_analysis_jobs_created_at", "analysis_jobs", ["created_at"])
+
+
+def downgrade():
+    op.drop_table("analysis_jobs")
+    op.drop_table("job_profiles")
+    op.drop_table("section_scores")
+    op.drop_table("skill_matches")
+    op.drop_table("job_data")
+    op.drop_table("cv_data")
+    op.drop_table("analyses")
@@ -0,0 +1,54 @@
+"""Indeksy historii analiz i kluczy obcych, wagi sekcji profili ogłoszeń
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 09:30:00
+
+Indeksy analysis_id tabel podrzędnych obsługują wczytywanie relacji (selectinload) i przeliczanie
+wyników (crud.rescore_analyses); indeksy złożone tabeli analyses - stronicowanie kluczem
+w GET /analyses. W PostgreSQL na dużych tabelach indeksy można utworzyć wcześniej ręcznie
+(CREATE INDEX CONCURRENTLY o tych samych nazwach) - migracja pomija istniejące indeksy.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_cv_data_analysis_id", "cv_data", ["analysis_id"]),
+    ("ix_job_data_analysis_id", "job_data", ["analysis_id"]),
+    ("ix_skill_matches_analysis_id", "skill_matches", ["analysis_id"]),
+    ("ix_section_scores_analysis_id", "section_scores", ["analysis_id"]),
+    ("ix_analyses_created_at_id", "analyses", ["created_at", "id"]),
+    ("ix_analyses_relevance_score_id", "analyses", ["relevance_score", "id"]),
+    ("ix_analyses_job_description_filename_created_at_id", "analyses", ["job_description_filename", "created_at", "id"]),
+]
+
+
+def upgrade():
+    # Baza utworzona przez create_all po zmianie modeli może już mieć kolumnę i część indeksów
+    offline = op.get_context().as_sql
+    inspector = None if offline else sa.inspect(op.get_bind())
+
+    if offline or "section_weights" not in {column["name"] for column in inspector.get_columns("job_profiles")}:
+        with op.batch_alter_table("job_profiles") as batch_op:
+            batch_op.add_column(sa.Column("section_weights", sa.JSON(), nullable=True))
+
+    existing = {}
+    for name, table, columns in INDEXES:
+        if not offline and table not in existing:
+            existing[table] = {index["name"] for index in inspector.get_indexes(table)}
+        if offline or name not in existing[table]:
+            op.create_index(name, table, columns)
+
+
+def downgrade():
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
+
+    with op.batch_alter_table("job_profiles") as batch_op:
+        batch_op.drop_column("section_weights")
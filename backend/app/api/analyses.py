@@ -0,0 +1,254 @@
+"""
+Endpointy historii zapisanych analiz: lista stronicowana kursorem, pojedyncza analiza
+oraz przeliczanie wyników zapisanych analiz dla nowych wag sekcji.
+"""
+from datetime import datetime
+from functools import partial
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import base64
+import json
+import os
+import time
+
+from fastapi import APIRouter, Depends, Form, HTTPException, Request
+from sqlalchemy.orm import Session
+
+from app.metrics import timed
+from app.models import crud
+from app.models.database import get_db
+from app.validation import parse_section_weights
+
+router = APIRouter(tags=["historia analiz"])
+
+# Maksymalna liczba analiz na stronie historii GET /analyses
+ANALYSES_MAX_PAGE_SIZE = int(os.getenv("ANALYSES_MAX_PAGE_SIZE", "100"))
+
+
+def encode_analyses_cursor(sort: str, analysis) -> str:
+    """
+    Koduje pozycję ostatniej analizy strony jako kursor kolejnej strony GET /analyses.
+
+    Args:
+        sort: Klucz sortowania
+        analysis: Ostatnia analiza strony
+
+    Returns:
+        str: Kursor (JSON w base64 bez dopełnienia)
+    """
+    value = getattr(analysis, sort)
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = json.dumps([sort, value, analysis.id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def decode_analyses_cursor(cursor: str, sort: str) -> Tuple:
+    """
+    Odczytuje kursor utworzony przez encode_analyses_cursor.
+
+    Args:
+        cursor: Kursor z poprzedniej strony
+        sort: Klucz sortowania bieżącego żądania
+
+    Returns:
+        Tuple: Para (wartość klucza sortowania, id) ostatniej analizy poprzedniej strony
+
+    Raises:
+        HTTPException: Jeśli kursor jest nieprawidłowy lub utworzono go dla innego sortowania
+    """
+    try:
+        cursor_sort, value, analysis_id = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if cursor_sort != sort:
+            raise ValueError(f"kursor dotyczy sortowania {cursor_sort}")
+        if sort == "created_at":
+            value = datetime.fromisoformat(value)
+        else:
+            value = float(value)
+        return value, int(analysis_id)
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=f"Nieprawidłowy kursor: {str(e)}")
+
+
+def load_analyses_page(db: Session, limit: int, **query) -> Tuple[List[Dict], Optional[str]]:
+    """
+    Wczytuje stronę historii analiz (crud.list_analyses) i zamienia ją na słowniki.
+    Pobierana jest jedna analiza więcej, aby ustalić, czy istnieje kolejna strona.
+    Funkcja blokująca - wywoływana w puli wątków, a nie w pętli zdarzeń.
+
+    Args:
+        db: Sesja bazy danych
+        limit: Liczba analiz na stronie
+        **query: Sortowanie, kursor i filtry crud.list_analyses
+
+    Returns:
+        Tuple[List[Dict], Optional[str]]: Analizy strony i kursor kolejnej strony (None dla ostatniej)
+    """
+    analyses = crud.list_analyses(db, limit=limit + 1, **query)
+    next_cursor = None
+    if len(analyses) > limit:
+        analyses = analyses[:limit]
+        next_cursor = encode_analyses_cursor(query["sort"], analyses[-1])
+    return [crud.analysis_summary_to_dict(analysis) for analysis in analyses], next_cursor
+
+
+def load_analysis(db: Session, analysis_id: int) -> Optional[Dict]:
+    """
+    Wczytuje zapisaną analizę wraz z danymi CV i ogłoszenia.
+    Funkcja blokująca - wywoływana w puli wątków, a nie w pętli zdarzeń.
+
+    Args:
+        db: Sesja bazy danych
+        analysis_id: Identyfikator analizy
+
+    Returns:
+        Optional[Dict]: Analiza lub None, jeśli nie istnieje
+    """
+    analysis = crud.get_analysis(db, analysis_id, include_documents=True)
+    if analysis is None:
+        return None
+    return crud.analysis_to_dict(analysis, include_documents=True)
+
+
+@router.get("/analyses")
+async def read_analyses(
+    request: Request,
+    sort: str = "created_at",
+    order: str = "desc",
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    job_description_filename: Optional[str] = None,
+    cv_filename: Optional[str] = None,
+    min_score: Optional[float] = None,
+    max_score: Optional[float] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    db: Session = Depends(get_db),
+):
+    """
+    Endpoint zwracający historię analiz stronicowaną kursorem.
+    Kolejną stronę zwraca żądanie z parametrem cursor równym next_cursor poprzedniej
+    (przy tym samym sortowaniu i filtrach); ostatnia strona ma next_cursor równe null.
+
+    Args:
+        request: Żądanie HTTP
+        sort: Klucz sortowania ("created_at" lub "relevance_score")
+        order: Kierunek sortowania ("desc" lub "asc")
+        limit: Liczba analiz na stronie (maksymalnie ANALYSES_MAX_PAGE_SIZE)
+        cursor: Kursor kolejnej strony (next_cursor z poprzedniej odpowiedzi)
+        job_description_filename: Tylko analizy względem tego pliku ogłoszenia
+        cv_filename: Tylko analizy tego pliku CV
+        min_score: Minimalny wynik relewantności
+        max_score: Maksymalny wynik relewantności
+        created_from: Najwcześniejsza data utworzenia (ISO 8601)
+        created_to: Najpóźniejsza data utworzenia (ISO 8601)
+        db: Sesja bazy danych
+
+    Returns:
+        dict: Analizy strony i kursor kolejnej strony
+
+    Raises:
+        HTTPException: Jeśli parametry sortowania, limitu lub kursora są nieprawidłowe
+    """
+    if sort not in crud.ANALYSIS_SORT_COLUMNS:
+        raise HTTPException(status_code=400, detail=f"Nieobsługiwane sortowanie: {sort}. Dozwolone: {', '.join(crud.ANALYSIS_SORT_COLUMNS)}")
+
+    if order not in ("desc", "asc"):
+        raise HTTPException(status_code=400, detail="Parametr order musi mieć wartość desc lub asc")
+
+    if not 1 <= limit <= ANALYSES_MAX_PAGE_SIZE:
+        raise HTTPException(status_code=400, detail=f"Parametr limit musi mieścić się w zakresie 1-{ANALYSES_MAX_PAGE_SIZE}")
+
+    after = decode_analyses_cursor(cursor, sort) if cursor else None
+
+    loop = asyncio.get_running_loop()
+    analyses, next_cursor = await loop.run_in_executor(request.app.state.executor, partial(
+        load_analyses_page,
+        db,
+        limit,
+        sort=sort,
+        descending=order == "desc",
+        after=after,
+        job_description_filename=job_description_filename,
+        cv_filename=cv_filename,
+        min_score=min_score,
+        max_score=max_score,
+        created_from=created_from,
+        created_to=created_to
+    ))
+
+    return {
+        "analyses": analyses,
+        "next_cursor": next_cursor
+    }
+
+
+@router.get("/analyses/{analysis_id}")
+async def read_analysis(analysis_id: int, request: Request, db: Session = Depends(get_db)):
+    """
+    Endpoint zwracający zapisaną analizę z ocenami sekcji, dopasowaniami umiejętności
+    oraz danymi CV i ogłoszenia.
+
+    Args:
+        analysis_id: Identyfikator analizy
+        request: Żądanie HTTP
+        db: Sesja bazy danych
+
+    Returns:
+        dict: Zapisana analiza
+
+    Raises:
+        HTTPException: Jeśli analiza nie istnieje
+    """
+    loop = asyncio.get_running_loop()
+    analysis = await loop.run_in_executor(request.app.state.executor, load_analysis, db, analysis_id)
+    if analysis is None:
+        raise HTTPException(status_code=404, detail=f"Nie znaleziono analizy: {analysis_id}")
+
+    return analysis
+
+
+@router.post("/analyses/rescore")
+async def rescore_analyses(
+    request: Request,
+    section_weights: str = Form(...),
+    job_description_filename: Optional[str] = Form(None),
+    db: Session = Depends(get_db),
+):
+    """
+    Endpoint przeliczający wyniki zapisanych analiz dla nowych wag sekcji.
+    Wyniki są obliczane w bazie danych z zapisanych ocen sekcji, bez ponownego
+    parsowania i kodowania dokumentów (crud.rescore_analyses).
+
+    Args:
+        request: Żądanie HTTP
+        section_weights: Nowe wagi sekcji w formacie JSON, np. {"skills": 0.6, "experience": 0.4}
+        job_description_filename: Przelicza tylko analizy względem tego ogłoszenia (opcjonalnie)
+        db: Sesja bazy danych
+
+    Returns:
+        dict: Liczba przeliczonych analiz i użyte wagi sekcji
+
+    Raises:
+        HTTPException: Jeśli wagi są nieprawidłowe lub wystąpił błąd bazy danych
+    """
+    weights = parse_section_weights(section_weights)
+    if weights is None:
+        raise HTTPException(status_code=400, detail="Należy podać wagi sekcji")
+
+    loop = asyncio.get_running_loop()
+    started = time.perf_counter()
+    try:
+        with timed("rescore"):
+            rescored = await loop.run_in_executor(
+                request.app.state.executor, crud.rescore_analyses, db, weights, job_description_filename
+            )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Nie udało się przeliczyć analiz: {str(e)}")
+
+    return {
+        "status": "success",
+        "rescored_analyses": rescored,
+        "section_weights": weights,
+        "took_ms": round((time.perf_counter() - started) * 1000, 2)
+    }
@@ -0,0 +1,340 @@
+"""
+Endpointy analizy CV względem przesłanego ogłoszenia: /analyze (także w kolejce zadań
+z run_async=true) i /analyze/batch, oraz wspólna obsługa przesłanych plików, z której
+korzystają endpointy analiz względem profili ogłoszeń.
+"""
+from typing import Dict, List, Optional
+import asyncio
+import os
+
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, UploadFile
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
+
+from app.metrics import in_request_context
+from app.models.database import get_db
+from app.persistence import persist_analyses
+from app.pipeline import UPLOAD_DIR, run_analysis_async, run_batch_analysis, store_upload
+from app.validation import parse_section_weights, require_ready, validate_batch_files, validate_file_extension, validate_pdf_engine
+
+router = APIRouter(tags=["analiza"])
+
+
+def build_ranking(result: Dict, cv_files: List[UploadFile], cv_filenames: List[str]) -> List[Dict]:
+    """
+    Buduje ranking CV według wyniku relewantności.
+
+    Args:
+        result: Wynik run_batch_analysis
+        cv_files: Przesłane pliki CV
+        cv_filenames: Nazwy zapisanych plików CV
+
+    Returns:
+        List[Dict]: Wyniki analiz posortowane malejąco według relewantności
+    """
+    ranking = []
+    for index, analysis in result["analyses"].items():
+        ranking.append({
+            "cv_filename": cv_files[index].filename,
+            "file": cv_filenames[index],
+            **analysis
+        })
+    ranking.sort(key=lambda item: item["relevance_score"], reverse=True)
+    for rank, item in enumerate(ranking, start=1):
+        item["rank"] = rank
+
+    return ranking
+
+
+async def analyze_uploads(request: Request, db: Session, cv_file: UploadFile, job_description_file: Optional[UploadFile] = None, job_profile: Optional[Dict] = None, pdf_engine: Optional[str] = None, section_weights: Optional[Dict[str, float]] = None) -> Dict:
+    """
+    Zapisuje przesłane pliki, wykonuje analizę CV w puli wątków i zapisuje jej wynik.
+
+    Args:
+        request: Żądanie HTTP (stan aplikacji w request.app.state)
+        db: Sesja bazy danych
+        cv_file: Plik CV
+        job_description_file: Plik z ogłoszeniem (gdy nie podano profilu)
+        job_profile: Wczytany profil ogłoszenia (dane i embeddingi)
+        pdf_engine: Silnik ekstrakcji PDF (domyślnie PDF_ENGINE)
+        section_weights: Wagi sekcji z żądania (domyślnie wagi profilu lub analizatora)
+
+    Returns:
+        dict: Wyniki analizy CV
+
+    Raises:
+        HTTPException: Jeśli wystąpił błąd podczas przetwarzania
+    """
+    state = request.app.state
+    loop = asyncio.get_running_loop()
+    executor = state.executor
+
+    try:
+        # Ograniczenie liczby analiz w toku, aby nie przepełnić kolejki puli wątków
+        async with state.analysis_slots:
+            # Zapisanie plików na dysku (nazwa pliku = skrót treści)
+            cv_filename = await loop.run_in_executor(executor, in_request_context(store_upload), cv_file)
+            cv_path = os.path.join(UPLOAD_DIR, cv_filename)
+            job_desc_filename = None
+            job_desc_path = None
+            if job_description_file:
+                job_desc_filename = await loop.run_in_executor(executor, in_request_context(store_upload), job_description_file)
+                job_desc_path = os.path.join(UPLOAD_DIR, job_desc_filename)
+
+            # Ekstrakcja treści i analiza NLP poza pętlą zdarzeń, kodowanie w harmonogramie
+            result = await run_analysis_async(
+                state.analyzer, state.parse_cache, executor, state.scheduler, cv_path, job_desc_path, job_profile, pdf_engine, section_weights
+            )
+
+            # Zapis wyniku w bazie danych i w indeksie CV
+            record = {
+                "cv_filename": cv_filename,
+                "job_description_filename": job_desc_filename or job_profile["filename"],
+                **result
+            }
+            analysis_ids = await persist_analyses(state.analyzer, state.cv_index, executor, db, [record])
+
+        return {
+            "status": "success",
+            "message": "Analiza zakończona pomyślnie",
+            "analysis_id": analysis_ids[0],
+            "files": {
+                "cv": cv_filename,
+                "job_description": job_desc_filename
+            },
+            "analysis": result["analysis"],
+            "cv_data": result["cv_data"],
+            "job_data": result["job_data"]
+        }
+
+    except Exception as e:
+        # Pliki nie są usuwane - przechowywane według treści mogą należeć także do innych analiz
+        raise HTTPException(status_code=500, detail=f"Wystąpił błąd podczas przetwarzania plików: {str(e)}")
+    finally:
+        # Zamknięcie plików
+        cv_file.file.close()
+        if job_description_file:
+            job_description_file.file.close()
+
+
+async def analyze_batch_uploads(request: Request, db: Session, cv_files: List[UploadFile], job_description_file: Optional[UploadFile] = None, job_profile: Optional[Dict] = None, pdf_engine: Optional[str] = None, section_weights: Optional[Dict[str, float]] = None) -> Dict:
+    """
+    Zapisuje przesłane pliki, wykonuje analizę wielu CV w puli wątków i zapisuje wyniki.
+
+    Args:
+        request: Żądanie HTTP (stan aplikacji w request.app.state)
+        db: Sesja bazy danych
+        cv_files: Pliki CV
+        job_description_file: Plik z ogłoszeniem (gdy nie podano profilu)
+        job_profile: Wczytany profil ogłoszenia (dane i embeddingi)
+        pdf_engine: Silnik ekstrakcji PDF (domyślnie PDF_ENGINE)
+        section_weights: Wagi sekcji z żądania (domyślnie wagi profilu lub analizatora)
+
+    Returns:
+        dict: Ranking CV z wynikami analizy
+
+    Raises:
+        HTTPException: Jeśli wystąpił błąd podczas przetwarzania
+    """
+    state = request.app.state
+    loop = asyncio.get_running_loop()
+    executor = state.executor
+
+    try:
+        async with state.analysis_slots:
+            # Zapisanie plików na dysku (nazwa pliku = skrót treści)
+            cv_filenames = []
+            for cv_file in cv_files:
+                cv_filenames.append(await loop.run_in_executor(executor, in_request_context(store_upload), cv_file))
+            cv_paths = [os.path.join(UPLOAD_DIR, filename) for filename in cv_filenames]
+            job_desc_filename = None
+            job_desc_path = None
+            if job_description_file:
+                job_desc_filename = await loop.run_in_executor(executor, in_request_context(store_upload), job_description_file)
+                job_desc_path = os.path.join(UPLOAD_DIR, job_desc_filename)
+
+            # Parsowanie i analiza poza pętlą zdarzeń
+            result = await loop.run_in_executor(
+                executor, in_request_context(run_batch_analysis), state.analyzer, state.parse_cache, cv_paths, job_desc_path, job_profile, pdf_engine, section_weights
+            )
+
+            # Zapis wszystkich wyników w jednej transakcji i w indeksie CV
+            records = [
+                {
+                    "cv_filename": cv_filenames[index],
+                    "job_description_filename": job_desc_filename or job_profile["filename"],
+                    "cv_data": result["cv_data"][index],
+                    "job_data": result["job_data"],
+                    "analysis": analysis
+                }
+                for index, analysis in result["analyses"].items()
+            ]
+            analysis_ids = await persist_analyses(state.analyzer, state.cv_index, executor, db, records)
+            for index, analysis_id in zip(result["analyses"].keys(), analysis_ids):
+                result["analyses"][index]["analysis_id"] = analysis_id
+
+        ranking = build_ranking(result, cv_files, cv_filenames)
+
+        return {
+            "status": "success",
+            "message": f"Przeanalizowano {len(ranking)} z {len(cv_files)} plików CV",
+            "files": {
+                "cv": cv_filenames,
+                "job_description": job_desc_filename
+            },
+            "job_data": result["job_data"],
+            "ranking": ranking,
+            "errors": [
+                {"cv_filename": cv_files[index].filename, "detail": detail}
+                for index, detail in result["errors"].items()
+            ]
+        }
+
+    except Exception as e:
+        # Pliki nie są usuwane - przechowywane według treści mogą należeć także do innych analiz
+        raise HTTPException(status_code=500, detail=f"Wystąpił błąd podczas przetwarzania plików: {str(e)}")
+    finally:
+        # Zamknięcie plików
+        for cv_file in cv_files:
+            cv_file.file.close()
+        if job_description_file:
+            job_description_file.file.close()
+
+
+async def submit_analysis_job(request: Request, cv_file: UploadFile, job_description_file: UploadFile, pdf_engine: Optional[str] = None, section_weights: Optional[Dict[str, float]] = None) -> JSONResponse:
+    """
+    Zapisuje przesłane pliki i dodaje analizę do kolejki zadań bez oczekiwania na wynik.
+
+    Args:
+        request: Żądanie HTTP (stan aplikacji w request.app.state)
+        cv_file: Plik CV
+        job_description_file: Plik z ogłoszeniem
+        pdf_engine: Silnik ekstrakcji PDF (domyślnie PDF_ENGINE)
+        section_weights: Wagi sekcji z żądania (domyślnie wagi analizatora)
+
+    Returns:
+        JSONResponse: Odpowiedź 202 z identyfikatorem zadania
+
+    Raises:
+        HTTPException: Jeśli nie udało się zapisać plików lub zadania
+    """
+    state = request.app.state
+    loop = asyncio.get_running_loop()
+    executor = state.executor
+
+    try:
+        # Zapis plików w kontekście żądania - czas trafia do etapu "save" i nagłówka Server-Timing
+        cv_filename = await loop.run_in_executor(executor, in_request_context(store_upload), cv_file)
+        job_desc_filename = await loop.run_in_executor(executor, in_request_context(store_upload), job_description_file)
+        job_id = await loop.run_in_executor(executor, state.job_queue.submit, {
+            "cv_filename": cv_filename,
+            "job_description_filename": job_desc_filename,
+            "pdf_engine": pdf_engine,
+            "section_weights": section_weights
+        })
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Nie udało się dodać zadania analizy: {str(e)}")
+    finally:
+        cv_file.file.close()
+        job_description_file.file.close()
+
+    if state.job_workers is not None:
+        state.job_workers.notify()
+
+    return JSONResponse(status_code=202, content={
+        "status": "queued",
+        "job_id": job_id,
+        "status_url": f"/jobs/{job_id}",
+        "files": {
+            "cv": cv_filename,
+            "job_description": job_desc_filename
+        }
+    })
+
+
+@router.post("/analyze")
+async def analyze_cv(
+    request: Request,
+    cv_file: UploadFile = File(...),
+    job_description_file: UploadFile = File(...),
+    pdf_engine: Optional[str] = Form(None),
+    run_async: bool = Form(False),
+    section_weights: Optional[str] = Form(None),
+    db: Session = Depends(get_db),
+):
+    """
+    Endpoint do analizy CV pod kątem zgodności z treścią ogłoszenia o pracę.
+    Z run_async=true analiza trafia do kolejki zadań, a odpowiedź 202 zawiera identyfikator
+    zadania, którego stan i wynik zwraca GET /jobs/{job_id}.
+
+    Args:
+        request: Żądanie HTTP
+        cv_file: Plik CV w formacie PDF, DOCX lub TXT
+        job_description_file: Plik z ogłoszeniem o pracę w formacie PDF, DOCX lub TXT
+        pdf_engine: Silnik ekstrakcji PDF ("auto", "fast" lub "pdfplumber")
+        run_async: Czy wykonać analizę asynchronicznie
+        section_weights: Wagi sekcji w formacie JSON, np. {"skills": 0.6, "experience": 0.4} (opcjonalnie)
+        db: Sesja bazy danych
+
+    Returns:
+        dict: Wyniki analizy CV lub identyfikator zadania
+
+    Raises:
+        HTTPException: Jeśli pliki mają nieprawidłowe rozszerzenia lub wystąpił błąd podczas przetwarzania
+    """
+    # Walidacja rozszerzeń plików
+    if not validate_file_extension(cv_file.filename):
+        raise HTTPException(status_code=400, detail="Nieprawidłowy format pliku CV. Dozwolone formaty: PDF, DOCX, TXT")
+
+    if not validate_file_extension(job_description_file.filename):
+        raise HTTPException(status_code=400, detail="Nieprawidłowy format pliku ogłoszenia. Dozwolone formaty: PDF, DOCX, TXT")
+
+    validate_pdf_engine(pdf_engine)
+    weights = parse_section_weights(section_weights)
+
+    if run_async:
+        return await submit_analysis_job(request, cv_file, job_description_file, pdf_engine, weights)
+
+    require_ready(request.app.state)
+
+    return await analyze_uploads(request, db, cv_file, job_description_file=job_description_file, pdf_engine=pdf_engine, section_weights=weights)
+
+
+@router.post("/analyze/batch")
+async def analyze_cv_batch(
+    request: Request,
+    cv_files: List[UploadFile] = File(...),
+    job_description_file: UploadFile = File(...),
+    pdf_engine: Optional[str] = Form(None),
+    section_weights: Optional[str] = Form(None),
+    db: Session = Depends(get_db),
+):
+    """
+    Endpoint do analizy wielu CV względem jednego ogłoszenia o pracę.
+    Zwraca ranking CV według wyniku relewantności.
+
+    Args:
+        request: Żądanie HTTP
+        cv_files: Pliki CV w formacie PDF, DOCX lub TXT
+        job_description_file: Plik z ogłoszeniem o pracę w formacie PDF, DOCX lub TXT
+        pdf_engine: Silnik ekstrakcji PDF ("auto", "fast" lub "pdfplumber")
+        section_weights: Wagi sekcji w formacie JSON (opcjonalnie)
+        db: Sesja bazy danych
+
+    Returns:
+        dict: Ranking CV z wynikami analizy
+
+    Raises:
+        HTTPException: Jeśli pliki mają nieprawidłowe rozszerzenia, jest ich zbyt wiele lub wystąpił błąd podczas przetwarzania
+    """
+    # Walidacja liczby i rozszerzeń plików
+    validate_batch_files(cv_files)
+
+    if not validate_file_extension(job_description_file.filename):
+        raise HTTPException(status_code=400, detail="Nieprawidłowy format pliku ogłoszenia. Dozwolone formaty: PDF, DOCX, TXT")
+
+    validate_pdf_engine(pdf_engine)
+    weights = parse_section_weights(section_weights)
+    require_ready(request.app.state)
+
+    return await analyze_batch_uploads(request, db, cv_files, job_description_file=job_description_file, pdf_engine=pdf_engine, section_weights=weights)
@@ -0,0 +1,277 @@
+"""
+Endpointy profili ogłoszeń: ogłoszenie jest parsowane i kodowane raz, a zapisany profil
+(dane, embeddingi sekcji i wagi sekcji) jest używany w kolejnych analizach CV.
+"""
+from collections import OrderedDict
+from typing import Dict, List, Optional
+import asyncio
+import os
+import threading
+
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, UploadFile
+from sqlalchemy.orm import Session
+
+from app.models import crud
+from app.models.database import get_db
+from app.nlp.parse_cache import ParseCache
+from app.nlp.scoring import RelevanceAnalyzer
+from app.pipeline import UPLOAD_DIR, parse_job_description, store_upload
+from app.api.analyze import analyze_batch_uploads, analyze_uploads
+from app.validation import parse_section_weights, require_ready, validate_batch_files, validate_file_extension, validate_pdf_engine
+
+router = APIRouter(tags=["profile ogłoszeń"])
+
+# Liczba profili ogłoszeń przechowywanych w pamięci procesu
+JOB_PROFILE_CACHE_SIZE = int(os.getenv("JOB_PROFILE_CACHE_SIZE", "128"))
+_job_profiles = OrderedDict()
+_job_profiles_lock = threading.Lock()
+
+
+def remember_job_profile(profile_id: int, job_profile: Dict):
+    """
+    Zapamiętuje wczytany profil ogłoszenia w ograniczonym cache procesu.
+
+    Args:
+        profile_id: Identyfikator profilu
+        job_profile: Dane i embeddingi ogłoszenia
+    """
+    with _job_profiles_lock:
+        _job_profiles[profile_id] = job_profile
+        _job_profiles.move_to_end(profile_id)
+        while len(_job_profiles) > JOB_PROFILE_CACHE_SIZE:
+            _job_profiles.popitem(last=False)
+
+
+def create_job_profile(analyzer: RelevanceAnalyzer, parse_cache: ParseCache, db: Session, job_desc_path: str, filename: str, pdf_engine: Optional[str] = None, section_weights: Optional[Dict[str, float]] = None) -> Dict:
+    """
+    Parsuje ogłoszenie, koduje jego sekcje i zapisuje je jako profil.
+    Funkcja blokująca - wywoływana w puli wątków, a nie w pętli zdarzeń.
+
+    Args:
+        analyzer: Analizator relewantności
+        parse_cache: Pamięć podręczna wyników parsowania
+        db: Sesja bazy danych
+        job_desc_path: Ścieżka do pliku ogłoszenia
+        filename: Oryginalna nazwa pliku ogłoszenia
+        pdf_engine: Silnik ekstrakcji PDF (domyślnie PDF_ENGINE)
+        section_weights: Wagi sekcji analiz względem profilu (None - domyślne)
+
+    Returns:
+        Dict: Identyfikator profilu i dane ogłoszenia
+    """
+    job_data, _ = parse_job_description(parse_cache, job_desc_path, pdf_engine)
+    embeddings = analyzer.encode_job(job_data)
+    profile = crud.create_job_profile(db, filename, job_data, embeddings, analyzer.model_name, section_weights)
+
+    remember_job_profile(profile.id, {"filename": filename, "job_data": job_data, "embeddings": embeddings, "section_weights": section_weights})
+
+    return {"id": profile.id, "job_data": job_data}
+
+
+def load_job_profile(analyzer: RelevanceAnalyzer, db: Session, profile_id: int) -> Optional[Dict]:
+    """
+    Wczytuje profil ogłoszenia z cache procesu lub z bazy danych.
+    Embeddingi obliczone innym modelem są kodowane ponownie.
+    Funkcja blokująca - wywoływana w puli wątków, a nie w pętli zdarzeń.
+
+    Args:
+        analyzer: Analizator relewantności
+        db: Sesja bazy danych
+        profile_id: Identyfikator profilu
+
+    Returns:
+        Optional[Dict]: Dane, embeddingi i wagi sekcji ogłoszenia lub None, jeśli profil nie istnieje
+    """
+    with _job_profiles_lock:
+        job_profile = _job_profiles.get(profile_id)
+        if job_profile is not None:
+            _job_profiles.move_to_end(profile_id)
+            return job_profile
+
+    profile = crud.get_job_profile(db, profile_id)
+    if profile is None:
+        return None
+
+    job_data = crud.job_profile_to_job_data(profile)
+    if profile.model_name == analyzer.model_name:
+        embeddings = crud.deserialize_embeddings(profile.embeddings)
+    else:
+        embeddings = analyzer.encode_job(job_data)
+
+    job_profile = {"filename": profile.filename, "job_data": job_data, "embeddings": embeddings, "section_weights": profile.section_weights}
+    remember_job_profile(profile_id, job_profile)
+
+    return job_profile
+
+
+async def get_job_profile_or_404(request: Request, profile_id: int, db: Session) -> Dict:
+    """
+    Wczytuje profil ogłoszenia w puli wątków.
+
+    Args:
+        request: Żądanie HTTP (stan aplikacji w request.app.state)
+        profile_id: Identyfikator profilu
+        db: Sesja bazy danych
+
+    Returns:
+        Dict: Dane i embeddingi ogłoszenia
+
+    Raises:
+        HTTPException: Jeśli profil nie istnieje lub model nie jest jeszcze gotowy
+    """
+    state = request.app.state
+    require_ready(state)
+
+    loop = asyncio.get_running_loop()
+    job_profile = await loop.run_in_executor(
+        state.executor, load_job_profile, state.analyzer, db, profile_id
+    )
+    if job_profile is None:
+        raise HTTPException(status_code=404, detail=f"Nie znaleziono profilu ogłoszenia: {profile_id}")
+
+    return job_profile
+
+
+@router.post("/job-profiles")
+async def upload_job_profile(
+    request: Request,
+    job_description_file: UploadFile = File(...),
+    pdf_engine: Optional[str] = Form(None),
+    section_weights: Optional[str] = Form(None),
+    db: Session = Depends(get_db),
+):
+    """
+    Endpoint do jednorazowego przetworzenia ogłoszenia o pracę.
+    Wynik parsowania i embeddingi sekcji są zapisywane jako profil do ponownego użycia.
+    Wagi sekcji profilu są domyślnymi wagami analiz względem tego ogłoszenia.
+
+    Args:
+        request: Żądanie HTTP
+        job_description_file: Plik z ogłoszeniem o pracę w formacie PDF, DOCX lub TXT
+        pdf_engine: Silnik ekstrakcji PDF ("auto", "fast" lub "pdfplumber")
+        section_weights: Wagi sekcji w formacie JSON (opcjonalnie, domyślnie wagi analizatora)
+        db: Sesja bazy danych
+
+    Returns:
+        dict: Identyfikator profilu i dane ogłoszenia
+
+    Raises:
+        HTTPException: Jeśli plik ma nieprawidłowe rozszerzenie lub wystąpił błąd podczas przetwarzania
+    """
+    if not validate_file_extension(job_description_file.filename):
+        raise HTTPException(status_code=400, detail="Nieprawidłowy format pliku ogłoszenia. Dozwolone formaty: PDF, DOCX, TXT")
+
+    validate_pdf_engine(pdf_engine)
+    weights = parse_section_weights(section_weights)
+    state = request.app.state
+    require_ready(state)
+
+    loop = asyncio.get_running_loop()
+    executor = state.executor
+
+    try:
+        async with state.analysis_slots:
+            job_desc_filename = await loop.run_in_executor(executor, store_upload, job_description_file)
+            job_desc_path = os.path.join(UPLOAD_DIR, job_desc_filename)
+            profile = await loop.run_in_executor(
+                executor, create_job_profile, state.analyzer, state.parse_cache, db, job_desc_path, job_description_file.filename, pdf_engine, weights
+            )
+
+        return {
+            "status": "success",
+            "message": "Profil ogłoszenia został zapisany",
+            "job_profile_id": profile["id"],
+            "job_data": profile["job_data"],
+            "section_weights": weights or state.analyzer.section_weights
+        }
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Wystąpił błąd podczas przetwarzania pliku: {str(e)}")
+    finally:
+        job_description_file.file.close()
+
+
+@router.get("/job-profiles/{profile_id}")
+async def read_job_profile(profile_id: int, request: Request, db: Session = Depends(get_db)):
+    """
+    Endpoint zwracający dane zapisanego profilu ogłoszenia.
+
+    Args:
+        profile_id: Identyfikator profilu
+        request: Żądanie HTTP
+        db: Sesja bazy danych
+
+    Returns:
+        dict: Dane ogłoszenia i wagi sekcji jego analiz
+    """
+    job_profile = await get_job_profile_or_404(request, profile_id, db)
+    return {
+        "job_profile_id": profile_id,
+        "job_data": job_profile["job_data"],
+        "section_weights": job_profile.get("section_weights") or request.app.state.analyzer.section_weights
+    }
+
+
+@router.post("/job-profiles/{profile_id}/analyze")
+async def analyze_cv_with_profile(
+    profile_id: int,
+    request: Request,
+    cv_file: UploadFile = File(...),
+    pdf_engine: Optional[str] = Form(None),
+    section_weights: Optional[str] = Form(None),
+    db: Session = Depends(get_db),
+):
+    """
+    Endpoint do analizy CV względem zapisanego profilu ogłoszenia.
+    Kodowana jest wyłącznie strona CV.
+
+    Args:
+        profile_id: Identyfikator profilu ogłoszenia
+        request: Żądanie HTTP
+        cv_file: Plik CV w formacie PDF, DOCX lub TXT
+        pdf_engine: Silnik ekstrakcji PDF ("auto", "fast" lub "pdfplumber")
+        section_weights: Wagi sekcji w formacie JSON (opcjonalnie, domyślnie wagi profilu)
+        db: Sesja bazy danych
+
+    Returns:
+        dict: Wyniki analizy CV
+    """
+    if not validate_file_extension(cv_file.filename):
+        raise HTTPException(status_code=400, detail="Nieprawidłowy format pliku CV. Dozwolone formaty: PDF, DOCX, TXT")
+
+    validate_pdf_engine(pdf_engine)
+    weights = parse_section_weights(section_weights)
+
+    job_profile = await get_job_profile_or_404(request, profile_id, db)
+    return await analyze_uploads(request, db, cv_file, job_profile=job_profile, pdf_engine=pdf_engine, section_weights=weights)
+
+
+@router.post("/job-profiles/{profile_id}/analyze/batch")
+async def analyze_cv_batch_with_profile(
+    profile_id: int,
+    request: Request,
+    cv_files: List[UploadFile] = File(...),
+    pdf_engine: Optional[str] = Form(None),
+    section_weights: Optional[str] = Form(None),
+    db: Session = Depends(get_db),
+):
+    """
+    Endpoint do analizy wielu CV względem zapisanego profilu ogłoszenia.
+
+    Args:
+        profile_id: Identyfikator profilu ogłoszenia
+        request: Żądanie HTTP
+        cv_files: Pliki CV w formacie PDF, DOCX lub TXT
+        pdf_engine: Silnik ekstrakcji PDF ("auto", "fast" lub "pdfplumber")
+        section_weights: Wagi sekcji w formacie JSON (opcjonalnie, domyślnie wagi profilu)
+        db: Sesja bazy danych
+
+    Returns:
+        dict: Ranking CV z wynikami analizy
+    """
+    validate_batch_files(cv_files)
+    validate_pdf_engine(pdf_engine)
+    weights = parse_section_weights(section_weights)
+
+    job_profile = await get_job_profile_or_404(request, profile_id, db)
+    return await analyze_batch_uploads(request, db, cv_files, job_profile=job_profile, pdf_engine=pdf_engine, section_weights=weights)
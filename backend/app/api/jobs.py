@@ -0,0 +1,75 @@
+"""
+Endpoint stanu zadań analizy asynchronicznej (POST /analyze z run_async=true).
+"""
+from typing import Dict, Optional
+import asyncio
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy.orm import Session
+
+from app.jobs.queue import JobQueue
+from app.models import crud
+from app.models.database import get_db
+
+router = APIRouter(tags=["zadania"])
+
+
+def load_job_result(job_queue: JobQueue, db: Session, job_id: str) -> Optional[Dict]:
+    """
+    Wczytuje stan zadania i - dla zadania zakończonego - zapisaną analizę.
+    Funkcja blokująca - wywoływana w puli wątków, a nie w pętli zdarzeń.
+
+    Args:
+        job_queue: Kolejka zadań
+        db: Sesja bazy danych
+        job_id: Identyfikator zadania
+
+    Returns:
+        Optional[Dict]: Stan zadania z wynikiem lub None, jeśli zadanie nie istnieje
+    """
+    job = job_queue.get(job_id)
+    if job is None:
+        return None
+
+    response = {
+        "job_id": job["id"],
+        "status": job["status"],
+        "attempts": job["attempts"],
+        "created_at": job["created_at"],
+        "started_at": job["started_at"],
+        "finished_at": job["finished_at"],
+        "error": job["error"],
+        "analysis_id": job["analysis_id"],
+        "analysis": None
+    }
+    if job["analysis_id"] is not None:
+        analysis = crud.get_analysis(db, job["analysis_id"])
+        if analysis is not None:
+            response["analysis"] = crud.analysis_to_dict(analysis)
+
+    return response
+
+
+@router.get("/jobs/{job_id}")
+async def read_job(job_id: str, request: Request, db: Session = Depends(get_db)):
+    """
+    Endpoint zwracający stan zadania analizy (queued, running, done, failed) i jej wynik.
+
+    Args:
+        job_id: Identyfikator zadania
+        request: Żądanie HTTP
+        db: Sesja bazy danych
+
+    Returns:
+        dict: Stan zadania i zapisana analiza (po zakończeniu)
+
+    Raises:
+        HTTPException: Jeśli zadanie nie istnieje
+    """
+    state = request.app.state
+    loop = asyncio.get_running_loop()
+    job = await loop.run_in_executor(state.executor, load_job_result, state.job_queue, db, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Nie znaleziono zadania: {job_id}")
+
+    return job
@@ -0,0 +1,134 @@
+"""
+Endpoint wyszukiwania zapisanych CV najlepiej pasujących do ogłoszenia w indeksie
+wektorowym CV (app.nlp.vector_index).
+"""
+from typing import Dict, List, Optional
+import asyncio
+import os
+import time
+
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, UploadFile
+from sqlalchemy.orm import Session
+
+from app.models import crud
+from app.models.database import get_db
+from app.nlp.scoring import RelevanceAnalyzer
+from app.nlp.vector_index import content_key_prefix
+from app.persistence import CV_INDEX_TYPE
+from app.pipeline import UPLOAD_DIR, parse_job_description, store_upload
+from app.api.job_profiles import get_job_profile_or_404
+from app.validation import parse_section_weights, require_ready, validate_file_extension, validate_pdf_engine
+
+router = APIRouter(tags=["wyszukiwanie CV"])
+
+
+def search_cv_index(analyzer: RelevanceAnalyzer, cv_index, db: Session, job_data: Dict, k: int, section_weights: Optional[Dict[str, float]] = None) -> List[Dict]:
+    """
+    Wyszukuje w indeksie wektorowym CV najlepiej pasujące do ogłoszenia.
+    Każde CV (plik o danym skrócie treści) występuje w wynikach raz, z jego najnowszą analizą.
+    Funkcja blokująca - wywoływana w puli wątków, a nie w pętli zdarzeń.
+
+    Args:
+        analyzer: Analizator relewantności
+        cv_index: Indeks wektorowy CV
+        db: Sesja bazy danych
+        job_data: Dane ogłoszenia o pracę
+        k: Liczba wyników
+        section_weights: Wagi sekcji wyszukiwania (domyślnie wagi analizatora)
+
+    Returns:
+        List[Dict]: CV (CVData.id, analiza, nazwa pliku) z wynikami, posortowane malejąco
+    """
+    query = analyzer.index_vectors([job_data], "job", section_weights)[0]
+    hits = cv_index.search(query, k)
+    analyses = crud.latest_cv_analyses(db, [content_key_prefix(key) for key, _ in hits])
+
+    results = []
+    for key, score in hits:
+        analysis = analyses.get(content_key_prefix(key))
+        # CV bez zapisanej analizy (np. indeks starszy niż baza danych) jest pomijane
+        if analysis is None:
+            continue
+        analysis_id, cv_id, cv_filename = analysis
+        results.append({"cv_id": cv_id, "analysis_id": analysis_id, "cv_filename": cv_filename, "score": round(score, 4)})
+    return results
+
+
+@router.post("/cvs/search")
+async def search_cvs(
+    request: Request,
+    job_description_file: Optional[UploadFile] = File(None),
+    job_profile_id: Optional[int] = Form(None),
+    k: int = Form(10),
+    pdf_engine: Optional[str] = Form(None),
+    section_weights: Optional[str] = Form(None),
+    db: Session = Depends(get_db),
+):
+    """
+    Endpoint wyszukujący zapisane CV najlepiej pasujące do ogłoszenia (top-k).
+    Ogłoszenie można przesłać jako plik lub wskazać zapisany profil.
+    Wynik to ważona suma podobieństw sekcji z tymi samymi wagami co w /analyze (z żądania,
+    profilu lub domyślne), ale przybliżona: sekcje są porównywane średnimi embeddingami,
+    a pełny tekst embeddingiem zamiast TF-IDF. Dokładny wynik daje analiza wybranych CV.
+
+    Args:
+        request: Żądanie HTTP
+        job_description_file: Plik z ogłoszeniem o pracę w formacie PDF, DOCX lub TXT
+        job_profile_id: Identyfikator profilu ogłoszenia
+        k: Liczba wyników
+        pdf_engine: Silnik ekstrakcji PDF ("auto", "fast" lub "pdfplumber")
+        section_weights: Wagi sekcji w formacie JSON (opcjonalnie)
+        db: Sesja bazy danych
+
+    Returns:
+        dict: Lista identyfikatorów CV z wynikami
+
+    Raises:
+        HTTPException: Jeśli nie podano ogłoszenia lub wystąpił błąd podczas przetwarzania
+    """
+    if job_description_file is None and job_profile_id is None:
+        raise HTTPException(status_code=400, detail="Należy przesłać plik ogłoszenia lub podać job_profile_id")
+
+    if k < 1:
+        raise HTTPException(status_code=400, detail="Parametr k musi być dodatni")
+
+    validate_pdf_engine(pdf_engine)
+    weights = parse_section_weights(section_weights)
+    state = request.app.state
+    require_ready(state)
+    if state.cv_index is None:
+        raise HTTPException(status_code=503, detail="Indeks CV jest niedostępny - przebuduj go skryptem scripts/build_cv_index.py")
+
+    loop = asyncio.get_running_loop()
+    executor = state.executor
+
+    if job_profile_id is not None:
+        job_profile = await get_job_profile_or_404(request, job_profile_id, db)
+        job_data = job_profile["job_data"]
+        weights = weights or job_profile.get("section_weights")
+    else:
+        if not validate_file_extension(job_description_file.filename):
+            raise HTTPException(status_code=400, detail="Nieprawidłowy format pliku ogłoszenia. Dozwolone formaty: PDF, DOCX, TXT")
+
+        try:
+            job_desc_filename = await loop.run_in_executor(executor, store_upload, job_description_file)
+            job_data, _ = await loop.run_in_executor(
+                executor, parse_job_description, state.parse_cache, os.path.join(UPLOAD_DIR, job_desc_filename), pdf_engine
+            )
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Wystąpił błąd podczas przetwarzania pliku: {str(e)}")
+        finally:
+            job_description_file.file.close()
+
+    started = time.perf_counter()
+    results = await loop.run_in_executor(
+        executor, search_cv_index, state.analyzer, state.cv_index, db, job_data, k, weights
+    )
+
+    return {
+        "status": "success",
+        "index_type": CV_INDEX_TYPE,
+        "indexed_cvs": len(state.cv_index),
+        "took_ms": round((time.perf_counter() - started) * 1000, 2),
+        "results": results
+    }
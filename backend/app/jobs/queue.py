@@ -0,0 +1,409 @@
+"""
+Moduł kolejki zadań asynchronicznych analiz.
+Zadanie przechodzi przez stany queued -> running -> done / failed. Dostępne implementacje:
+- InMemoryJobQueue - w pamięci procesu (testy, pojedynczy proces),
+- SQLiteJobQueue - plik SQLite współdzielony przez procesy na jednym hoście,
+- DatabaseJobQueue - tabela analysis_jobs w bazie aplikacji (trwała, wspólna dla instancji).
+Zadanie pobrane przez worker, który przestał działać, wraca do kolejki po upływie czasu dzierżawy.
+"""
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import Callable, Dict, Optional, Tuple
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+from sqlalchemy import and_, or_
+
+from app.models.models import AnalysisJob
+
+# Stany zadania
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+
+
+def _timestamp(value) -> Optional[str]:
+    """
+    Zamienia czas (sekundy epoki lub datetime) na tekst ISO 8601.
+    """
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return datetime.fromtimestamp(value).isoformat()
+
+
+def _job_dict(job_id: str, status: str, payload: Dict, attempts: int, analysis_id: Optional[int], error: Optional[str], created_at, started_at, finished_at) -> Dict:
+    """
+    Buduje opis zadania zwracany przez JobQueue.get.
+    """
+    return {
+        "id": job_id,
+        "status": status,
+        "payload": payload,
+        "attempts": attempts,
+        "analysis_id": analysis_id,
+        "error": error,
+        "created_at": _timestamp(created_at),
+        "started_at": _timestamp(started_at),
+        "finished_at": _timestamp(finished_at)
+    }
+
+
+class JobQueue:
+    """
+    Interfejs kolejki zadań. Metody są blokujące - w aplikacji wywoływane w puli wątków.
+    """
+
+    def submit(self, payload: Dict) -> str:
+        """
+        Dodaje zadanie do kolejki.
+
+        Args:
+            payload: Parametry zadania (serializowalne do JSON)
+
+        Returns:
+            str: Identyfikator zadania
+        """
+        raise NotImplementedError
+
+    def claim(self) -> Optional[Tuple[str, Dict]]:
+        """
+        Pobiera najstarsze oczekujące zadanie i oznacza je jako wykonywane.
+
+        Returns:
+            Optional[Tuple[str, Dict]]: Identyfikator i parametry zadania lub None, gdy kolejka jest pusta
+        """
+        raise NotImplementedError
+
+    def complete(self, job_id: str, analysis_id: Optional[int]):
+        """
+        Oznacza zadanie jako zakończone.
+
+        Args:
+            job_id: Identyfikator zadania
+            analysis_id: Identyfikator zapisanej analizy
+        """
+        raise NotImplementedError
+
+    def fail(self, job_id: str, error: str):
+        """
+        Oznacza zadanie jako zakończone błędem.
+
+        Args:
+            job_id: Identyfikator zadania
+            error: Opis błędu
+        """
+        raise NotImplementedError
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """
+        Zwraca stan zadania.
+
+        Args:
+            job_id: Identyfikator zadania
+
+        Returns:
+            Optional[Dict]: Opis zadania lub None, jeśli nie istnieje
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """
+        Zwalnia zasoby kolejki.
+        """
+
+
+class InMemoryJobQueue(JobQueue):
+    """
+    Kolejka w pamięci procesu. Zadania nie przetrwają ponownego uruchomienia i nie są
+    widoczne dla innych procesów - przeznaczona do testów i pracy z jednym workerem serwera.
+    """
+
+    def __init__(self, max_finished: int = 10000):
+        """
+        Inicjalizacja kolejki.
+
+        Args:
+            max_finished: Maksymalna liczba przechowywanych zadań zakończonych (najstarsze są usuwane)
+        """
+        self.max_finished = max_finished
+        self._jobs = {}
+        self._pending = deque()
+        self._finished = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, payload: Dict) -> str:
+        job_id = str(uuid.uuid4())
+        with self._lock:
+            self._jobs[job_id] = _job_dict(job_id, JOB_QUEUED, payload, 0, None, None, time.time(), None, None)
+            self._pending.append(job_id)
+        return job_id
+
+    def claim(self) -> Optional[Tuple[str, Dict]]:
+        with self._lock:
+            if not self._pending:
+                return None
+            job = self._jobs[self._pending.popleft()]
+            job["status"] = JOB_RUNNING
+            job["attempts"] += 1
+            job["started_at"] = _timestamp(time.time())
+            return job["id"], job["payload"]
+
+    def complete(self, job_id: str, analysis_id: Optional[int]):
+        self._finish(job_id, JOB_DONE, analysis_id=analysis_id)
+
+    def fail(self, job_id: str, error: str):
+        self._finish(job_id, JOB_FAILED, error=error)
+
+    def _finish(self, job_id: str, status: str, analysis_id: Optional[int] = None, error: Optional[str] = None):
+        """
+        Zapisuje stan końcowy zadania i usuwa najstarsze zakończone zadania ponad limit.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            job.update(status=status, analysis_id=analysis_id, error=error, finished_at=_timestamp(time.time()))
+            self._finished[job_id] = None
+            while len(self._finished) > self.max_finished:
+                expired_id, _ = self._finished.popitem(last=False)
+                self._jobs.pop(expired_id, None)
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job is not None else None
+
+
+class SQLiteJobQueue(JobQueue):
+    """
+    Kolejka w pliku SQLite. Pobieranie zadań odbywa się w transakcji z blokadą zapisu,
+    więc z jednego pliku mogą korzystać workery wielu procesów na tym samym hoście.
+    """
+
+    def __init__(self, db_path: str, lease_seconds: float = 600.0, max_attempts: int = 3):
+        """
+        Inicjalizacja kolejki.
+
+        Args:
+            db_path: Ścieżka do pliku SQLite
+            lease_seconds: Czas, po którym wykonywane zadanie wraca do kolejki (worker przestał działać)
+            max_attempts: Maksymalna liczba pobrań zadania
+        """
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        # Transakcje są otwierane jawnie (BEGIN IMMEDIATE) przy pobieraniu zadań
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs "
+            "(id TEXT PRIMARY KEY, status TEXT NOT NULL, payload TEXT NOT NULL, attempts INTEGER NOT NULL, "
+            "analysis_id INTEGER, error TEXT, created_at REAL NOT NULL, started_at REAL, finished_at REAL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ix_jobs_status_created_at ON jobs (status, created_at)")
+
+    def submit(self, payload: Dict) -> str:
+        job_id = str(uuid.uuid4())
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (id, status, payload, attempts, created_at) VALUES (?, ?, ?, 0, ?)",
+                (job_id, JOB_QUEUED, json.dumps(payload), time.time())
+            )
+        return job_id
+
+    def claim(self) -> Optional[Tuple[str, Dict]]:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                while True:
+                    now = time.time()
+                    row = self._conn.execute(
+                        "SELECT id, status, payload, attempts FROM jobs "
+                        "WHERE status = ? OR (status = ? AND started_at < ?) ORDER BY created_at LIMIT 1",
+                        (JOB_QUEUED, JOB_RUNNING, now - self.lease_seconds)
+                    ).fetchone()
+                    if row is None:
+                        self._conn.execute("COMMIT")
+                        return None
+
+                    job_id, status, payload, attempts = row
+                    if status == JOB_RUNNING and attempts >= self.max_attempts:
+                        self._conn.execute(
+                            "UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE id = ?",
+                            (JOB_FAILED, "Przekroczono limit prób wykonania zadania", now, job_id)
+                        )
+                        continue
+
+                    self._conn.execute(
+                        "UPDATE jobs SET status = ?, attempts = attempts + 1, started_at = ? WHERE id = ?",
+                        (JOB_RUNNING, now, job_id)
+                    )
+                    self._conn.execute("COMMIT")
+                    return job_id, json.loads(payload)
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def complete(self, job_id: str, analysis_id: Optional[int]):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, analysis_id = ?, finished_at = ? WHERE id = ?",
+                (JOB_DONE, analysis_id, time.time(), job_id)
+            )
+
+    def fail(self, job_id: str, error: str):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE id = ?",
+                (JOB_FAILED, error, time.time(), job_id)
+            )
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id, status, payload, attempts, analysis_id, error, created_at, started_at, finished_at "
+                "FROM jobs WHERE id = ?",
+                (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return _job_dict(row[0], row[1], json.loads(row[2]), *row[3:])
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class DatabaseJobQueue(JobQueue):
+    """
+    Kolejka w tabeli analysis_jobs bazy danych aplikacji - trwała i wspólna dla wszystkich
+    instancji. W PostgreSQL zadania są pobierane z blokadą FOR UPDATE SKIP LOCKED, więc
+    równoległe workery nie pobierają tego samego zadania.
+    """
+
+    def __init__(self, session_factory: Callable, lease_seconds: float = 600.0, max_attempts: int = 3):
+        """
+        Inicjalizacja kolejki.
+
+        Args:
+            session_factory: Fabryka sesji SQLAlchemy (SessionLocal)
+            lease_seconds: Czas, po którym wykonywane zadanie wraca do kolejki (worker przestał działać)
+            max_attempts: Maksymalna liczba pobrań zadania
+        """
+        self.session_factory = session_factory
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+
+    def submit(self, payload: Dict) -> str:
+        job_id = str(uuid.uuid4())
+        db = self.session_factory()
+        try:
+            db.add(AnalysisJob(id=job_id, status=JOB_QUEUED, payload=payload, attempts=0))
+            db.commit()
+        finally:
+            db.close()
+        return job_id
+
+    def claim(self) -> Optional[Tuple[str, Dict]]:
+        db = self.session_factory()
+        try:
+            while True:
+                now = datetime.now()
+                expired = datetime.fromtimestamp(now.timestamp() - self.lease_seconds)
+                job = (
+                    db.query(AnalysisJob)
+                    .filter(or_(
+                        AnalysisJob.status == JOB_QUEUED,
+                        and_(AnalysisJob.status == JOB_RUNNING, AnalysisJob.started_at < expired)
+                    ))
+                    .order_by(AnalysisJob.created_at)
+                    .with_for_update(skip_locked=True)
+                    .first()
+                )
+                if job is None:
+                    db.rollback()
+                    return None
+
+                if job.status == JOB_RUNNING and job.attempts >= self.max_attempts:
+                    job.status = JOB_FAILED
+                    job.error = "Przekroczono limit prób wykonania zadania"
+                    job.finished_at = now
+                    db.commit()
+                    continue
+
+                claimed = (job.id, job.payload)
+                job.status = JOB_RUNNING
+                job.attempts += 1
+                job.started_at = now
+                db.commit()
+                return claimed
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def complete(self, job_id: str, analysis_id: Optional[int]):
+        self._update(job_id, status=JOB_DONE, analysis_id=analysis_id, finished_at=datetime.now())
+
+    def fail(self, job_id: str, error: str):
+        self._update(job_id, status=JOB_FAILED, error=error, finished_at=datetime.now())
+
+    def _update(self, job_id: str, **values):
+        """
+        Aktualizuje kolumny zadania w osobnej transakcji.
+        """
+        db = self.session_factory()
+        try:
+            db.query(AnalysisJob).filter(AnalysisJob.id == job_id).update(values)
+            db.commit()
+        finally:
+            db.close()
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        db = self.session_factory()
+        try:
+            job = db.get(AnalysisJob, job_id)
+            if job is None:
+                return None
+            return _job_dict(
+                job.id, job.status, job.payload, job.attempts, job.analysis_id, job.error,
+                job.created_at, job.started_at, job.finished_at
+            )
+        finally:
+            db.close()
+
+
+def create_job_queue(kind: str, path: Optional[str] = None, session_factory: Optional[Callable] = None, lease_seconds: float = 600.0, max_attempts: int = 3) -> JobQueue:
+    """
+    Tworzy kolejkę zadań wybranego typu.
+
+    Args:
+        kind: Typ kolejki: "memory", "sqlite" lub "database"
+        path: Ścieżka do pliku SQLite (kolejka "sqlite")
+        session_factory: Fabryka sesji SQLAlchemy (kolejka "database")
+        lease_seconds: Czas, po którym wykonywane zadanie wraca do kolejki
+        max_attempts: Maksymalna liczba pobrań zadania
+
+    Returns:
+        JobQueue: Kolejka zadań
+
+    Raises:
+        ValueError: Jeśli typ kolejki nie jest obsługiwany
+    """
+    if kind == "memory":
+        return InMemoryJobQueue()
+    if kind == "sqlite":
+        return SQLiteJobQueue(path, lease_seconds=lease_seconds, max_attempts=max_attempts)
+    if kind == "database":
+        return DatabaseJobQueue(session_factory, lease_seconds=lease_seconds, max_attempts=max_attempts)
+    raise ValueError(f"Nieobsługiwany typ kolejki zadań: {kind}")
@@ -0,0 +1,117 @@
+"""
+Moduł puli workerów zadań asynchronicznych.
+Workery pobierają zadania z kolejki (app.jobs.queue) i wykonują je w dedykowanych wątkach,
+osobnych od puli obsługującej żądania synchroniczne, więc długie analizy nie blokują API.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+import asyncio
+import logging
+
+from app.jobs.queue import JobQueue
+
+logger = logging.getLogger(__name__)
+
+
+class JobWorkerPool:
+    """
+    Pula workerów działająca w pętli zdarzeń asyncio. Bezczynne workery odpytują kolejkę
+    co poll_interval sekund; zadanie dodane w tym samym procesie budzi je od razu (notify).
+    """
+
+    def __init__(self, queue: JobQueue, handler: Callable[[Dict], Optional[int]], workers: int = 1, poll_interval: float = 0.5):
+        """
+        Inicjalizacja puli.
+
+        Args:
+            queue: Kolejka zadań
+            handler: Funkcja blokująca wykonująca zadanie; zwraca identyfikator zapisanej analizy
+            workers: Liczba równolegle wykonywanych zadań
+            poll_interval: Odstęp między sprawdzeniami pustej kolejki w sekundach
+        """
+        self.queue = queue
+        self.handler = handler
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="jobs")
+        self._wakeup = None
+        self._tasks = []
+
+    async def start(self):
+        """
+        Uruchamia workery w bieżącej pętli zdarzeń.
+        """
+        self._wakeup = asyncio.Event()
+        self._tasks = [asyncio.create_task(self._run()) for _ in range(self.workers)]
+
+    async def stop(self):
+        """
+        Zatrzymuje workery. Przerwane zadania wrócą do kolejki po upływie czasu dzierżawy.
+        """
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def notify(self):
+        """
+        Budzi bezczynne workery po dodaniu zadania (wywoływane z wątku pętli zdarzeń).
+        """
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _wait(self):
+        """
+        Czeka na nowe zadanie lub upływ czasu odpytywania.
+        """
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
+    async def _run(self):
+        """
+        Pętla workera: pobranie zadania, wykonanie i zapis stanu końcowego.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                claimed = await loop.run_in_executor(self._executor, self.queue.claim)
+            except Exception as e:
+                logger.warning("Nie udało się pobrać zadania z kolejki: %s", e)
+                await self._wait()
+                continue
+
+            if claimed is None:
+                await self._wait()
+                continue
+
+            job_id, payload = claimed
+            try:
+                analysis_id = await loop.run_in_executor(self._executor, self.handler, payload)
+            except Exception as e:
+                logger.warning("Zadanie %s zakończone błędem: %s", job_id, e)
+                await self._finish(self.queue.fail, job_id, str(e))
+            else:
+                await self._finish(self.queue.complete, job_id, analysis_id)
+
+    async def _finish(self, mark: Callable, job_id: str, value):
+        """
+        Zapisuje stan końcowy zadania; błąd zapisu nie zatrzymuje workera
+        (zadanie wróci do kolejki po upływie czasu dzierżawy).
+
+        Args:
+            mark: Metoda kolejki complete lub fail
+            job_id: Identyfikator zadania
+            value: Identyfikator analizy lub opis błędu
+        """
+        try:
+            await asyncio.get_running_loop().run_in_executor(self._executor, mark, job_id, value)
+        except Exception as e:
+            logger.warning("Nie udało się zapisać stanu zadania %s: %s", job_id, e)
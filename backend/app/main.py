@@ -1,20 +1,338 @@
 """
 Główny moduł aplikacji FastAPI do analizy CV.
-Zawiera konfigurację aplikacji oraz główne endpointy API.
+Zawiera konfigurację aplikacji, ładowanie modelu i cykl życia instancji oraz endpointy
+stanu (zdrowie, gotowość, metryki). Endpointy analiz są zdefiniowane w modułach app.api.
 """
-from fastapi import FastAPI, UploadFile, File, HTTPException, Form
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from typing import List, Optional
+from fastapi.responses import JSONResponse, Response
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, Tuple
+import asyncio
+import logging
 import os
-import shutil
-import uuid
+import time
 from datetime import datetime
 
+from app.jobs.queue import create_job_queue
+from app.jobs.worker import JobWorkerPool
+from app.metrics import (
+    PROMETHEUS_CONTENT_TYPE, REGISTRY, REQUEST_SECONDS, CallbackMetric,
+    finish_request, start_request
+)
+from app.models.database import SessionLocal, async_engine
+from app.nlp.parse_cache import ParseCache
+from app.nlp.batching import InferenceScheduler
+from app.nlp.embedding_cache import EmbeddingCache
+from app.nlp.hashing_encoder import HashingSentenceEncoder
+from app.nlp.onnx_encoder import OnnxSentenceEncoder
+from app.nlp.scoring import SCORED_SECTIONS, RelevanceAnalyzer
+from app.nlp.skill_table import load_skill_table
+from app.nlp.tfidf_model import load_tfidf_model
+from app.nlp.vector_index import IndexMismatchError, create_index
+from app.persistence import CV_INDEX_PATH, CV_INDEX_TYPE, run_analysis_job
+from app.api import analyses, analyze, job_profiles, jobs, search
+from app.validation import READY_RETRY_AFTER
+
+logger = logging.getLogger(__name__)
+
+# Nazwa modelu SentenceTransformer używanego do analizy
+MODEL_NAME = os.getenv("MODEL_NAME", "distiluse-base-multilingual-cased-v1")
+
+# Backend kodowania: "torch" (SentenceTransformer), "onnx" (eksport scripts/export_onnx.py
+# uruchamiany przez ONNX Runtime, domyślnie w wariancie int8) lub "hashing" (koder zastępczy
+# bez modelu - benchmarki i uruchomienia offline)
+ENCODER_BACKEND = os.getenv("ENCODER_BACKEND", "torch")
+ONNX_MODEL_PATH = os.getenv(
+    "ONNX_MODEL_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "onnx")
+)
+ONNX_VARIANT = os.getenv("ONNX_VARIANT") or None
+ONNX_THREADS = int(os.getenv("ONNX_THREADS", "0"))
+
+# Liczba wątków obliczeń PyTorch w workerze gunicorn ze współdzielonymi wagami (0 - liczba rdzeni);
+# gunicorn.conf.py ustawia domyślnie rdzenie podzielone przez liczbę workerów
+TORCH_THREADS = int(os.getenv("TORCH_THREADS", "0"))
+
+# Koder załadowany w procesie nadrzędnym gunicorn przed utworzeniem workerów (preload_encoder)
+_preloaded_encoder = None
+
+# Liczba wątków wykonujących parsowanie i kodowanie (praca CPU poza pętlą zdarzeń)
+ANALYSIS_WORKERS = int(os.getenv("ANALYSIS_WORKERS", "2"))
+
+# Maksymalna liczba analiz oczekujących na wolny wątek
+ANALYSIS_MAX_PENDING = int(os.getenv("ANALYSIS_MAX_PENDING", "16"))
+
+# Pamięć podręczna embeddingów: rozmiar LRU i opcjonalny plik SQLite
+EMBEDDING_CACHE_SIZE = int(os.getenv("EMBEDDING_CACHE_SIZE", "50000"))
+EMBEDDING_CACHE_PATH = os.getenv("EMBEDDING_CACHE_PATH") or None
+
+# Mikro-batchowanie kodowania między równoległymi analizami
+INFERENCE_BATCHING = os.getenv("INFERENCE_BATCHING", "True").lower() in ("1", "true", "yes")
+INFERENCE_MAX_BATCH = int(os.getenv("INFERENCE_MAX_BATCH", "64"))
+INFERENCE_MAX_WAIT_MS = float(os.getenv("INFERENCE_MAX_WAIT_MS", "5"))
+
+# Pamięć podręczna wyników parsowania: rozmiar LRU i opcjonalny plik SQLite z limitem wpisów
+PARSE_CACHE_SIZE = int(os.getenv("PARSE_CACHE_SIZE", "1024"))
+PARSE_CACHE_PATH = os.getenv("PARSE_CACHE_PATH") or None
+PARSE_CACHE_MAX_DISK_ENTRIES = int(os.getenv("PARSE_CACHE_MAX_DISK_ENTRIES", "100000"))
+
+# Kolejka zadań asynchronicznych analiz: "database" (tabela analysis_jobs - trwała, wspólna dla
+# procesów i instancji), "sqlite" (plik JOB_QUEUE_PATH) lub "memory" (pamięć procesu - testy)
+JOB_QUEUE = os.getenv("JOB_QUEUE", "database")
+JOB_QUEUE_PATH = os.getenv(
+    "JOB_QUEUE_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "jobs.sqlite3")
+)
+# Liczba zadań wykonywanych równolegle w procesie (0 - proces tylko przyjmuje zadania)
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "1"))
+JOB_POLL_INTERVAL = float(os.getenv("JOB_POLL_INTERVAL", "0.5"))
+# Czas, po którym zadanie przerwanego workera wraca do kolejki, i limit prób jego wykonania
+JOB_LEASE_SECONDS = float(os.getenv("JOB_LEASE_SECONDS", "600"))
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+
+# Model TF-IDF dopasowany do korpusu (scripts/fit_tfidf.py), wczytywany przy starcie
+TFIDF_MODEL_PATH = os.getenv(
+    "TFIDF_MODEL_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "tfidf.npz")
+)
+
+# Dopasowanie umiejętności: "topk" (SKILL_TOP_K wymagań na umiejętność z CV) lub "assignment"
+# (optymalne przypisanie jeden do jednego); próg minimalnego podobieństwa dopasowania
+SKILL_MATCHING = os.getenv("SKILL_MATCHING", "topk")
+SKILL_TOP_K = int(os.getenv("SKILL_TOP_K", "1"))
+SKILL_MATCH_THRESHOLD = float(os.getenv("SKILL_MATCH_THRESHOLD", "0.7"))
+
+# Tabela embeddingów kanonicznych umiejętności (scripts/build_skill_table.py), mapowana w pamięci
+SKILL_TABLE_PATH = os.getenv(
+    "SKILL_TABLE_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "skill_table.npy")
+)
+
+
+def load_encoder() -> Tuple[object, str]:
+    """
+    Ładuje koder wskazany przez ENCODER_BACKEND.
+    
+    Returns:
+        Tuple[object, str]: Koder o interfejsie SentenceTransformer i nazwa przestrzeni jego embeddingów
+        
+    Raises:
+        ValueError: Jeśli backend nie jest obsługiwany lub eksport ONNX nie odpowiada MODEL_NAME
+    """
+    if ENCODER_BACKEND == "onnx":
+        model = OnnxSentenceEncoder(ONNX_MODEL_PATH, variant=ONNX_VARIANT, num_threads=ONNX_THREADS)
+        if model.source_model != MODEL_NAME:
+            raise ValueError(f"Eksport ONNX ({model.source_model}) nie odpowiada modelowi MODEL_NAME ({MODEL_NAME})")
+        # Wektory ONNX są przechowywane w cache i profilach osobno od wektorów PyTorch
+        return model, model.model_name
+    
+    if ENCODER_BACKEND == "hashing":
+        model = HashingSentenceEncoder()
+        return model, model.model_name
+    
+    if ENCODER_BACKEND != "torch":
+        raise ValueError(f"Nieobsługiwany backend kodowania: {ENCODER_BACKEND}")
+    
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(MODEL_NAME), MODEL_NAME
+
+
+def preload_encoder() -> bool:
+    """
+    Ładuje wagi modelu w procesie nadrzędnym gunicorn, zanim zostaną utworzone workery
+    (gunicorn.conf.py). Workery tworzone przez fork współdzielą strony pamięci z wagami
+    (copy-on-write) - wagi są tylko odczytywane, więc pozostają wspólne, a każdy worker
+    tworzy własny analizator, cache i pule wątków.
+    
+    Returns:
+        bool: True, jeśli model został załadowany
+    """
+    global _preloaded_encoder
+    
+    if ENCODER_BACKEND != "torch":
+        # Sesja ONNX Runtime tworzy pule wątków już przy inicjalizacji i nie przetrwa fork
+        logger.warning("Backend %s nie obsługuje współdzielenia wag - model zostanie załadowany w każdym workerze", ENCODER_BACKEND)
+        return False
+    
+    import torch
+    # Ładowanie jednym wątkiem: pula wątków OpenMP uruchomiona przed fork blokuje obliczenia w workerach
+    torch.set_num_threads(1)
+    
+    started = time.perf_counter()
+    model, model_name = load_encoder()
+    # Tryb inferencji; wagi nie są modyfikowane, więc ich strony pamięci nie są kopiowane w workerach
+    model.eval()
+    for parameter in model.parameters():
+        parameter.requires_grad_(False)
+    
+    _preloaded_encoder = (model, model_name)
+    logger.info("Wagi modelu %s załadowane przed utworzeniem workerów w %.2f s", model_name, time.perf_counter() - started)
+    return True
+
+
+def build_analyzer() -> RelevanceAnalyzer:
+    """
+    Tworzy analizator relewantności (z modelem TF-IDF, jeśli go dopasowano) i rozgrzewa model pojedynczym kodowaniem.
+    Używa modelu załadowanego przez preload_encoder, jeśli proces jest workerem gunicorn.
+    
+    Returns:
+        RelevanceAnalyzer: Gotowy do użycia analizator
+    """
+    if _preloaded_encoder is not None:
+        model, model_name = _preloaded_encoder
+        import torch
+        torch.set_num_threads(TORCH_THREADS or os.cpu_count() or 1)
+    else:
+        model, model_name = load_encoder()
+    
+    cache = EmbeddingCache(model_name, max_entries=EMBEDDING_CACHE_SIZE, db_path=EMBEDDING_CACHE_PATH)
+    tfidf_model = load_tfidf_model(TFIDF_MODEL_PATH)
+    if tfidf_model is None:
+        logger.warning("Brak modelu TF-IDF (%s) - słownik będzie dopasowywany dla każdej pary dokumentów", TFIDF_MODEL_PATH)
+    skill_table = load_skill_table(SKILL_TABLE_PATH)
+    if skill_table is None:
+        logger.info("Brak tabeli umiejętności (%s) - wszystkie umiejętności będą kodowane modelem", SKILL_TABLE_PATH)
+    elif skill_table.model_name != model_name or skill_table.dimension != model.get_sentence_embedding_dimension():
+        logger.warning("Tabela umiejętności (%s) zakodowana modelem %s nie odpowiada modelowi %s - pominięto", SKILL_TABLE_PATH, skill_table.model_name, model_name)
+        skill_table = None
+    analyzer = RelevanceAnalyzer(
+        model_name=model_name,
+        cache=cache,
+        tfidf_model=tfidf_model,
+        model=model,
+        skill_matching=SKILL_MATCHING,
+        skill_top_k=SKILL_TOP_K,
+        skill_threshold=SKILL_MATCH_THRESHOLD,
+        skill_table=skill_table
+    )
+    # Pierwsze wywołanie encode inicjalizuje tokenizer i alokacje modelu
+    analyzer.model.encode(["rozgrzewka modelu"])
+    return analyzer
+
+
+async def warm_up(app: FastAPI):
+    """
+    Ładuje i rozgrzewa model w tle, gdy serwer przyjmuje już połączenia.
+    Do czasu zakończenia endpointy analizy odpowiadają kodem 503, a /ready stanem "starting".
+    
+    Args:
+        app: Instancja aplikacji FastAPI
+    """
+    loop = asyncio.get_running_loop()
+    executor = app.state.executor
+    started = time.perf_counter()
+    
+    try:
+        # Import bibliotek modelu, wczytanie wag i pierwsze kodowanie poza pętlą zdarzeń
+        analyzer = await loop.run_in_executor(executor, build_analyzer)
+        
+        # Indeks wektorowy CV aktualizowany przy zapisie każdej analizy (wspólny dla workerów)
+        index_dim = analyzer.model.get_sentence_embedding_dimension() * len(SCORED_SECTIONS)
+        try:
+            app.state.cv_index = await loop.run_in_executor(
+                executor, create_index, CV_INDEX_TYPE, CV_INDEX_PATH, index_dim, analyzer.model_name, SCORED_SECTIONS
+            )
+        except IndexMismatchError as e:
+            logger.warning("Indeks CV nie zostanie użyty: %s", e)
+        
+        if INFERENCE_BATCHING:
+            scheduler = InferenceScheduler(
+                analyzer.model,
+                max_batch_size=INFERENCE_MAX_BATCH,
+                max_wait_ms=INFERENCE_MAX_WAIT_MS
+            )
+            await scheduler.start()
+            analyzer.encoder = scheduler
+            app.state.scheduler = scheduler
+        
+        # Workery zadań asynchronicznych startują dopiero z gotowym analizatorem
+        if JOB_WORKERS > 0:
+            job_workers = JobWorkerPool(
+                app.state.job_queue,
+                partial(run_analysis_job, analyzer, app.state.parse_cache, app.state.cv_index),
+                workers=JOB_WORKERS,
+                poll_interval=JOB_POLL_INTERVAL
+            )
+            await job_workers.start()
+            app.state.job_workers = job_workers
+    except Exception as e:
+        logger.exception("Nie udało się załadować modelu")
+        app.state.warmup_error = str(e)
+        return
+    
+    app.state.warmup_seconds = round(time.perf_counter() - started, 3)
+    # Analizator jest udostępniany na końcu - jego obecność oznacza gotowość instancji
+    app.state.analyzer = analyzer
+    logger.info("Model %s gotowy po %.2f s", analyzer.model_name, app.state.warmup_seconds)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Cykl życia aplikacji: pula wątków analizy i ładowanie modelu w tle.
+    Serwer przyjmuje połączenia od razu; gotowość do analizy sygnalizuje /ready.
+    
+    Args:
+        app: Instancja aplikacji FastAPI
+    """
+    executor = ThreadPoolExecutor(max_workers=ANALYSIS_WORKERS, thread_name_prefix="analysis")
+    
+    app.state.executor = executor
+    app.state.parse_cache = ParseCache(
+        max_entries=PARSE_CACHE_SIZE,
+        db_path=PARSE_CACHE_PATH,
+        max_disk_entries=PARSE_CACHE_MAX_DISK_ENTRIES
+    )
+    app.state.analysis_slots = asyncio.Semaphore(ANALYSIS_WORKERS + ANALYSIS_MAX_PENDING)
+    # Kolejka przyjmuje zadania także w trakcie ładowania modelu
+    app.state.job_queue = create_job_queue(
+        JOB_QUEUE,
+        path=JOB_QUEUE_PATH,
+        session_factory=SessionLocal,
+        lease_seconds=JOB_LEASE_SECONDS,
+        max_attempts=JOB_MAX_ATTEMPTS
+    )
+    app.state.job_workers = None
+    app.state.analyzer = None
+    app.state.cv_index = None
+    app.state.scheduler = None
+    app.state.warmup_error = None
+    app.state.warmup_seconds = None
+    app.state.warmup = asyncio.create_task(warm_up(app))
+    
+    try:
+        yield
+    finally:
+        if not app.state.warmup.done():
+            app.state.warmup.cancel()
+            try:
+                await app.state.warmup
+            except asyncio.CancelledError:
+                pass
+        if app.state.job_workers is not None:
+            await app.state.job_workers.stop()
+        if app.state.scheduler is not None:
+            await app.state.scheduler.stop()
+        executor.shutdown(wait=False, cancel_futures=True)
+        if app.state.cv_index is not None:
+            app.state.cv_index.save()
+        if app.state.analyzer is not None:
+            app.state.analyzer.cache.close()
+        app.state.parse_cache.close()
+        app.state.job_queue.close()
+        if async_engine is not None:
+            await async_engine.dispose()
+
+
 # Utworzenie instancji aplikacji FastAPI
 app = FastAPI(
     title="CV Analyzer API",
     description="API do analizy CV pod kątem zgodności z treścią ogłoszenia o pracę",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
 # Konfiguracja CORS
@@ -24,26 +342,82 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Rozkład czasu etapów analizy widoczny dla frontendu
+    expose_headers=["Server-Timing"],
 )
 
-# Utworzenie katalogu na przesłane pliki
-UPLOAD_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "uploads")
-os.makedirs(UPLOAD_DIR, exist_ok=True)
-
-# Dozwolone rozszerzenia plików
-ALLOWED_EXTENSIONS = {"pdf", "docx", "txt"}
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    """
+    Mierzy czas obsługi żądania i dodaje do odpowiedzi nagłówek Server-Timing
+    z czasami etapów potoku analizy (app.metrics.timed) wykonanych w trakcie żądania.
+    
+    Args:
+        request: Żądanie HTTP
+        call_next: Dalsza obsługa żądania
+        
+    Returns:
+        Response: Odpowiedź z nagłówkiem Server-Timing
+    """
+    timings, token = start_request()
+    started = time.perf_counter()
+    try:
+        response = await call_next(request)
+    finally:
+        finish_request(token)
+    elapsed = time.perf_counter() - started
+    
+    # Szablon ścieżki zamiast ścieżki z parametrami - ograniczona liczba serii metryk
+    route = request.scope.get("route")
+    REQUEST_SECONDS.observe(
+        elapsed,
+        method=request.method,
+        route=route.path if route is not None else "unmatched",
+        status=response.status_code
+    )
+    response.headers["Server-Timing"] = timings.server_timing(total=elapsed)
+    response.headers["Timing-Allow-Origin"] = "*"
+    
+    return response
 
-def validate_file_extension(filename: str) -> bool:
+def cache_metric(field: str) -> Dict[Tuple[str, ...], float]:
     """
-    Sprawdza, czy rozszerzenie pliku jest dozwolone.
+    Odczytuje pole statystyk pamięci podręcznych (jak w /cache/stats) dla metryk Prometheus.
     
     Args:
-        filename: Nazwa pliku do sprawdzenia
+        field: Nazwa pola statystyk, np. "hit_ratio"
         
     Returns:
-        bool: True jeśli rozszerzenie jest dozwolone, False w przeciwnym przypadku
+        Dict[Tuple[str, ...], float]: Nazwa cache -> wartość
     """
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    caches = {"parse_results": getattr(app.state, "parse_cache", None)}
+    analyzer = getattr(app.state, "analyzer", None)
+    if analyzer is not None:
+        caches["embeddings"] = analyzer.cache
+    
+    values = {}
+    for name, cache in caches.items():
+        if cache is not None:
+            stats = cache.stats()
+            values[(name,)] = stats["hits"] + stats["disk_hits"] if field == "hits" else stats[field]
+    return values
+
+REGISTRY.register(CallbackMetric(
+    "cv_analyzer_cache_hit_ratio", "Udział trafień pamięci podręcznej", "gauge", ("cache",),
+    partial(cache_metric, "hit_ratio")
+))
+REGISTRY.register(CallbackMetric(
+    "cv_analyzer_cache_hits_total", "Trafienia pamięci podręcznej (pamięć i dysk)", "counter", ("cache",),
+    partial(cache_metric, "hits")
+))
+REGISTRY.register(CallbackMetric(
+    "cv_analyzer_cache_misses_total", "Chybienia pamięci podręcznej", "counter", ("cache",),
+    partial(cache_metric, "misses")
+))
+REGISTRY.register(CallbackMetric(
+    "cv_analyzer_cache_entries", "Liczba wpisów pamięci podręcznej w pamięci procesu", "gauge", ("cache",),
+    partial(cache_metric, "entries")
+))
 
 @app.get("/health")
 async def health_check():
@@ -55,77 +429,70 @@ async def health_check():
     """
     return {"status": "ok", "timestamp": datetime.now().isoformat()}
 
-@app.post("/analyze")
-async def analyze_cv(
-    cv_file: UploadFile = File(...),
-    job_description_file: UploadFile = File(...),
-):
+@app.get("/ready")
+async def readiness_check():
     """
-    Endpoint do analizy CV pod kątem zgodności z treścią ogłoszenia o pracę.
+    Endpoint gotowości instancji: w odróżnieniu od /health (proces działa) zwraca 200
+    dopiero wtedy, gdy model został załadowany i rozgrzany.
     
-    Args:
-        cv_file: Plik CV w formacie PDF, DOCX lub TXT
-        job_description_file: Plik z ogłoszeniem o pracę w formacie PDF, DOCX lub TXT
-        
     Returns:
-        dict: Wyniki analizy CV
-        
-    Raises:
-        HTTPException: Jeśli pliki mają nieprawidłowe rozszerzenia lub wystąpił błąd podczas przetwarzania
+        dict: Status gotowości (kod 503 w trakcie ładowania modelu lub po błędzie)
     """
-    # Walidacja rozszerzeń plików
-    if not validate_file_extension(cv_file.filename):
-        raise HTTPException(status_code=400, detail="Nieprawidłowy format pliku CV. Dozwolone formaty: PDF, DOCX, TXT")
-    
-    if not validate_file_extension(job_description_file.filename):
-        raise HTTPException(status_code=400, detail="Nieprawidłowy format pliku ogłoszenia. Dozwolone formaty: PDF, DOCX, TXT")
+    if app.state.analyzer is not None:
+        return {
+            "status": "ready",
+            "model_name": app.state.analyzer.model_name,
+            "pid": os.getpid(),
+            "warmup_seconds": app.state.warmup_seconds
+        }
     
-    # Generowanie unikalnych nazw plików
-    cv_filename = f"{uuid.uuid4()}_{cv_file.filename}"
-    job_desc_filename = f"{uuid.uuid4()}_{job_description_file.filename}"
+    if app.state.warmup_error is not None:
+        return JSONResponse(status_code=503, content={"status": "failed", "detail": app.state.warmup_error})
+    return JSONResponse(status_code=503, content={"status": "starting"}, headers={"Retry-After": str(READY_RETRY_AFTER)})
+
+@app.get("/cache/stats")
+async def cache_stats():
+    """
+    Endpoint zwracający statystyki pamięci podręcznych embeddingów i wyników parsowania.
     
-    # Zapisywanie plików
-    cv_path = os.path.join(UPLOAD_DIR, cv_filename)
-    job_desc_path = os.path.join(UPLOAD_DIR, job_desc_filename)
+    Returns:
+        dict: Liczniki trafień i chybień cache
+    """
+    return {
+        "embeddings": app.state.analyzer.cache.stats() if app.state.analyzer is not None else None,
+        "parse_results": app.state.parse_cache.stats()
+    }
+
+@app.get("/metrics")
+async def read_metrics():
+    """
+    Endpoint z metrykami wydajności w formacie tekstowym Prometheus: histogramy czasu
+    etapów analizy (według formatu pliku) i żądań HTTP, rozmiary batchy kodowania
+    oraz trafienia pamięci podręcznych. Wartości dotyczą bieżącego procesu.
     
-    try:
-        # Zapisanie plików na dysku
-        with open(cv_path, "wb") as f:
-            shutil.copyfileobj(cv_file.file, f)
-        
-        with open(job_desc_path, "wb") as f:
-            shutil.copyfileobj(job_description_file.file, f)
-            
-        # TODO: Implementacja ekstrakcji treści i analizy NLP
-        
-        # Tymczasowa odpowiedź (do zastąpienia rzeczywistą analizą)
-        return {
-            "status": "success",
-            "message": "Pliki zostały przesłane pomyślnie",
-            "files": {
-                "cv": cv_filename,
-                "job_description": job_desc_filename
-            },
-            "analysis": {
-                "relevance_score": 0.0,  # Placeholder
-                "skills_match": [],      # Placeholder
-                "experience_match": [],  # Placeholder
-                "education_match": []    # Placeholder
-            }
-        }
+    Returns:
+        Response: Metryki w formacie tekstowym Prometheus
+    """
+    return Response(content=REGISTRY.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+@app.get("/inference/stats")
+async def inference_stats():
+    """
+    Endpoint zwracający statystyki mikro-batchowania kodowania.
     
-    except Exception as e:
-        # Usunięcie plików w przypadku błędu
-        if os.path.exists(cv_path):
-            os.remove(cv_path)
-        if os.path.exists(job_desc_path):
-            os.remove(job_desc_path)
-        
-        raise HTTPException(status_code=500, detail=f"Wystąpił błąd podczas przetwarzania plików: {str(e)}")
-    finally:
-        # Zamknięcie plików
-        cv_file.file.close()
-        job_description_file.file.close()
+    Returns:
+        dict: Liczba batchy i średni rozmiar batcha
+    """
+    if app.state.scheduler is None:
+        return {"enabled": False}
+    return {"enabled": True, **app.state.scheduler.stats()}
+
+# Endpointy analiz, zadań, historii, profili ogłoszeń i wyszukiwania CV
+app.include_router(analyze.router)
+app.include_router(jobs.router)
+app.include_router(analyses.router)
+app.include_router(job_profiles.router)
+app.include_router(search.router)
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,277 @@
+"""
+Moduł metryk wydajności w formacie tekstowym Prometheus (endpoint /metrics).
+Etapy potoku analizy są mierzone przez timed(): czas trafia do histogramu etapu oraz -
+w trakcie obsługi żądania HTTP - do pomiarów żądania (RequestTimings), z których powstaje
+nagłówek Server-Timing. Metryki są przechowywane w pamięci procesu; przy wielu workerach
+gunicorn każdy z nich udostępnia własne wartości (etykieta instance po stronie Prometheusa).
+"""
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple
+import threading
+import time
+
+# Przedziały histogramów czasu [s] i liczby tekstów w batchu
+DURATION_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512)
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    """
+    Formatuje etykiety próbki, np. {stage="extract",format="pdf"}.
+    """
+    pairs = [
+        '{}="{}"'.format(name, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for name, value in zip(names, values)
+    ]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    """
+    Formatuje wartość próbki (liczby całkowite bez części ułamkowej).
+    """
+    if value == int(value):
+        return str(int(value))
+    return repr(float(value))
+
+
+class Histogram:
+    """
+    Histogram z etykietami (skumulowane przedziały, suma i liczba obserwacji).
+    """
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (), buckets: Tuple[float, ...] = DURATION_BUCKETS):
+        """
+        Inicjalizacja histogramu.
+
+        Args:
+            name: Nazwa metryki
+            documentation: Opis metryki (# HELP)
+            labelnames: Nazwy etykiet
+            buckets: Górne granice przedziałów (rosnąco, bez +Inf)
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # Etykiety -> [liczby obserwacji w przedziałach (bez kumulacji), suma, liczba]
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        """
+        Dodaje obserwację dla podanych etykiet.
+        """
+        key = tuple(str(labels.get(name, "")) for name in self.labelnames)
+        index = len(self.buckets)
+        for position, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = position
+                break
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def collect(self) -> List[str]:
+        """
+        Zwraca linie metryki w formacie tekstowym Prometheus.
+        """
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            values = sorted((key, (list(state[0]), state[1], state[2])) for key, state in self._values.items())
+        for key, (counts, total, count) in values:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else _format_value(bound)
+                bucket_label = f'le="{le}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, bucket_label)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {count}")
+        return lines
+
+
+class CallbackMetric:
+    """
+    Metryka, której wartości są odczytywane w chwili pobrania metryk
+    (np. ze statystyk pamięci podręcznych prowadzonych przez same obiekty).
+    """
+
+    def __init__(self, name: str, documentation: str, metric_type: str, labelnames: Tuple[str, ...], callback: Callable[[], Dict[Tuple[str, ...], float]]):
+        """
+        Inicjalizacja metryki.
+
+        Args:
+            name: Nazwa metryki
+            documentation: Opis metryki (# HELP)
+            metric_type: Typ metryki ("gauge" lub "counter")
+            labelnames: Nazwy etykiet
+            callback: Funkcja zwracająca słownik wartości etykiet -> wartość
+        """
+        self.name = name
+        self.documentation = documentation
+        self.metric_type = metric_type
+        self.labelnames = tuple(labelnames)
+        self.callback = callback
+
+    def collect(self) -> List[str]:
+        """
+        Zwraca linie metryki w formacie tekstowym Prometheus.
+        """
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"]
+        for key, value in sorted(self.callback().items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Rejestr metryk procesu.
+    """
+
+    def __init__(self):
+        self._metrics = OrderedDict()
+
+    def register(self, metric):
+        """
+        Rejestruje metrykę (ponowna rejestracja nazwy zastępuje poprzednią).
+
+        Returns:
+            Zarejestrowana metryka
+        """
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        """
+        Zwraca wszystkie metryki w formacie tekstowym Prometheus.
+        """
+        lines = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+# Typ treści odpowiedzi /metrics (format tekstowy Prometheus; kodowanie dopisuje Response)
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4"
+
+STAGE_SECONDS = REGISTRY.register(Histogram(
+    "cv_analyzer_stage_duration_seconds",
+    "Czas etapów potoku analizy (format - rozszerzenie przetwarzanego pliku)",
+    ("stage", "format")
+))
+REQUEST_SECONDS = REGISTRY.register(Histogram(
+    "cv_analyzer_http_request_duration_seconds",
+    "Czas obsługi żądań HTTP",
+    ("method", "route", "status")
+))
+ENCODE_TEXTS = REGISTRY.register(Histogram(
+    "cv_analyzer_encode_texts",
+    "Liczba tekstów przekazanych do kodowania w jednym wywołaniu (po pominięciu trafień cache)",
+    buckets=BATCH_SIZE_BUCKETS
+))
+ENCODER_BATCH_SIZE = REGISTRY.register(Histogram(
+    "cv_analyzer_encoder_batch_size",
+    "Liczba tekstów w batchu modelu złożonym przez mikro-batchowanie",
+    buckets=BATCH_SIZE_BUCKETS
+))
+
+# Pomiary etapów bieżącego żądania HTTP (None poza obsługą żądania)
+_request_timings: ContextVar[Optional["RequestTimings"]] = ContextVar("request_timings", default=None)
+
+
+class RequestTimings:
+    """
+    Łączny czas etapów jednego żądania (źródło nagłówka Server-Timing).
+    Etapy wykonywane w wątkach puli dopisują się do tego samego obiektu (in_request_context).
+    """
+
+    def __init__(self):
+        self._durations = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, stage: str, seconds: float):
+        """
+        Dolicza czas etapu (etap wykonany kilka razy, np. ekstrakcja CV i ogłoszenia, jest sumowany).
+        """
+        with self._lock:
+            self._durations[stage] = self._durations.get(stage, 0.0) + seconds
+
+    def server_timing(self, total: Optional[float] = None) -> str:
+        """
+        Formatuje pomiary jako wartość nagłówka Server-Timing (czasy w milisekundach).
+
+        Args:
+            total: Całkowity czas obsługi żądania [s] (opcjonalnie)
+
+        Returns:
+            str: Np. "extract;dur=12.3, encode;dur=40.1, total;dur=61.0"
+        """
+        with self._lock:
+            durations = list(self._durations.items())
+        if total is not None:
+            durations.append(("total", total))
+        return ", ".join(f"{stage};dur={seconds * 1000:.1f}" for stage, seconds in durations)
+
+
+def start_request() -> Tuple[RequestTimings, object]:
+    """
+    Rozpoczyna zbieranie pomiarów etapów dla bieżącego żądania.
+
+    Returns:
+        Tuple[RequestTimings, object]: Pomiary żądania i token do finish_request
+    """
+    timings = RequestTimings()
+    return timings, _request_timings.set(timings)
+
+
+def finish_request(token: object):
+    """
+    Kończy zbieranie pomiarów etapów rozpoczęte przez start_request.
+    """
+    _request_timings.reset(token)
+
+
+def in_request_context(function: Callable) -> Callable:
+    """
+    Wiąże funkcję z kontekstem bieżącego żądania, aby etapy wykonane w puli wątków
+    (loop.run_in_executor nie przenosi zmiennych kontekstowych) trafiły do jego pomiarów.
+
+    Args:
+        function: Funkcja blokująca
+
+    Returns:
+        Callable: Funkcja wykonywana w kopii bieżącego kontekstu
+    """
+    return partial(copy_context().run, function)
+
+
+@contextmanager
+def timed(stage: str, file_format: str = ""):
+    """
+    Mierzy czas bloku jako etap potoku analizy.
+
+    Args:
+        stage: Nazwa etapu (np. "extract", "encode")
+        file_format: Format przetwarzanego pliku (np. "pdf"), jeśli dotyczy
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        STAGE_SECONDS.observe(elapsed, stage=stage, format=file_format)
+        timings = _request_timings.get()
+        if timings is not None:
+            timings.add(stage, elapsed)
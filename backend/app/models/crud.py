@@ -0,0 +1,525 @@
+"""
+Moduł operacji na bazie danych.
+Zawiera funkcje zapisu i odczytu obiektów wykorzystywane przez endpointy API.
+"""
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional, Tuple
+import io
+
+import numpy as np
+from sqlalchemy import Numeric, and_, case, cast, func, insert, or_, select, tuple_, update
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+from app.models.models import Analysis, CVData, JobData, JobProfile, SectionScore, SkillMatch
+
+
+# Kolumny, według których można stronicować historię analiz (list_analyses)
+ANALYSIS_SORT_COLUMNS = {
+    "created_at": Analysis.created_at,
+    "relevance_score": Analysis.relevance_score
+}
+
+
+class SavedAnalysis(NamedTuple):
+    """
+    Identyfikatory analizy zapisanej przez save_analyses.
+    """
+    id: int
+    cv_data_id: int
+
+
+def serialize_embeddings(embeddings: Dict[str, np.ndarray]) -> bytes:
+    """
+    Serializuje embeddingi sekcji do formatu NPZ.
+
+    Args:
+        embeddings: Słownik sekcja -> macierz embeddingów
+
+    Returns:
+        bytes: Zserializowane embeddingi
+    """
+    buffer = io.BytesIO()
+    np.savez(buffer, **{section: np.asarray(matrix, dtype=np.float32) for section, matrix in embeddings.items()})
+    return buffer.getvalue()
+
+
+def deserialize_embeddings(data: bytes) -> Dict[str, np.ndarray]:
+    """
+    Odczytuje embeddingi sekcji zapisane funkcją serialize_embeddings.
+
+    Args:
+        data: Zserializowane embeddingi
+
+    Returns:
+        Dict[str, np.ndarray]: Słownik sekcja -> macierz embeddingów
+    """
+    with np.load(io.BytesIO(data)) as archive:
+        return {section: archive[section] for section in archive.files}
+
+
+def create_job_profile(db: Session, filename: str, job_data: Dict, embeddings: Dict[str, np.ndarray], model_name: str, section_weights: Optional[Dict[str, float]] = None) -> JobProfile:
+    """
+    Zapisuje przetworzone ogłoszenie o pracę jako profil wielokrotnego użytku.
+
+    Args:
+        db: Sesja bazy danych
+        filename: Nazwa pliku ogłoszenia
+        job_data: Wynik JobDescriptionParser.parse_job_description
+        embeddings: Embeddingi sekcji ogłoszenia (RelevanceAnalyzer.encode_job)
+        model_name: Nazwa modelu, którym obliczono embeddingi
+        section_weights: Wagi sekcji analiz względem profilu (None - domyślne wagi analizatora)
+
+    Returns:
+        JobProfile: Zapisany profil
+    """
+    profile = JobProfile(
+        filename=filename,
+        job_title=job_data.get("job_title"),
+        company=job_data.get("company"),
+        required_skills=job_data.get("required_skills", []),
+        responsibilities=job_data.get("responsibilities", []),
+        qualifications=job_data.get("qualifications", []),
+        full_text=job_data.get("full_text", ""),
+        model_name=model_name,
+        embeddings=serialize_embeddings(embeddings),
+        section_weights=section_weights
+    )
+    db.add(profile)
+    db.commit()
+    db.refresh(profile)
+    return profile
+
+
+def get_job_profile(db: Session, profile_id: int) -> Optional[JobProfile]:
+    """
+    Pobiera profil ogłoszenia o pracę.
+
+    Args:
+        db: Sesja bazy danych
+        profile_id: Identyfikator profilu
+
+    Returns:
+        Optional[JobProfile]: Profil lub None, jeśli nie istnieje
+    """
+    return db.get(JobProfile, profile_id)
+
+
+def job_profile_to_job_data(profile: JobProfile) -> Dict:
+    """
+    Odtwarza słownik danych ogłoszenia w formacie zwracanym przez JobDescriptionParser.
+
+    Args:
+        profile: Profil ogłoszenia
+
+    Returns:
+        Dict: Dane ogłoszenia o pracę
+    """
+    return {
+        "job_title": profile.job_title or "",
+        "company": profile.company or "",
+        "required_skills": profile.required_skills or [],
+        "responsibilities": profile.responsibilities or [],
+        "qualifications": profile.qualifications or [],
+        "full_text": profile.full_text
+    }
+
+
+def _cv_data_row(cv_data: Dict) -> Dict:
+    """
+    Zwraca wartości kolumn tabeli cv_data dla wyniku CVParser.parse_cv.
+    """
+    return {
+        "contact_info": cv_data.get("contact_info", {}),
+        "skills": cv_data.get("skills", []),
+        "experience": cv_data.get("experience", []),
+        "education": cv_data.get("education", []),
+        "full_text": cv_data.get("full_text", "")
+    }
+
+
+def _job_data_row(job_data: Dict) -> Dict:
+    """
+    Zwraca wartości kolumn tabeli job_data dla wyniku JobDescriptionParser.parse_job_description.
+    """
+    return {
+        "job_title": job_data.get("job_title"),
+        "company": job_data.get("company"),
+        "required_skills": job_data.get("required_skills", []),
+        "responsibilities": job_data.get("responsibilities", []),
+        "qualifications": job_data.get("qualifications", []),
+        "full_text": job_data.get("full_text", "")
+    }
+
+
+def _skill_match_rows(analysis: Dict) -> List[Dict]:
+    """
+    Zwraca wartości kolumn tabeli skill_matches dla wyniku analizy.
+    """
+    return [
+        {
+            "cv_skill": match["cv_skill"][:255],
+            "job_skill": match["job_skill"][:255],
+            "similarity_score": match["similarity_score"]
+        }
+        for match in analysis.get("skill_matches", [])
+    ]
+
+
+def _section_score_rows(analysis: Dict, section_weights: Dict[str, float]) -> List[Dict]:
+    """
+    Zwraca wartości kolumn tabeli section_scores dla wyniku analizy.
+    """
+    return [
+        {
+            "section_name": section,
+            "score": score,
+            "weight": section_weights.get(section, 0.0)
+        }
+        for section, score in analysis.get("section_scores", {}).items()
+    ]
+
+
+def add_analysis(db: Session, cv_filename: str, job_description_filename: str, cv_data: Dict, job_data: Dict, analysis: Dict, section_weights: Dict[str, float]) -> Analysis:
+    """
+    Dodaje do sesji analizę wraz z danymi CV, ogłoszenia, dopasowaniami i ocenami sekcji
+    jako obiekty ORM. Nie zatwierdza transakcji. Zapis wielu analiz - save_analyses.
+
+    Args:
+        db: Sesja bazy danych
+        cv_filename: Nazwa pliku CV
+        job_description_filename: Nazwa pliku ogłoszenia
+        cv_data: Wynik CVParser.parse_cv
+        job_data: Wynik JobDescriptionParser.parse_job_description
+        analysis: Wynik RelevanceAnalyzer.analyze_relevance
+        section_weights: Wagi sekcji użyte do obliczenia wyniku (gdy analiza nie zawiera własnych)
+
+    Returns:
+        Analysis: Dodana (niezatwierdzona) analiza
+    """
+    record = Analysis(
+        cv_filename=cv_filename,
+        job_description_filename=job_description_filename,
+        relevance_score=analysis["relevance_score"]
+    )
+    record.cv_data = CVData(**_cv_data_row(cv_data))
+    record.job_data = JobData(**_job_data_row(job_data))
+    record.skill_matches = [SkillMatch(**row) for row in _skill_match_rows(analysis)]
+    record.section_scores = [SectionScore(**row) for row in _section_score_rows(analysis, analysis.get("section_weights", section_weights))]
+    db.add(record)
+    return record
+
+
+def save_analyses(db: Session, records: List[Dict], section_weights: Dict[str, float]) -> List[SavedAnalysis]:
+    """
+    Zapisuje wiele analiz w jednej transakcji instrukcjami INSERT wielu wierszy.
+    Każda tabela jest zapisywana jednym poleceniem (wiele zestawów parametrów) zamiast
+    osobnego INSERT dla każdego obiektu ORM; identyfikatory analiz i danych CV wracają
+    przez RETURNING w kolejności rekordów. Działa także w AsyncSession.run_sync.
+
+    Args:
+        db: Sesja bazy danych
+        records: Lista słowników z kluczami cv_filename, job_description_filename,
+            cv_data, job_data i analysis
+        section_weights: Wagi sekcji użyte do obliczenia wyników (dla analiz bez
+            własnego klucza section_weights)
+
+    Returns:
+        List[SavedAnalysis]: Identyfikatory zapisanych analiz i ich danych CV
+    """
+    if not records:
+        return []
+
+    try:
+        analysis_ids = db.scalars(
+            insert(Analysis).returning(Analysis.id, sort_by_parameter_order=True),
+            [
+                {
+                    "cv_filename": record["cv_filename"],
+                    "job_description_filename": record["job_description_filename"],
+                    "relevance_score": record["analysis"]["relevance_score"]
+                }
+                for record in records
+            ]
+        ).all()
+        cv_data_ids = db.scalars(
+            insert(CVData).returning(CVData.id, sort_by_parameter_order=True),
+            [{"analysis_id": analysis_id, **_cv_data_row(record["cv_data"])} for analysis_id, record in zip(analysis_ids, records)]
+        ).all()
+        db.execute(
+            insert(JobData),
+            [{"analysis_id": analysis_id, **_job_data_row(record["job_data"])} for analysis_id, record in zip(analysis_ids, records)]
+        )
+
+        skill_rows = [
+            {"analysis_id": analysis_id, **row}
+            for analysis_id, record in zip(analysis_ids, records)
+            for row in _skill_match_rows(record["analysis"])
+        ]
+        if skill_rows:
+            db.execute(insert(SkillMatch), skill_rows)
+
+        section_rows = [
+            {"analysis_id": analysis_id, **row}
+            for analysis_id, record in zip(analysis_ids, records)
+            for row in _section_score_rows(record["analysis"], record["analysis"].get("section_weights", section_weights))
+        ]
+        if section_rows:
+            db.execute(insert(SectionScore), section_rows)
+
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return [SavedAnalysis(analysis_id, cv_data_id) for analysis_id, cv_data_id in zip(analysis_ids, cv_data_ids)]
+
+
+def rescore_analyses(db: Session, section_weights: Dict[str, float], job_description_filename: Optional[str] = None, batch_size: int = 50000) -> int:
+    """
+    Przelicza wyniki zapisanych analiz dla nowych wag sekcji bez ponownego kodowania.
+    Wynik analizy to zaokrąglona suma ocen sekcji (section_scores) pomnożonych przez wagi,
+    więc wystarczą dwie instrukcje UPDATE wykonywane w bazie danych: nowe wagi ocen sekcji
+    i suma iloczynów jako relevance_score. Analizy są przetwarzane zakresami identyfikatorów
+    po batch_size, każdy zakres w osobnej transakcji (krótkie blokady, postęp przy przerwaniu).
+
+    Args:
+        db: Sesja bazy danych
+        section_weights: Nowe wagi sekcji (sekcje pominięte mają wagę 0)
+        job_description_filename: Przelicza tylko analizy względem tego ogłoszenia (opcjonalnie)
+        batch_size: Szerokość zakresu identyfikatorów analiz w jednej transakcji
+
+    Returns:
+        int: Liczba przeliczonych analiz
+    """
+    filters = []
+    if job_description_filename is not None:
+        filters.append(Analysis.job_description_filename == job_description_filename)
+
+    first_id, last_id = db.execute(select(func.min(Analysis.id), func.max(Analysis.id)).where(*filters)).one()
+    if first_id is None:
+        return 0
+
+    weight = case(section_weights, value=SectionScore.section_name, else_=0.0)
+    weighted_sum = (
+        select(func.coalesce(func.sum(SectionScore.score * SectionScore.weight), 0.0))
+        .where(SectionScore.analysis_id == Analysis.id)
+        .scalar_subquery()
+    )
+    # Zaokrąglenie jak w RelevanceAnalyzer (PostgreSQL: round tylko dla typu numeric)
+    relevance_score = func.round(cast(weighted_sum, Numeric), 2)
+
+    rescored = 0
+    for start in range(first_id, last_id + 1, batch_size):
+        in_range = (Analysis.id >= start, Analysis.id < start + batch_size)
+        scores_in_range = [SectionScore.analysis_id >= start, SectionScore.analysis_id < start + batch_size]
+        if filters:
+            scores_in_range.append(SectionScore.analysis_id.in_(select(Analysis.id).where(*in_range, *filters)))
+        try:
+            db.execute(
+                update(SectionScore).where(*scores_in_range).values(weight=weight),
+                execution_options={"synchronize_session": False}
+            )
+            result = db.execute(
+                update(Analysis).where(*in_range, *filters).values(relevance_score=relevance_score),
+                execution_options={"synchronize_session": False}
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        rescored += result.rowcount
+    return rescored
+
+
+def list_analyses(
+    db: Session,
+    sort: str = "created_at",
+    descending: bool = True,
+    limit: int = 20,
+    after: Optional[Tuple] = None,
+    job_description_filename: Optional[str] = None,
+    cv_filename: Optional[str] = None,
+    min_score: Optional[float] = None,
+    max_score: Optional[float] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None
+) -> List[Analysis]:
+    """
+    Pobiera stronę historii analiz stronicowanej kluczem (keyset): kolejna strona zaczyna się
+    za parą (wartość klucza sortowania, id) ostatniej analizy poprzedniej, więc koszt zapytania
+    nie rośnie z numerem strony (w odróżnieniu od OFFSET). Zapytanie korzysta z indeksów
+    (klucz, id); oceny sekcji i tytuł ogłoszenia są wczytywane dwoma zapytaniami dla całej strony.
+
+    Args:
+        db: Sesja bazy danych
+        sort: Klucz sortowania ("created_at" lub "relevance_score")
+        descending: Czy sortować malejąco
+        limit: Liczba analiz na stronie
+        after: Para (wartość klucza, id) ostatniej analizy poprzedniej strony (opcjonalnie)
+        job_description_filename: Tylko analizy względem tego ogłoszenia (opcjonalnie)
+        cv_filename: Tylko analizy tego pliku CV (opcjonalnie)
+        min_score: Minimalny wynik relewantności (opcjonalnie)
+        max_score: Maksymalny wynik relewantności (opcjonalnie)
+        created_from: Najwcześniejsza data utworzenia (opcjonalnie)
+        created_to: Najpóźniejsza data utworzenia (opcjonalnie)
+
+    Returns:
+        List[Analysis]: Analizy z załadowanymi ocenami sekcji i danymi ogłoszenia
+    """
+    sort_column = ANALYSIS_SORT_COLUMNS[sort]
+    query = select(Analysis).options(
+        selectinload(Analysis.section_scores),
+        selectinload(Analysis.job_data).load_only(JobData.job_title, JobData.company)
+    )
+
+    if job_description_filename is not None:
+        query = query.where(Analysis.job_description_filename == job_description_filename)
+    if cv_filename is not None:
+        query = query.where(Analysis.cv_filename == cv_filename)
+    if min_score is not None:
+        query = query.where(Analysis.relevance_score >= min_score)
+    if max_score is not None:
+        query = query.where(Analysis.relevance_score <= max_score)
+    if created_from is not None:
+        query = query.where(Analysis.created_at >= created_from)
+    if created_to is not None:
+        query = query.where(Analysis.created_at <= created_to)
+
+    if after is not None:
+        key = tuple_(sort_column, Analysis.id)
+        query = query.where(key < tuple_(*after) if descending else key > tuple_(*after))
+
+    if descending:
+        query = query.order_by(sort_column.desc(), Analysis.id.desc())
+    else:
+        query = query.order_by(sort_column.asc(), Analysis.id.asc())
+
+    return db.scalars(query.limit(limit)).all()
+
+
+def get_analysis(db: Session, analysis_id: int, include_documents: bool = False) -> Optional[Analysis]:
+    """
+    Pobiera analizę wraz z ocenami sekcji i dopasowaniami umiejętności
+    (stała liczba zapytań: analiza z danymi dokumentów oraz po jednym na każdą kolekcję).
+
+    Args:
+        db: Sesja bazy danych
+        analysis_id: Identyfikator analizy
+        include_documents: Czy wczytać także dane CV i ogłoszenia
+
+    Returns:
+        Optional[Analysis]: Analiza lub None, jeśli nie istnieje
+    """
+    options = [selectinload(Analysis.section_scores), selectinload(Analysis.skill_matches)]
+    if include_documents:
+        options.extend([joinedload(Analysis.cv_data), joinedload(Analysis.job_data)])
+    return (
+        db.query(Analysis)
+        .options(*options)
+        .filter(Analysis.id == analysis_id)
+        .one_or_none()
+    )
+
+
+def latest_cv_analyses(db: Session, content_prefixes: List[str]) -> Dict[str, Tuple[int, int, str]]:
+    """
+    Wyszukuje najnowszą analizę każdego CV o nazwie pliku zaczynającej się od podanego
+    początku skrótu treści (identyfikatory indeksu wektorowego CV). Zakres nazw
+    [prefiks, prefiks + "g") obejmuje wszystkie nazwy z cyfrą szesnastkową po prefiksie
+    i korzysta z indeksu ix_analyses_cv_filename_id.
+
+    Args:
+        db: Sesja bazy danych
+        content_prefixes: Początki skrótów treści CV (cyfry szesnastkowe)
+
+    Returns:
+        Dict[str, Tuple[int, int, str]]: Prefiks -> (id analizy, id danych CV, nazwa pliku CV)
+    """
+    if not content_prefixes:
+        return {}
+
+    latest = (
+        select(func.max(Analysis.id))
+        .where(or_(*[
+            and_(Analysis.cv_filename >= prefix, Analysis.cv_filename < f"{prefix}g")
+            for prefix in content_prefixes
+        ]))
+        .group_by(Analysis.cv_filename)
+    )
+    rows = db.execute(
+        select(Analysis.id, CVData.id, Analysis.cv_filename)
+        .join(CVData, CVData.analysis_id == Analysis.id)
+        .where(Analysis.id.in_(latest))
+        .order_by(Analysis.id)
+    ).all()
+
+    prefix_length = len(content_prefixes[0])
+    return {cv_filename[:prefix_length]: (analysis_id, cv_data_id, cv_filename) for analysis_id, cv_data_id, cv_filename in rows}
+
+
+def _document_dict(document, columns: Tuple[str, ...]) -> Optional[Dict]:
+    """
+    Zwraca wybrane kolumny danych CV lub ogłoszenia jako słownik.
+    """
+    if document is None:
+        return None
+    return {column: getattr(document, column) for column in columns}
+
+
+def analysis_summary_to_dict(analysis: Analysis) -> Dict:
+    """
+    Zamienia analizę na skrócony słownik zwracany przez listę analiz (GET /analyses).
+
+    Args:
+        analysis: Analiza z załadowanymi ocenami sekcji i danymi ogłoszenia (list_analyses)
+
+    Returns:
+        Dict: Wynik i oceny sekcji, pliki oraz stanowisko z ogłoszenia
+    """
+    return {
+        "analysis_id": analysis.id,
+        "cv_filename": analysis.cv_filename,
+        "job_description_filename": analysis.job_description_filename,
+        "job_title": analysis.job_data.job_title if analysis.job_data else None,
+        "company": analysis.job_data.company if analysis.job_data else None,
+        "relevance_score": analysis.relevance_score,
+        "section_scores": {score.section_name: score.score for score in analysis.section_scores},
+        "created_at": analysis.created_at.isoformat() if analysis.created_at else None
+    }
+
+
+def analysis_to_dict(analysis: Analysis, include_documents: bool = False) -> Dict:
+    """
+    Zamienia zapisaną analizę na słownik zwracany przez API.
+
+    Args:
+        analysis: Analiza z załadowanymi ocenami sekcji i dopasowaniami umiejętności
+        include_documents: Czy dołączyć dane CV i ogłoszenia (get_analysis z include_documents)
+
+    Returns:
+        Dict: Wynik, oceny i wagi sekcji oraz dopasowania umiejętności
+    """
+    result = {
+        "analysis_id": analysis.id,
+        "cv_filename": analysis.cv_filename,
+        "job_description_filename": analysis.job_description_filename,
+        "relevance_score": analysis.relevance_score,
+        "section_scores": {score.section_name: score.score for score in analysis.section_scores},
+        "section_weights": {score.section_name: score.weight for score in analysis.section_scores},
+        "skill_matches": [
+            {
+                "cv_skill": match.cv_skill,
+                "job_skill": match.job_skill,
+                "similarity_score": match.similarity_score
+            }
+            for match in analysis.skill_matches
+        ],
+        "created_at": analysis.created_at.isoformat() if analysis.created_at else None
+    }
+    if include_documents:
+        result["cv_data"] = _document_dict(
+            analysis.cv_data, ("contact_info", "skills", "experience", "education", "full_text")
+        )
+        result["job_data"] = _document_dict(
+            analysis.job_data, ("job_title", "company", "required_skills", "responsibilities", "qualifications", "full_text")
+        )
+    return result
@@ -2,7 +2,7 @@
 Moduły modeli ORM dla bazy danych PostgreSQL.
 Definiuje strukturę tabel i relacje między nimi.
 """
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text, JSON
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text, JSON, LargeBinary, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -15,6 +15,14 @@ class Analysis(Base):
     Przechowuje wyniki analizy oraz referencje do plików.
     """
     __tablename__ = "analyses"
+    __table_args__ = (
+        # Stronicowanie historii analiz (GET /analyses) według klucza sortowania i id
+        Index("ix_analyses_created_at_id", "created_at", "id"),
+        Index("ix_analyses_relevance_score_id", "relevance_score", "id"),
+        Index("ix_analyses_job_description_filename_created_at_id", "job_description_filename", "created_at", "id"),
+        # Wyniki wyszukiwania w indeksie CV (identyfikator = początek skrótu treści pliku CV)
+        Index("ix_analyses_cv_filename_id", "cv_filename", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     cv_filename = Column(String(255), nullable=False)
@@ -35,7 +43,7 @@ class CVData(Base):
     __tablename__ = "cv_data"
     
     id = Column(Integer, primary_key=True, index=True)
-    analysis_id = Column(Integer, ForeignKey("analyses.id"), nullable=False)
+    analysis_id = Column(Integer, ForeignKey("analyses.id"), nullable=False, index=True)
     contact_info = Column(JSON, nullable=True)
     skills = Column(JSON, nullable=True)  # Lista umiejętności
     experience = Column(JSON, nullable=True)  # Lista doświadczeń
@@ -52,7 +60,7 @@ class JobData(Base):
     __tablename__ = "job_data"
     
     id = Column(Integer, primary_key=True, index=True)
-    analysis_id = Column(Integer, ForeignKey("analyses.id"), nullable=False)
+    analysis_id = Column(Integer, ForeignKey("analyses.id"), nullable=False, index=True)
     job_title = Column(String(255), nullable=True)
     company = Column(String(255), nullable=True)
     required_skills = Column(JSON, nullable=True)  # Lista wymaganych umiejętności
@@ -70,7 +78,7 @@ class SkillMatch(Base):
     __tablename__ = "skill_matches"
     
     id = Column(Integer, primary_key=True, index=True)
-    analysis_id = Column(Integer, ForeignKey("analyses.id"), nullable=False)
+    analysis_id = Column(Integer, ForeignKey("analyses.id"), nullable=False, index=True)
     cv_skill = Column(String(255), nullable=False)
     job_skill = Column(String(255), nullable=False)
     similarity_score = Column(Float, nullable=False)  # Wartość od 0 do 1
@@ -85,10 +93,48 @@ class SectionScore(Base):
     __tablename__ = "section_scores"
     
     id = Column(Integer, primary_key=True, index=True)
-    analysis_id = Column(Integer, ForeignKey("analyses.id"), nullable=False)
+    analysis_id = Column(Integer, ForeignKey("analyses.id"), nullable=False, index=True)
     section_name = Column(String(50), nullable=False)  # np. "skills", "experience", "education"
     score = Column(Float, nullable=False)  # Wartość od 0 do 1
     weight = Column(Float, nullable=False)  # Waga sekcji w ogólnej ocenie
     
     # Relacje
     analysis = relationship("Analysis", back_populates="section_scores")
+
+class JobProfile(Base):
+    """
+    Model przetworzonego ogłoszenia o pracę wielokrotnego użytku.
+    Przechowuje wynik parsowania oraz embeddingi sekcji, aby kolejne analizy
+    względem tego samego ogłoszenia obliczały tylko stronę CV.
+    """
+    __tablename__ = "job_profiles"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    filename = Column(String(255), nullable=False)
+    job_title = Column(String(255), nullable=True)
+    company = Column(String(255), nullable=True)
+    required_skills = Column(JSON, nullable=True)  # Lista wymaganych umiejętności
+    responsibilities = Column(JSON, nullable=True)  # Lista obowiązków
+    qualifications = Column(JSON, nullable=True)  # Lista kwalifikacji
+    full_text = Column(Text, nullable=False)
+    model_name = Column(String(255), nullable=False)  # Model, którym obliczono embeddingi
+    embeddings = Column(LargeBinary, nullable=False)  # Embeddingi sekcji w formacie NPZ
+    section_weights = Column(JSON, nullable=True)  # Wagi sekcji analiz względem profilu (None - domyślne)
+    created_at = Column(DateTime, default=datetime.now)
+
+class AnalysisJob(Base):
+    """
+    Model zadania analizy wykonywanego asynchronicznie (trwała kolejka zadań w bazie danych).
+    Wynik zakończonego zadania jest zapisywany w tabelach analiz i wskazywany przez analysis_id.
+    """
+    __tablename__ = "analysis_jobs"
+    
+    id = Column(String(36), primary_key=True)
+    status = Column(String(20), nullable=False, index=True)  # queued, running, done, failed
+    payload = Column(JSON, nullable=False)  # Pliki i parametry analizy
+    attempts = Column(Integer, nullable=False, default=0)  # Liczba pobrań zadania przez workery
+    analysis_id = Column(Integer, ForeignKey("analyses.id"), nullable=True)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.now, index=True)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
@@ -0,0 +1,188 @@
+"""
+Moduł harmonogramu wnioskowania z mikro-batchowaniem.
+Zbiera żądania kodowania z równoległych analiz i przekazuje je do modelu
+jako jeden batch, gdy osiągnie on maksymalny rozmiar lub upłynie maksymalny czas oczekiwania.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+import asyncio
+
+import numpy as np
+
+from app.metrics import ENCODER_BATCH_SIZE
+
+
+class InferenceScheduler:
+    """
+    Harmonogram łączący żądania kodowania z wielu analiz w jeden batch modelu.
+    Działa w pętli zdarzeń asyncio; kodowanie odbywa się w dedykowanym wątku.
+    """
+
+    def __init__(self, model, max_batch_size: int = 64, max_wait_ms: float = 5.0):
+        """
+        Inicjalizacja harmonogramu.
+
+        Args:
+            model: Model SentenceTransformer (lub obiekt z metodą encode)
+            max_batch_size: Maksymalna liczba tekstów w jednym batchu
+            max_wait_ms: Maksymalny czas oczekiwania na dopełnienie batcha w milisekundach
+        """
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self._loop = None
+        self._queue = None
+        self._task = None
+        # Jeden wątek inferencji: kolejne batche nie konkurują o rdzenie CPU
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="inference")
+
+        # Statystyki batchowania
+        self.batches = 0
+        self.batched_texts = 0
+
+    @property
+    def running(self) -> bool:
+        """
+        Informuje, czy harmonogram przyjmuje żądania.
+        """
+        return self._task is not None and not self._task.done()
+
+    async def start(self):
+        """
+        Uruchamia pętlę zbierającą żądania w bieżącej pętli zdarzeń.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """
+        Zatrzymuje pętlę harmonogramu i wątek inferencji.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def submit(self, texts: List[str]) -> np.ndarray:
+        """
+        Dodaje teksty do kolejki i czeka na ich embeddingi.
+
+        Args:
+            texts: Lista tekstów do zakodowania
+
+        Returns:
+            np.ndarray: Macierz embeddingów w kolejności tekstów wejściowych
+        """
+        future = self._loop.create_future()
+        await self._queue.put((list(texts), future))
+        return await future
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """
+        Synchroniczny interfejs zgodny z SentenceTransformer.encode dla wątków puli analiz.
+        Gdy harmonogram nie działa, koduje teksty bezpośrednio modelem.
+
+        Args:
+            texts: Lista tekstów do zakodowania
+
+        Returns:
+            np.ndarray: Macierz embeddingów
+        """
+        if not texts or not self.running:
+            return np.asarray(self.model.encode(texts))
+
+        if self._in_loop_thread():
+            raise RuntimeError("InferenceScheduler.encode nie może być wywołane z wątku pętli zdarzeń; użyj submit()")
+
+        return asyncio.run_coroutine_threadsafe(self.submit(texts), self._loop).result()
+
+    def _in_loop_thread(self) -> bool:
+        """
+        Sprawdza, czy bieżący wątek wykonuje pętlę zdarzeń harmonogramu.
+        """
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    async def _run(self):
+        """
+        Główna pętla: zbiera żądania do batcha i przekazuje je do modelu.
+        """
+        while True:
+            items = [await self._queue.get()]
+            size = len(items[0][0])
+            deadline = self._loop.time() + self.max_wait
+
+            # Dopełnianie batcha do limitu rozmiaru lub czasu
+            while size < self.max_batch_size:
+                timeout = deadline - self._loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                items.append(item)
+                size += len(item[0])
+
+            await self._flush(items)
+
+    async def _flush(self, items: List):
+        """
+        Koduje zebrany batch i rozdziela wyniki między oczekujące żądania.
+
+        Args:
+            items: Lista par (teksty, future)
+        """
+        texts = [text for item_texts, _ in items for text in item_texts]
+
+        try:
+            embeddings = await self._loop.run_in_executor(self._executor, self._encode_batch, texts)
+        except Exception as e:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self.batches += 1
+        self.batched_texts += len(texts)
+        ENCODER_BATCH_SIZE.observe(len(texts))
+
+        offset = 0
+        for item_texts, future in items:
+            if not future.done():
+                future.set_result(embeddings[offset:offset + len(item_texts)])
+            offset += len(item_texts)
+
+    def _encode_batch(self, texts: List[str]) -> np.ndarray:
+        """
+        Wywołuje model dla całego batcha (w wątku inferencji).
+
+        Args:
+            texts: Teksty wszystkich żądań w batchu
+
+        Returns:
+            np.ndarray: Macierz embeddingów
+        """
+        return np.asarray(self.model.encode(texts, batch_size=self.max_batch_size))
+
+    def stats(self) -> Dict:
+        """
+        Zwraca statystyki batchowania.
+
+        Returns:
+            Dict: Liczba batchy i średni rozmiar batcha
+        """
+        return {
+            "batches": self.batches,
+            "texts": self.batched_texts,
+            "avg_batch_size": round(self.batched_texts / self.batches, 2) if self.batches else 0.0,
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000.0
+        }
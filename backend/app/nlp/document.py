@@ -0,0 +1,114 @@
+"""
+Moduł wspólnej normalizacji i tokenizacji tekstu dokumentu.
+Obiekt Document oblicza tekst małymi literami, tokeny z pozycjami znaków i terminy
+raz (przy pierwszym użyciu), a korzystają z nich wyszukiwanie umiejętności z taksonomii,
+TF-IDF pełnego tekstu i podświetlanie słów kluczowych. Dokument jest tworzony przez parser
+lub analizę i przekazywany jawnie - nie jest przechowywany między żądaniami.
+"""
+from functools import cached_property
+from typing import FrozenSet, List, Set, Tuple, Union
+import re
+
+# Token to ciąg znaków słowa (odpowiednik \b\w+\b)
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# Słowa pomijane w terminach dokumentu (TF-IDF i słowa kluczowe)
+STOP_WORDS = frozenset([
+    'i', 'oraz', 'w', 'na', 'z', 'do', 'dla', 'a', 'o', 'przez',
+    'się', 'jest', 'są', 'być', 'to', 'że'
+])
+
+# Minimalna długość terminu (jak domyślny token_pattern TfidfVectorizer: \b\w\w+\b)
+MIN_TERM_LENGTH = 2
+
+
+class Document:
+    """
+    Tekst dokumentu z wynikami normalizacji obliczanymi leniwie i zapamiętywanymi.
+    Pozycje tokenów są indeksami znaków w oryginalnym tekście.
+    """
+
+    def __init__(self, text: str):
+        """
+        Inicjalizacja dokumentu.
+
+        Args:
+            text: Pełny tekst dokumentu
+        """
+        self.text = text or ""
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    @cached_property
+    def lowered(self) -> str:
+        """
+        Tekst dokumentu małymi literami.
+        """
+        return self.text.lower()
+
+    @cached_property
+    def _offsets_valid(self) -> bool:
+        """
+        Czy pozycje w tekście małymi literami są pozycjami w oryginalnym tekście
+        (lower() może zmienić długość tekstu dla niektórych znaków Unicode).
+        """
+        return len(self.lowered) == len(self.text)
+
+    @cached_property
+    def tokens(self) -> List[str]:
+        """
+        Tokeny dokumentu małymi literami w kolejności wystąpienia.
+        """
+        if self._offsets_valid:
+            return TOKEN_PATTERN.findall(self.lowered)
+        return [token.lower() for token in TOKEN_PATTERN.findall(self.text)]
+
+    @cached_property
+    def offsets(self) -> List[Tuple[int, int]]:
+        """
+        Pozycje (początek, koniec) tokenów w tekście dokumentu (obliczane dopiero przy użyciu).
+        """
+        text = self.lowered if self._offsets_valid else self.text
+        return [match.span() for match in TOKEN_PATTERN.finditer(text)]
+
+    @cached_property
+    def terms(self) -> List[str]:
+        """
+        Terminy dokumentu: tokeny bez słów pomijanych i krótszych niż MIN_TERM_LENGTH.
+        """
+        return [token for token in self.tokens if len(token) >= MIN_TERM_LENGTH and token not in STOP_WORDS]
+
+    @cached_property
+    def term_set(self) -> FrozenSet[str]:
+        """
+        Zbiór unikalnych terminów dokumentu.
+        """
+        return frozenset(self.terms)
+
+    def spans(self, words: Set[str]) -> List[Tuple[int, int]]:
+        """
+        Zwraca pozycje wystąpień podanych tokenów w tekście dokumentu.
+
+        Args:
+            words: Zbiór tokenów (małymi literami)
+
+        Returns:
+            List[Tuple[int, int]]: Pozycje (początek, koniec) w kolejności wystąpienia
+        """
+        return [offset for token, offset in zip(self.tokens, self.offsets) if token in words]
+
+
+def as_document(text: Union[str, Document]) -> Document:
+    """
+    Zwraca obiekt Document dla tekstu (lub ten sam obiekt, jeśli nim jest).
+    """
+    return text if isinstance(text, Document) else Document(text)
+
+
+def document_terms(document: Union[str, Document]) -> List[str]:
+    """
+    Analizator TfidfVectorizer (analyzer=document_terms): terminy dokumentu.
+    Przyjmuje Document (terminy obliczone raz są używane ponownie) lub tekst.
+    """
+    return as_document(document).terms
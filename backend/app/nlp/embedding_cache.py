@@ -0,0 +1,250 @@
+"""
+Moduł pamięci podręcznej embeddingów zdań.
+Przechowuje wektory w ograniczonym cache LRU w pamięci oraz opcjonalnie
+w trwałej warstwie SQLite, aby powtarzające się teksty nie były kodowane ponownie.
+"""
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+import hashlib
+import os
+import sqlite3
+import threading
+import unicodedata
+
+import numpy as np
+
+from app.metrics import ENCODE_TEXTS
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalizuje tekst przed kodowaniem i wyznaczeniem klucza cache.
+
+    Args:
+        text: Tekst do normalizacji
+
+    Returns:
+        str: Tekst w postaci NFC z ujednoliconymi białymi znakami
+    """
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+class EmbeddingCache:
+    """
+    Dwupoziomowa pamięć podręczna embeddingów.
+    Kluczem jest skrót SHA-256 z nazwy modelu i znormalizowanego tekstu.
+    """
+
+    def __init__(self, model_name: str, max_entries: int = 50000, db_path: Optional[str] = None):
+        """
+        Inicjalizacja pamięci podręcznej.
+
+        Args:
+            model_name: Nazwa modelu, dla którego przechowywane są wektory
+            max_entries: Maksymalna liczba wektorów w pamięci (LRU)
+            db_path: Ścieżka do pliku SQLite z trwałą warstwą cache (opcjonalnie)
+        """
+        self.model_name = model_name
+        self.max_entries = max_entries
+        self.db_path = db_path
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = None
+
+        # Liczniki do dobierania rozmiaru cache
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if db_path:
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+            self._conn.commit()
+
+    def make_key(self, text: str) -> str:
+        """
+        Wyznacza klucz cache dla znormalizowanego tekstu.
+
+        Args:
+            text: Znormalizowany tekst
+
+        Returns:
+            str: Klucz cache
+        """
+        return hashlib.sha256(f"{self.model_name}\0{text}".encode("utf-8")).hexdigest()
+
+    def get_many(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Pobiera wektory dla podanych kluczy z pamięci, a następnie z dysku.
+
+        Args:
+            keys: Lista kluczy cache
+
+        Returns:
+            Dict[str, np.ndarray]: Znalezione wektory (brakujące klucze są pomijane)
+        """
+        found = {}
+        missing = []
+
+        with self._lock:
+            for key in keys:
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    found[key] = vector
+                    self.hits += 1
+                else:
+                    missing.append(key)
+
+            if missing and self._conn is not None:
+                for start in range(0, len(missing), 500):
+                    chunk = missing[start:start + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = self._conn.execute(
+                        f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", chunk
+                    ).fetchall()
+                    for key, blob in rows:
+                        vector = np.frombuffer(blob, dtype=np.float32)
+                        found[key] = vector
+                        self._remember(key, vector)
+                        self.disk_hits += 1
+
+            self.misses += len(set(missing) - found.keys())
+
+        return found
+
+    def put_many(self, items: Dict[str, np.ndarray]):
+        """
+        Zapisuje wektory w pamięci oraz w warstwie trwałej.
+
+        Args:
+            items: Słownik klucz -> wektor
+        """
+        if not items:
+            return
+
+        with self._lock:
+            for key, vector in items.items():
+                self._remember(key, np.asarray(vector, dtype=np.float32))
+
+            if self._conn is not None:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                    [(key, np.asarray(vector, dtype=np.float32).tobytes()) for key, vector in items.items()]
+                )
+                self._conn.commit()
+
+    def _remember(self, key: str, vector: np.ndarray):
+        """
+        Dodaje wektor do cache LRU w pamięci, usuwając najdawniej używane wpisy.
+
+        Args:
+            key: Klucz cache
+            vector: Wektor embeddingu
+        """
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self) -> Dict:
+        """
+        Zwraca statystyki działania cache.
+
+        Returns:
+            Dict: Liczniki trafień, chybień i rozmiar cache
+        """
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "model_name": self.model_name,
+                "entries": len(self._memory),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round((self.hits + self.disk_hits) / lookups, 4) if lookups else 0.0,
+                "persistent": self._conn is not None
+            }
+
+    def close(self):
+        """
+        Zamyka połączenie z warstwą trwałą.
+        """
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def cached_embeddings(texts: List[str], cache: Optional[EmbeddingCache] = None) -> Tuple[Dict[str, np.ndarray], List[str]]:
+    """
+    Wyszukuje w cache wektory znormalizowanych tekstów.
+
+    Args:
+        texts: Lista znormalizowanych tekstów
+        cache: Pamięć podręczna embeddingów (opcjonalnie)
+
+    Returns:
+        Tuple[Dict[str, np.ndarray], List[str]]: Znalezione wektory (tekst -> wektor)
+            i unikalne teksty, które trzeba zakodować modelem
+    """
+    unique = list(dict.fromkeys(texts))
+    if cache is None:
+        return {}, unique
+
+    keys = [cache.make_key(text) for text in unique]
+    found = cache.get_many(keys)
+    vectors = {text: found[key] for text, key in zip(unique, keys) if key in found}
+    return vectors, [text for text, key in zip(unique, keys) if key not in found]
+
+
+def store_embeddings(vectors: Dict[str, np.ndarray], cache: Optional[EmbeddingCache] = None):
+    """
+    Zapisuje w cache wektory zakodowanych tekstów.
+
+    Args:
+        vectors: Słownik znormalizowany tekst -> wektor
+        cache: Pamięć podręczna embeddingów (opcjonalnie)
+    """
+    if cache is not None and vectors:
+        cache.put_many({cache.make_key(text): vector for text, vector in vectors.items()})
+
+
+def encode_with_cache(model, texts: List[str], cache: Optional[EmbeddingCache] = None, encoded: Optional[Dict[str, np.ndarray]] = None) -> np.ndarray:
+    """
+    Koduje teksty modelem, pomijając te, których wektory są już w cache
+    lub zostały obliczone wcześniej (np. przez harmonogram w pętli zdarzeń).
+
+    Args:
+        model: Model SentenceTransformer (lub obiekt z metodą encode)
+        texts: Lista tekstów do zakodowania
+        cache: Pamięć podręczna embeddingów (opcjonalnie)
+        encoded: Wektory obliczone wcześniej (znormalizowany tekst -> wektor), opcjonalnie
+
+    Returns:
+        np.ndarray: Macierz embeddingów w kolejności tekstów wejściowych
+    """
+    normalized = [normalize_text(text) for text in texts]
+    if not normalized:
+        return np.zeros((0, 0), dtype=np.float32)
+
+    vectors = dict(encoded) if encoded else {}
+    found, pending = cached_embeddings([text for text in normalized if text not in vectors], cache)
+    vectors.update(found)
+
+    # Kodowanie tylko unikalnych tekstów, których brak w cache
+    if pending:
+        ENCODE_TEXTS.observe(len(pending))
+        computed = dict(zip(pending, np.asarray(model.encode(pending), dtype=np.float32)))
+        store_embeddings(computed, cache)
+        vectors.update(computed)
+
+    return np.vstack([vectors[text] for text in normalized])
@@ -0,0 +1,60 @@
+"""
+Moduł lekkiego kodera zastępczego, działającego bez modelu językowego.
+Słowa tekstu są haszowane do wektora o stałym wymiarze (feature hashing), więc koder nie wymaga
+pobierania wag ani bibliotek modelu. Służy do benchmarków i uruchomień offline
+(ENCODER_BACKEND=hashing) - podobieństwo wektorów odzwierciedla wspólne słowa, a nie znaczenie.
+"""
+from typing import List
+import re
+import zlib
+
+import numpy as np
+
+# Wzorzec słowa (litery, cyfry i podkreślenia, także znaki diakrytyczne)
+WORD_PATTERN = re.compile(r"\w+")
+
+
+class HashingSentenceEncoder:
+    """
+    Koder zgodny z interfejsem SentenceTransformer używanym przez RelevanceAnalyzer
+    (encode, get_sentence_embedding_dimension).
+    """
+
+    def __init__(self, dimension: int = 512):
+        """
+        Inicjalizacja kodera.
+
+        Args:
+            dimension: Wymiar embeddingów
+        """
+        self.dimension = dimension
+        # Nazwa przestrzeni embeddingów - wektory nie trafiają do cache i profili innych koderów
+        self.model_name = f"hashing-{dimension}"
+
+    def get_sentence_embedding_dimension(self) -> int:
+        """
+        Zwraca wymiar embeddingów.
+        """
+        return self.dimension
+
+    def encode(self, texts: List[str], batch_size: int = 32, **kwargs) -> np.ndarray:
+        """
+        Koduje teksty jako znormalizowane histogramy haszy słów.
+
+        Args:
+            texts: Lista tekstów do zakodowania
+            batch_size: Ignorowany - dla zgodności z SentenceTransformer.encode
+
+        Returns:
+            np.ndarray: Macierz embeddingów (float32)
+        """
+        if isinstance(texts, str):
+            texts = [texts]
+
+        embeddings = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for word in WORD_PATTERN.findall(text.lower()):
+                embeddings[row, zlib.crc32(word.encode("utf-8")) % self.dimension] += 1.0
+
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return embeddings / np.where(norms == 0, 1.0, norms)
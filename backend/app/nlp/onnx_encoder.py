@@ -0,0 +1,121 @@
+"""
+Moduł kodowania tekstów modelem wyeksportowanym do ONNX (scripts/export_onnx.py).
+Model (w tym pooling i warstwa Dense modelu SentenceTransformer) jest uruchamiany przez
+ONNX Runtime na CPU, zwykle w wersji skwantyzowanej do int8. Zależność opcjonalna:
+onnxruntime jest importowany dopiero przy tworzeniu kodera.
+"""
+from typing import List, Optional
+import json
+import os
+import threading
+
+import numpy as np
+
+# Plik z opisem eksportu zapisywany obok modelu
+ENCODER_CONFIG_FILE = "encoder.json"
+
+
+class OnnxSentenceEncoder:
+    """
+    Koder zgodny z interfejsem SentenceTransformer używanym przez RelevanceAnalyzer
+    (encode, get_sentence_embedding_dimension).
+    """
+
+    def __init__(self, model_dir: str, variant: Optional[str] = None, num_threads: int = 0):
+        """
+        Inicjalizacja kodera: wczytanie tokenizera i sesji ONNX Runtime.
+
+        Args:
+            model_dir: Katalog z eksportem (encoder.json, pliki .onnx i tokenizer)
+            variant: Wariant modelu, np. "int8" lub "fp32" (domyślnie wskazany w encoder.json)
+            num_threads: Liczba wątków obliczeń wewnątrz operatora (0 - domyślna ONNX Runtime)
+
+        Raises:
+            FileNotFoundError: Jeśli katalog nie zawiera eksportu modelu
+            ValueError: Jeśli eksport nie zawiera wskazanego wariantu
+        """
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+
+        config_path = os.path.join(model_dir, ENCODER_CONFIG_FILE)
+        if not os.path.exists(config_path):
+            raise FileNotFoundError(f"Brak eksportu modelu ONNX w katalogu: {model_dir} (scripts/export_onnx.py)")
+
+        with open(config_path, "r", encoding="utf-8") as f:
+            self.config = json.load(f)
+
+        self.variant = variant or self.config["default_variant"]
+        if self.variant not in self.config["variants"]:
+            raise ValueError(f"Eksport modelu ONNX nie zawiera wariantu: {self.variant}")
+        # Nazwa przestrzeni embeddingów - odróżnia wektory ONNX od wektorów PyTorch w cache i profilach
+        self.source_model = self.config["source_model"]
+        self.model_name = f"{self.source_model}+onnx-{self.variant}"
+        self.max_seq_length = self.config["max_seq_length"]
+
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        # Szybki tokenizer zmienia ustawienia dopełniania przy każdym wywołaniu - nie jest bezpieczny
+        # dla wątków; sesja ONNX Runtime może być używana równolegle
+        self._tokenizer_lock = threading.Lock()
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+        self.session = ort.InferenceSession(
+            os.path.join(model_dir, self.config["variants"][self.variant]),
+            sess_options=options,
+            providers=["CPUExecutionProvider"]
+        )
+        self._input_names = [model_input.name for model_input in self.session.get_inputs()]
+
+    def get_sentence_embedding_dimension(self) -> int:
+        """
+        Zwraca wymiar embeddingów.
+        """
+        return self.config["dimension"]
+
+    def _run(self, texts: List[str]) -> np.ndarray:
+        """
+        Koduje jeden batch tekstów.
+
+        Args:
+            texts: Teksty do zakodowania
+
+        Returns:
+            np.ndarray: Macierz embeddingów
+        """
+        with self._tokenizer_lock:
+            encoded = self.tokenizer(
+                texts,
+                padding=True,
+                truncation=True,
+                max_length=self.max_seq_length,
+                return_tensors="np"
+            )
+        feed = {name: encoded[name].astype(np.int64) for name in self._input_names}
+        return self.session.run(None, feed)[0]
+
+    def encode(self, texts: List[str], batch_size: int = 32, **kwargs) -> np.ndarray:
+        """
+        Koduje teksty w batchach. Teksty są sortowane według długości, aby ograniczyć
+        dopełnianie sekwencji w batchu; wynik zachowuje kolejność wejściową.
+
+        Args:
+            texts: Lista tekstów do zakodowania
+            batch_size: Liczba tekstów w jednym uruchomieniu modelu
+
+        Returns:
+            np.ndarray: Macierz embeddingów (float32)
+        """
+        if isinstance(texts, str):
+            texts = [texts]
+        if not texts:
+            return np.zeros((0, self.get_sentence_embedding_dimension()), dtype=np.float32)
+
+        order = np.argsort([-len(text) for text in texts], kind="stable")
+        embeddings = np.zeros((len(texts), self.get_sentence_embedding_dimension()), dtype=np.float32)
+        for start in range(0, len(texts), batch_size):
+            batch = order[start:start + batch_size]
+            embeddings[batch] = self._run([texts[i] for i in batch])
+
+        return embeddings
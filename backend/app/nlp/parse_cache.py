@@ -0,0 +1,227 @@
+"""
+Moduł pamięci podręcznej wyników parsowania dokumentów.
+Wyniki CVParser.parse_cv i JobDescriptionParser.parse_job_description są
+przechowywane według skrótu SHA-256 treści pliku, jego rozszerzenia i wersji parsera, więc
+ponowne przesłanie tego samego pliku nie wymaga ekstrakcji tekstu ani analizy regex.
+"""
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+import json
+import os
+import sqlite3
+import threading
+import time
+
+# Co ile zapisów liczba wpisów warstwy trwałej jest odczytywana z bazy (COUNT) - między
+# odczytami jest prowadzona lokalnie, a plik mogą współdzielić inne procesy
+DISK_RECOUNT_INTERVAL = 1000
+
+# Co ile sekund trafienie w warstwę trwałą odświeża czas użycia wpisu - częstsze odświeżanie
+# zajmowałoby blokadę zapisu bazy przy każdym odczycie (kolejność usuwania jest przybliżona)
+DISK_TOUCH_INTERVAL = 300
+
+
+class ParseCache:
+    """
+    Dwupoziomowa pamięć podręczna wyników parsowania.
+    Warstwa w pamięci jest ograniczona liczbą wpisów (LRU), a opcjonalna warstwa
+    SQLite - maksymalną liczbą wpisów, z usuwaniem najdawniej używanych.
+    """
+
+    def __init__(self, max_entries: int = 1024, db_path: Optional[str] = None, max_disk_entries: int = 100000):
+        """
+        Inicjalizacja pamięci podręcznej.
+
+        Args:
+            max_entries: Maksymalna liczba wyników w pamięci (LRU)
+            db_path: Ścieżka do pliku SQLite z trwałą warstwą cache (opcjonalnie)
+            max_disk_entries: Maksymalna liczba wyników w warstwie trwałej
+        """
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = None
+        # Liczba wpisów warstwy trwałej i zapisy od ostatniego COUNT
+        self._disk_entries = 0
+        self._writes_since_count = 0
+
+        # Liczniki do dobierania rozmiaru cache
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if db_path:
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS parse_results "
+                "(key TEXT PRIMARY KEY, result TEXT NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_parse_results_accessed_at ON parse_results (accessed_at)"
+            )
+            self._conn.commit()
+            self._disk_entries = self._count_disk_entries()
+
+    @staticmethod
+    def make_key(kind: str, filename: str, parser_version: str) -> str:
+        """
+        Wyznacza klucz cache.
+
+        Args:
+            kind: Rodzaj dokumentu ("cv" lub "job")
+            filename: Nazwa pliku ze skrótem SHA-256 treści i rozszerzeniem (parser wybiera
+                metodę ekstrakcji według rozszerzenia)
+            parser_version: Wersja parsera
+
+        Returns:
+            str: Klucz cache
+        """
+        return f"{kind}:{parser_version}:{filename}"
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Pobiera wynik parsowania z pamięci lub z dysku.
+
+        Args:
+            key: Klucz cache
+
+        Returns:
+            Optional[Dict]: Kopia zapisanego wyniku lub None
+        """
+        with self._lock:
+            payload = self._memory.get(key)
+            if payload is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return json.loads(payload)
+
+            if self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT result, accessed_at FROM parse_results WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    now = time.time()
+                    if now - row[1] >= DISK_TOUCH_INTERVAL:
+                        self._conn.execute("UPDATE parse_results SET accessed_at = ? WHERE key = ?", (now, key))
+                        self._conn.commit()
+                    self._remember(key, row[0])
+                    self.disk_hits += 1
+                    return json.loads(row[0])
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, result: Dict):
+        """
+        Zapisuje wynik parsowania w pamięci i w warstwie trwałej.
+
+        Args:
+            key: Klucz cache
+            result: Wynik parsowania (serializowalny do JSON)
+        """
+        payload = json.dumps(result, ensure_ascii=False)
+
+        with self._lock:
+            self._remember(key, payload)
+
+            if self._conn is not None:
+                now = time.time()
+                inserted = self._conn.execute(
+                    "INSERT OR IGNORE INTO parse_results (key, result, accessed_at) VALUES (?, ?, ?)",
+                    (key, payload, now)
+                ).rowcount
+                if inserted:
+                    self._disk_entries += 1
+                else:
+                    self._conn.execute(
+                        "UPDATE parse_results SET result = ?, accessed_at = ? WHERE key = ?",
+                        (payload, now, key)
+                    )
+
+                self._writes_since_count += 1
+                if self._writes_since_count >= DISK_RECOUNT_INTERVAL:
+                    self._disk_entries = self._count_disk_entries()
+
+                # Usuwanie najdawniej używanych wpisów po przekroczeniu limitu
+                if self._disk_entries > self.max_disk_entries:
+                    deleted = self._conn.execute(
+                        "DELETE FROM parse_results WHERE key IN "
+                        "(SELECT key FROM parse_results ORDER BY accessed_at LIMIT ?)",
+                        (self._disk_entries - self.max_disk_entries,)
+                    ).rowcount
+                    self._disk_entries -= deleted
+                self._conn.commit()
+
+    def get_or_parse(self, key: str, parse: Callable[[], Dict]) -> Dict:
+        """
+        Zwraca wynik z cache lub wykonuje parsowanie i zapisuje jego wynik.
+
+        Args:
+            key: Klucz cache
+            parse: Funkcja wykonująca parsowanie
+
+        Returns:
+            Dict: Wynik parsowania
+        """
+        result = self.get(key)
+        if result is None:
+            result = parse()
+            self.put(key, result)
+        return result
+
+    def _count_disk_entries(self) -> int:
+        """
+        Odczytuje liczbę wpisów warstwy trwałej (także zapisanych przez inne procesy).
+
+        Returns:
+            int: Liczba wpisów w tabeli parse_results
+        """
+        self._writes_since_count = 0
+        return self._conn.execute("SELECT COUNT(*) FROM parse_results").fetchone()[0]
+
+    def _remember(self, key: str, payload: str):
+        """
+        Dodaje wynik do cache LRU w pamięci, usuwając najdawniej używane wpisy.
+
+        Args:
+            key: Klucz cache
+            payload: Wynik zserializowany do JSON
+        """
+        self._memory[key] = payload
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self) -> Dict:
+        """
+        Zwraca statystyki działania cache.
+
+        Returns:
+            Dict: Liczniki trafień, chybień i rozmiar cache
+        """
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "entries": len(self._memory),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round((self.hits + self.disk_hits) / lookups, 4) if lookups else 0.0,
+                "persistent": self._conn is not None
+            }
+
+    def close(self):
+        """
+        Zamyka połączenie z warstwą trwałą.
+        """
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -4,10 +4,91 @@ Obsługuje formaty PDF, DOCX i TXT.
 """
 import os
 import re
-from typing import Dict, List, Optional, Tuple
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
 
-import pdfplumber
-from docx import Document
+import pypdfium2 as pdfium
+
+from app.metrics import timed
+from app.nlp.document import Document
+from app.nlp.sections import SectionSegmenter, section_text
+from app.nlp.skill_matcher import get_skill_matcher
+
+# Wersja logiki parsowania - należy ją zmienić przy każdej zmianie wyników ekstrakcji,
+# aby unieważnić zapisane w cache wyniki parsowania
+PARSER_VERSION = "5"
+
+# Silnik ekstrakcji tekstu z PDF: "fast" (pypdfium2, sam tekst bez analizy układu strony),
+# "pdfplumber" (pełna analiza układu) lub "auto" (fast z przejściem na pdfplumber,
+# gdy tekst wygląda na niepełny lub zniekształcony)
+PDF_ENGINES = ("auto", "fast", "pdfplumber")
+PDF_ENGINE = os.getenv("PDF_ENGINE", "auto")
+
+# Progi heurystyki trybu "auto"
+PDF_FAST_MIN_CHARS_PER_PAGE = 40
+PDF_FAST_MAX_REPLACEMENT_RATIO = 0.01
+PDF_FAST_MAX_GLUED_WORD_RATIO = 0.05
+# Próbka tekstu szybkiego silnika oceniana heurystyką trybu "auto" (pierwsze strony
+# do wyczerpania limitu stron lub znaków); reszta dokumentu jest przekazywana strumieniowo
+PDF_AUTO_SAMPLE_PAGES = 3
+PDF_AUTO_SAMPLE_CHARS = 20000
+
+# Limity ekstrakcji z PDF (0 - bez limitu): liczba stron i znaków tekstu są przycinane
+# deterministycznie (wynik trafia do cache), przekroczenie czasu przerywa ekstrakcję błędem
+PDF_MAX_PAGES = int(os.getenv("PDF_MAX_PAGES", "0"))
+PDF_MAX_CHARS = int(os.getenv("PDF_MAX_CHARS", "0"))
+PDF_MAX_SECONDS = float(os.getenv("PDF_MAX_SECONDS", "0"))
+
+# Słowa kluczowe nagłówków sekcji (sekcja -> grupy alternatyw w kolejności priorytetu)
+CV_SECTION_HEADINGS = {
+    "skills": [r'umiejętności|skills|kompetencje|technologie|languages|języki|narzędzia|tools'],
+    "experience": [r'doświadczenie|experience|zatrudnienie|praca|employment|career'],
+    "education": [r'edukacja|education|wykształcenie|studia|szkoła|university|college']
+}
+JOB_SECTION_HEADINGS = {
+    "required_skills": [
+        r'wymagania|requirements|umiejętności|skills|kwalifikacje|qualifications',
+        r'oczekujemy|we expect|we require'
+    ],
+    "responsibilities": [
+        r'obowiązki|responsibilities|zadania|tasks|zakres obowiązków',
+        r'będziesz odpowiedzialny za|you will be responsible for'
+    ],
+    "qualifications": [
+        r'kwalifikacje|qualifications|wykształcenie|education',
+        r'wymagane doświadczenie|required experience'
+    ]
+}
+
+# Wzorzec zakresu dat pozycji doświadczenia i wykształcenia
+DATE_PATTERN = re.compile(
+    r'\b(0?[1-9]|1[0-2])/\d{4}\s*-\s*(0?[1-9]|1[0-2])/\d{4}|\d{4}\s*-\s*\d{4}|\d{4}\s*-\s*(obecnie|present)',
+    re.IGNORECASE
+)
+
+
+def needs_layout_analysis(pages: List[str]) -> bool:
+    """
+    Ocenia, czy tekst z szybkiego silnika wymaga ponownej ekstrakcji przez pdfplumber.
+    Sprawdzane są: zbyt mało tekstu na stronę, znaki zastępcze (brak mapowania fontu
+    na Unicode) oraz sklejone słowa (brak odstępów między wyrazami).
+    
+    Args:
+        pages: Tekst kolejnych stron
+        
+    Returns:
+        bool: True, jeśli należy użyć pdfplumber
+    """
+    text = "".join(pages)
+    if not pages or len(text.strip()) < PDF_FAST_MIN_CHARS_PER_PAGE * len(pages):
+        return True
+    
+    if text.count("\ufffd") > PDF_FAST_MAX_REPLACEMENT_RATIO * len(text):
+        return True
+    
+    words = text.split()
+    glued = sum(1 for word in words if len(word) > 30)
+    return glued > PDF_FAST_MAX_GLUED_WORD_RATIO * len(words)
 
 
 class DocumentParser:
@@ -15,16 +96,36 @@ class DocumentParser:
     Klasa do ekstrakcji treści z dokumentów w różnych formatach.
     """
     
-    def __init__(self, file_path: str):
+    # Podział na sekcje właściwy dla rodzaju dokumentu (ustawiany w klasach pochodnych)
+    segmenter: Optional[SectionSegmenter] = None
+    
+    def __init__(self, file_path: str, pdf_engine: Optional[str] = None):
         """
         Inicjalizacja parsera dokumentów.
         
         Args:
             file_path: Ścieżka do pliku dokumentu
+            pdf_engine: Silnik ekstrakcji PDF (domyślnie PDF_ENGINE)
+        
+        Raises:
+            ValueError: Jeśli silnik ekstrakcji PDF nie jest obsługiwany
         """
         self.file_path = file_path
         self.file_extension = os.path.splitext(file_path)[1].lower()
+        self.pdf_engine = pdf_engine or PDF_ENGINE
+        if self.pdf_engine not in PDF_ENGINES:
+            raise ValueError(f"Nieobsługiwany silnik ekstrakcji PDF: {self.pdf_engine}")
+        # Silnik faktycznie użyty do ekstrakcji (w trybie "auto" wybierany heurystycznie)
+        self.pdf_engine_used = None
+        self.pdf_max_pages = PDF_MAX_PAGES
+        self.pdf_max_chars = PDF_MAX_CHARS
+        self.pdf_max_seconds = PDF_MAX_SECONDS
+        # Czy tekst PDF przycięto limitem stron lub znaków
+        self.pdf_truncated = False
         self.content = ""
+        # Tokenizowany pełny tekst (wspólny dla wyszukiwania umiejętności i analizy)
+        self.document = Document("")
+        # Zakresy sekcji w treści dokumentu (sekcja -> początek, koniec)
         self.sections = {}
     
     def extract_content(self) -> str:
@@ -37,34 +138,201 @@ class DocumentParser:
         Raises:
             ValueError: Jeśli format pliku nie jest obsługiwany
         """
-        if self.file_extension == '.pdf':
-            self.content = self._extract_from_pdf()
-        elif self.file_extension == '.docx':
-            self.content = self._extract_from_docx()
-        elif self.file_extension == '.txt':
-            self.content = self._extract_from_txt()
-        else:
-            raise ValueError(f"Nieobsługiwany format pliku: {self.file_extension}")
-        
+        with timed("extract", self.file_extension.lstrip('.')):
+            if self.file_extension == '.pdf':
+                self.content = self._extract_from_pdf()
+            elif self.file_extension == '.docx':
+                self.content = self._extract_from_docx()
+            elif self.file_extension == '.txt':
+                self.content = self._extract_from_txt()
+            else:
+                raise ValueError(f"Nieobsługiwany format pliku: {self.file_extension}")
+        
+        self.document = Document(self.content)
         return self.content
     
+    def index_sections(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Wyznacza zakresy sekcji dokumentu w jednym przebiegu po treści.
+        
+        Returns:
+            Dict[str, Tuple[int, int]]: Sekcja -> (początek, koniec) treści sekcji
+        """
+        self.sections = self.segmenter.segment(self.content) if self.segmenter else {}
+        return self.sections
+    
+    def _section_text(self, section: str, stop_at_blank_line: bool = False) -> Optional[str]:
+        """
+        Zwraca treść sekcji z indeksu wyznaczonego przez index_sections.
+        
+        Args:
+            section: Nazwa sekcji
+            stop_at_blank_line: Czy obciąć sekcję na pierwszej pustej linii
+            
+        Returns:
+            Optional[str]: Treść sekcji lub None, jeśli dokument jej nie zawiera
+        """
+        return section_text(self.content, self.sections.get(section), stop_at_blank_line)
+    
     def _extract_from_pdf(self) -> str:
         """
-        Ekstrahuje tekst z pliku PDF.
+        Ekstrahuje tekst z pliku PDF wybranym silnikiem.
         
         Returns:
             str: Tekst z pliku PDF
         """
-        text = ""
+        return "".join(page + "\n" for page in self.iter_pdf_pages())
+    
+    def iter_pdf_pages(self) -> Iterator[str]:
+        """
+        Zwraca tekst kolejnych stron PDF w miarę ekstrakcji (z limitami stron, znaków i czasu).
+        Strona jest zwalniana po odczytaniu tekstu, więc pamięć nie rośnie z liczbą stron
+        dokumentu. W trybie "auto" silnik jest wybierany na podstawie próbki pierwszych stron
+        (PDF_AUTO_SAMPLE_PAGES, PDF_AUTO_SAMPLE_CHARS), a pozostałe strony są przekazywane
+        strumieniowo bez buforowania.
+        
+        Limit czasu jest sprawdzany między stronami: ekstrakcja pojedynczej strony nie jest
+        przerywana, więc czas może zostać przekroczony o czas przetwarzania jednej strony.
+        
+        Returns:
+            Iterator[str]: Tekst kolejnych stron
+        
+        Raises:
+            Exception: Jeśli ekstrakcja się nie powiodła lub przekroczyła limit czasu
+        """
+        self.pdf_truncated = False
+        deadline = time.monotonic() + self.pdf_max_seconds if self.pdf_max_seconds > 0 else None
+        
+        if self.pdf_engine == "pdfplumber":
+            self.pdf_engine_used = "pdfplumber"
+            yield from self._limit_pages(self._iter_pages_pdfplumber(), deadline)
+            return
+        
+        self.pdf_engine_used = "fast"
+        pages = self._limit_pages(self._iter_pages_fast(), deadline)
+        if self.pdf_engine == "fast":
+            yield from pages
+            return
+        
         try:
-            with pdfplumber.open(self.file_path) as pdf:
-                for page in pdf.pages:
-                    text += page.extract_text() or ""
-                    text += "\n"
+            sample = self._sample_pages(pages)
+            if needs_layout_analysis(sample):
+                pages.close()
+                self.pdf_truncated = False
+                self.pdf_engine_used = "pdfplumber"
+                yield from self._limit_pages(self._iter_pages_pdfplumber(), deadline)
+                return
+            
+            yield from sample
+            yield from pages
+        finally:
+            # Zamknięcie szybkiego silnika także przy przerwaniu odczytu próbki
+            pages.close()
+    
+    def _sample_pages(self, pages: Iterator[str]) -> List[str]:
+        """
+        Odczytuje pierwsze strony do oceny heurystyki trybu "auto".
+        
+        Args:
+            pages: Tekst kolejnych stron z szybkiego silnika
+        
+        Returns:
+            List[str]: Tekst stron próbki (do PDF_AUTO_SAMPLE_PAGES stron lub PDF_AUTO_SAMPLE_CHARS znaków)
+        """
+        sample = []
+        chars = 0
+        while len(sample) < PDF_AUTO_SAMPLE_PAGES and chars < PDF_AUTO_SAMPLE_CHARS:
+            text = next(pages, None)
+            if text is None:
+                break
+            sample.append(text)
+            chars += len(text)
+        return sample
+    
+    def _limit_pages(self, pages: Iterator[str], deadline: Optional[float]) -> Iterator[str]:
+        """
+        Przepuszcza tekst stron z limitem znaków i czasu (limit stron stosują silniki).
+        
+        Args:
+            pages: Tekst kolejnych stron z silnika ekstrakcji
+            deadline: Chwila (time.monotonic) przekroczenia limitu czasu lub None
+        
+        Returns:
+            Iterator[str]: Tekst kolejnych stron (ostatnia strona przycięta do limitu znaków)
+        
+        Raises:
+            Exception: Jeśli ekstrakcja przekroczyła limit czasu
+        """
+        remaining = self.pdf_max_chars
+        try:
+            for text in pages:
+                if deadline is not None and time.monotonic() > deadline:
+                    raise Exception(f"Błąd podczas ekstrakcji tekstu z PDF: przekroczono limit czasu {self.pdf_max_seconds:g} s")
+                if self.pdf_max_chars > 0:
+                    if len(text) >= remaining:
+                        self.pdf_truncated = True
+                        yield text[:remaining]
+                        return
+                    remaining -= len(text)
+                yield text
+        finally:
+            # Zamknięcie silnika zwalnia dokument także przy przerwaniu ekstrakcji
+            pages.close()
+    
+    def _page_count(self, total: int) -> int:
+        """
+        Zwraca liczbę stron do ekstrakcji z uwzględnieniem limitu stron.
+        """
+        if self.pdf_max_pages > 0 and total > self.pdf_max_pages:
+            self.pdf_truncated = True
+            return self.pdf_max_pages
+        return total
+    
+    def _iter_pages_fast(self) -> Iterator[str]:
+        """
+        Ekstrahuje tekst stron PDF przez pypdfium2 (warstwa tekstowa bez analizy układu).
+        
+        Returns:
+            Iterator[str]: Tekst kolejnych stron
+        """
+        try:
+            pdf = pdfium.PdfDocument(self.file_path)
+            try:
+                for index in range(self._page_count(len(pdf))):
+                    page = pdf[index]
+                    textpage = page.get_textpage()
+                    text = textpage.get_text_range()
+                    textpage.close()
+                    page.close()
+                    # PDFium rozdziela linie znakami CRLF
+                    yield text.replace("\r\n", "\n").replace("\r", "\n")
+            finally:
+                pdf.close()
         except Exception as e:
             raise Exception(f"Błąd podczas ekstrakcji tekstu z PDF: {str(e)}")
+    
+    def _iter_pages_pdfplumber(self) -> Iterator[str]:
+        """
+        Ekstrahuje tekst stron PDF przez pdfplumber (pełna analiza układu strony).
         
-        return text
+        Returns:
+            Iterator[str]: Tekst kolejnych stron
+        """
+        # Import przy pierwszym użyciu - silnik zapasowy nie wydłuża startu aplikacji
+        import pdfplumber
+        
+        try:
+            with pdfplumber.open(self.file_path) as pdf:
+                for index in range(self._page_count(len(pdf.pages))):
+                    page = pdf.pages[index]
+                    text = page.extract_text() or ""
+                    # Zwolnienie obiektów układu strony (znaki, linie, mapa tekstu) zapamiętanych
+                    # przez pdfplumber (odpowiednik Page.close z nowszych wersji)
+                    page.flush_cache()
+                    page.get_textmap.cache_clear()
+                    yield text
+        except Exception as e:
+            raise Exception(f"Błąd podczas ekstrakcji tekstu z PDF: {str(e)}")
     
     def _extract_from_docx(self) -> str:
         """
@@ -73,6 +341,8 @@ class DocumentParser:
         Returns:
             str: Tekst z pliku DOCX
         """
+        from docx import Document
+        
         text = ""
         try:
             doc = Document(self.file_path)
@@ -110,14 +380,17 @@ class CVParser(DocumentParser):
     Dziedziczy po DocumentParser i dodaje funkcje specyficzne dla CV.
     """
     
-    def __init__(self, file_path: str):
+    segmenter = SectionSegmenter(CV_SECTION_HEADINGS)
+    
+    def __init__(self, file_path: str, pdf_engine: Optional[str] = None):
         """
         Inicjalizacja parsera CV.
         
         Args:
             file_path: Ścieżka do pliku CV
+            pdf_engine: Silnik ekstrakcji PDF (domyślnie PDF_ENGINE)
         """
-        super().__init__(file_path)
+        super().__init__(file_path, pdf_engine)
         self.contact_info = {}
         self.skills = []
         self.experience = []
@@ -133,11 +406,13 @@ class CVParser(DocumentParser):
         # Najpierw ekstrahujemy pełną treść
         self.extract_content()
         
-        # Następnie identyfikujemy i ekstrahujemy poszczególne sekcje
-        self._extract_contact_info()
-        self._extract_skills()
-        self._extract_experience()
-        self._extract_education()
+        # Następnie wyznaczamy zakresy sekcji (jeden przebieg) i ekstrahujemy ich treść
+        with timed("sections", self.file_extension.lstrip('.')):
+            self.index_sections()
+            self._extract_contact_info()
+            self._extract_skills()
+            self._extract_experience()
+            self._extract_education()
         
         return {
             "contact_info": self.contact_info,
@@ -178,18 +453,8 @@ class CVParser(DocumentParser):
         """
         Ekstrahuje umiejętności z CV.
         """
-        # Identyfikacja sekcji umiejętności
-        skill_section_patterns = [
-            r'(?i)umiejętności|skills|kompetencje|technologie|languages|języki|narzędzia|tools'
-        ]
-        
-        # Próba znalezienia sekcji umiejętności
-        skill_section = None
-        for pattern in skill_section_patterns:
-            match = re.search(f"({pattern}).*?(\n|$)(.*?)(\n\n|\Z)", self.content, re.DOTALL)
-            if match:
-                skill_section = match.group(3)
-                break
+        # Sekcja umiejętności kończy się na pierwszej pustej linii
+        skill_section = self._section_text("skills", stop_at_blank_line=True)
         
         if skill_section:
             # Wyodrębnienie umiejętności z sekcji
@@ -197,33 +462,15 @@ class CVParser(DocumentParser):
             skills_raw = re.split(r'[,;•\n]', skill_section)
             self.skills = [skill.strip() for skill in skills_raw if skill.strip()]
         else:
-            # Jeśli nie znaleziono dedykowanej sekcji, próbujemy wyodrębnić popularne umiejętności
-            common_skills = [
-                "Python", "Java", "JavaScript", "TypeScript", "C#", "C++", "SQL", "HTML", "CSS",
-                "React", "Angular", "Vue", "Node.js", "Django", "Flask", "Spring", "ASP.NET",
-                "Docker", "Kubernetes", "AWS", "Azure", "GCP", "Git", "CI/CD", "Agile", "Scrum"
-            ]
-            
-            for skill in common_skills:
-                if re.search(r'\b' + re.escape(skill) + r'\b', self.content, re.IGNORECASE):
-                    self.skills.append(skill)
+            # Jeśli nie znaleziono dedykowanej sekcji, wyszukujemy umiejętności z taksonomii
+            # (jeden przebieg automatu Aho-Corasick niezależnie od rozmiaru słownika)
+            self.skills = get_skill_matcher().extract(self.document)
     
     def _extract_experience(self):
         """
         Ekstrahuje doświadczenie zawodowe z CV.
         """
-        # Identyfikacja sekcji doświadczenia
-        exp_section_patterns = [
-            r'(?i)doświadczenie|experience|zatrudnienie|praca|employment|career'
-        ]
-        
-        # Próba znalezienia sekcji doświadczenia
-        exp_section = None
-        for pattern in exp_section_patterns:
-            match = re.search(f"({pattern}).*?(\n|$)(.*?)(\n\n\n|\Z)", self.content, re.DOTALL)
-            if match:
-                exp_section = match.group(3)
-                break
+        exp_section = self._section_text("experience")
         
         if exp_section:
             # Podział na poszczególne pozycje (uproszczona metoda)
@@ -239,8 +486,7 @@ class CVParser(DocumentParser):
                         company = lines[1].strip()
                         
                         # Próba wyodrębnienia dat
-                        date_pattern = r'\b(0?[1-9]|1[0-2])/\d{4}\s*-\s*(0?[1-9]|1[0-2])/\d{4}|\d{4}\s*-\s*\d{4}|\d{4}\s*-\s*(obecnie|present)'
-                        date_match = re.search(date_pattern, entry, re.IGNORECASE)
+                        date_match = DATE_PATTERN.search(entry)
                         dates = date_match.group(0) if date_match else ""
                         
                         # Opis stanowiska
@@ -257,18 +503,7 @@ class CVParser(DocumentParser):
         """
         Ekstrahuje wykształcenie z CV.
         """
-        # Identyfikacja sekcji wykształcenia
-        edu_section_patterns = [
-            r'(?i)edukacja|education|wykształcenie|studia|szkoła|university|college'
-        ]
-        
-        # Próba znalezienia sekcji wykształcenia
-        edu_section = None
-        for pattern in edu_section_patterns:
-            match = re.search(f"({pattern}).*?(\n|$)(.*?)(\n\n\n|\Z)", self.content, re.DOTALL)
-            if match:
-                edu_section = match.group(3)
-                break
+        edu_section = self._section_text("education")
         
         if edu_section:
             # Podział na poszczególne pozycje (uproszczona metoda)
@@ -283,8 +518,7 @@ class CVParser(DocumentParser):
                         institution = lines[1].strip()
                         
                         # Próba wyodrębnienia dat
-                        date_pattern = r'\b(0?[1-9]|1[0-2])/\d{4}\s*-\s*(0?[1-9]|1[0-2])/\d{4}|\d{4}\s*-\s*\d{4}|\d{4}\s*-\s*(obecnie|present)'
-                        date_match = re.search(date_pattern, entry, re.IGNORECASE)
+                        date_match = DATE_PATTERN.search(entry)
                         dates = date_match.group(0) if date_match else ""
                         
                         self.education.append({
@@ -300,14 +534,17 @@ class JobDescriptionParser(DocumentParser):
     Dziedziczy po DocumentParser i dodaje funkcje specyficzne dla ogłoszeń.
     """
     
-    def __init__(self, file_path: str):
+    segmenter = SectionSegmenter(JOB_SECTION_HEADINGS)
+    
+    def __init__(self, file_path: str, pdf_engine: Optional[str] = None):
         """
         Inicjalizacja parsera ogłoszeń o pracę.
         
         Args:
             file_path: Ścieżka do pliku ogłoszenia
+            pdf_engine: Silnik ekstrakcji PDF (domyślnie PDF_ENGINE)
         """
-        super().__init__(file_path)
+        super().__init__(file_path, pdf_engine)
         self.job_title = ""
         self.company = ""
         self.required_skills = []
@@ -324,12 +561,14 @@ class JobDescriptionParser(DocumentParser):
         # Najpierw ekstrahujemy pełną treść
         self.extract_content()
         
-        # Następnie identyfikujemy i ekstrahujemy poszczególne sekcje
-        self._extract_job_title()
-        self._extract_company()
-        self._extract_required_skills()
-        self._extract_responsibilities()
-        self._extract_qualifications()
+        # Następnie wyznaczamy zakresy sekcji (jeden przebieg) i ekstrahujemy ich treść
+        with timed("sections", self.file_extension.lstrip('.')):
+            self.index_sections()
+            self._extract_job_title()
+            self._extract_company()
+            self._extract_required_skills()
+            self._extract_responsibilities()
+            self._extract_qualifications()
         
         return {
             "job_title": self.job_title,
@@ -374,19 +613,7 @@ class JobDescriptionParser(DocumentParser):
         """
         Ekstrahuje wymagane umiejętności z ogłoszenia.
         """
-        # Identyfikacja sekcji wymaganych umiejętności
-        skill_section_patterns = [
-            r'(?i)wymagania|requirements|umiejętności|skills|kwalifikacje|qualifications',
-            r'(?i)oczekujemy|we expect|we require'
-        ]
-        
-        # Próba znalezienia sekcji umiejętności
-        skill_section = None
-        for pattern in skill_section_patterns:
-            match = re.search(f"({pattern}).*?(\n|$)(.*?)(\n\n|\Z)", self.content, re.DOTALL)
-            if match:
-                skill_section = match.group(3)
-                break
+        skill_section = self._section_text("required_skills", stop_at_blank_line=True)
         
         if skill_section:
             # Wyodrębnienie umiejętności z sekcji
@@ -398,19 +625,7 @@ class JobDescriptionParser(DocumentParser):
         """
         Ekstrahuje obowiązki z ogłoszenia.
         """
-        # Identyfikacja sekcji obowiązków
-        resp_section_patterns = [
-            r'(?i)obowiązki|responsibilities|zadania|tasks|zakres obowiązków',
-            r'(?i)będziesz odpowiedzialny za|you will be responsible for'
-        ]
-        
-        # Próba znalezienia sekcji obowiązków
-        resp_section = None
-        for pattern in resp_section_patterns:
-            match = re.search(f"({pattern}).*?(\n|$)(.*?)(\n\n|\Z)", self.content, re.DOTALL)
-            if match:
-                resp_section = match.group(3)
-                break
+        resp_section = self._section_text("responsibilities", stop_at_blank_line=True)
         
         if resp_section:
             # Wyodrębnienie obowiązków z sekcji
@@ -421,19 +636,7 @@ class JobDescriptionParser(DocumentParser):
         """
         Ekstrahuje kwalifikacje z ogłoszenia.
         """
-        # Identyfikacja sekcji kwalifikacji
-        qual_section_patterns = [
-            r'(?i)kwalifikacje|qualifications|wykształcenie|education',
-            r'(?i)wymagane doświadczenie|required experience'
-        ]
-        
-        # Próba znalezienia sekcji kwalifikacji
-        qual_section = None
-        for pattern in qual_section_patterns:
-            match = re.search(f"({pattern}).*?(\n|$)(.*?)(\n\n|\Z)", self.content, re.DOTALL)
-            if match:
-                qual_section = match.group(3)
-                break
+        qual_section = self._section_text("qualifications", stop_at_blank_line=True)
         
         if qual_section:
             # Wyodrębnienie kwalifikacji z sekcji
@@ -1,12 +1,61 @@
 """
 Moduł do analizy NLP i oceny relewantności CV względem ogłoszenia o pracę.
 """
-from typing import Dict, List, Tuple
-import re
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from sentence_transformers import SentenceTransformer
+
+from app.metrics import timed
+from app.nlp.document import Document, document_terms
+from app.nlp.embedding_cache import EmbeddingCache, cached_embeddings, encode_with_cache, normalize_text, store_embeddings
+from app.nlp.skill_table import SkillTable
+from app.nlp.vector_index import combine_section_vectors
+
+if TYPE_CHECKING:
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+# Sekcje oceniane osobno (section_scores) i domyślne wagi końcowego wyniku;
+# sekcje bez wagi (np. full_text) są raportowane, ale nie wpływają na wynik
+SCORED_SECTIONS = ("skills", "experience", "education", "full_text")
+DEFAULT_SECTION_WEIGHTS = {
+    "skills": 0.5,
+    "experience": 0.3,
+    "education": 0.2
+}
+
+# Tryby dopasowania umiejętności: "topk" - k najbardziej podobnych wymagań dla każdej umiejętności
+# z CV (k=1 - najlepsze wymaganie, wiele umiejętności może wskazać to samo), "assignment" -
+# optymalne przypisanie jeden do jednego (scipy.optimize.linear_sum_assignment)
+SKILL_MATCHING_MODES = ("topk", "assignment")
+
+def validate_section_weights(section_weights: Dict[str, float]) -> Dict[str, float]:
+    """
+    Sprawdza wagi sekcji podane w żądaniu lub profilu ogłoszenia.
+    Sekcje pominięte w słowniku mają wagę 0.
+    
+    Args:
+        section_weights: Słownik sekcja -> waga
+        
+    Returns:
+        Dict[str, float]: Wagi sekcji jako liczby zmiennoprzecinkowe
+        
+    Raises:
+        ValueError: Jeśli sekcja jest nieznana, waga nie jest nieujemną liczbą lub wszystkie wagi są zerowe
+    """
+    if not isinstance(section_weights, dict) or not section_weights:
+        raise ValueError("Wagi sekcji muszą być niepustym słownikiem sekcja -> waga")
+    
+    weights = {}
+    for section, weight in section_weights.items():
+        if section not in SCORED_SECTIONS:
+            raise ValueError(f"Nieznana sekcja: {section}. Dozwolone: {', '.join(SCORED_SECTIONS)}")
+        if isinstance(weight, bool) or not isinstance(weight, (int, float)) or not np.isfinite(weight) or weight < 0:
+            raise ValueError(f"Waga sekcji {section} musi być nieujemną liczbą")
+        weights[section] = float(weight)
+    
+    if sum(weights.values()) <= 0:
+        raise ValueError("Co najmniej jedna waga sekcji musi być dodatnia")
+    
+    return weights
 
 class RelevanceAnalyzer:
     """
@@ -14,138 +63,599 @@ class RelevanceAnalyzer:
     Wykorzystuje modele NLP do obliczania podobieństwa semantycznego.
     """
     
-    def __init__(self, model_name: str = "distiluse-base-multilingual-cased-v1"):
+    def __init__(self, model_name: str = "distiluse-base-multilingual-cased-v1", cache: Optional[EmbeddingCache] = None, tfidf_model: Optional["TfidfVectorizer"] = None, model=None, skill_matching: str = "topk", skill_top_k: int = 1, skill_threshold: float = 0.7, skill_table: Optional[SkillTable] = None):
         """
         Inicjalizacja analizatora relewantności.
         
         Args:
             model_name: Nazwa modelu SentenceTransformer do wykorzystania
+            cache: Pamięć podręczna embeddingów (opcjonalnie)
+            tfidf_model: Model TF-IDF dopasowany do korpusu (load_tfidf_model); bez niego
+                słownik jest dopasowywany osobno dla każdej pary dokumentów
+            model: Gotowy koder o interfejsie SentenceTransformer, np. OnnxSentenceEncoder
+                (opcjonalnie); model_name powinien wtedy identyfikować jego embeddingi
+            skill_matching: Tryb dopasowania umiejętności ("topk" lub "assignment")
+            skill_top_k: Liczba wymagań dopasowywanych do umiejętności z CV w trybie "topk"
+            skill_threshold: Minimalne podobieństwo dopasowania umiejętności
+            skill_table: Tabela embeddingów kanonicznych umiejętności (opcjonalnie); umiejętności
+                z taksonomii nie są kodowane modelem
+        
+        Raises:
+            ValueError: Jeśli tryb dopasowania umiejętności jest nieobsługiwany lub skill_top_k < 1
         """
-        self.model = SentenceTransformer(model_name)
+        if skill_matching not in SKILL_MATCHING_MODES:
+            raise ValueError(f"Nieobsługiwany tryb dopasowania umiejętności: {skill_matching}. Dozwolone: {', '.join(SKILL_MATCHING_MODES)}")
+        if skill_top_k < 1:
+            raise ValueError("skill_top_k musi być dodatnie")
+        
+        # Biblioteki modelu (torch, transformers, sklearn) są importowane dopiero tutaj, a nie przy
+        # imporcie modułu - aplikacja przyjmuje połączenia, zanim analizator zostanie utworzony
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        
+        if model is None:
+            from sentence_transformers import SentenceTransformer
+            model = SentenceTransformer(model_name)
+        
+        self.model_name = model_name
+        self.model = model
+        # Obiekt z metodą encode: domyślnie model, może go zastąpić np. harmonogram batchujący
+        self.encoder = self.model
+        self.cache = cache
+        # Model korpusowy jest tylko do odczytu (transform) i może być współdzielony między wątkami
+        self.tfidf_model = tfidf_model
         self.tfidf_vectorizer = TfidfVectorizer(
             min_df=1, 
-            stop_words=['i', 'oraz', 'w', 'na', 'z', 'do', 'dla', 'a', 'o', 'przez']
+            analyzer=document_terms
         )
-        self.section_weights = {
-            "skills": 0.5,
-            "experience": 0.3,
-            "education": 0.2
-        }
+        self.section_weights = dict(DEFAULT_SECTION_WEIGHTS)
+        self.skill_matching = skill_matching
+        self.skill_top_k = skill_top_k
+        self.skill_threshold = skill_threshold
+        self.skill_table = skill_table
+    
+    def encode(self, texts: List[str], encoded: Optional[Dict[str, np.ndarray]] = None) -> np.ndarray:
+        """
+        Koduje teksty modelem z wykorzystaniem pamięci podręcznej embeddingów.
+        
+        Args:
+            texts: Lista tekstów do zakodowania
+            encoded: Wektory obliczone wcześniej (znormalizowany tekst -> wektor), opcjonalnie
+            
+        Returns:
+            np.ndarray: Macierz embeddingów
+        """
+        return encode_with_cache(self.encoder, texts, self.cache, encoded)
+    
+    def prepare_encoding(self, cv_data: Dict, job_data: Dict, job_embeddings: Optional[Dict[str, np.ndarray]] = None) -> Tuple[Dict[str, np.ndarray], List[str]]:
+        """
+        Wyznacza teksty, które analyze_relevance przekaże do modelu, i wyszukuje je w cache.
+        Pozwala zakodować brakujące teksty poza wątkiem analizy (InferenceScheduler.submit
+        w pętli zdarzeń) i przekazać je do analyze_relevance jako encoded.
+        
+        Args:
+            cv_data: Dane z CV
+            job_data: Dane z ogłoszenia o pracę
+            job_embeddings: Wcześniej obliczone embeddingi ogłoszenia (opcjonalnie)
+            
+        Returns:
+            Tuple[Dict[str, np.ndarray], List[str]]: Wektory znalezione w cache
+                i unikalne znormalizowane teksty do zakodowania
+        """
+        texts, _, _ = self._model_texts(self._relevance_section_texts(cv_data, job_data, job_embeddings))
+        return cached_embeddings([normalize_text(text) for text in texts], self.cache)
     
-    def analyze_relevance(self, cv_data: Dict, job_data: Dict) -> Dict:
+    def store_embeddings(self, vectors: Dict[str, np.ndarray]):
+        """
+        Zapisuje w cache wektory zakodowane poza analizatorem (patrz prepare_encoding).
+        
+        Args:
+            vectors: Słownik znormalizowany tekst -> wektor
+        """
+        store_embeddings(vectors, self.cache)
+    
+    def _relevance_section_texts(self, cv_data: Dict, job_data: Dict, job_embeddings: Optional[Dict[str, np.ndarray]] = None) -> Dict:
+        """
+        Zwraca teksty sekcji CV i ogłoszenia kodowane w analyze_relevance
+        (sekcje ogłoszenia pomijane, gdy podano jego embeddingi).
+        """
+        section_texts = {}
+        for section, texts in self._cv_section_texts(cv_data).items():
+            section_texts[("cv", section)] = texts
+        if job_embeddings is None:
+            for section, texts in self._job_section_texts(job_data).items():
+                section_texts[("job", section)] = texts
+        return section_texts
+    
+    def analyze_relevance(self, cv_data: Dict, job_data: Dict, job_embeddings: Optional[Dict[str, np.ndarray]] = None, section_weights: Optional[Dict[str, float]] = None,
+                          cv_document: Optional[Document] = None, job_document: Optional[Document] = None, encoded: Optional[Dict[str, np.ndarray]] = None) -> Dict:
         """
         Analizuje relewantność CV względem ogłoszenia o pracę.
         
         Args:
             cv_data: Dane z CV
             job_data: Dane z ogłoszenia o pracę
+            job_embeddings: Wcześniej obliczone embeddingi ogłoszenia (opcjonalnie)
+            section_weights: Wagi sekcji tej analizy (domyślnie self.section_weights)
+            cv_document: Tokenizowany pełny tekst CV (domyślnie tworzony z cv_data)
+            job_document: Tokenizowany pełny tekst ogłoszenia (domyślnie tworzony z job_data)
+            encoded: Wektory obliczone wcześniej (wynik prepare_encoding uzupełniony o zakodowane teksty)
             
         Returns:
             Dict: Wyniki analizy relewantności
         """
+        section_weights = section_weights or self.section_weights
+        
+        # Tokenizacja pełnych tekstów wykonywana raz na analizę dla TF-IDF i słów kluczowych
+        if cv_document is None:
+            cv_document = Document(cv_data.get("full_text", ""))
+        if job_document is None:
+            job_document = Document(job_data.get("full_text", ""))
+        
+        # Zebranie wszystkich tekstów i zakodowanie ich w jednym przebiegu modelu
+        embeddings = self._encode_sections(self._relevance_section_texts(cv_data, job_data, job_embeddings), encoded)
+        
+        # Embeddingi ogłoszenia z profilu nie są kodowane ponownie
+        if job_embeddings is not None:
+            for section, section_embeddings in job_embeddings.items():
+                embeddings[("job", section)] = section_embeddings
+        
         # Analiza umiejętności
         skills_score, skill_matches = self._analyze_skills(
             cv_data.get("skills", []),
-            job_data.get("required_skills", [])
+            job_data.get("required_skills", []),
+            embeddings[("cv", "skills")],
+            embeddings[("job", "skills")]
         )
         
         # Analiza doświadczenia
         experience_score = self._analyze_experience(
-            cv_data.get("experience", []),
-            job_data.get("responsibilities", []),
-            job_data.get("qualifications", [])
+            embeddings[("cv", "experience")],
+            embeddings[("job", "experience")]
         )
         
         # Analiza wykształcenia
         education_score = self._analyze_education(
-            cv_data.get("education", []),
-            job_data.get("qualifications", [])
+            embeddings[("cv", "education")],
+            embeddings[("job", "education")]
         )
         
         # Analiza pełnego tekstu
-        full_text_score = self._analyze_full_text(
-            cv_data.get("full_text", ""),
-            job_data.get("full_text", "")
-        )
+        with timed("tfidf"):
+            full_text_score = self._analyze_full_text(cv_document, job_document)
         
         # Obliczanie końcowego wyniku
         section_scores = {
-            "skills": skills_score,
-            "experience": experience_score,
-            "education": education_score,
-            "full_text": full_text_score
+            "skills": float(skills_score),
+            "experience": float(experience_score),
+            "education": float(education_score),
+            "full_text": float(full_text_score)
         }
         
         # Obliczanie ważonego wyniku
-        weighted_score = (
-            skills_score * self.section_weights["skills"] +
-            experience_score * self.section_weights["experience"] +
-            education_score * self.section_weights["education"]
-        )
+        weighted_score = sum(section_scores[section] * weight for section, weight in section_weights.items())
         
         # Przygotowanie wyniku
+        highlighted_keywords, highlight_spans = self._extract_highlighted_keywords(cv_document, job_document)
         result = {
-            "relevance_score": round(weighted_score, 2),
+            "relevance_score": round(float(weighted_score), 2),
             "section_scores": section_scores,
+            "section_weights": dict(section_weights),
             "skill_matches": skill_matches,
-            "highlighted_keywords": self._extract_highlighted_keywords(cv_data.get("full_text", ""), job_data.get("full_text", ""))
+            "highlighted_keywords": highlighted_keywords,
+            "highlight_spans": highlight_spans
         }
         
         return result
     
-    def _analyze_skills(self, cv_skills: List[str], job_skills: List[str]) -> Tuple[float, List[Dict]]:
+    def encode_job(self, job_data: Dict) -> Dict[str, np.ndarray]:
+        """
+        Koduje sekcje ogłoszenia o pracę, aby można je było użyć dla wielu CV.
+        
+        Args:
+            job_data: Dane z ogłoszenia o pracę
+            
+        Returns:
+            Dict[str, np.ndarray]: Embeddingi sekcji ogłoszenia ("skills", "experience", "education")
+        """
+        return self._encode_sections(self._job_section_texts(job_data))
+    
+    def analyze_batch(self, cv_data_list: List[Dict], job_data: Dict, job_embeddings: Optional[Dict[str, np.ndarray]] = None, section_weights: Optional[Dict[str, float]] = None,
+                      job_document: Optional[Document] = None, cv_documents: Optional[List[Document]] = None) -> List[Dict]:
+        """
+        Analizuje relewantność wielu CV względem jednego ogłoszenia.
+        Ogłoszenie jest kodowane raz, sekcje wszystkich CV jednym wywołaniem modelu,
+        a podobieństwa liczone są macierzowo (CV x ogłoszenie).
+        
+        Args:
+            cv_data_list: Lista danych z CV
+            job_data: Dane z ogłoszenia o pracę
+            job_embeddings: Wcześniej obliczone embeddingi ogłoszenia (opcjonalnie)
+            section_weights: Wagi sekcji tych analiz (domyślnie self.section_weights)
+            job_document: Tokenizowany pełny tekst ogłoszenia (domyślnie tworzony z job_data)
+            cv_documents: Tokenizowane pełne teksty CV w kolejności cv_data_list (domyślnie tworzone z cv_data_list)
+            
+        Returns:
+            List[Dict]: Wyniki analizy w kolejności CV wejściowych
+        """
+        if not cv_data_list:
+            return []
+        
+        section_weights = section_weights or self.section_weights
+        
+        if job_embeddings is None:
+            job_embeddings = self.encode_job(job_data)
+        
+        job_skills = job_data.get("required_skills", [])
+        # Ogłoszenie tokenizowane raz dla wszystkich CV partii
+        if job_document is None:
+            job_document = Document(job_data.get("full_text", ""))
+        if cv_documents is None:
+            cv_documents = [Document(cv_data.get("full_text", "")) for cv_data in cv_data_list]
+        
+        # Kodowanie sekcji wszystkich CV w jednym wywołaniu
+        section_texts = {}
+        for i, cv_data in enumerate(cv_data_list):
+            for section, texts in self._cv_section_texts(cv_data).items():
+                section_texts[(i, section)] = texts
+        cv_embeddings = self._encode_sections(section_texts)
+        
+        # Doświadczenie i wykształcenie: wektor podobieństw wszystkich CV do ogłoszenia
+        experience_scores = self._batch_pair_similarity(
+            [cv_embeddings[(i, "experience")] for i in range(len(cv_data_list))],
+            job_embeddings["experience"]
+        )
+        education_scores = self._batch_pair_similarity(
+            [cv_embeddings[(i, "education")] for i in range(len(cv_data_list))],
+            job_embeddings["education"]
+        )
+        
+        # Umiejętności: jedna macierz podobieństwa (wszystkie umiejętności z CV x wymagane umiejętności)
+        skill_blocks = [cv_embeddings[(i, "skills")] for i in range(len(cv_data_list))]
+        skill_offsets = np.cumsum([0] + [len(block) for block in skill_blocks])
+        skill_similarity = None
+        if job_skills and len(job_embeddings["skills"]) and skill_offsets[-1]:
+            skill_similarity = self._skill_similarity(
+                [skill for cv_data in cv_data_list for skill in cv_data.get("skills", [])],
+                job_skills,
+                np.vstack(skill_blocks),
+                job_embeddings["skills"]
+            )
+        
+        # Pełny tekst: jedno mnożenie macierzy rzadkiej TF-IDF (wszystkie CV x ogłoszenie)
+        with timed("tfidf"):
+            full_text_scores = self._batch_full_text(cv_documents, job_document)
+        
+        results = []
+        for i, cv_data in enumerate(cv_data_list):
+            cv_skills = cv_data.get("skills", [])
+            if skill_similarity is not None and cv_skills:
+                skills_score, skill_matches = self._match_skills(
+                    skill_similarity[skill_offsets[i]:skill_offsets[i + 1]],
+                    cv_skills,
+                    job_skills
+                )
+            else:
+                skills_score, skill_matches = 0.0, []
+            
+            section_scores = {
+                "skills": float(skills_score),
+                "experience": float(experience_scores[i]),
+                "education": float(education_scores[i]),
+                "full_text": float(full_text_scores[i])
+            }
+            highlighted_keywords, highlight_spans = self._extract_highlighted_keywords(cv_documents[i], job_document)
+            results.append({
+                "section_scores": section_scores,
+                "skill_matches": skill_matches,
+                "highlighted_keywords": highlighted_keywords,
+                "highlight_spans": highlight_spans
+            })
+        
+        # Obliczanie ważonych wyników dla wszystkich CV naraz
+        sections = list(section_weights.keys())
+        score_matrix = np.array([[result["section_scores"][section] for section in sections] for result in results])
+        weighted_scores = score_matrix @ np.array([section_weights[section] for section in sections])
+        
+        for result, weighted_score in zip(results, weighted_scores):
+            result["relevance_score"] = round(float(weighted_score), 2)
+            result["section_weights"] = dict(section_weights)
+        
+        return results
+    
+    def index_vectors(self, data_list: List[Dict], document_type: str = "cv", section_weights: Optional[Dict[str, float]] = None) -> np.ndarray:
+        """
+        Oblicza wektory dokumentów do indeksu wektorowego CV.
+        Łączy embeddingi sekcji SCORED_SECTIONS w jeden wektor (patrz combine_section_vectors);
+        teksty wszystkich dokumentów są kodowane jednym wywołaniem modelu. Wektory ogłoszeń
+        (zapytania) są ważone wagami sekcji analizy, więc wynik wyszukiwania jest ważoną sumą
+        podobieństw sekcji jak w analyze_relevance - przybliżoną, bo sekcje są porównywane
+        średnimi embeddingami, a pełny tekst embeddingiem zamiast TF-IDF.
+        
+        Args:
+            data_list: Lista danych z CV lub ogłoszeń o pracę
+            document_type: "cv" lub "job"
+            section_weights: Wagi sekcji wyszukiwania dla ogłoszeń (domyślnie self.section_weights)
+            
+        Returns:
+            np.ndarray: Macierz wektorów indeksu (jeden wiersz na dokument)
+        """
+        section_texts = {}
+        for i, data in enumerate(data_list):
+            if document_type == "cv":
+                texts = self._cv_section_texts(data)
+            else:
+                texts = self._job_section_texts(data)
+            full_text = data.get("full_text", "")
+            texts["full_text"] = [full_text] if full_text.strip() else []
+            for section, section_list in texts.items():
+                section_texts[(i, section)] = section_list
+        
+        embeddings = self._encode_sections(section_texts)
+        dim = self.model.get_sentence_embedding_dimension()
+        
+        weights = None if document_type == "cv" else (section_weights or self.section_weights)
+        
+        vectors = []
+        for i in range(len(data_list)):
+            sections = {section: matrix for (index, section), matrix in embeddings.items() if index == i}
+            vectors.append(combine_section_vectors(sections, dim, SCORED_SECTIONS, weights))
+        
+        return np.vstack(vectors) if vectors else np.zeros((0, dim * len(SCORED_SECTIONS)), dtype=np.float32)
+    
+    def _cv_section_texts(self, cv_data: Dict) -> Dict[str, List[str]]:
+        """
+        Przygotowuje teksty CV do zakodowania dla poszczególnych sekcji.
+        
+        Args:
+            cv_data: Dane z CV
+            
+        Returns:
+            Dict[str, List[str]]: Teksty sekcji "skills", "experience" i "education"
+        """
+        cv_experience = cv_data.get("experience", [])
+        cv_education = cv_data.get("education", [])
+        
+        # Umiejętności (normalizacja do lowercase)
+        section_texts = {
+            "skills": [skill.lower() for skill in cv_data.get("skills", [])],
+            "experience": [],
+            "education": []
+        }
+        
+        # Ekstrakcja opisów doświadczenia z CV
+        if cv_experience:
+            cv_exp_descriptions = []
+            for exp in cv_experience:
+                description = exp.get("description", "")
+                position = exp.get("position", "")
+                company = exp.get("company", "")
+                cv_exp_descriptions.append(f"{position} {company} {description}")
+            section_texts["experience"] = [" ".join(cv_exp_descriptions)]
+        
+        # Ekstrakcja informacji o wykształceniu z CV
+        if cv_education:
+            cv_edu_text = []
+            for edu in cv_education:
+                degree = edu.get("degree", "")
+                institution = edu.get("institution", "")
+                cv_edu_text.append(f"{degree} {institution}")
+            section_texts["education"] = [" ".join(cv_edu_text)]
+        
+        return section_texts
+    
+    def _job_section_texts(self, job_data: Dict) -> Dict[str, List[str]]:
+        """
+        Przygotowuje teksty ogłoszenia do zakodowania dla poszczególnych sekcji.
+        
+        Args:
+            job_data: Dane z ogłoszenia o pracę
+            
+        Returns:
+            Dict[str, List[str]]: Teksty sekcji "skills", "experience" i "education"
+        """
+        job_qualifications = job_data.get("qualifications", [])
+        
+        # Połączenie obowiązków i kwalifikacji z ogłoszenia
+        job_requirements = job_data.get("responsibilities", []) + job_qualifications
+        
+        return {
+            "skills": [skill.lower() for skill in job_data.get("required_skills", [])],
+            "experience": [" ".join(job_requirements)] if job_requirements else [],
+            "education": [" ".join(job_qualifications)] if job_qualifications else []
+        }
+    
+    def _model_texts(self, section_texts: Dict) -> Tuple[List[str], Dict, Dict]:
+        """
+        Zbiera teksty sekcji przekazywane do modelu (bez umiejętności rozwiązanych tabelą kanoniczną).
+        
+        Args:
+            section_texts: Teksty do zakodowania dla każdej sekcji
+            
+        Returns:
+            Tuple[List[str], Dict, Dict]: Teksty dla modelu, zakresy (początek, koniec) sekcji
+                w tej liście oraz identyfikatory kanoniczne umiejętności sekcji
+        """
+        all_texts = []
+        offsets = {}
+        canonical_ids = {}
+        for section, texts in section_texts.items():
+            # Umiejętności z tabeli kanonicznej nie są kodowane modelem
+            if self.skill_table is not None and texts and self._section_name(section) == "skills":
+                canonical_ids[section] = self.skill_table.lookup(texts)
+                texts = [text for text, canonical_id in zip(texts, canonical_ids[section]) if canonical_id < 0]
+            offsets[section] = (len(all_texts), len(all_texts) + len(texts))
+            all_texts.extend(texts)
+        return all_texts, offsets, canonical_ids
+    
+    def _encode_sections(self, section_texts: Dict, encoded: Optional[Dict[str, np.ndarray]] = None) -> Dict:
+        """
+        Koduje teksty wszystkich sekcji jednym wywołaniem modelu
+        i rozdziela wynikowe wektory z powrotem na sekcje.
+        
+        Args:
+            section_texts: Teksty do zakodowania dla każdej sekcji
+            encoded: Wektory obliczone wcześniej (znormalizowany tekst -> wektor), opcjonalnie
+            
+        Returns:
+            Dict: Macierze embeddingów dla każdej sekcji (te same klucze co na wejściu)
+        """
+        all_texts, offsets, canonical_ids = self._model_texts(section_texts)
+        
+        with timed("encode"):
+            embeddings = self.encode(all_texts, encoded) if all_texts else np.zeros((0, 0), dtype=np.float32)
+        
+        section_embeddings = {section: embeddings[start:end] for section, (start, end) in offsets.items()}
+        for section, ids in canonical_ids.items():
+            section_embeddings[section] = self._canonical_skill_embeddings(ids, section_embeddings[section])
+        
+        return section_embeddings
+    
+    @staticmethod
+    def _section_name(key) -> str:
+        """
+        Zwraca nazwę sekcji z klucza _encode_sections ("skills", ("cv", "skills"), (0, "skills")).
+        """
+        return key[-1] if isinstance(key, tuple) else key
+    
+    def _canonical_skill_embeddings(self, canonical_ids: np.ndarray, encoded: np.ndarray) -> np.ndarray:
+        """
+        Składa embeddingi umiejętności z wierszy tabeli kanonicznej i wektorów zakodowanych modelem.
+        Umiejętności spoza taksonomii zachowują własne wektory - zastąpienie ich najbliższą
+        kanoniczną zmieniałoby wyniki bez wiedzy użytkownika.
+        
+        Args:
+            canonical_ids: Identyfikatory kanoniczne umiejętności (-1 dla nierozwiązanych)
+            encoded: Embeddingi nierozwiązanych umiejętności (w kolejności ich wystąpienia)
+            
+        Returns:
+            np.ndarray: Macierz embeddingów wszystkich umiejętności
+        """
+        table = self.skill_table
+        embeddings = np.empty((len(canonical_ids), table.dimension), dtype=np.float32)
+        
+        known = canonical_ids >= 0
+        if not known.all():
+            embeddings[~known] = encoded
+        embeddings[known] = table.embeddings[canonical_ids[known]]
+        return embeddings
+    
+    @staticmethod
+    def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+        """
+        Normalizuje wiersze macierzy do długości jednostkowej.
+        
+        Args:
+            matrix: Macierz embeddingów
+            
+        Returns:
+            np.ndarray: Macierz o wierszach z normą L2 równą 1 (wiersze zerowe bez zmian)
+        """
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.where(norms == 0, 1.0, norms)
+    
+    def _batch_pair_similarity(self, cv_embeddings: List[np.ndarray], job_embedding: np.ndarray) -> np.ndarray:
+        """
+        Oblicza podobieństwo cosinusowe jednego tekstu z każdego CV do tekstu ogłoszenia.
+        CV bez danych w danej sekcji otrzymują wynik 0.
+        
+        Args:
+            cv_embeddings: Lista embeddingów sekcji CV (pusta macierz, gdy brak danych)
+            job_embedding: Embedding sekcji ogłoszenia (pusta macierz, gdy brak danych)
+            
+        Returns:
+            np.ndarray: Wektor podobieństw o długości liczby CV
+        """
+        scores = np.zeros(len(cv_embeddings))
+        present = [i for i, embedding in enumerate(cv_embeddings) if len(embedding)]
+        
+        if not present or len(job_embedding) == 0:
+            return scores
+        
+        cv_matrix = self._normalize_rows(np.vstack([cv_embeddings[i] for i in present]))
+        scores[present] = cv_matrix @ self._normalize_rows(job_embedding)[0]
+        
+        return scores
+    
+    def _analyze_skills(self, cv_skills: List[str], job_skills: List[str], cv_embeddings: np.ndarray, job_embeddings: np.ndarray) -> Tuple[float, List[Dict]]:
         """
         Analizuje dopasowanie umiejętności z CV do wymagań z ogłoszenia.
         
         Args:
             cv_skills: Lista umiejętności z CV
             job_skills: Lista wymaganych umiejętności z ogłoszenia
+            cv_embeddings: Embeddingi umiejętności z CV
+            job_embeddings: Embeddingi wymaganych umiejętności
             
         Returns:
             Tuple[float, List[Dict]]: Wynik dopasowania umiejętności i lista dopasowań
         """
-        if not cv_skills or not job_skills:
+        if not cv_skills or not job_skills or len(cv_embeddings) == 0 or len(job_embeddings) == 0:
             return 0.0, []
         
-        # Normalizacja umiejętności (lowercase)
-        cv_skills_norm = [skill.lower() for skill in cv_skills]
-        job_skills_norm = [skill.lower() for skill in job_skills]
-        
-        # Obliczanie embeddings dla wszystkich umiejętności
-        all_skills = cv_skills_norm + job_skills_norm
-        embeddings = self.model.encode(all_skills)
-        
-        cv_embeddings = embeddings[:len(cv_skills_norm)]
-        job_embeddings = embeddings[len(cv_skills_norm):]
-        
         # Obliczanie macierzy podobieństwa
-        similarity_matrix = cosine_similarity(cv_embeddings, job_embeddings)
+        similarity_matrix = self._skill_similarity(cv_skills, job_skills, cv_embeddings, job_embeddings)
         
-        # Znajdowanie najlepszych dopasowań
-        skill_matches = []
-        matched_job_skills = set()
-        total_similarity = 0.0
+        return self._match_skills(similarity_matrix, cv_skills, job_skills)
+    
+    def _skill_similarity(self, cv_skills: List[str], job_skills: List[str], cv_embeddings: np.ndarray, job_embeddings: np.ndarray) -> np.ndarray:
+        """
+        Wyznacza macierz podobieństwa umiejętności z CV i wymagań. Pary o tym samym
+        identyfikatorze kanonicznym (nazwa lub alias z taksonomii) są rozstrzygane porównaniem
+        identyfikatorów przed mnożeniem macierzy i mają podobieństwo dokładnie 1.
         
-        for i, cv_skill in enumerate(cv_skills):
-            best_match_idx = np.argmax(similarity_matrix[i])
-            best_match_score = similarity_matrix[i][best_match_idx]
+        Args:
+            cv_skills: Lista umiejętności z CV
+            job_skills: Lista wymaganych umiejętności z ogłoszenia
+            cv_embeddings: Embeddingi umiejętności z CV
+            job_embeddings: Embeddingi wymaganych umiejętności
             
-            if best_match_score > 0.7:  # Próg podobieństwa
-                job_skill = job_skills[best_match_idx]
-                skill_matches.append({
-                    "cv_skill": cv_skill,
-                    "job_skill": job_skill,
-                    "similarity_score": float(best_match_score)
-                })
-                matched_job_skills.add(best_match_idx)
-                total_similarity += best_match_score
+        Returns:
+            np.ndarray: Macierz podobieństwa (umiejętności z CV x wymagania)
+        """
+        same_skill = None
+        if self.skill_table is not None:
+            cv_ids = self.skill_table.lookup([skill.lower() for skill in cv_skills])
+            job_ids = self.skill_table.lookup([skill.lower() for skill in job_skills])
+            same_skill = (cv_ids[:, None] == job_ids[None, :]) & (cv_ids[:, None] >= 0)
+        
+        similarity_matrix = self._normalize_rows(cv_embeddings) @ self._normalize_rows(job_embeddings).T
+        if same_skill is not None:
+            similarity_matrix[same_skill] = 1.0
+        return similarity_matrix
+    
+    def _match_skills(self, similarity_matrix: np.ndarray, cv_skills: List[str], job_skills: List[str]) -> Tuple[float, List[Dict]]:
+        """
+        Wyznacza dopasowania umiejętności na podstawie macierzy podobieństwa w trybie
+        skill_matching; średnie podobieństwo i pokrycie wymagań są liczone na tablicach.
+        
+        Args:
+            similarity_matrix: Macierz podobieństwa (umiejętności z CV x wymagane umiejętności)
+            cv_skills: Lista umiejętności z CV
+            job_skills: Lista wymaganych umiejętności z ogłoszenia
+            
+        Returns:
+            Tuple[float, List[Dict]]: Wynik dopasowania umiejętności i lista dopasowań
+        """
+        if self.skill_matching == "assignment":
+            cv_indices, job_indices, scores = self._assign_skills(similarity_matrix)
+        else:
+            cv_indices, job_indices, scores = self._top_k_skills(similarity_matrix)
+        
+        skill_matches = [
+            {
+                "cv_skill": cv_skills[i],
+                "job_skill": job_skills[j],
+                "similarity_score": score
+            }
+            for i, j, score in zip(cv_indices.tolist(), job_indices.tolist(), scores.tolist())
+        ]
         
         # Obliczanie wyniku dopasowania umiejętności
         if skill_matches:
             # Średnie podobieństwo dopasowanych umiejętności
-            avg_similarity = total_similarity / len(skill_matches)
+            avg_similarity = scores.mean()
             # Pokrycie wymaganych umiejętności
-            coverage = len(matched_job_skills) / len(job_skills)
+            coverage = np.unique(job_indices).size / len(job_skills)
             # Końcowy wynik jako średnia z podobieństwa i pokrycia
             skills_score = (avg_similarity + coverage) / 2
         else:
@@ -153,132 +663,175 @@ class RelevanceAnalyzer:
         
         return skills_score, skill_matches
     
-    def _analyze_experience(self, cv_experience: List[Dict], job_responsibilities: List[str], job_qualifications: List[str]) -> float:
+    def _top_k_skills(self, similarity_matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
-        Analizuje dopasowanie doświadczenia z CV do wymagań z ogłoszenia.
+        Wybiera dla każdej umiejętności z CV do skill_top_k najbardziej podobnych wymagań
+        z podobieństwem powyżej progu (operacje na całej macierzy, bez pętli po wierszach).
         
         Args:
-            cv_experience: Lista doświadczeń z CV
-            job_responsibilities: Lista obowiązków z ogłoszenia
-            job_qualifications: Lista kwalifikacji z ogłoszenia
+            similarity_matrix: Macierz podobieństwa (umiejętności z CV x wymagane umiejętności)
             
         Returns:
-            float: Wynik dopasowania doświadczenia
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Indeksy umiejętności z CV, indeksy wymagań
+                i podobieństwa dopasowań (w kolejności umiejętności z CV, malejąco według podobieństwa)
         """
-        if not cv_experience or (not job_responsibilities and not job_qualifications):
-            return 0.0
+        k = min(self.skill_top_k, similarity_matrix.shape[1])
+        if k == 1:
+            top = similarity_matrix.argmax(axis=1)[:, None]
+        else:
+            top = np.argpartition(-similarity_matrix, k - 1, axis=1)[:, :k]
+            order = np.argsort(-np.take_along_axis(similarity_matrix, top, axis=1), axis=1, kind="stable")
+            top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(similarity_matrix, top, axis=1)
         
-        # Ekstrakcja opisów doświadczenia z CV
-        cv_exp_descriptions = []
-        for exp in cv_experience:
-            description = exp.get("description", "")
-            position = exp.get("position", "")
-            company = exp.get("company", "")
-            cv_exp_descriptions.append(f"{position} {company} {description}")
+        cv_indices, ranks = np.nonzero(top_scores > self.skill_threshold)
+        return cv_indices, top[cv_indices, ranks], top_scores[cv_indices, ranks]
+    
+    def _assign_skills(self, similarity_matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Wyznacza przypisanie jeden do jednego umiejętności z CV i wymagań o największej sumie
+        podobieństw powyżej progu (algorytm węgierski, scipy.optimize.linear_sum_assignment).
         
-        # Połączenie obowiązków i kwalifikacji z ogłoszenia
-        job_requirements = job_responsibilities + job_qualifications
+        Args:
+            similarity_matrix: Macierz podobieństwa (umiejętności z CV x wymagane umiejętności)
+            
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Indeksy umiejętności z CV, indeksy wymagań
+                i podobieństwa dopasowań (w kolejności umiejętności z CV)
+        """
+        from scipy.optimize import linear_sum_assignment
+        
+        # Pary poniżej progu nie mogą zastąpić dopasowania powyżej progu; wiersze i kolumny
+        # bez żadnej pary powyżej progu są pomijane, co zmniejsza rozwiązywany problem
+        above_threshold = similarity_matrix > self.skill_threshold
+        rows = np.flatnonzero(above_threshold.any(axis=1))
+        columns = np.flatnonzero(above_threshold.any(axis=0))
+        candidates = similarity_matrix[np.ix_(rows, columns)]
+        candidate_above = above_threshold[np.ix_(rows, columns)]
+        row_indices, column_indices = linear_sum_assignment(np.where(candidate_above, candidates, 0.0), maximize=True)
+        
+        keep = candidate_above[row_indices, column_indices]
+        cv_indices, job_indices = rows[row_indices[keep]], columns[column_indices[keep]]
+        return cv_indices, job_indices, similarity_matrix[cv_indices, job_indices]
+    
+    def _analyze_experience(self, cv_embeddings: np.ndarray, job_embeddings: np.ndarray) -> float:
+        """
+        Analizuje dopasowanie doświadczenia z CV do wymagań z ogłoszenia.
         
+        Args:
+            cv_embeddings: Embedding opisu doświadczenia z CV
+            job_embeddings: Embedding obowiązków i kwalifikacji z ogłoszenia
+            
+        Returns:
+            float: Wynik dopasowania doświadczenia
+        """
         # Jeśli brak danych, zwróć 0
-        if not cv_exp_descriptions or not job_requirements:
+        if len(cv_embeddings) == 0 or len(job_embeddings) == 0:
             return 0.0
         
-        # Obliczanie embeddings
-        cv_exp_text = " ".join(cv_exp_descriptions)
-        job_req_text = " ".join(job_requirements)
-        
-        embeddings = self.model.encode([cv_exp_text, job_req_text])
-        
         # Obliczanie podobieństwa cosinusowego
-        similarity = cosine_similarity([embeddings[0]], [embeddings[1]])[0][0]
+        similarity = self._normalize_rows(cv_embeddings[:1])[0] @ self._normalize_rows(job_embeddings[:1])[0]
         
         return float(similarity)
     
-    def _analyze_education(self, cv_education: List[Dict], job_qualifications: List[str]) -> float:
+    def _analyze_education(self, cv_embeddings: np.ndarray, job_embeddings: np.ndarray) -> float:
         """
         Analizuje dopasowanie wykształcenia z CV do wymagań z ogłoszenia.
         
         Args:
-            cv_education: Lista wykształcenia z CV
-            job_qualifications: Lista kwalifikacji z ogłoszenia
+            cv_embeddings: Embedding wykształcenia z CV
+            job_embeddings: Embedding kwalifikacji z ogłoszenia
             
         Returns:
             float: Wynik dopasowania wykształcenia
         """
-        if not cv_education or not job_qualifications:
-            return 0.0
-        
-        # Ekstrakcja informacji o wykształceniu z CV
-        cv_edu_text = []
-        for edu in cv_education:
-            degree = edu.get("degree", "")
-            institution = edu.get("institution", "")
-            cv_edu_text.append(f"{degree} {institution}")
-        
         # Jeśli brak danych, zwróć 0
-        if not cv_edu_text:
+        if len(cv_embeddings) == 0 or len(job_embeddings) == 0:
             return 0.0
         
-        # Obliczanie embeddings
-        cv_edu_text_combined = " ".join(cv_edu_text)
-        job_qual_text = " ".join(job_qualifications)
-        
-        embeddings = self.model.encode([cv_edu_text_combined, job_qual_text])
-        
         # Obliczanie podobieństwa cosinusowego
-        similarity = cosine_similarity([embeddings[0]], [embeddings[1]])[0][0]
+        similarity = self._normalize_rows(cv_embeddings[:1])[0] @ self._normalize_rows(job_embeddings[:1])[0]
         
         return float(similarity)
     
-    def _analyze_full_text(self, cv_text: str, job_text: str) -> float:
+    def _analyze_full_text(self, cv_document: Document, job_document: Document) -> float:
         """
         Analizuje podobieństwo pełnego tekstu CV i ogłoszenia.
         
         Args:
-            cv_text: Pełny tekst CV
-            job_text: Pełny tekst ogłoszenia
+            cv_document: Pełny tekst CV
+            job_document: Pełny tekst ogłoszenia
             
         Returns:
             float: Wynik podobieństwa tekstów
         """
-        if not cv_text or not job_text:
-            return 0.0
-        
-        # Obliczanie TF-IDF
-        tfidf_matrix = self.tfidf_vectorizer.fit_transform([cv_text, job_text])
-        
-        # Obliczanie podobieństwa cosinusowego
-        similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
-        
-        return float(similarity)
+        return float(self._batch_full_text([cv_document], job_document)[0])
     
-    def _extract_highlighted_keywords(self, cv_text: str, job_text: str) -> List[str]:
+    def _batch_full_text(self, cv_documents: List[Document], job_document: Document) -> np.ndarray:
         """
-        Ekstrahuje słowa kluczowe z ogłoszenia, które występują w CV.
+        Oblicza podobieństwo TF-IDF pełnego tekstu wielu CV do ogłoszenia.
+        Z modelem korpusowym teksty są tylko transformowane, a wyniki powstają z jednego
+        iloczynu macierzy rzadkich (wiersze TF-IDF mają normę L2 równą 1). Bez modelu
+        słownik jest dopasowywany osobno dla każdej pary, jak dotychczas. Terminy dokumentów
+        są obliczane raz (Document.terms) i używane ponownie przez słowa kluczowe.
         
         Args:
-            cv_text: Pełny tekst CV
-            job_text: Pełny tekst ogłoszenia
+            cv_documents: Pełne teksty CV
+            job_document: Pełny tekst ogłoszenia
             
         Returns:
-            List[str]: Lista słów kluczowych do podświetlenia
+            np.ndarray: Wektor podobieństw o długości liczby CV (0 dla pustych tekstów)
         """
-        if not cv_text or not job_text:
-            return []
+        scores = np.zeros(len(cv_documents))
+        if not job_document.text:
+            return scores
+        
+        present = [i for i, cv_document in enumerate(cv_documents) if cv_document.text]
+        if not present:
+            return scores
+        
+        if self.tfidf_model is not None:
+            cv_matrix = self.tfidf_model.transform([cv_documents[i] for i in present])
+            job_vector = self.tfidf_model.transform([job_document])
+            scores[present] = (cv_matrix @ job_vector.T).toarray().ravel()
+            return scores
+        
+        from sklearn.base import clone
+        from sklearn.metrics.pairwise import cosine_similarity
+        
+        for i in present:
+            # Obliczanie TF-IDF (kopia wzorca - dopasowanie nie modyfikuje obiektu współdzielonego przez wątki)
+            tfidf_matrix = clone(self.tfidf_vectorizer).fit_transform([cv_documents[i], job_document])
+            
+            # Obliczanie podobieństwa cosinusowego
+            scores[i] = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
         
-        # Tokenizacja tekstów
-        cv_tokens = set(re.findall(r'\b\w+\b', cv_text.lower()))
-        job_tokens = set(re.findall(r'\b\w+\b', job_text.lower()))
+        return scores
+    
+    def _extract_highlighted_keywords(self, cv_document: Document, job_document: Document) -> Tuple[List[str], Dict[str, List[Tuple[int, int]]]]:
+        """
+        Ekstrahuje słowa kluczowe z ogłoszenia, które występują w CV, wraz z ich pozycjami
+        w obu tekstach (frontend podświetla je bez ponownego przeszukiwania tekstu).
         
-        # Usunięcie stop words
-        stop_words = {'i', 'oraz', 'w', 'na', 'z', 'do', 'dla', 'a', 'o', 'przez', 'się', 'jest', 'są', 'być', 'to', 'że'}
-        cv_tokens = cv_tokens - stop_words
-        job_tokens = job_tokens - stop_words
+        Args:
+            cv_document: Pełny tekst CV
+            job_document: Pełny tekst ogłoszenia
+            
+        Returns:
+            Tuple[List[str], Dict[str, List[Tuple[int, int]]]]: Słowa kluczowe (w kolejności
+                wystąpienia w CV) i pozycje znaków (początek, koniec) ich wystąpień w tekstach "cv" i "job"
+        """
+        if not cv_document.text or not job_document.text:
+            return [], {"cv": [], "job": []}
         
-        # Znalezienie wspólnych słów
-        common_tokens = cv_tokens.intersection(job_tokens)
+        # Wspólne terminy (bez stop words) dłuższe niż 2 znaki
+        common_terms = cv_document.term_set & job_document.term_set
+        keywords = {term for term in common_terms if len(term) > 2}
         
-        # Filtrowanie słów krótszych niż 3 znaki
-        highlighted_keywords = [token for token in common_tokens if len(token) > 2]
+        highlighted_keywords = [term for term in dict.fromkeys(cv_document.terms) if term in keywords]
+        highlight_spans = {
+            "cv": cv_document.spans(keywords),
+            "job": job_document.spans(keywords)
+        }
         
-        return highlighted_keywords
+        return highlighted_keywords, highlight_spans
@@ -0,0 +1,177 @@
+"""
+Moduł podziału dokumentu na sekcje.
+Nagłówki sekcji są wykrywane w jednym przebiegu po tekście, a wynikiem jest indeks
+zakresów (sekcja -> początek, koniec), z którego korzystają ekstraktory parserów CV i ogłoszeń.
+"""
+from typing import Dict, List, Optional, Tuple
+import re
+
+# Ograniczenia nagłówka: krótka linia, niebędąca punktem listy
+MAX_HEADING_LENGTH = 60
+MAX_HEADING_WORDS = 5
+
+# Pusta linia kończąca sekcję-listę
+BLANK_LINE_PATTERN = re.compile(r"\n[ \t]*\n")
+
+
+class SectionSegmenter:
+    """
+    Jednoprzebiegowy podział tekstu na sekcje na podstawie słów kluczowych nagłówków.
+    Za nagłówek uznawana jest linia:
+    - zakończona dwukropkiem ("Doświadczenie zawodowe:"),
+    - zaczynająca się od krótkiego tytułu z dwukropkiem i treścią ("Umiejętności: Python, SQL"),
+    - złożona wyłącznie ze słowa kluczowego i co najwyżej jednego słowa przed i po nim ("Work Experience").
+    Sekcja trwa do następnego nagłówka innej sekcji lub do najbliższej linii zakończonej dwukropkiem.
+    """
+
+    def __init__(self, headings: Dict[str, List[str]]):
+        """
+        Inicjalizacja i kompilacja wzorców nagłówków.
+
+        Args:
+            headings: Słownik sekcja -> lista grup słów kluczowych (alternatyw regex)
+                w kolejności priorytetu; grupa o niższym indeksie jest używana,
+                jeśli dokument zawiera pasujący nagłówek
+        """
+        self.sections = list(headings.keys())
+        self._label_patterns = [
+            (section, priority, re.compile(rf"\b(?:{group})", re.IGNORECASE))
+            for section, groups in headings.items()
+            for priority, group in enumerate(groups)
+        ]
+
+        keywords = "|".join(group for groups in headings.values() for group in groups)
+        # Jeden wzorzec dla wszystkich postaci nagłówka, kotwiczony na początku linii,
+        # więc praca w każdej linii jest ograniczona (czas liniowy względem długości tekstu)
+        self._heading_pattern = re.compile(
+            rf"^[ \t]*(?:"
+            rf"(?P<bare>(?:\w+[ \t]+)?(?:{keywords})(?:[ \t]+\w+)?)(?P<colon>[ \t]*:)?"
+            rf"|(?P<title>[^\s:\-•*–][^\n:]{{0,{MAX_HEADING_LENGTH - 1}}}):(?P<inline>[^\n]*)"
+            rf")[ \t]*$",
+            re.IGNORECASE | re.MULTILINE
+        )
+
+    def _labels(self, title: str) -> Dict[str, int]:
+        """
+        Przypisuje nagłówkowi sekcje, których słowa kluczowe zawiera.
+
+        Args:
+            title: Tekst nagłówka
+
+        Returns:
+            Dict[str, int]: Sekcja -> priorytet dopasowanej grupy słów kluczowych
+        """
+        labels = {}
+        for section, priority, pattern in self._label_patterns:
+            if section not in labels and pattern.search(title):
+                labels[section] = priority
+        return labels
+
+    def find_headings(self, text: str) -> List[Tuple[int, int, bool, Dict[str, int]]]:
+        """
+        Wyszukuje nagłówki sekcji w tekście.
+
+        Args:
+            text: Tekst dokumentu
+
+        Returns:
+            List[Tuple[int, int, bool, Dict[str, int]]]: Nagłówki w kolejności występowania:
+                początek linii, początek treści sekcji, czy nagłówek kończy każdą sekcję
+                (linia zakończona dwukropkiem) oraz przypisane sekcje z priorytetami
+        """
+        headings = []
+        # Etykiety powtarzających się nagłówków są wyznaczane raz
+        labels_by_title = {}
+        for match in self._heading_pattern.finditer(text):
+            line_end = match.end()
+            content_start = line_end + 1 if line_end < len(text) else line_end
+
+            if match.group("bare") is not None:
+                title = match.group("bare")
+                standalone = match.group("colon") is not None
+            else:
+                title = match.group("title")
+                standalone = not match.group("inline").strip()
+                if not standalone:
+                    content_start = match.start("inline")
+
+            words = title.lower().split()
+            if len(words) > MAX_HEADING_WORDS:
+                continue
+
+            title = " ".join(words)
+            if len(title) > MAX_HEADING_LENGTH:
+                continue
+
+            labels = labels_by_title.get(title)
+            if labels is None:
+                labels = labels_by_title[title] = self._labels(title)
+            # Krótka linia z dwukropkiem i treścią bez słowa kluczowego to zwykły tekst ("Email: ...")
+            if not labels and not standalone:
+                continue
+
+            headings.append((match.start(), content_start, standalone, labels))
+
+        return headings
+
+    def segment(self, text: str) -> Dict[str, Tuple[int, int]]:
+        """
+        Wyznacza zakresy treści sekcji.
+
+        Args:
+            text: Tekst dokumentu
+
+        Returns:
+            Dict[str, Tuple[int, int]]: Sekcja -> (początek, koniec) treści w tekście;
+                sekcje bez nagłówka są pomijane
+        """
+        headings = self.find_headings(text)
+        spans = {}
+
+        for section in self.sections:
+            first = None
+            for index, (_, _, _, labels) in enumerate(headings):
+                priority = labels.get(section)
+                if priority is not None and (first is None or priority < headings[first][3][section]):
+                    first = index
+                    if priority == 0:
+                        break
+            if first is None:
+                continue
+
+            end = len(text)
+            for line_start, _, standalone, labels in headings[first + 1:]:
+                if standalone or section not in labels:
+                    end = line_start
+                    break
+
+            spans[section] = (headings[first][1], max(end, headings[first][1]))
+
+        return spans
+
+
+def section_text(text: str, span: Optional[Tuple[int, int]], stop_at_blank_line: bool = False) -> Optional[str]:
+    """
+    Zwraca treść sekcji na podstawie zakresu wyznaczonego przez SectionSegmenter.
+
+    Args:
+        text: Tekst dokumentu
+        span: Zakres sekcji lub None
+        stop_at_blank_line: Czy obciąć sekcję na pierwszej pustej linii (sekcje-listy)
+
+    Returns:
+        Optional[str]: Treść sekcji lub None, jeśli dokument jej nie zawiera
+    """
+    if span is None:
+        return None
+
+    start, end = span
+    if stop_at_blank_line:
+        # Pominięcie pustych linii bezpośrednio po nagłówku
+        while start < end and text[start] in " \t\n":
+            start += 1
+        blank = BLANK_LINE_PATTERN.search(text, start, end)
+        if blank:
+            end = blank.start()
+
+    return text[start:end]
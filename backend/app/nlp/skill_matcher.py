@@ -0,0 +1,180 @@
+"""
+Moduł jednoprzebiegowego wyszukiwania umiejętności w tekście.
+Wykorzystuje automat Aho-Corasick zbudowany ze słownika umiejętności i ich aliasów,
+dzięki czemu tekst jest skanowany raz, niezależnie od rozmiaru słownika.
+"""
+from collections import deque
+from functools import lru_cache
+from typing import Dict, List, Optional, Union
+import json
+import os
+
+from app.nlp.document import Document, as_document
+
+# Domyślna taksonomia umiejętności (nazwa kanoniczna -> lista aliasów)
+DEFAULT_TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "skills.json")
+SKILL_TAXONOMY_PATH = os.getenv("SKILL_TAXONOMY_PATH", DEFAULT_TAXONOMY_PATH)
+
+
+def _is_word_char(char: str) -> bool:
+    """
+    Sprawdza, czy znak jest znakiem słowa w sensie wyrażeń regularnych (\\w).
+    """
+    return char.isalnum() or char == "_"
+
+
+class SkillMatcher:
+    """
+    Wyszukiwanie wielu wzorców jednocześnie (Aho-Corasick) bez rozróżniania wielkości liter.
+    Dopasowanie musi zaczynać i kończyć się na granicy słowa, jeśli skrajny znak
+    wzorca jest znakiem słowa (np. "Java" nie pasuje w "JavaScript", a "C++" pasuje przed spacją).
+    """
+
+    def __init__(self, taxonomy: Dict[str, List[str]]):
+        """
+        Inicjalizacja i budowa automatu.
+
+        Args:
+            taxonomy: Słownik nazwa kanoniczna -> lista aliasów
+        """
+        self.canonical_names = list(taxonomy.keys())
+        # Stan automatu: przejścia, link porażki, wyjścia (długość wzorca, indeks nazwy kanonicznej)
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+
+        for canonical_id, (canonical, aliases) in enumerate(taxonomy.items()):
+            for pattern in {canonical, *aliases}:
+                pattern = pattern.strip().lower()
+                if pattern:
+                    self._add_pattern(pattern, canonical_id)
+
+        self._build_failure_links()
+
+    def __len__(self) -> int:
+        return len(self.canonical_names)
+
+    def _add_pattern(self, pattern: str, canonical_id: int):
+        """
+        Dodaje wzorzec do drzewa trie.
+
+        Args:
+            pattern: Wzorzec (małymi literami)
+            canonical_id: Indeks nazwy kanonicznej
+        """
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append((len(pattern), canonical_id))
+
+    def _build_failure_links(self):
+        """
+        Wyznacza linki porażki przeszukiwaniem wszerz i scala wyjścia stanów.
+        """
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                candidate = self._goto[fail].get(char, 0)
+                self._fail[next_state] = candidate if candidate != next_state else 0
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def find_all(self, text: Union[str, Document]) -> List[Dict]:
+        """
+        Znajduje wszystkie wystąpienia umiejętności w tekście w jednym przebiegu.
+
+        Args:
+            text: Tekst do przeszukania lub Document (używa jego tekstu małymi literami)
+
+        Returns:
+            List[Dict]: Dopasowania z nazwą kanoniczną, pozycją początku i końca
+        """
+        document = as_document(text)
+        text = document.text
+        lowered = document.lowered
+        # lower() może zmienić długość tekstu dla niektórych znaków Unicode
+        offsets_valid = len(lowered) == len(text)
+        goto, fail, output = self._goto, self._fail, self._output
+
+        matches = []
+        state = 0
+        for end, char in enumerate(lowered, start=1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            for length, canonical_id in output[state]:
+                start = end - length
+                if self._at_boundary(lowered, start, end):
+                    matches.append({
+                        "skill": self.canonical_names[canonical_id],
+                        "start": start if offsets_valid else None,
+                        "end": end if offsets_valid else None
+                    })
+
+        return matches
+
+    @staticmethod
+    def _at_boundary(text: str, start: int, end: int) -> bool:
+        """
+        Sprawdza granice słowa wokół dopasowania (odpowiednik \\b po stronie znaków słowa).
+        """
+        if _is_word_char(text[start]) and start > 0 and _is_word_char(text[start - 1]):
+            return False
+        if _is_word_char(text[end - 1]) and end < len(text) and _is_word_char(text[end]):
+            return False
+        return True
+
+    def extract(self, text: Union[str, Document]) -> List[str]:
+        """
+        Zwraca unikalne nazwy kanoniczne umiejętności w kolejności pierwszego wystąpienia.
+
+        Args:
+            text: Tekst do przeszukania lub Document
+
+        Returns:
+            List[str]: Lista nazw kanonicznych umiejętności
+        """
+        found = []
+        seen = set()
+        for match in self.find_all(text):
+            if match["skill"] not in seen:
+                seen.add(match["skill"])
+                found.append(match["skill"])
+        return found
+
+
+def load_taxonomy(path: Optional[str] = None) -> Dict[str, List[str]]:
+    """
+    Wczytuje taksonomię umiejętności z pliku JSON.
+
+    Args:
+        path: Ścieżka do pliku (domyślnie SKILL_TAXONOMY_PATH)
+
+    Returns:
+        Dict[str, List[str]]: Słownik nazwa kanoniczna -> lista aliasów
+    """
+    with open(path or SKILL_TAXONOMY_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=1)
+def get_skill_matcher() -> SkillMatcher:
+    """
+    Zwraca współdzielony automat zbudowany z domyślnej taksonomii (budowany raz na proces).
+
+    Returns:
+        SkillMatcher: Automat wyszukiwania umiejętności
+    """
+    return SkillMatcher(load_taxonomy())
@@ -0,0 +1,176 @@
+"""
+Moduł tabeli embeddingów kanonicznych umiejętności.
+Taksonomia umiejętności jest kodowana offline (scripts/build_skill_table.py) do macierzy .npy
+z tabelą identyfikatorów i aliasów w pliku JSON obok niej. Plik JSON wskazuje macierz nazwaną
+skrótem jej zawartości, więc nowa tabela jest podmieniana jedną operacją (zamiana pliku JSON)
+i czytelnik nie połączy nowej macierzy ze starymi metadanymi. Macierz jest mapowana w pamięci
+(mmap) - wczytanie nie odczytuje jej w całości, a strony pliku są współdzielone przez workery
+w pamięci podręcznej systemu. Umiejętności są rozwiązywane do identyfikatorów kanonicznych
+dokładnie lub przez alias. Nazwy spoza taksonomii są kodowane bezpośrednio modelem, a nie
+zastępowane najbliższym wierszem tabeli - przyciągnięcie do sąsiada zmieniałoby ich wynik
+względem każdego wymagania.
+"""
+from typing import Dict, List, Optional
+import glob
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from app.nlp.embedding_cache import normalize_text
+
+
+def skill_key(skill: str) -> str:
+    """
+    Zwraca klucz wyszukiwania umiejętności w tabeli (małe litery, pojedyncze spacje).
+    """
+    return normalize_text(skill).lower()
+
+
+def metadata_path(path: str) -> str:
+    """
+    Zwraca ścieżkę pliku JSON z tabelą identyfikatorów dla pliku macierzy.
+    """
+    return f"{os.path.splitext(path)[0]}.json"
+
+
+def matrix_path(path: str, digest: str) -> str:
+    """
+    Zwraca ścieżkę pliku macierzy o danym skrócie zawartości (np. skill_table.<skrót>.npy).
+    """
+    return f"{os.path.splitext(path)[0]}.{digest[:16]}.npy"
+
+
+class SkillTable:
+    """
+    Tabela kanonicznych umiejętności: identyfikator = numer wiersza macierzy embeddingów.
+    Wiersze są znormalizowane, więc iloczyn skalarny jest podobieństwem cosinusowym.
+    """
+
+    def __init__(self, taxonomy: Dict[str, List[str]], embeddings: np.ndarray, model_name: str):
+        """
+        Inicjalizacja tabeli.
+
+        Args:
+            taxonomy: Słownik nazwa kanoniczna -> lista aliasów (kolejność wierszy macierzy)
+            embeddings: Macierz embeddingów nazw kanonicznych (może być mapowana w pamięci)
+            model_name: Nazwa modelu, którym zakodowano tabelę
+
+        Raises:
+            ValueError: Jeśli liczba wierszy macierzy nie odpowiada taksonomii
+        """
+        if len(embeddings) != len(taxonomy):
+            raise ValueError(f"Macierz tabeli umiejętności ma {len(embeddings)} wierszy, a taksonomia {len(taxonomy)} nazw")
+
+        self.names = list(taxonomy.keys())
+        # Widok ndarray zamiast np.memmap - indeksowanie bez narzutu podklasy, bez kopiowania danych
+        self.embeddings = np.asarray(embeddings)
+        self.model_name = model_name
+        # Aliasy nie nadpisują nazw kanonicznych ani wcześniejszych aliasów
+        self._ids = {}
+        for canonical_id, name in enumerate(self.names):
+            self._ids.setdefault(skill_key(name), canonical_id)
+        for canonical_id, aliases in enumerate(taxonomy.values()):
+            for alias in aliases:
+                if alias.strip():
+                    self._ids.setdefault(skill_key(alias), canonical_id)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def dimension(self) -> int:
+        return self.embeddings.shape[1]
+
+    def lookup(self, skills: List[str]) -> np.ndarray:
+        """
+        Rozwiązuje umiejętności do identyfikatorów kanonicznych (nazwa lub alias).
+
+        Args:
+            skills: Lista umiejętności
+
+        Returns:
+            np.ndarray: Identyfikatory kanoniczne (-1 dla umiejętności spoza taksonomii)
+        """
+        canonical_ids = np.empty(len(skills), dtype=np.int64)
+        for position, skill in enumerate(skills):
+            # Umiejętności z analizatora są już małymi literami - normalizacja tylko przy braku trafienia
+            canonical_id = self._ids.get(skill)
+            if canonical_id is None:
+                canonical_id = self._ids.get(skill_key(skill), -1)
+            canonical_ids[position] = canonical_id
+        return canonical_ids
+
+
+def build_skill_table(model, model_name: str, taxonomy: Dict[str, List[str]], path: str, batch_size: int = 256) -> SkillTable:
+    """
+    Koduje nazwy kanoniczne taksonomii i zapisuje tabelę (macierz .npy i plik JSON).
+
+    Args:
+        model: Koder o interfejsie SentenceTransformer
+        model_name: Nazwa przestrzeni embeddingów kodera
+        taxonomy: Słownik nazwa kanoniczna -> lista aliasów
+        path: Ścieżka tabeli (.npy); macierz jest zapisywana obok pod nazwą ze skrótem zawartości
+        batch_size: Liczba nazw w jednym wywołaniu modelu
+
+    Returns:
+        SkillTable: Zapisana tabela
+    """
+    # Teksty jak w RelevanceAnalyzer (małe litery, normalizacja cache) - te same wektory co przy kodowaniu
+    texts = [skill_key(name) for name in taxonomy]
+    embeddings = np.asarray(model.encode(texts, batch_size=batch_size), dtype=np.float32).reshape(len(texts), -1)
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    embeddings = embeddings / np.where(norms == 0, 1.0, norms)
+
+    embeddings = embeddings.astype(np.float32)
+    digest = hashlib.sha256(embeddings.tobytes()).hexdigest()
+    matrix = matrix_path(path, digest)
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    # Macierz pod nową nazwą, a potem podmiana pliku JSON - jedyny krok widoczny dla czytelników
+    tmp_path = f"{matrix}.tmp.npy"
+    np.save(tmp_path, embeddings)
+    os.replace(tmp_path, matrix)
+    tmp_metadata_path = f"{metadata_path(path)}.tmp"
+    with open(tmp_metadata_path, "w", encoding="utf-8") as f:
+        json.dump({"model_name": model_name, "matrix": os.path.basename(matrix), "sha256": digest, "skills": taxonomy}, f, ensure_ascii=False)
+    os.replace(tmp_metadata_path, metadata_path(path))
+
+    # Usunięcie poprzednich macierzy (workery, które je zmapowały, zachowują dostęp do danych)
+    stale = glob.glob(f"{glob.escape(os.path.splitext(path)[0])}.*.npy") + [path]
+    for stale_path in stale:
+        if os.path.exists(stale_path) and os.path.abspath(stale_path) != os.path.abspath(matrix):
+            os.remove(stale_path)
+
+    return SkillTable(taxonomy, embeddings, model_name)
+
+
+def load_skill_table(path: Optional[str]) -> Optional[SkillTable]:
+    """
+    Wczytuje tabelę zapisaną funkcją build_skill_table (macierz mapowana w pamięci, tylko do odczytu).
+    Macierz jest odczytywana z pliku wskazanego w metadanych; jeśli w międzyczasie zbudowano
+    nową tabelę i stara macierz została usunięta, metadane są odczytywane ponownie.
+
+    Args:
+        path: Ścieżka do pliku macierzy (.npy)
+
+    Returns:
+        Optional[SkillTable]: Tabela lub None, jeśli pliki nie istnieją
+    """
+    if not path:
+        return None
+
+    for _ in range(2):
+        if not os.path.exists(metadata_path(path)):
+            return None
+        with open(metadata_path(path), "r", encoding="utf-8") as f:
+            metadata = json.load(f)
+        # Tabele zbudowane przed wersjonowaniem macierzy - plik pod ścieżką path
+        matrix = os.path.join(os.path.dirname(path), metadata["matrix"]) if "matrix" in metadata else path
+        try:
+            embeddings = np.load(matrix, mmap_mode="r")
+        except FileNotFoundError:
+            continue
+        return SkillTable(metadata["skills"], embeddings, metadata["model_name"])
+    return None
@@ -0,0 +1,87 @@
+"""
+Moduł modelu TF-IDF dopasowanego do korpusu zapisanych CV i ogłoszeń.
+Model jest dopasowywany offline (scripts/fit_tfidf.py), zapisywany jako słownik i wagi IDF
+w pliku NPZ i wczytywany przy starcie aplikacji - żądania wykonują wyłącznie transform.
+"""
+from typing import TYPE_CHECKING, Iterable, Optional
+import os
+
+import numpy as np
+
+from app.nlp.document import document_terms
+
+if TYPE_CHECKING:
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+
+def fit_tfidf_model(texts: Iterable[str], min_df: int = 2, max_df: float = 0.95, max_features: Optional[int] = None, sublinear_tf: bool = True) -> "TfidfVectorizer":
+    """
+    Dopasowuje model TF-IDF do korpusu dokumentów (terminy z app.nlp.document.Document).
+
+    Args:
+        texts: Teksty dokumentów (może być generatorem - korpus nie musi mieścić się w pamięci)
+        min_df: Minimalna liczba dokumentów zawierających termin
+        max_df: Maksymalny odsetek dokumentów zawierających termin
+        max_features: Maksymalny rozmiar słownika (opcjonalnie)
+        sublinear_tf: Czy stosować logarytmiczne skalowanie częstości terminów
+
+    Returns:
+        TfidfVectorizer: Dopasowany model
+    """
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    vectorizer = TfidfVectorizer(
+        min_df=min_df,
+        max_df=max_df,
+        max_features=max_features,
+        sublinear_tf=sublinear_tf,
+        analyzer=document_terms
+    )
+    return vectorizer.fit(texts)
+
+
+def save_tfidf_model(vectorizer: "TfidfVectorizer", path: str):
+    """
+    Zapisuje słownik i wagi IDF modelu do pliku NPZ.
+
+    Args:
+        vectorizer: Dopasowany model TF-IDF
+        path: Ścieżka do pliku wynikowego
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    # Zapis do pliku tymczasowego i podmiana - działająca aplikacja nie odczyta połowy pliku
+    tmp_path = f"{path}.tmp.npz"
+    np.savez(
+        tmp_path,
+        terms=np.array(vectorizer.get_feature_names_out(), dtype=str),
+        idf=vectorizer.idf_.astype(np.float64),
+        sublinear_tf=np.array(vectorizer.sublinear_tf)
+    )
+    os.replace(tmp_path, path)
+
+
+def load_tfidf_model(path: Optional[str]) -> Optional["TfidfVectorizer"]:
+    """
+    Wczytuje model zapisany funkcją save_tfidf_model.
+
+    Args:
+        path: Ścieżka do pliku modelu
+
+    Returns:
+        Optional[TfidfVectorizer]: Model gotowy do transform lub None, jeśli plik nie istnieje
+    """
+    if not path or not os.path.exists(path):
+        return None
+
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    with np.load(path) as archive:
+        terms = archive["terms"].tolist()
+        vectorizer = TfidfVectorizer(
+            vocabulary={term: index for index, term in enumerate(terms)},
+            sublinear_tf=bool(archive["sublinear_tf"]),
+            analyzer=document_terms
+        )
+        vectorizer.idf_ = archive["idf"]
+
+    return vectorizer
@@ -0,0 +1,529 @@
+"""
+Moduł indeksu wektorowego zapisanych CV.
+Pozwala wyszukać CV najlepiej pasujące do ogłoszenia bez ponownego uruchamiania
+pełnej analizy relewantności dla każdego zapisanego CV.
+"""
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Sequence, Tuple
+import json
+import os
+import re
+import threading
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows - indeks używany przez jeden proces
+    fcntl = None
+
+# Liczba cyfr szesnastkowych skrótu SHA-256 treści CV tworzących identyfikator w indeksie (60 bitów - mieści się w int64)
+CONTENT_KEY_HEX_DIGITS = 15
+
+
+def content_key(filename: str) -> int:
+    """
+    Wyznacza identyfikator CV w indeksie z nazwy pliku zapisanego przez store_upload
+    ("<sha256>.<rozszerzenie>"). To samo CV analizowane wielokrotnie ma jeden wpis w indeksie.
+
+    Args:
+        filename: Nazwa pliku CV w katalogu UPLOAD_DIR
+
+    Returns:
+        int: Pierwsze 60 bitów skrótu treści pliku
+    """
+    return int(os.path.basename(filename)[:CONTENT_KEY_HEX_DIGITS], 16)
+
+
+def content_key_prefix(key: int) -> str:
+    """
+    Zwraca początek nazwy pliku CV (skrótu treści) odpowiadający identyfikatorowi z indeksu.
+    """
+    return f"{key:0{CONTENT_KEY_HEX_DIGITS}x}"
+
+
+def combine_section_vectors(section_embeddings: Dict[str, np.ndarray], dim: int, sections: Sequence[str],
+                            weights: Optional[Dict[str, float]] = None) -> np.ndarray:
+    """
+    Łączy embeddingi sekcji dokumentu w jeden wektor indeksu.
+    Każda sekcja jest uśredniana i normalizowana, a brakujące sekcje są wypełniane zerami.
+    Wektory CV w indeksie nie są ważone; wagi otrzymuje wektor zapytania, więc iloczyn
+    skalarny jest ważoną sumą podobieństw cosinusowych sekcji dla wag danego wyszukiwania.
+
+    Args:
+        section_embeddings: Słownik sekcja -> macierz embeddingów (może być pusta)
+        dim: Wymiar embeddingów modelu
+        sections: Kolejność sekcji w wektorze
+        weights: Wagi sekcji wektora zapytania (None - wektor CV bez wag)
+
+    Returns:
+        np.ndarray: Wektor o wymiarze dim * len(sections)
+    """
+    parts = []
+    for section in sections:
+        embeddings = section_embeddings.get(section)
+        part = np.zeros(dim, dtype=np.float32)
+        if embeddings is not None and len(embeddings):
+            centroid = np.asarray(embeddings, dtype=np.float32).reshape(-1, dim).mean(axis=0)
+            norm = np.linalg.norm(centroid)
+            if norm > 0:
+                part = centroid / norm
+                if weights is not None:
+                    part = part * weights.get(section, 0.0)
+        parts.append(part)
+    return np.concatenate(parts).astype(np.float32)
+
+
+class IndexMismatchError(ValueError):
+    """
+    Indeks zbudowano innym modelem, dla innego wymiaru wektorów lub innego układu sekcji.
+    """
+
+
+def check_metadata(path: str, dim: int, model_name: Optional[str], sections: Optional[Sequence[str]] = None):
+    """
+    Sprawdza, czy indeks w katalogu zbudowano tym samym modelem, wymiarem wektorów
+    i układem sekcji, a dla nowego indeksu zapisuje te dane w pliku index.json.
+
+    Args:
+        path: Katalog z plikami indeksu
+        dim: Wymiar wektorów indeksu
+        model_name: Nazwa modelu kodującego wektory (None - bez sprawdzania modelu)
+        sections: Kolejność sekcji w wektorach indeksu (None - bez sprawdzania sekcji)
+
+    Raises:
+        IndexMismatchError: Jeśli indeks zbudowano innym modelem, wymiarem lub układem sekcji
+    """
+    sections = list(sections) if sections is not None else None
+    metadata_path = os.path.join(path, "index.json")
+    if os.path.exists(metadata_path):
+        with open(metadata_path, "r", encoding="utf-8") as f:
+            metadata = json.load(f)
+        if metadata.get("dim") != dim or (model_name is not None and metadata.get("model_name") != model_name):
+            raise IndexMismatchError(
+                f"Indeks CV w {path} zbudowano modelem {metadata.get('model_name')} (wymiar {metadata.get('dim')}), "
+                f"a bieżący model to {model_name} (wymiar {dim}) - przebuduj go skryptem scripts/build_cv_index.py"
+            )
+        if sections is not None and metadata.get("sections") != sections:
+            raise IndexMismatchError(
+                f"Indeks CV w {path} zbudowano dla sekcji {metadata.get('sections')}, a bieżące sekcje to {sections} "
+                f"- przebuduj go skryptem scripts/build_cv_index.py"
+            )
+        return
+
+    tmp_path = f"{metadata_path}.tmp.{os.getpid()}"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"model_name": model_name, "dim": dim, "sections": sections}, f)
+    os.replace(tmp_path, metadata_path)
+
+
+class VectorLog:
+    """
+    Dziennik wektorów indeksu w plikach binarnych (ids.i64, vectors.f32), tylko dopisywany.
+    Jest wspólny dla procesów (workerów gunicorn): zapis odbywa się pod blokadą pliku,
+    a każdy proces odczytuje wiersze dopisane od ostatniego odczytu. Późniejszy wiersz
+    z tym samym identyfikatorem zastępuje wcześniejszy.
+    """
+
+    def __init__(self, path: str, dim: int):
+        """
+        Inicjalizacja dziennika.
+
+        Args:
+            path: Katalog z plikami dziennika
+            dim: Wymiar wektorów
+        """
+        self.dim = dim
+        os.makedirs(path, exist_ok=True)
+        self._ids_path = os.path.join(path, "ids.i64")
+        self._vectors_path = os.path.join(path, "vectors.f32")
+        self._lock_path = os.path.join(path, ".lock")
+        # Liczba odczytanych wierszy i plik, z którego je odczytano (zmiana = przebudowany indeks)
+        self.rows = 0
+        self._file_id = None
+
+    @contextmanager
+    def _file_lock(self, exclusive: bool):
+        """
+        Blokada dziennika między procesami (wyłączna przy zapisie, współdzielona przy odczycie).
+        """
+        if fcntl is None:
+            yield
+            return
+        with open(self._lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def append(self, ids: np.ndarray, vectors: np.ndarray):
+        """
+        Dopisuje wiersze na końcu dziennika.
+
+        Args:
+            ids: Identyfikatory
+            vectors: Macierz wektorów (len(ids) x dim)
+        """
+        with self._file_lock(exclusive=True):
+            # Najpierw wektory - niedokończony zapis zostawia wektor bez identyfikatora, który jest pomijany
+            with open(self._vectors_path, "ab") as f:
+                vectors.tofile(f)
+            with open(self._ids_path, "ab") as f:
+                ids.tofile(f)
+
+    def skip(self, rows: int):
+        """
+        Oznacza pierwsze rows wierszy jako odczytane (np. zawarte w migawce indeksu HNSW).
+        """
+        self.rows = rows
+        self._file_id = self._stat_id()
+
+    def _stat_id(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self._ids_path)
+        except FileNotFoundError:
+            return None
+        return stat.st_dev, stat.st_ino
+
+    def read_new(self) -> Tuple[np.ndarray, np.ndarray, bool]:
+        """
+        Odczytuje wiersze dopisane od ostatniego odczytu (przez dowolny proces).
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, bool]: Nowe identyfikatory, ich wektory oraz informacja,
+            czy dziennik przebudowano (wtedy zwracane są wszystkie wiersze i należy odrzucić poprzednie)
+        """
+        empty = (np.zeros(0, dtype=np.int64), np.zeros((0, self.dim), dtype=np.float32))
+        with self._file_lock(exclusive=False):
+            file_id = self._stat_id()
+            if file_id is None or not os.path.exists(self._vectors_path):
+                return empty + (False,)
+
+            reset = self._file_id is not None and file_id != self._file_id
+            start = 0 if reset else self.rows
+            count = min(os.path.getsize(self._ids_path) // 8, os.path.getsize(self._vectors_path) // (4 * self.dim))
+            if count < start:
+                # Plik krótszy niż odczytana część - dziennik zapisano od nowa
+                reset, start = True, 0
+            self._file_id = file_id
+            if count == start and not reset:
+                return empty + (False,)
+
+            ids = np.fromfile(self._ids_path, dtype=np.int64, count=count - start, offset=start * 8)
+            vectors = np.fromfile(
+                self._vectors_path, dtype=np.float32, count=(count - start) * self.dim, offset=start * 4 * self.dim
+            ).reshape(-1, self.dim)
+            self.rows = count
+        return ids, vectors, reset
+
+
+def latest_rows(ids: np.ndarray, vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Zostawia ostatnie wystąpienie każdego identyfikatora (w kolejności dziennika).
+    """
+    if len(ids) < 2:
+        return ids, vectors
+    _, reversed_first = np.unique(ids[::-1], return_index=True)
+    keep = np.sort(len(ids) - 1 - reversed_first)
+    return ids[keep], vectors[keep]
+
+
+class BruteForceIndex:
+    """
+    Dokładny indeks przeszukiwany iloczynem macierzowym NumPy.
+    Wektory i identyfikatory są dopisywane do dziennika (VectorLog), więc aktualizacja
+    nie wymaga przepisywania całego indeksu, a każdy proces przed wyszukiwaniem
+    dołącza wiersze dopisane przez pozostałe procesy. Dziennik jest jedynym trwałym
+    stanem indeksu - macierz w pamięci jest odtwarzana z niego przy starcie.
+    """
+
+    def __init__(self, path: str, dim: int, model_name: Optional[str] = None, sections: Optional[Sequence[str]] = None):
+        """
+        Inicjalizacja indeksu.
+
+        Args:
+            path: Katalog z plikami indeksu
+            dim: Wymiar wektorów indeksu
+            model_name: Nazwa modelu kodującego wektory
+            sections: Kolejność sekcji w wektorach indeksu
+
+        Raises:
+            IndexMismatchError: Jeśli indeks zbudowano innym modelem, wymiarem lub układem sekcji
+        """
+        self.path = path
+        self.dim = dim
+        self._lock = threading.Lock()
+        self._log = VectorLog(path, dim)
+        check_metadata(path, dim, model_name, sections)
+        self._clear()
+        self._refresh()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _clear(self):
+        self._count = 0
+        self._ids = np.zeros(0, dtype=np.int64)
+        self._vectors = np.zeros((0, self.dim), dtype=np.float32)
+        self._positions = {}
+
+    def _refresh(self):
+        """
+        Dołącza wiersze dopisane do dziennika od ostatniego odczytu. Wywoływana pod self._lock.
+        """
+        ids, vectors, reset = self._log.read_new()
+        if reset:
+            self._clear()
+        if len(ids) == 0:
+            return
+
+        ids, vectors = latest_rows(ids, vectors)
+        positions = np.array([self._positions.get(cv_id, -1) for cv_id in ids.tolist()], dtype=np.int64)
+        existing = positions >= 0
+        # Zastąpienie wektorów istniejących identyfikatorów w miejscu
+        self._vectors[positions[existing]] = vectors[existing]
+
+        new_ids, new_vectors = ids[~existing], vectors[~existing]
+        required = self._count + len(new_ids)
+        if required > len(self._ids):
+            # Bufory powiększane dwukrotnie - dopisanie nie kopiuje całego indeksu przy każdej analizie
+            capacity = max(required, 2 * len(self._ids), 1024)
+            ids_buffer = np.zeros(capacity, dtype=np.int64)
+            vectors_buffer = np.zeros((capacity, self.dim), dtype=np.float32)
+            ids_buffer[:self._count] = self._ids[:self._count]
+            vectors_buffer[:self._count] = self._vectors[:self._count]
+            self._ids, self._vectors = ids_buffer, vectors_buffer
+        self._ids[self._count:required] = new_ids
+        self._vectors[self._count:required] = new_vectors
+        self._positions.update(zip(new_ids.tolist(), range(self._count, required)))
+        self._count = required
+
+    def add(self, ids: List[int], vectors: np.ndarray):
+        """
+        Dopisuje wektory do dziennika indeksu.
+        Ponowne dodanie istniejącego identyfikatora zastępuje jego wektor.
+
+        Args:
+            ids: Identyfikatory CV
+            vectors: Macierz wektorów (len(ids) x dim)
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(len(ids), self.dim)
+
+        with self._lock:
+            self._log.append(ids, vectors)
+            self._refresh()
+
+    def search(self, query: np.ndarray, k: int = 10) -> List[Tuple[int, float]]:
+        """
+        Wyszukuje k wektorów o największym iloczynie skalarnym z zapytaniem.
+
+        Args:
+            query: Wektor zapytania
+            k: Liczba wyników
+
+        Returns:
+            List[Tuple[int, float]]: Pary (identyfikator CV, wynik) posortowane malejąco
+        """
+        with self._lock:
+            self._refresh()
+            ids, vectors = self._ids[:self._count], self._vectors[:self._count]
+
+        if len(ids) == 0:
+            return []
+
+        scores = vectors @ np.asarray(query, dtype=np.float32)
+        k = min(k, len(ids))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(int(ids[i]), float(scores[i])) for i in top]
+
+    def save(self):
+        """
+        Nie zapisuje niczego: każde add dopisuje wiersze do dziennika od razu, a dziennik
+        jest jedynym trwałym stanem indeksu. Metoda istnieje dla wspólnego interfejsu
+        z HNSWIndex (zapis przy zamknięciu aplikacji i po budowie indeksu).
+        """
+
+
+class HNSWIndex:
+    """
+    Przybliżony indeks HNSW (hnswlib) dla dużych zbiorów CV.
+    Źródłem danych jest wspólny dziennik wektorów (VectorLog) - każdy proces dołącza
+    do swojego grafu wiersze dopisane przez pozostałe procesy. Graf jest zapisywany
+    tylko w save() jako migawka hnsw.<liczba wierszy>.bin, od której przy starcie
+    odtwarzana jest pozostała część dziennika.
+    """
+
+    SNAPSHOT_PATTERN = re.compile(r"^hnsw\.(\d+)\.bin$")
+
+    def __init__(self, path: str, dim: int, model_name: Optional[str] = None, sections: Optional[Sequence[str]] = None,
+                 max_elements: int = 10000, ef_construction: int = 200, m: int = 16, ef_search: int = 64):
+        """
+        Inicjalizacja indeksu.
+
+        Args:
+            path: Katalog z plikami indeksu
+            dim: Wymiar wektorów indeksu
+            model_name: Nazwa modelu kodującego wektory
+            sections: Kolejność sekcji w wektorach indeksu
+            max_elements: Początkowa pojemność indeksu (zwiększana automatycznie)
+            ef_construction: Parametr jakości budowy grafu
+            m: Liczba połączeń węzła w grafie
+            ef_search: Parametr jakości wyszukiwania
+
+        Raises:
+            ImportError: Jeśli pakiet hnswlib nie jest zainstalowany
+            IndexMismatchError: Jeśli indeks zbudowano innym modelem, wymiarem lub układem sekcji
+        """
+        import hnswlib
+
+        self._hnswlib = hnswlib
+        self.path = path
+        self.dim = dim
+        self.max_elements = max_elements
+        self.ef_construction = ef_construction
+        self.m = m
+        self.ef_search = ef_search
+        self._lock = threading.Lock()
+        self._log = VectorLog(path, dim)
+        check_metadata(path, dim, model_name, sections)
+
+        self._index = None
+        for rows, snapshot_path in self._snapshots():
+            try:
+                index = hnswlib.Index(space="ip", dim=dim)
+                index.load_index(snapshot_path, allow_replace_deleted=True)
+            except (FileNotFoundError, RuntimeError):
+                # Migawka usunięta przez inny proces lub niepełna - próba starszej
+                continue
+            self._index = index
+            self._log.skip(rows)
+            break
+        if self._index is None:
+            self._index = self._new_index()
+        self._index.set_ef(ef_search)
+        self._refresh()
+
+    def __len__(self) -> int:
+        return self._index.get_current_count()
+
+    def _new_index(self):
+        index = self._hnswlib.Index(space="ip", dim=self.dim)
+        index.init_index(max_elements=self.max_elements, ef_construction=self.ef_construction, M=self.m, allow_replace_deleted=True)
+        return index
+
+    def _snapshots(self) -> List[Tuple[int, str]]:
+        """
+        Zwraca migawki grafu (liczba wierszy dziennika, ścieżka) od najnowszej.
+        """
+        snapshots = []
+        for name in os.listdir(self.path):
+            match = self.SNAPSHOT_PATTERN.match(name)
+            if match:
+                snapshots.append((int(match.group(1)), os.path.join(self.path, name)))
+        return sorted(snapshots, reverse=True)
+
+    def _refresh(self):
+        """
+        Dodaje do grafu wiersze dopisane do dziennika od ostatniego odczytu. Wywoływana pod self._lock.
+        """
+        ids, vectors, reset = self._log.read_new()
+        if reset:
+            self._index = self._new_index()
+            self._index.set_ef(self.ef_search)
+        if len(ids) == 0:
+            return
+
+        ids, vectors = latest_rows(ids, vectors)
+        required = self._index.get_current_count() + len(ids)
+        if required > self._index.get_max_elements():
+            self._index.resize_index(max(required, self._index.get_max_elements() * 2))
+        # Istniejący identyfikator jest aktualizowany w grafie
+        self._index.add_items(vectors, ids)
+
+    def add(self, ids: List[int], vectors: np.ndarray):
+        """
+        Dopisuje wektory do dziennika indeksu i dodaje je do grafu.
+
+        Args:
+            ids: Identyfikatory CV
+            vectors: Macierz wektorów (len(ids) x dim)
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(len(ids), self.dim)
+
+        with self._lock:
+            self._log.append(ids, vectors)
+            self._refresh()
+
+    def search(self, query: np.ndarray, k: int = 10) -> List[Tuple[int, float]]:
+        """
+        Wyszukuje k najbliższych wektorów zapytania.
+
+        Args:
+            query: Wektor zapytania
+            k: Liczba wyników
+
+        Returns:
+            List[Tuple[int, float]]: Pary (identyfikator CV, wynik) posortowane malejąco
+        """
+        with self._lock:
+            self._refresh()
+            count = self._index.get_current_count()
+            if count == 0:
+                return []
+            k = min(k, count)
+            self._index.set_ef(max(self.ef_search, k))
+            labels, distances = self._index.knn_query(np.asarray(query, dtype=np.float32), k=k)
+
+        # Dla przestrzeni "ip" hnswlib zwraca odległość 1 - iloczyn skalarny
+        return [(int(label), float(1.0 - distance)) for label, distance in zip(labels[0], distances[0])]
+
+    def save(self):
+        """
+        Zapisuje migawkę grafu (przy zamknięciu aplikacji i po budowie indeksu).
+        Starsze migawki są usuwane; zapis przez plik tymczasowy i podmianę.
+        """
+        with self._lock:
+            self._refresh()
+            rows = self._log.rows
+            snapshot_path = os.path.join(self.path, f"hnsw.{rows}.bin")
+            if os.path.exists(snapshot_path):
+                return
+            tmp_path = f"{snapshot_path}.tmp.{os.getpid()}"
+            self._index.save_index(tmp_path)
+            os.replace(tmp_path, snapshot_path)
+
+        for snapshot_rows, path in self._snapshots():
+            if snapshot_rows < rows:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
+
+def create_index(kind: str, path: str, dim: int, model_name: Optional[str] = None, sections: Optional[Sequence[str]] = None):
+    """
+    Tworzy indeks wektorowy wybranego typu.
+
+    Args:
+        kind: Typ indeksu: "bruteforce" (dokładny) lub "hnsw" (przybliżony)
+        path: Katalog z plikami indeksu
+        dim: Wymiar wektorów indeksu
+        model_name: Nazwa modelu kodującego wektory (zapisywana przy indeksie i sprawdzana przy wczytaniu)
+        sections: Kolejność sekcji w wektorach indeksu (zapisywana i sprawdzana jak model)
+
+    Returns:
+        BruteForceIndex | HNSWIndex: Indeks wektorowy
+
+    Raises:
+        ValueError: Jeśli typ indeksu nie jest obsługiwany
+        IndexMismatchError: Jeśli indeks zbudowano innym modelem, wymiarem lub układem sekcji
+    """
+    if kind == "bruteforce":
+        return BruteForceIndex(path, dim, model_name, sections)
+    if kind == "hnsw":
+        return HNSWIndex(path, dim, model_name, sections)
+    raise ValueError(f"Nieobsługiwany typ indeksu: {kind}")
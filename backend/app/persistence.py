@@ -0,0 +1,137 @@
+"""
+Moduł zapisu wyników analiz: tabele analiz w bazie danych (crud.save_analyses) oraz indeks
+wektorowy zapisanych CV, a także wykonanie zadania analizy z kolejki zadań asynchronicznych.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+import asyncio
+import logging
+import os
+
+from sqlalchemy.orm import Session
+
+from app.metrics import in_request_context, timed
+from app.models import crud
+from app.models.database import AsyncSessionLocal, SessionLocal
+from app.nlp.parse_cache import ParseCache
+from app.nlp.scoring import RelevanceAnalyzer
+from app.nlp.vector_index import content_key
+from app.pipeline import UPLOAD_DIR, run_analysis
+
+logger = logging.getLogger(__name__)
+
+# Zapisywanie wyników analiz w bazie danych
+PERSIST_ANALYSES = os.getenv("PERSIST_ANALYSES", "True").lower() in ("1", "true", "yes")
+
+# Indeks wektorowy zapisanych CV: "bruteforce" (dokładny) lub "hnsw" (przybliżony)
+CV_INDEX_TYPE = os.getenv("CV_INDEX_TYPE", "bruteforce")
+CV_INDEX_PATH = os.getenv(
+    "CV_INDEX_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "index", "cv")
+)
+
+
+async def persist_analyses(analyzer: RelevanceAnalyzer, cv_index, executor: ThreadPoolExecutor, db: Session, records: List[Dict]) -> List[Optional[int]]:
+    """
+    Zapisuje analizy w bazie danych (jedna transakcja, crud.save_analyses) i dodaje ich CV
+    do indeksu wektorowego. W trybie DATABASE_MODE=async zapis odbywa się przez AsyncSession
+    w pętli zdarzeń, bez zajmowania wątku puli analiz na czas oczekiwania na bazę.
+    Błąd zapisu nie przerywa żądania - analiza jest zwracana bez identyfikatora.
+
+    Args:
+        analyzer: Analizator relewantności
+        cv_index: Indeks wektorowy CV
+        executor: Pula wątków analizy
+        db: Sesja bazy danych (tryb synchroniczny)
+        records: Lista słowników z kluczami cv_filename, job_description_filename,
+            cv_data, job_data i analysis
+
+    Returns:
+        List[Optional[int]]: Identyfikatory zapisanych analiz (None, gdy zapis się nie powiódł)
+    """
+    if not PERSIST_ANALYSES or not records:
+        return [None] * len(records)
+
+    loop = asyncio.get_running_loop()
+
+    try:
+        with timed("db_write"):
+            if AsyncSessionLocal is not None:
+                async with AsyncSessionLocal() as session:
+                    saved = await session.run_sync(crud.save_analyses, records, analyzer.section_weights)
+            else:
+                saved = await loop.run_in_executor(executor, crud.save_analyses, db, records, analyzer.section_weights)
+    except Exception as e:
+        logger.warning("Nie udało się zapisać analiz w bazie danych: %s", e)
+        return [None] * len(records)
+
+    await loop.run_in_executor(executor, in_request_context(index_saved_cvs), analyzer, cv_index, records)
+
+    return [analysis.id for analysis in saved]
+
+
+def index_saved_cvs(analyzer: RelevanceAnalyzer, cv_index, records: List[Dict]):
+    """
+    Dodaje CV zapisanych analiz do indeksu wektorowego.
+    Identyfikatorem CV w indeksie jest skrót treści pliku (content_key), więc CV analizowane
+    ponownie zastępuje swój wpis zamiast dodawać kolejny.
+    Błąd aktualizacji indeksu jest tylko logowany - analizy są już zapisane.
+    Funkcja blokująca - wywoływana w puli wątków, a nie w pętli zdarzeń.
+
+    Args:
+        analyzer: Analizator relewantności
+        cv_index: Indeks wektorowy CV (None, jeśli jest niedostępny)
+        records: Rekordy zapisanych analiz (z kluczami cv_filename i cv_data)
+    """
+    if cv_index is None:
+        return
+
+    # Jedno kodowanie na plik CV, także gdy partia zawiera to samo CV kilka razy
+    unique = {content_key(record["cv_filename"]): record["cv_data"] for record in records}
+
+    try:
+        with timed("index"):
+            vectors = analyzer.index_vectors(list(unique.values()), "cv")
+            cv_index.add(list(unique.keys()), vectors)
+    except Exception as e:
+        logger.warning("Nie udało się zaktualizować indeksu CV: %s", e)
+
+
+def run_analysis_job(analyzer: RelevanceAnalyzer, parse_cache: ParseCache, cv_index, payload: Dict) -> int:
+    """
+    Wykonuje zadanie analizy z kolejki: parsowanie, ocenę relewantności i zapis wyniku
+    w tabelach analiz. W odróżnieniu od persist_analyses błąd zapisu kończy zadanie błędem,
+    ponieważ zapisana analiza jest jedynym wynikiem zadania.
+    Funkcja blokująca - wywoływana w wątkach puli zadań.
+
+    Args:
+        analyzer: Analizator relewantności
+        parse_cache: Pamięć podręczna wyników parsowania
+        cv_index: Indeks wektorowy CV
+        payload: Parametry zadania (app.api.analyze.submit_analysis_job)
+
+    Returns:
+        int: Identyfikator zapisanej analizy
+    """
+    result = run_analysis(
+        analyzer,
+        parse_cache,
+        os.path.join(UPLOAD_DIR, payload["cv_filename"]),
+        os.path.join(UPLOAD_DIR, payload["job_description_filename"]),
+        pdf_engine=payload.get("pdf_engine"),
+        section_weights=payload.get("section_weights")
+    )
+    record = {
+        "cv_filename": payload["cv_filename"],
+        "job_description_filename": payload["job_description_filename"],
+        **result
+    }
+
+    db = SessionLocal()
+    try:
+        with timed("db_write"):
+            saved = crud.save_analyses(db, [record], analyzer.section_weights)
+        index_saved_cvs(analyzer, cv_index, [record])
+        return saved[0].id
+    finally:
+        db.close()
@@ -0,0 +1,312 @@
+"""
+Moduł potoku analizy: zapis przesłanych plików, parsowanie z pamięcią podręczną wyników
+(ParseCache) i ocena relewantności pojedynczych CV oraz partii CV względem ogłoszenia.
+Funkcje blokujące są wywoływane w puli wątków analizy, a nie w pętli zdarzeń.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import hashlib
+import os
+import uuid
+
+from fastapi import UploadFile
+import numpy as np
+
+from app.metrics import in_request_context, timed
+from app.nlp.batching import InferenceScheduler
+from app.nlp.document import Document
+from app.nlp.parse_cache import ParseCache
+from app.nlp.parser import PARSER_VERSION, PDF_ENGINE, PDF_MAX_CHARS, PDF_MAX_PAGES, CVParser, JobDescriptionParser
+from app.nlp.scoring import RelevanceAnalyzer
+
+# Utworzenie katalogu na przesłane pliki
+UPLOAD_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "uploads")
+os.makedirs(UPLOAD_DIR, exist_ok=True)
+
+# Rozmiar bloku odczytu przy zapisie i haszowaniu przesłanych plików
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def store_upload(upload: UploadFile) -> str:
+    """
+    Zapisuje przesłany plik na dysku pod nazwą wynikającą ze skrótu SHA-256 jego treści.
+    Identyczne pliki są przechowywane tylko raz.
+
+    Args:
+        upload: Przesłany plik
+
+    Returns:
+        str: Nazwa zapisanego pliku w katalogu UPLOAD_DIR ("<sha256>.<rozszerzenie>")
+    """
+    extension = upload.filename.rsplit('.', 1)[1].lower()
+    tmp_path = os.path.join(UPLOAD_DIR, f".{uuid.uuid4()}.tmp")
+    digest = hashlib.sha256()
+
+    try:
+        with timed("save", extension):
+            with open(tmp_path, "wb") as f:
+                for chunk in iter(lambda: upload.file.read(UPLOAD_CHUNK_SIZE), b""):
+                    digest.update(chunk)
+                    f.write(chunk)
+
+            filename = f"{digest.hexdigest()}.{extension}"
+            path = os.path.join(UPLOAD_DIR, filename)
+            if os.path.exists(path):
+                os.remove(tmp_path)
+            else:
+                os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    return filename
+
+
+def parse_cached(parse_cache: ParseCache, kind: str, path: str, parse, pdf_engine: Optional[str] = None) -> Tuple[Dict, Document]:
+    """
+    Zwraca wynik parsowania pliku z cache lub wykonuje parsowanie.
+    Kluczem jest nazwa pliku w UPLOAD_DIR (skrót treści i rozszerzenie), wersja parsera
+    oraz - dla plików PDF - silnik ekstrakcji i limity stron i znaków.
+    Razem z wynikiem zwracany jest tokenizowany pełny tekst do analizy: dokument parsera
+    albo - przy trafieniu w cache - dokument utworzony z zapisanego full_text.
+
+    Args:
+        parse_cache: Pamięć podręczna wyników parsowania
+        kind: Rodzaj dokumentu ("cv" lub "job")
+        path: Ścieżka do pliku zapisanego przez store_upload
+        parse: Funkcja wykonująca parsowanie i zwracająca wynik oraz dokument parsera
+        pdf_engine: Silnik ekstrakcji PDF (domyślnie PDF_ENGINE)
+
+    Returns:
+        Tuple[Dict, Document]: Wynik parsowania i tokenizowany pełny tekst dokumentu
+    """
+    filename = os.path.basename(path)
+    extension = os.path.splitext(filename)[1]
+    parser_version = PARSER_VERSION
+    if extension.lower() == ".pdf":
+        # Limity stron i znaków zmieniają wynik ekstrakcji, więc są częścią klucza
+        parser_version = f"{PARSER_VERSION}-{pdf_engine or PDF_ENGINE}-{PDF_MAX_PAGES}-{PDF_MAX_CHARS}"
+    key = ParseCache.make_key(kind, filename, parser_version)
+
+    documents = []
+
+    def parse_document() -> Dict:
+        result, document = parse()
+        documents.append(document)
+        return result
+
+    result = parse_cache.get_or_parse(key, parse_document)
+    document = documents[0] if documents else Document(result.get("full_text", ""))
+    return result, document
+
+
+def parse_cv(parse_cache: ParseCache, path: str, pdf_engine: Optional[str] = None) -> Tuple[Dict, Document]:
+    """
+    Parsuje CV z wykorzystaniem cache wyników parsowania.
+
+    Args:
+        parse_cache: Pamięć podręczna wyników parsowania
+        path: Ścieżka do pliku CV
+        pdf_engine: Silnik ekstrakcji PDF (domyślnie PDF_ENGINE)
+
+    Returns:
+        Tuple[Dict, Document]: Wynik CVParser.parse_cv i tokenizowany pełny tekst CV
+    """
+    def parse() -> Tuple[Dict, Document]:
+        parser = CVParser(path, pdf_engine)
+        return parser.parse_cv(), parser.document
+
+    return parse_cached(parse_cache, "cv", path, parse, pdf_engine)
+
+
+def parse_job_description(parse_cache: ParseCache, path: str, pdf_engine: Optional[str] = None) -> Tuple[Dict, Document]:
+    """
+    Parsuje ogłoszenie o pracę z wykorzystaniem cache wyników parsowania.
+
+    Args:
+        parse_cache: Pamięć podręczna wyników parsowania
+        path: Ścieżka do pliku ogłoszenia
+        pdf_engine: Silnik ekstrakcji PDF (domyślnie PDF_ENGINE)
+
+    Returns:
+        Tuple[Dict, Document]: Wynik JobDescriptionParser.parse_job_description i tokenizowany pełny tekst ogłoszenia
+    """
+    def parse() -> Tuple[Dict, Document]:
+        parser = JobDescriptionParser(path, pdf_engine)
+        return parser.parse_job_description(), parser.document
+
+    return parse_cached(parse_cache, "job", path, parse, pdf_engine)
+
+
+def parse_analysis_inputs(parse_cache: ParseCache, cv_path: str, job_desc_path: Optional[str] = None, job_profile: Optional[Dict] = None, pdf_engine: Optional[str] = None, section_weights: Optional[Dict[str, float]] = None) -> Dict:
+    """
+    Parsuje CV i ogłoszenie analizy. Gdy podano profil ogłoszenia, jego dane i embeddingi
+    są używane zamiast parsowania pliku.
+
+    Args:
+        parse_cache: Pamięć podręczna wyników parsowania
+        cv_path: Ścieżka do pliku CV
+        job_desc_path: Ścieżka do pliku ogłoszenia
+        job_profile: Wczytany profil ogłoszenia (dane i embeddingi)
+        pdf_engine: Silnik ekstrakcji PDF (domyślnie PDF_ENGINE)
+        section_weights: Wagi sekcji z żądania (domyślnie wagi profilu lub analizatora)
+
+    Returns:
+        Dict: Dane i dokumenty CV i ogłoszenia, embeddingi ogłoszenia oraz wagi sekcji analizy
+    """
+    cv_data, cv_document = parse_cv(parse_cache, cv_path, pdf_engine)
+    inputs = {"cv_data": cv_data, "cv_document": cv_document, "section_weights": section_weights}
+
+    if job_profile is not None:
+        inputs["job_data"] = job_profile["job_data"]
+        inputs["job_document"] = None
+        inputs["job_embeddings"] = job_profile["embeddings"]
+        inputs["section_weights"] = section_weights or job_profile.get("section_weights")
+    else:
+        inputs["job_data"], inputs["job_document"] = parse_job_description(parse_cache, job_desc_path, pdf_engine)
+        inputs["job_embeddings"] = None
+
+    return inputs
+
+
+def finish_analysis(analyzer: RelevanceAnalyzer, inputs: Dict, encoded: Optional[Dict[str, np.ndarray]] = None) -> Dict:
+    """
+    Ocenia relewantność sparsowanego CV względem ogłoszenia.
+
+    Args:
+        analyzer: Analizator relewantności
+        inputs: Wynik parse_analysis_inputs
+        encoded: Wektory tekstów zakodowane wcześniej (znormalizowany tekst -> wektor), opcjonalnie
+
+    Returns:
+        Dict: Dane CV, dane ogłoszenia i wyniki analizy
+    """
+    analysis = analyzer.analyze_relevance(
+        inputs["cv_data"], inputs["job_data"], inputs["job_embeddings"], inputs["section_weights"],
+        cv_document=inputs["cv_document"], job_document=inputs["job_document"], encoded=encoded
+    )
+
+    return {
+        "cv_data": inputs["cv_data"],
+        "job_data": inputs["job_data"],
+        "analysis": analysis
+    }
+
+
+def run_analysis(analyzer: RelevanceAnalyzer, parse_cache: ParseCache, cv_path: str, job_desc_path: Optional[str] = None, job_profile: Optional[Dict] = None, pdf_engine: Optional[str] = None, section_weights: Optional[Dict[str, float]] = None) -> Dict:
+    """
+    Wykonuje pełny potok analizy: parsowanie CV i ogłoszenia oraz ocenę relewantności.
+
+    Args:
+        analyzer: Analizator relewantności
+        parse_cache: Pamięć podręczna wyników parsowania
+        cv_path: Ścieżka do pliku CV
+        job_desc_path: Ścieżka do pliku ogłoszenia
+        job_profile: Wczytany profil ogłoszenia (dane i embeddingi)
+        pdf_engine: Silnik ekstrakcji PDF (domyślnie PDF_ENGINE)
+        section_weights: Wagi sekcji z żądania (domyślnie wagi profilu lub analizatora)
+
+    Returns:
+        Dict: Dane CV, dane ogłoszenia i wyniki analizy
+    """
+    return finish_analysis(analyzer, parse_analysis_inputs(parse_cache, cv_path, job_desc_path, job_profile, pdf_engine, section_weights))
+
+
+async def run_analysis_async(analyzer: RelevanceAnalyzer, parse_cache: ParseCache, executor: ThreadPoolExecutor, scheduler: Optional[InferenceScheduler], cv_path: str, job_desc_path: Optional[str] = None, job_profile: Optional[Dict] = None, pdf_engine: Optional[str] = None, section_weights: Optional[Dict[str, float]] = None) -> Dict:
+    """
+    Wykonuje potok analizy z kodowaniem w pętli zdarzeń: parsowanie i wyszukiwanie wektorów
+    w cache oraz ocena relewantności działają w puli wątków, a brakujące teksty trafiają do
+    harmonogramu mikro-batchowania bez blokowania wątku. Kodowanie oczekuje więc tyle analiz,
+    ile jest w toku (analysis_slots), a nie tylko ANALYSIS_WORKERS. Bez harmonogramu
+    wykonuje run_analysis w puli wątków.
+
+    Args:
+        analyzer: Analizator relewantności
+        parse_cache: Pamięć podręczna wyników parsowania
+        executor: Pula wątków analizy
+        scheduler: Harmonogram mikro-batchowania (None - kodowanie w wątku analizy)
+        cv_path: Ścieżka do pliku CV
+        job_desc_path: Ścieżka do pliku ogłoszenia
+        job_profile: Wczytany profil ogłoszenia (dane i embeddingi)
+        pdf_engine: Silnik ekstrakcji PDF (domyślnie PDF_ENGINE)
+        section_weights: Wagi sekcji z żądania (domyślnie wagi profilu lub analizatora)
+
+    Returns:
+        Dict: Dane CV, dane ogłoszenia i wyniki analizy
+    """
+    loop = asyncio.get_running_loop()
+
+    if scheduler is None or not scheduler.running:
+        return await loop.run_in_executor(
+            executor, in_request_context(run_analysis), analyzer, parse_cache, cv_path, job_desc_path, job_profile, pdf_engine, section_weights
+        )
+
+    def prepare() -> Tuple[Dict, Dict[str, np.ndarray], List[str]]:
+        inputs = parse_analysis_inputs(parse_cache, cv_path, job_desc_path, job_profile, pdf_engine, section_weights)
+        found, pending = analyzer.prepare_encoding(inputs["cv_data"], inputs["job_data"], inputs["job_embeddings"])
+        return inputs, found, pending
+
+    inputs, encoded, pending = await loop.run_in_executor(executor, in_request_context(prepare))
+
+    if pending:
+        with timed("encode"):
+            vectors = await scheduler.submit(pending)
+        computed = dict(zip(pending, np.asarray(vectors, dtype=np.float32)))
+        encoded.update(computed)
+    else:
+        computed = {}
+
+    def finish() -> Dict:
+        analyzer.store_embeddings(computed)
+        return finish_analysis(analyzer, inputs, encoded)
+
+    return await loop.run_in_executor(executor, in_request_context(finish))
+
+
+def run_batch_analysis(analyzer: RelevanceAnalyzer, parse_cache: ParseCache, cv_paths: List[str], job_desc_path: Optional[str] = None, job_profile: Optional[Dict] = None, pdf_engine: Optional[str] = None, section_weights: Optional[Dict[str, float]] = None) -> Dict:
+    """
+    Wykonuje analizę wielu CV względem jednego ogłoszenia.
+    Ogłoszenie jest parsowane i kodowane tylko raz (lub pochodzi z profilu). CV, których
+    nie udało się sparsować, są zwracane z opisem błędu i nie przerywają analizy pozostałych.
+
+    Args:
+        analyzer: Analizator relewantności
+        parse_cache: Pamięć podręczna wyników parsowania
+        cv_paths: Ścieżki do plików CV
+        job_desc_path: Ścieżka do pliku ogłoszenia
+        job_profile: Wczytany profil ogłoszenia (dane i embeddingi)
+        pdf_engine: Silnik ekstrakcji PDF (domyślnie PDF_ENGINE)
+        section_weights: Wagi sekcji z żądania (domyślnie wagi profilu lub analizatora)
+
+    Returns:
+        Dict: Dane ogłoszenia, dane CV i wyniki analiz (według indeksu pliku) oraz błędy parsowania
+    """
+    if job_profile is not None:
+        job_data = job_profile["job_data"]
+        job_document = None
+        job_embeddings = job_profile["embeddings"]
+        section_weights = section_weights or job_profile.get("section_weights")
+    else:
+        job_data, job_document = parse_job_description(parse_cache, job_desc_path, pdf_engine)
+        job_embeddings = None
+
+    parsed = []
+    errors = {}
+    for index, cv_path in enumerate(cv_paths):
+        try:
+            parsed.append((index, *parse_cv(parse_cache, cv_path, pdf_engine)))
+        except Exception as e:
+            errors[index] = str(e)
+
+    analyses = analyzer.analyze_batch(
+        [cv_data for _, cv_data, _ in parsed], job_data, job_embeddings, section_weights,
+        job_document=job_document, cv_documents=[cv_document for _, _, cv_document in parsed]
+    )
+
+    return {
+        "job_data": job_data,
+        "cv_data": {index: cv_data for index, cv_data, _ in parsed},
+        "analyses": {index: analysis for (index, _, _), analysis in zip(parsed, analyses)},
+        "errors": errors
+    }
@@ -0,0 +1,49 @@
+"""
+Wspólna konfiguracja testów.
+Testy działają bez modelu i serwera bazy danych: koder zastępczy (ENCODER_BACKEND=hashing)
+i pliki SQLite w katalogu tymczasowym. Zmienne środowiskowe są ustawiane przed importem
+modułów aplikacji, które odczytują konfigurację przy imporcie.
+"""
+import os
+import sys
+import tempfile
+
+import pytest
+
+# Dodanie ścieżki do katalogu backend (importy app.* i scripts.*)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'test.db')}")
+os.environ.setdefault("ENCODER_BACKEND", "hashing")
+
+
+@pytest.fixture
+def db(tmp_path):
+    """
+    Sesja bazy SQLite z utworzonym schematem (osobny plik dla każdego testu).
+    """
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from app.models.models import Base
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'analyses.db'}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def analyzer():
+    """
+    Analizator relewantności z koderem zastępczym (bez modelu SentenceTransformer).
+    """
+    from app.nlp.hashing_encoder import HashingSentenceEncoder
+    from app.nlp.scoring import RelevanceAnalyzer
+
+    model = HashingSentenceEncoder()
+    return RelevanceAnalyzer(model.model_name, model=model)
@@ -0,0 +1,109 @@
+"""
+Testy stronicowania historii analiz kursorem (crud.list_analyses, GET /analyses).
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.analyses import decode_analyses_cursor, load_analyses_page
+from app.models import crud
+
+# Wyniki z powtórzeniami - kolejność remisów rozstrzyga identyfikator analizy
+SCORES = [0.5, 0.2, 0.5, 0.9, 0.2, 0.5, 0.7, 0.2, 0.9, 0.1, 0.5]
+
+
+@pytest.fixture
+def analyses(db):
+    """
+    Zapisuje analizy z powtarzającymi się wynikami i datami utworzenia.
+    """
+    created_at = datetime(2024, 5, 1, 12, 0, 0)
+    for index, score in enumerate(SCORES):
+        record = crud.add_analysis(
+            db,
+            f"cv{index}.txt",
+            "ogloszenie.txt" if index % 2 == 0 else "inne.txt",
+            {"skills": ["python"], "full_text": f"cv {index}"},
+            {"job_title": "Python Developer", "full_text": "ogłoszenie"},
+            {"relevance_score": score, "section_scores": {"skills": score}, "skill_matches": []},
+            {"skills": 1.0}
+        )
+        # Co druga para analiz ma tę samą datę utworzenia
+        record.created_at = created_at + timedelta(minutes=index // 2)
+    db.commit()
+    return db
+
+
+def read_all_pages(db, limit: int, sort: str, descending: bool, **filters) -> list:
+    """
+    Odczytuje kolejne strony jak klient GET /analyses (kursor next_cursor poprzedniej strony).
+    """
+    ids = []
+    after = None
+    # Każda strona zawiera co najmniej jedną analizę - więcej stron oznacza zapętlenie kursora
+    for _ in range(len(SCORES) + 1):
+        page, next_cursor = load_analyses_page(db, limit, sort=sort, descending=descending, after=after, **filters)
+        assert len(page) <= limit
+        ids.extend(analysis["analysis_id"] for analysis in page)
+        if next_cursor is None:
+            return ids
+        after = decode_analyses_cursor(next_cursor, sort)
+    pytest.fail("Kursor nie prowadzi do ostatniej strony")
+
+
+def expected_order(db, sort: str, descending: bool, **filters) -> list:
+    """
+    Kolejność analiz wyznaczona bez kursora (jedna strona ze wszystkimi analizami).
+    """
+    return [analysis.id for analysis in crud.list_analyses(db, sort=sort, descending=descending, limit=1000, **filters)]
+
+
+@pytest.mark.parametrize("sort", ["created_at", "relevance_score"])
+@pytest.mark.parametrize("descending", [True, False])
+@pytest.mark.parametrize("limit", [1, 2, 3, 100])
+def test_cursor_pages_cover_all_analyses_once(analyses, sort, descending, limit):
+    ids = read_all_pages(analyses, limit, sort, descending)
+
+    assert ids == expected_order(analyses, sort, descending)
+    assert sorted(ids) == list(range(1, len(SCORES) + 1))
+
+
+def test_full_order_breaks_ties_by_id(analyses):
+    ids = expected_order(analyses, "relevance_score", descending=True)
+
+    scores = [SCORES[analysis_id - 1] for analysis_id in ids]
+    assert scores == sorted(SCORES, reverse=True)
+    for previous, current in zip(ids, ids[1:]):
+        if SCORES[previous - 1] == SCORES[current - 1]:
+            assert previous > current
+
+
+def test_cursor_pages_with_filters(analyses):
+    filters = {"job_description_filename": "ogloszenie.txt", "min_score": 0.3}
+
+    ids = read_all_pages(analyses, 2, "relevance_score", True, **filters)
+
+    assert ids == expected_order(analyses, "relevance_score", True, **filters)
+    assert all((analysis_id - 1) % 2 == 0 and SCORES[analysis_id - 1] >= 0.3 for analysis_id in ids)
+
+
+def test_last_page_has_no_cursor(analyses):
+    page, next_cursor = load_analyses_page(analyses, len(SCORES), sort="created_at", descending=True, after=None)
+
+    assert len(page) == len(SCORES)
+    assert next_cursor is None
+
+
+def test_cursor_for_other_sort_is_rejected(analyses):
+    _, next_cursor = load_analyses_page(analyses, 2, sort="created_at", descending=True, after=None)
+
+    with pytest.raises(HTTPException) as error:
+        decode_analyses_cursor(next_cursor, "relevance_score")
+    assert error.value.status_code == 400
+
+
+def test_malformed_cursor_is_rejected():
+    with pytest.raises(HTTPException) as error:
+        decode_analyses_cursor("nie-kursor", "created_at")
+    assert error.value.status_code == 400
@@ -0,0 +1,87 @@
+"""
+Testy wyszukiwania zapisanych CV w indeksie wektorowym (index_saved_cvs, search_cv_index).
+"""
+import hashlib
+import os
+
+import pytest
+
+from app.persistence import index_saved_cvs
+from app.api.search import search_cv_index
+from app.models import crud
+from app.nlp.parser import CVParser, JobDescriptionParser
+from app.nlp.scoring import DEFAULT_SECTION_WEIGHTS, SCORED_SECTIONS
+from app.nlp.vector_index import create_index
+from scripts.sample_pdf import SAMPLE_DIR
+
+
+def upload_name(text: str) -> str:
+    # Nazwa pliku jak w store_upload: skrót SHA-256 treści i rozszerzenie
+    return f"{hashlib.sha256(text.encode('utf-8')).hexdigest()}.txt"
+
+
+@pytest.fixture(scope="module")
+def job_data():
+    return JobDescriptionParser(os.path.join(SAMPLE_DIR, "przyklad_ogloszenie.txt")).parse_job_description()
+
+
+@pytest.fixture(scope="module")
+def cv_data():
+    return CVParser(os.path.join(SAMPLE_DIR, "przyklad_cv.txt")).parse_cv()
+
+
+@pytest.fixture
+def cv_index(tmp_path, analyzer):
+    dim = analyzer.model.get_sentence_embedding_dimension() * len(SCORED_SECTIONS)
+    return create_index("bruteforce", str(tmp_path), dim, analyzer.model_name, SCORED_SECTIONS)
+
+
+def save(db, analyzer, cv_index, cv_filename: str, cv_data: dict, job_data: dict) -> int:
+    record = {
+        "cv_filename": cv_filename,
+        "job_description_filename": "ogloszenie.txt",
+        "cv_data": cv_data,
+        "job_data": job_data,
+        "analysis": analyzer.analyze_relevance(cv_data, job_data)
+    }
+    saved = crud.save_analyses(db, [record], DEFAULT_SECTION_WEIGHTS)
+    index_saved_cvs(analyzer, cv_index, [record])
+    return saved[0].id
+
+
+def test_cv_analysed_twice_is_one_hit(db, analyzer, cv_index, cv_data, job_data):
+    cv_filename = upload_name(cv_data["full_text"])
+    save(db, analyzer, cv_index, cv_filename, cv_data, job_data)
+    latest = save(db, analyzer, cv_index, cv_filename, cv_data, job_data)
+
+    results = search_cv_index(analyzer, cv_index, db, job_data, k=10)
+
+    assert len(cv_index) == 1
+    assert [(result["analysis_id"], result["cv_filename"]) for result in results] == [(latest, cv_filename)]
+
+
+def test_each_cv_file_is_returned_once(db, analyzer, cv_index, cv_data, job_data):
+    other = {
+        "skills": ["COBOL"],
+        "experience": [{"title": "Księgowy", "description": "Księgowość i COBOL"}],
+        "education": [],
+        "full_text": "COBOL, księgowość"
+    }
+    for data in (cv_data, other, cv_data, other):
+        save(db, analyzer, cv_index, upload_name(data["full_text"]), data, job_data)
+
+    results = search_cv_index(analyzer, cv_index, db, job_data, k=10)
+
+    assert [result["cv_filename"] for result in results] == [upload_name(cv_data["full_text"]), upload_name(other["full_text"])]
+
+
+def test_search_uses_requested_section_weights(db, analyzer, cv_index, cv_data, job_data):
+    save(db, analyzer, cv_index, upload_name(cv_data["full_text"]), cv_data, job_data)
+
+    default = search_cv_index(analyzer, cv_index, db, job_data, k=1)[0]["score"]
+    doubled = search_cv_index(
+        analyzer, cv_index, db, job_data, k=1,
+        section_weights={section: 2 * weight for section, weight in DEFAULT_SECTION_WEIGHTS.items()}
+    )[0]["score"]
+
+    assert doubled == pytest.approx(2 * default, abs=1e-3)
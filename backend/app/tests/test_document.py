@@ -0,0 +1,49 @@
+"""
+Testy przekazywania tokenizowanego dokumentu parsera do analizy relewantności.
+"""
+import os
+
+import pytest
+
+from app.nlp.parser import CVParser, JobDescriptionParser
+from scripts.sample_pdf import SAMPLE_DIR
+
+CV_PATH = os.path.join(SAMPLE_DIR, "przyklad_cv.txt")
+JOB_PATH = os.path.join(SAMPLE_DIR, "przyklad_ogloszenie.txt")
+
+
+@pytest.fixture
+def parsed():
+    cv_parser = CVParser(CV_PATH)
+    job_parser = JobDescriptionParser(JOB_PATH)
+    return cv_parser.parse_cv(), cv_parser.document, job_parser.parse_job_description(), job_parser.document
+
+
+def tokenized(document) -> bool:
+    # Wartości cached_property są zapisywane w __dict__ obiektu przy pierwszym użyciu
+    return "terms" in vars(document)
+
+
+def test_parser_document_holds_extracted_text(parsed):
+    cv_data, cv_document, job_data, job_document = parsed
+
+    assert cv_document.text == cv_data["full_text"]
+    assert job_document.text == job_data["full_text"]
+
+
+def test_analysis_uses_parser_documents(analyzer, parsed):
+    cv_data, cv_document, job_data, job_document = parsed
+
+    shared = analyzer.analyze_relevance(cv_data, job_data, cv_document=cv_document, job_document=job_document)
+
+    assert tokenized(cv_document) and tokenized(job_document)
+    assert shared == analyzer.analyze_relevance(cv_data, job_data)
+
+
+def test_batch_uses_parser_documents(analyzer, parsed):
+    cv_data, cv_document, job_data, job_document = parsed
+
+    shared = analyzer.analyze_batch([cv_data], job_data, job_document=job_document, cv_documents=[cv_document])
+
+    assert tokenized(cv_document) and tokenized(job_document)
+    assert shared == analyzer.analyze_batch([cv_data], job_data)
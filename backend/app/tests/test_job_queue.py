@@ -0,0 +1,128 @@
+"""
+Testy kolejki zadań w pliku SQLite (SQLiteJobQueue): dzierżawa i ponowne próby.
+"""
+import time
+
+import pytest
+
+from app.jobs.queue import JOB_DONE, JOB_FAILED, JOB_QUEUED, JOB_RUNNING, SQLiteJobQueue
+
+LEASE_SECONDS = 0.2
+
+
+@pytest.fixture
+def queue_path(tmp_path):
+    return str(tmp_path / "jobs.db")
+
+
+@pytest.fixture
+def queue(queue_path):
+    queue = SQLiteJobQueue(queue_path, lease_seconds=LEASE_SECONDS, max_attempts=2)
+    yield queue
+    queue.close()
+
+
+def expire_lease():
+    time.sleep(LEASE_SECONDS * 1.5)
+
+
+def test_jobs_are_claimed_in_submission_order(queue):
+    first = queue.submit({"n": 1})
+    second = queue.submit({"n": 2})
+
+    assert queue.get(first)["status"] == JOB_QUEUED
+    assert queue.claim() == (first, {"n": 1})
+    assert queue.claim() == (second, {"n": 2})
+    assert queue.claim() is None
+
+
+def test_claimed_job_is_leased(queue):
+    job_id = queue.submit({"n": 1})
+
+    queue.claim()
+
+    job = queue.get(job_id)
+    assert job["status"] == JOB_RUNNING
+    assert job["attempts"] == 1
+    assert job["started_at"] is not None
+    # W czasie dzierżawy zadanie nie jest wydawane ponownie
+    assert queue.claim() is None
+
+
+def test_expired_lease_returns_job_for_retry(queue):
+    job_id = queue.submit({"n": 1})
+    queue.claim()
+
+    expire_lease()
+
+    assert queue.claim() == (job_id, {"n": 1})
+    assert queue.get(job_id)["attempts"] == 2
+
+
+def test_job_fails_after_max_attempts(queue):
+    job_id = queue.submit({"n": 1})
+    queue.claim()
+    expire_lease()
+    queue.claim()
+    expire_lease()
+
+    assert queue.claim() is None
+    job = queue.get(job_id)
+    assert job["status"] == JOB_FAILED
+    assert job["attempts"] == 2
+    assert job["error"]
+
+
+def test_exhausted_job_does_not_block_next_job(queue):
+    exhausted = queue.submit({"n": 1})
+    queue.claim()
+    expire_lease()
+    queue.claim()
+    expire_lease()
+    waiting = queue.submit({"n": 2})
+
+    assert queue.claim() == (waiting, {"n": 2})
+    assert queue.get(exhausted)["status"] == JOB_FAILED
+
+
+def test_completed_job_is_not_reclaimed(queue):
+    job_id = queue.submit({"n": 1})
+    queue.claim()
+
+    queue.complete(job_id, 42)
+    expire_lease()
+
+    assert queue.claim() is None
+    job = queue.get(job_id)
+    assert job["status"] == JOB_DONE
+    assert job["analysis_id"] == 42
+    assert job["finished_at"] is not None
+
+
+def test_failed_job_is_not_reclaimed(queue):
+    job_id = queue.submit({"n": 1})
+    queue.claim()
+
+    queue.fail(job_id, "Błąd parsowania")
+    expire_lease()
+
+    assert queue.claim() is None
+    assert queue.get(job_id)["error"] == "Błąd parsowania"
+
+
+def test_queues_sharing_file_do_not_claim_same_job(queue, queue_path):
+    other = SQLiteJobQueue(queue_path, lease_seconds=LEASE_SECONDS, max_attempts=2)
+    try:
+        job_ids = {queue.submit({"n": n}) for n in range(4)}
+
+        claimed = [queue.claim(), other.claim(), queue.claim(), other.claim()]
+
+        assert {job_id for job_id, _ in claimed} == job_ids
+        assert queue.claim() is None
+        assert other.claim() is None
+    finally:
+        other.close()
+
+
+def test_unknown_job(queue):
+    assert queue.get("brak") is None
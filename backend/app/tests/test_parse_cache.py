@@ -0,0 +1,124 @@
+"""
+Testy pamięci podręcznej wyników parsowania (ParseCache) z warstwą SQLite.
+"""
+import sqlite3
+
+import pytest
+
+from app.nlp import parse_cache
+from app.nlp.parse_cache import ParseCache
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "parse_cache.db")
+
+
+def accessed_at(db_path: str, key: str) -> float:
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT accessed_at FROM parse_results WHERE key = ?", (key,)).fetchone()[0]
+    finally:
+        conn.close()
+
+
+def disk_keys(db_path: str) -> list:
+    conn = sqlite3.connect(db_path)
+    try:
+        return [key for (key,) in conn.execute("SELECT key FROM parse_results ORDER BY accessed_at")]
+    finally:
+        conn.close()
+
+
+def test_disk_layer_keeps_most_recent_entries(db_path):
+    cache = ParseCache(max_entries=2, db_path=db_path, max_disk_entries=3)
+
+    for index in range(6):
+        cache.put(f"k{index}", {"index": index})
+
+    assert disk_keys(db_path) == ["k3", "k4", "k5"]
+    cache.close()
+
+
+def test_replacing_key_does_not_count_as_new_entry(db_path):
+    cache = ParseCache(max_entries=1, db_path=db_path, max_disk_entries=3)
+    for index in range(3):
+        cache.put(f"k{index}", {"index": index})
+
+    cache.put("k2", {"index": 20})
+
+    assert disk_keys(db_path) == ["k0", "k1", "k2"]
+    assert cache.get("k2") == {"index": 20}
+    cache.close()
+
+
+def test_disk_hit_after_reopen(db_path):
+    cache = ParseCache(max_entries=1, db_path=db_path, max_disk_entries=10)
+    cache.put("k0", {"skills": ["python"]})
+    cache.close()
+
+    reopened = ParseCache(max_entries=1, db_path=db_path, max_disk_entries=10)
+
+    assert reopened.get("k0") == {"skills": ["python"]}
+    assert reopened.stats()["disk_hits"] == 1
+    reopened.close()
+
+
+def test_limit_applies_to_entries_written_before_open(db_path):
+    for index in range(4):
+        previous = ParseCache(db_path=db_path, max_disk_entries=10)
+        previous.put(f"k{index}", {})
+        previous.close()
+
+    cache = ParseCache(db_path=db_path, max_disk_entries=4)
+    cache.put("k4", {})
+
+    assert disk_keys(db_path) == ["k1", "k2", "k3", "k4"]
+    cache.close()
+
+
+def test_entries_of_other_process_are_counted_periodically(db_path, monkeypatch):
+    monkeypatch.setattr(parse_cache, "DISK_RECOUNT_INTERVAL", 2)
+    cache = ParseCache(db_path=db_path, max_disk_entries=3)
+    other = ParseCache(db_path=db_path, max_disk_entries=100)
+
+    for index in range(3):
+        other.put(f"other{index}", {})
+    cache.put("k0", {})
+    cache.put("k1", {})
+
+    assert disk_keys(db_path) == ["other2", "k0", "k1"]
+    cache.close()
+    other.close()
+
+
+def test_disk_hit_refreshes_access_time_only_after_interval(db_path, monkeypatch):
+    cache = ParseCache(max_entries=1, db_path=db_path, max_disk_entries=10)
+    cache.put("k0", {})
+    written = accessed_at(db_path, "k0")
+    cache.put("k1", {})
+
+    assert cache.get("k0") == {}
+    assert accessed_at(db_path, "k0") == written
+
+    monkeypatch.setattr(parse_cache, "DISK_TOUCH_INTERVAL", 0)
+    cache.put("k1", {})
+    assert cache.get("k0") == {}
+    assert accessed_at(db_path, "k0") > written
+    cache.close()
+
+
+def test_key_includes_file_extension():
+    assert ParseCache.make_key("cv", "abc.pdf", "1") != ParseCache.make_key("cv", "abc.txt", "1")
+
+
+def test_memory_layer_is_lru():
+    cache = ParseCache(max_entries=2)
+    cache.put("a", {"n": 1})
+    cache.put("b", {"n": 2})
+    cache.get("a")
+    cache.put("c", {"n": 3})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"n": 1}
+    assert cache.stats()["evictions"] == 1
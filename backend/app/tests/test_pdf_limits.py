@@ -0,0 +1,142 @@
+"""
+Testy limitów ekstrakcji tekstu z PDF (DocumentParser._limit_pages, iter_pdf_pages).
+"""
+import os
+import time
+
+import pytest
+
+from app.nlp.parser import PDF_AUTO_SAMPLE_PAGES, DocumentParser
+from scripts.sample_pdf import SAMPLE_DIR, layout_pages, write_text_pdf
+
+
+class PageSource:
+    """
+    Silnik ekstrakcji zastępczy: generator tekstu stron z informacją o zamknięciu.
+    """
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.read = 0
+        self.closed = False
+
+    def __call__(self):
+        try:
+            for text in self.pages:
+                self.read += 1
+                yield text
+        finally:
+            self.closed = True
+
+
+@pytest.fixture
+def parser():
+    return DocumentParser("dokument.pdf")
+
+
+@pytest.fixture(scope="module")
+def long_pdf(tmp_path_factory):
+    """
+    Dokument PDF o liczbie stron większej niż próbka trybu "auto".
+    """
+    with open(os.path.join(SAMPLE_DIR, "przyklad_cv.txt"), "r", encoding="utf-8") as f:
+        text = f.read()
+    copies = 1
+    while len(layout_pages("\n".join([text] * copies))) < PDF_AUTO_SAMPLE_PAGES + 3:
+        copies += 1
+    path = str(tmp_path_factory.mktemp("pdf") / "cv.pdf")
+    write_text_pdf(path, "\n".join([text] * copies))
+    return path
+
+
+def test_limit_pages_without_limits_passes_all_pages(parser):
+    source = PageSource(["abc", "def", "ghi"])
+
+    assert list(parser._limit_pages(source(), None)) == ["abc", "def", "ghi"]
+    assert not parser.pdf_truncated
+    assert source.closed
+
+
+def test_limit_pages_cuts_last_page_at_char_limit(parser):
+    parser.pdf_max_chars = 8
+    source = PageSource(["abcde", "fghij", "klmno"])
+
+    assert list(parser._limit_pages(source(), None)) == ["abcde", "fgh"]
+    assert parser.pdf_truncated
+    # Strony za limitem nie są odczytywane, a silnik jest zamykany
+    assert source.read == 2
+    assert source.closed
+
+
+def test_limit_pages_page_ending_exactly_at_limit_is_truncated(parser):
+    parser.pdf_max_chars = 5
+    source = PageSource(["abcde", "fghij"])
+
+    assert list(parser._limit_pages(source(), None)) == ["abcde"]
+    assert parser.pdf_truncated
+
+
+def test_limit_pages_raises_after_deadline_and_closes_engine(parser):
+    parser.pdf_max_seconds = 1
+    source = PageSource(["abc", "def"])
+
+    with pytest.raises(Exception, match="limit czasu"):
+        list(parser._limit_pages(source(), time.monotonic() - 1))
+    assert source.closed
+
+
+def test_limit_pages_closes_engine_when_consumer_stops(parser):
+    source = PageSource(["abc", "def", "ghi"])
+
+    pages = parser._limit_pages(source(), None)
+    assert next(pages) == "abc"
+    pages.close()
+    assert source.closed
+
+
+@pytest.mark.parametrize("engine", ["fast", "pdfplumber", "auto"])
+def test_page_limit_truncates_document(long_pdf, engine):
+    parser = DocumentParser(long_pdf, pdf_engine=engine)
+    parser.pdf_max_pages = 2
+
+    assert len(list(parser.iter_pdf_pages())) == 2
+    assert parser.pdf_truncated
+
+
+@pytest.mark.parametrize("engine", ["fast", "pdfplumber", "auto"])
+def test_char_limit_truncates_content(long_pdf, engine):
+    parser = DocumentParser(long_pdf, pdf_engine=engine)
+    parser.pdf_max_chars = 500
+
+    content = parser.extract_content()
+
+    # Każda strona kończy się znakiem nowej linii
+    assert len(content) == 501
+    assert parser.pdf_truncated
+
+
+def test_document_within_limits_is_not_truncated(long_pdf):
+    parser = DocumentParser(long_pdf, pdf_engine="fast")
+    parser.pdf_max_pages = 1000
+    parser.pdf_max_chars = 10 ** 7
+
+    full = DocumentParser(long_pdf, pdf_engine="fast").extract_content()
+
+    assert parser.extract_content() == full
+    assert not parser.pdf_truncated
+
+
+def test_auto_engine_reads_only_sample_before_first_page(long_pdf, monkeypatch):
+    parser = DocumentParser(long_pdf, pdf_engine="auto")
+    source = PageSource(list(parser._iter_pages_fast()))
+    monkeypatch.setattr(parser, "_iter_pages_fast", source)
+
+    pages = parser.iter_pdf_pages()
+    assert next(pages)
+    # Heurystyka ocenia próbkę, a pozostałe strony są odczytywane dopiero na żądanie
+    assert source.read == PDF_AUTO_SAMPLE_PAGES
+    assert parser.pdf_engine_used == "fast"
+
+    assert len(list(pages)) == len(source.pages) - 1
+    assert source.read == len(source.pages)
+    assert source.closed
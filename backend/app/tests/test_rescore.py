@@ -0,0 +1,100 @@
+"""
+Testy przeliczania zapisanych analiz dla nowych wag sekcji (crud.rescore_analyses).
+"""
+import os
+
+import pytest
+
+from app.models import crud
+from app.models.models import Analysis, SectionScore
+from app.nlp.parser import CVParser, JobDescriptionParser
+from app.nlp.scoring import DEFAULT_SECTION_WEIGHTS
+from scripts.sample_pdf import SAMPLE_DIR
+
+NEW_WEIGHTS = [
+    {"skills": 0.2, "experience": 0.2, "education": 0.1, "full_text": 0.5},
+    {"full_text": 1.0},
+    {"skills": 3.0, "education": 1.0}
+]
+
+
+@pytest.fixture(scope="module")
+def documents():
+    """
+    Przykładowe ogłoszenie i warianty przykładowego CV o różnych wynikach sekcji.
+    """
+    cv_data = CVParser(os.path.join(SAMPLE_DIR, "przyklad_cv.txt")).parse_cv()
+    job_data = JobDescriptionParser(os.path.join(SAMPLE_DIR, "przyklad_ogloszenie.txt")).parse_job_description()
+    variants = [
+        cv_data,
+        {**cv_data, "skills": cv_data["skills"][:2]},
+        {**cv_data, "experience": [], "full_text": cv_data["full_text"][:300]},
+        {**cv_data, "skills": [], "education": []}
+    ]
+    return variants, job_data
+
+
+def save(db, analyzer, documents, job_filenames=("ogloszenie.txt",)) -> dict:
+    """
+    Zapisuje analizy wariantów CV z domyślnymi wagami.
+
+    Returns:
+        dict: Identyfikator analizy -> (dane CV, nazwa pliku ogłoszenia)
+    """
+    variants, job_data = documents
+    saved = {}
+    for job_filename in job_filenames:
+        for index, cv_data in enumerate(variants):
+            analysis = analyzer.analyze_relevance(cv_data, job_data, section_weights=DEFAULT_SECTION_WEIGHTS)
+            record = crud.add_analysis(db, f"cv{index}.txt", job_filename, cv_data, job_data, analysis, DEFAULT_SECTION_WEIGHTS)
+            db.flush()
+            saved[record.id] = (cv_data, job_filename)
+    db.commit()
+    return saved
+
+
+@pytest.mark.parametrize("section_weights", NEW_WEIGHTS)
+def test_rescore_matches_fresh_analysis(db, analyzer, documents, section_weights):
+    saved = save(db, analyzer, documents)
+    job_data = documents[1]
+
+    assert crud.rescore_analyses(db, section_weights) == len(saved)
+
+    db.expire_all()
+    for analysis_id, (cv_data, _) in saved.items():
+        expected = analyzer.analyze_relevance(cv_data, job_data, section_weights=section_weights)
+        assert db.get(Analysis, analysis_id).relevance_score == expected["relevance_score"]
+
+
+def test_rescore_updates_section_weights(db, analyzer, documents):
+    save(db, analyzer, documents)
+    section_weights = NEW_WEIGHTS[2]
+
+    crud.rescore_analyses(db, section_weights)
+
+    db.expire_all()
+    for row in db.query(SectionScore):
+        assert row.weight == section_weights.get(row.section_name, 0.0)
+
+
+@pytest.mark.parametrize("batch_size", [1, 3, 1000])
+def test_rescore_limited_to_job_description(db, analyzer, documents, batch_size):
+    saved = save(db, analyzer, documents, job_filenames=("ogloszenie.txt", "inne.txt"))
+    before = {analysis.id: analysis.relevance_score for analysis in db.query(Analysis)}
+    job_data = documents[1]
+    section_weights = NEW_WEIGHTS[1]
+
+    rescored = crud.rescore_analyses(db, section_weights, job_description_filename="inne.txt", batch_size=batch_size)
+
+    db.expire_all()
+    assert rescored == sum(1 for _, job_filename in saved.values() if job_filename == "inne.txt")
+    for analysis_id, (cv_data, job_filename) in saved.items():
+        score = db.get(Analysis, analysis_id).relevance_score
+        if job_filename == "inne.txt":
+            assert score == analyzer.analyze_relevance(cv_data, job_data, section_weights=section_weights)["relevance_score"]
+        else:
+            assert score == before[analysis_id]
+
+
+def test_rescore_without_analyses(db):
+    assert crud.rescore_analyses(db, DEFAULT_SECTION_WEIGHTS) == 0
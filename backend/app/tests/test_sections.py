@@ -0,0 +1,124 @@
+"""
+Testy granic sekcji wyznaczanych przez SectionSegmenter.
+"""
+import pytest
+
+from app.nlp.parser import CV_SECTION_HEADINGS, JOB_SECTION_HEADINGS
+from app.nlp.sections import SectionSegmenter, section_text
+
+
+@pytest.fixture(scope="module")
+def cv_segmenter():
+    return SectionSegmenter(CV_SECTION_HEADINGS)
+
+
+@pytest.fixture(scope="module")
+def job_segmenter():
+    return SectionSegmenter(JOB_SECTION_HEADINGS)
+
+
+def texts(text: str, spans: dict) -> dict:
+    return {section: text[start:end] for section, (start, end) in spans.items()}
+
+
+def test_section_ends_at_next_heading(cv_segmenter):
+    text = "Jan Kowalski\n\nUmiejętności:\nPython, SQL\n\nDoświadczenie:\nFirma X\n\nEdukacja:\nPolitechnika\n"
+
+    assert texts(text, cv_segmenter.segment(text)) == {
+        "skills": "Python, SQL\n\n",
+        "experience": "Firma X\n\n",
+        "education": "Politechnika\n"
+    }
+
+
+def test_inline_heading_content_starts_after_colon(cv_segmenter):
+    text = "Umiejętności: Python, SQL\nDoświadczenie:\nFirma X"
+
+    sections = texts(text, cv_segmenter.segment(text))
+
+    assert sections["skills"] == " Python, SQL\n"
+    assert sections["experience"] == "Firma X"
+
+
+def test_bare_heading_without_colon(cv_segmenter):
+    text = "Work Experience\nFirma X\nSKILLS\nPython"
+
+    assert texts(text, cv_segmenter.segment(text)) == {"experience": "Firma X\n", "skills": "Python"}
+
+
+def test_standalone_colon_line_ends_section(cv_segmenter):
+    text = "Umiejętności:\nPython\nZainteresowania:\nżeglarstwo\n"
+
+    assert texts(text, cv_segmenter.segment(text)) == {"skills": "Python\n"}
+
+
+def test_inline_label_without_keyword_does_not_end_section(cv_segmenter):
+    text = "Doświadczenie:\nFirma X\nStanowisko: programista\nOkres: 2019-2021\n"
+
+    assert texts(text, cv_segmenter.segment(text)) == {
+        "experience": "Firma X\nStanowisko: programista\nOkres: 2019-2021\n"
+    }
+
+
+def test_inline_heading_of_same_section_continues_it(cv_segmenter):
+    text = "Umiejętności:\nPython\nNarzędzia: Git, Docker\nDoświadczenie:\nFirma X"
+
+    assert texts(text, cv_segmenter.segment(text))["skills"] == "Python\nNarzędzia: Git, Docker\n"
+
+
+@pytest.mark.parametrize("line", [
+    "- Skills: Python",
+    "• Doświadczenie: 5 lat",
+    "Posiadam bogate doświadczenie w pracy z wieloma technologiami:",
+    "Bardzo długi tytuł przekraczający dopuszczalną długość nagłówka sekcji CV, zawierający słowo skills:"
+])
+def test_list_items_and_long_lines_are_not_headings(cv_segmenter, line):
+    assert cv_segmenter.find_headings(line) == []
+    assert cv_segmenter.segment(f"{line}\nPython\n") == {}
+
+
+def test_keyword_inside_sentence_is_not_heading(cv_segmenter):
+    text = "Mam duże doświadczenie w zespole i znam Python oraz SQL bardzo dobrze\n"
+
+    assert cv_segmenter.segment(text) == {}
+
+
+def test_heading_on_last_line_gives_empty_section(cv_segmenter):
+    text = "Doświadczenie:\nFirma X\nUmiejętności:"
+
+    spans = cv_segmenter.segment(text)
+
+    assert spans["skills"] == (len(text), len(text))
+    assert texts(text, spans)["experience"] == "Firma X\n"
+
+
+def test_higher_priority_group_wins_over_earlier_heading(job_segmenter):
+    text = "Oczekujemy:\nznajomości Pythona\nWymagania:\nSQL\nObowiązki:\nrozwój API\n"
+
+    sections = texts(text, job_segmenter.segment(text))
+
+    assert sections["required_skills"] == "SQL\n"
+    assert sections["responsibilities"] == "rozwój API\n"
+
+
+def test_lower_priority_group_used_without_primary_heading(job_segmenter):
+    text = "Oczekujemy:\nznajomości Pythona\nOferujemy:\nbenefity\n"
+
+    assert texts(text, job_segmenter.segment(text)) == {"required_skills": "znajomości Pythona\n"}
+
+
+def test_heading_shared_by_sections(job_segmenter):
+    text = "Kwalifikacje:\ntytuł magistra informatyki\nObowiązki:\nrozwój API\n"
+
+    sections = texts(text, job_segmenter.segment(text))
+
+    assert sections["required_skills"] == sections["qualifications"] == "tytuł magistra informatyki\n"
+
+
+def test_section_text_stops_at_blank_line(cv_segmenter):
+    text = "Umiejętności:\n\n  Python\nSQL\n\nReferencje na życzenie\n"
+    span = cv_segmenter.segment(text)["skills"]
+
+    assert section_text(text, span) == "\n  Python\nSQL\n\nReferencje na życzenie\n"
+    assert section_text(text, span, stop_at_blank_line=True) == "Python\nSQL"
+    assert section_text(text, None) is None
@@ -0,0 +1,118 @@
+"""
+Testy tabeli embeddingów kanonicznych umiejętności i jej użycia w RelevanceAnalyzer.
+"""
+import json
+import os
+
+import numpy as np
+import pytest
+
+from app.nlp.hashing_encoder import HashingSentenceEncoder
+from app.nlp.scoring import RelevanceAnalyzer
+from app.nlp.skill_table import SkillTable, build_skill_table, load_skill_table, metadata_path
+
+TAXONOMY = {
+    "JavaScript": ["JS", "ECMAScript"],
+    "Python": ["py"],
+    "PostgreSQL": ["Postgres"],
+    "Docker": []
+}
+
+
+@pytest.fixture(scope="module")
+def model():
+    return HashingSentenceEncoder()
+
+
+@pytest.fixture
+def table_path(tmp_path, model):
+    path = str(tmp_path / "skill_table.npy")
+    build_skill_table(model, model.model_name, TAXONOMY, path)
+    return path
+
+
+def matrix_files(path: str) -> list:
+    directory = os.path.dirname(path)
+    return sorted(name for name in os.listdir(directory) if name.endswith(".npy"))
+
+
+def test_build_writes_matrix_named_by_content(table_path):
+    with open(metadata_path(table_path), "r", encoding="utf-8") as f:
+        metadata = json.load(f)
+
+    assert matrix_files(table_path) == [metadata["matrix"]]
+    assert metadata["sha256"][:16] in metadata["matrix"]
+
+
+def test_rebuild_swaps_matrix_with_metadata(table_path, model):
+    old = load_skill_table(table_path)
+
+    build_skill_table(model, model.model_name, {"Rust": [], **TAXONOMY}, table_path)
+    new = load_skill_table(table_path)
+
+    assert len(new) == len(new.embeddings) == len(TAXONOMY) + 1
+    assert len(matrix_files(table_path)) == 1
+    # Tabela wczytana przed przebudową nadal ma spójne dane (macierz zmapowana w pamięci)
+    assert len(old) == len(old.embeddings) == len(TAXONOMY)
+    assert float(np.abs(old.embeddings).sum()) > 0
+
+
+def test_table_built_before_versioning_is_loaded(tmp_path):
+    path = str(tmp_path / "skill_table.npy")
+    np.save(path, np.eye(2, dtype=np.float32))
+    with open(metadata_path(path), "w", encoding="utf-8") as f:
+        json.dump({"model_name": "model", "skills": {"Python": [], "SQL": []}}, f)
+
+    table = load_skill_table(path)
+
+    assert table.names == ["Python", "SQL"]
+
+
+def test_missing_table(tmp_path):
+    assert load_skill_table(str(tmp_path / "brak.npy")) is None
+    assert load_skill_table(None) is None
+
+
+def test_aliases_resolve_to_canonical_ids(table_path):
+    table = load_skill_table(table_path)
+
+    assert table.lookup(["js", "ECMAScript", "javascript", "Postgres", "COBOL"]).tolist() == [0, 0, 0, 2, -1]
+
+
+def test_same_canonical_skill_matches_exactly(table_path, model):
+    analyzer = RelevanceAnalyzer(model.model_name, model=model, skill_table=load_skill_table(table_path))
+    cv_data = {"skills": ["JS", "Postgres"], "full_text": "JS Postgres"}
+    job_data = {"required_skills": ["JavaScript", "PostgreSQL"], "full_text": "JavaScript PostgreSQL"}
+
+    matches = analyzer.analyze_relevance(cv_data, job_data)["skill_matches"]
+
+    assert [(match["cv_skill"], match["job_skill"], match["similarity_score"]) for match in matches] == [
+        ("JS", "JavaScript", 1.0),
+        ("Postgres", "PostgreSQL", 1.0)
+    ]
+
+
+def test_unknown_skills_keep_model_vectors(model):
+    table = SkillTable(TAXONOMY, np.eye(len(TAXONOMY), 4, dtype=np.float32), "model")
+    analyzer = RelevanceAnalyzer(model.model_name, model=model, skill_table=table)
+    canonical_ids = table.lookup(["js", "wewnętrzny framework", "docker"])
+    # Wektor umiejętności spoza taksonomii bardzo podobny (0.95) do wiersza JavaScript
+    encoded = np.array([[0.95, np.sqrt(1 - 0.95 ** 2), 0.0, 0.0]], dtype=np.float32)
+
+    embeddings = analyzer._canonical_skill_embeddings(canonical_ids, encoded)
+
+    np.testing.assert_array_equal(embeddings, [table.embeddings[0], encoded[0], table.embeddings[3]])
+
+
+def test_batch_matches_single_analysis(table_path, model):
+    analyzer = RelevanceAnalyzer(model.model_name, model=model, skill_table=load_skill_table(table_path))
+    job_data = {"required_skills": ["JavaScript", "Python", "Kubernetes"], "full_text": "JavaScript Python"}
+    cv_data_list = [
+        {"skills": ["JS", "Docker"], "full_text": "JS Docker"},
+        {"skills": ["py", "Helm"], "full_text": "py Helm"}
+    ]
+
+    batch = analyzer.analyze_batch(cv_data_list, job_data)
+
+    for cv_data, result in zip(cv_data_list, batch):
+        assert result["skill_matches"] == analyzer.analyze_relevance(cv_data, job_data)["skill_matches"]
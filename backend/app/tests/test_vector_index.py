@@ -0,0 +1,102 @@
+"""
+Testy indeksu wektorowego CV współdzielonego przez procesy (dziennik VectorLog, migawki HNSW).
+Dwie instancje indeksu na tym samym katalogu odpowiadają dwóm workerom serwera.
+"""
+import os
+
+import numpy as np
+import pytest
+
+from app.nlp.vector_index import IndexMismatchError, create_index
+
+DIM = 8
+KINDS = ["bruteforce", "hnsw"]
+
+
+def unit_vectors(count: int, seed: int) -> np.ndarray:
+    vectors = np.random.default_rng(seed).normal(size=(count, DIM)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def top_id(index, query: np.ndarray) -> int:
+    return index.search(query, k=1)[0][0]
+
+
+@pytest.fixture(params=KINDS)
+def kind(request):
+    if request.param == "hnsw":
+        pytest.importorskip("hnswlib")
+    return request.param
+
+
+def test_vectors_added_by_one_instance_are_visible_to_another(tmp_path, kind):
+    writer = create_index(kind, str(tmp_path), DIM, "model")
+    reader = create_index(kind, str(tmp_path), DIM, "model")
+    vectors = unit_vectors(20, seed=1)
+
+    writer.add(list(range(20)), vectors)
+
+    assert sorted(cv_id for cv_id, _ in reader.search(vectors[0], k=20)) == list(range(20))
+    assert top_id(reader, vectors[7]) == 7
+
+
+def test_duplicate_id_replaces_vector_in_every_instance(tmp_path, kind):
+    first = create_index(kind, str(tmp_path), DIM, "model")
+    second = create_index(kind, str(tmp_path), DIM, "model")
+    vectors = unit_vectors(11, seed=2)
+    first.add(list(range(10)), vectors[:10])
+
+    second.add([3], vectors[10:])
+
+    for index in (first, second):
+        results = index.search(vectors[10], k=10)
+        assert len(results) == 10
+        assert results[0][0] == 3
+        assert results[0][1] == pytest.approx(1.0, abs=1e-5)
+
+
+def test_index_is_restored_after_restart(tmp_path, kind):
+    index = create_index(kind, str(tmp_path), DIM, "model")
+    vectors = unit_vectors(30, seed=3)
+    index.add(list(range(20)), vectors[:20])
+    index.save()
+    # Wiersze dopisane po migawce są odtwarzane z dziennika
+    index.add(list(range(20, 30)), vectors[20:])
+
+    restored = create_index(kind, str(tmp_path), DIM, "model")
+
+    assert len(restored.search(vectors[0], k=50)) == 30
+    assert top_id(restored, vectors[25]) == 25
+
+
+def test_hnsw_graph_is_saved_only_by_save(tmp_path):
+    pytest.importorskip("hnswlib")
+    index = create_index("hnsw", str(tmp_path), DIM, "model")
+
+    index.add([1, 2], unit_vectors(2, seed=4))
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".bin")]
+
+    index.save()
+    index.add([3], unit_vectors(1, seed=5))
+    index.save()
+    assert [name for name in os.listdir(tmp_path) if name.endswith(".bin")] == ["hnsw.3.bin"]
+
+
+@pytest.mark.parametrize("dim, model_name", [(DIM * 2, "model"), (DIM, "inny-model")])
+def test_index_of_other_model_is_refused(tmp_path, kind, dim, model_name):
+    create_index(kind, str(tmp_path), DIM, "model").add([1], unit_vectors(1, seed=6))
+
+    with pytest.raises(IndexMismatchError):
+        create_index(kind, str(tmp_path), dim, model_name)
+
+
+def test_index_of_other_section_layout_is_refused(tmp_path, kind):
+    create_index(kind, str(tmp_path), DIM, "model", ["skills", "experience"])
+
+    with pytest.raises(IndexMismatchError):
+        create_index(kind, str(tmp_path), DIM, "model", ["skills", "education"])
+
+
+def test_unknown_index_kind(tmp_path):
+    with pytest.raises(ValueError):
+        create_index("faiss", str(tmp_path), DIM)
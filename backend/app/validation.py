@@ -0,0 +1,110 @@
+"""
+Moduł walidacji żądań API: rozszerzenia i liczba przesłanych plików, silnik ekstrakcji PDF,
+wagi sekcji oraz gotowość instancji (załadowany model) do obsługi analiz.
+"""
+from typing import Dict, List, Optional
+import json
+import os
+
+from fastapi import HTTPException, UploadFile
+
+from app.nlp.parser import PDF_ENGINES
+from app.nlp.scoring import validate_section_weights
+
+# Dozwolone rozszerzenia plików
+ALLOWED_EXTENSIONS = {"pdf", "docx", "txt"}
+
+# Maksymalna liczba plików CV w jednym żądaniu /analyze/batch
+BATCH_MAX_FILES = int(os.getenv("BATCH_MAX_FILES", "500"))
+
+# Sugerowany czas ponowienia żądania (nagłówek Retry-After), gdy model jest jeszcze ładowany [s]
+READY_RETRY_AFTER = int(os.getenv("READY_RETRY_AFTER", "5"))
+
+
+def validate_file_extension(filename: str) -> bool:
+    """
+    Sprawdza, czy rozszerzenie pliku jest dozwolone.
+
+    Args:
+        filename: Nazwa pliku do sprawdzenia
+
+    Returns:
+        bool: True jeśli rozszerzenie jest dozwolone, False w przeciwnym przypadku
+    """
+    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+
+
+def validate_batch_files(cv_files: List[UploadFile]):
+    """
+    Sprawdza liczbę i rozszerzenia plików CV przesłanych do analizy zbiorczej.
+
+    Args:
+        cv_files: Pliki CV
+
+    Raises:
+        HTTPException: Jeśli plików jest zbyt wiele lub mają nieprawidłowe rozszerzenia
+    """
+    if len(cv_files) > BATCH_MAX_FILES:
+        raise HTTPException(status_code=400, detail=f"Zbyt wiele plików CV. Maksymalna liczba: {BATCH_MAX_FILES}")
+
+    for cv_file in cv_files:
+        if not validate_file_extension(cv_file.filename):
+            raise HTTPException(status_code=400, detail=f"Nieprawidłowy format pliku CV: {cv_file.filename}. Dozwolone formaty: PDF, DOCX, TXT")
+
+
+def validate_pdf_engine(pdf_engine: Optional[str]):
+    """
+    Sprawdza silnik ekstrakcji PDF wskazany w żądaniu.
+
+    Args:
+        pdf_engine: Nazwa silnika lub None (domyślny PDF_ENGINE)
+
+    Raises:
+        HTTPException: Jeśli silnik nie jest obsługiwany
+    """
+    if pdf_engine is not None and pdf_engine not in PDF_ENGINES:
+        raise HTTPException(status_code=400, detail=f"Nieobsługiwany silnik ekstrakcji PDF: {pdf_engine}. Dozwolone: {', '.join(PDF_ENGINES)}")
+
+
+def parse_section_weights(section_weights: Optional[str]) -> Optional[Dict[str, float]]:
+    """
+    Odczytuje wagi sekcji przesłane w żądaniu jako JSON, np. {"skills": 0.6, "experience": 0.4}.
+
+    Args:
+        section_weights: Wagi sekcji w formacie JSON lub None (wagi domyślne)
+
+    Returns:
+        Optional[Dict[str, float]]: Sprawdzone wagi sekcji lub None
+
+    Raises:
+        HTTPException: Jeśli wagi nie są poprawnym JSON-em lub zawierają nieprawidłowe wartości
+    """
+    if section_weights is None or not section_weights.strip():
+        return None
+
+    try:
+        return validate_section_weights(json.loads(section_weights))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Nieprawidłowe wagi sekcji: {str(e)}")
+
+
+def require_ready(state):
+    """
+    Sprawdza, czy model został załadowany i analizator może obsługiwać żądania.
+
+    Args:
+        state: Stan aplikacji (request.app.state)
+
+    Raises:
+        HTTPException: 503, jeśli model jest jeszcze ładowany lub jego ładowanie się nie powiodło
+    """
+    if state.analyzer is not None:
+        return
+
+    if state.warmup_error is not None:
+        raise HTTPException(status_code=503, detail=f"Nie udało się załadować modelu: {state.warmup_error}")
+    raise HTTPException(
+        status_code=503,
+        detail="Model jest ładowany, spróbuj ponownie za chwilę",
+        headers={"Retry-After": str(READY_RETRY_AFTER)}
+    )
@@ -0,0 +1,36 @@
+"""
+Konfiguracja serwera gunicorn dla trybu wieloprocesowego (workery uvicorn).
+Uruchomienie z katalogu backend: gunicorn app.main:app (plik jest wczytywany automatycznie).
+Przy PRELOAD_MODEL=True wagi modelu są ładowane raz w procesie nadrzędnym, a workery
+tworzone przez fork współdzielą je w trybie copy-on-write zamiast ładować własne kopie.
+"""
+import gc
+import os
+
+bind = f"{os.getenv('API_HOST', '0.0.0.0')}:{os.getenv('PORT', os.getenv('API_PORT', '8000'))}"
+workers = int(os.getenv("WEB_CONCURRENCY", "2"))
+worker_class = "uvicorn.workers.UvicornWorker"
+# Limit czasu obejmuje ładowanie modelu przy ponownym uruchomieniu workera
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+preload_app = os.getenv("PRELOAD_MODEL", "True").lower() in ("1", "true", "yes")
+
+# Rdzenie dzielone między workery zamiast nadsubskrypcji wątków obliczeń PyTorch
+os.environ.setdefault("TORCH_THREADS", str(max(1, (os.cpu_count() or 1) // workers)))
+
+
+def on_starting(server):
+    """
+    Ładuje wagi modelu w procesie nadrzędnym, zanim zostaną utworzone workery.
+
+    Args:
+        server: Proces nadrzędny gunicorn (Arbiter)
+    """
+    if not preload_app:
+        return
+
+    from app.main import preload_encoder
+
+    preload_encoder()
+    # Obiekty utworzone do tej pory trafiają do generacji stałej - odśmiecanie w workerach
+    # nie zapisuje ich nagłówków, więc zawierające je strony pamięci pozostają współdzielone
+    gc.freeze()
@@ -0,0 +1,216 @@
+"""
+Benchmark odczytu historii analiz: GET /analyses (stronicowanie kluczem) i GET /analyses/{id}.
+Wypełnia bazę --count syntetycznymi analizami (z danymi CV i ogłoszenia, dopasowaniami
+umiejętności i ocenami sekcji), a następnie mierzy opóźnienia p50/p95 oraz liczbę zapytań SQL
+na żądanie dla pierwszej i dalekiej strony (kursor w połowie historii), sortowania według
+wyniku, filtrów i szczegółów analizy. Dla porównania mierzona jest ta sama daleka strona
+pobierana przez OFFSET. Wypełniona baza wskazana przez --database-url jest używana ponownie
+(wypełnianie jest pomijane, jeśli zawiera już --count analiz benchmarku).
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+# Dodanie ścieżki do katalogu głównego projektu
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scripts.benchmark_suite import summarize
+
+# Prefiks nazw plików CV analiz wstawianych przez benchmark
+FILENAME_PREFIX = "benchmark-"
+JOB_FILES = 50
+SKILL_MATCHES = 3
+SECTIONS = ("skills", "experience", "education", "full_text")
+
+
+def seed(session_factory, count: int, chunk_size: int = 20000, seed_value: int = 0):
+    """
+    Wstawia syntetyczne analizy instrukcjami INSERT wielu wierszy.
+
+    Args:
+        session_factory: Fabryka sesji
+        count: Liczba analiz
+        chunk_size: Liczba analiz w jednej transakcji
+        seed_value: Ziarno generatora wyników
+    """
+    from sqlalchemy import insert
+
+    from app.models.models import Analysis, CVData, JobData, SectionScore, SkillMatch
+
+    rng = np.random.default_rng(seed_value)
+    started_at = datetime(2024, 1, 1)
+    db = session_factory()
+    try:
+        for offset in range(0, count, chunk_size):
+            size = min(chunk_size, count - offset)
+            scores = rng.random((size, len(SECTIONS)))
+            ids = db.scalars(
+                insert(Analysis).returning(Analysis.id, sort_by_parameter_order=True),
+                [
+                    {
+                        "cv_filename": f"{FILENAME_PREFIX}{offset + index}.pdf",
+                        "job_description_filename": f"{FILENAME_PREFIX}job-{(offset + index) % JOB_FILES}.pdf",
+                        "relevance_score": round(float(scores[index, :3] @ (0.5, 0.3, 0.2)), 2),
+                        # Kilka analiz na sekundę, część z tą samą datą (rozstrzyga id)
+                        "created_at": started_at + timedelta(seconds=(offset + index) // 3)
+                    }
+                    for index in range(size)
+                ]
+            ).all()
+            db.execute(insert(CVData), [
+                {"analysis_id": analysis_id, "skills": ["Python", "SQL", "Docker"], "experience": [], "education": [], "full_text": "Treść CV kandydata."}
+                for analysis_id in ids
+            ])
+            db.execute(insert(JobData), [
+                {"analysis_id": analysis_id, "job_title": "Python Developer", "company": "Tech Solutions", "required_skills": ["Python", "SQL"], "full_text": "Ogłoszenie o pracę."}
+                for analysis_id in ids
+            ])
+            db.execute(insert(SkillMatch), [
+                {"analysis_id": analysis_id, "cv_skill": f"skill-{skill}", "job_skill": f"skill-{skill}", "similarity_score": 0.9}
+                for analysis_id in ids
+                for skill in range(SKILL_MATCHES)
+            ])
+            db.execute(insert(SectionScore), [
+                {"analysis_id": analysis_id, "section_name": section, "score": float(scores[index, position]), "weight": (0.5, 0.3, 0.2, 0.0)[position]}
+                for index, analysis_id in enumerate(ids)
+                for position, section in enumerate(SECTIONS)
+            ])
+            db.commit()
+            print(f"Wstawiono {offset + size} z {count} analiz", end="\r")
+    finally:
+        db.close()
+    print()
+
+
+def measure(client, queries: list, path: str, params: dict, repeat: int) -> dict:
+    """
+    Wykonuje żądanie GET repeat razy i zwraca podsumowanie opóźnień z liczbą zapytań SQL.
+    """
+    timings = []
+    for _ in range(repeat):
+        queries.clear()
+        started = time.perf_counter()
+        response = client.get(path, params=params)
+        timings.append(time.perf_counter() - started)
+        if response.status_code != 200:
+            raise RuntimeError(f"{path} zwróciło {response.status_code}: {response.text}")
+    return {**summarize(timings), "queries": len(queries)}
+
+
+def measure_offset(session_factory, offset: int, limit: int, repeat: int) -> dict:
+    """
+    Mierzy pobranie tej samej dalekiej strony przez OFFSET (bez wczytywania relacji).
+    """
+    from sqlalchemy import select
+
+    from app.models.models import Analysis
+
+    timings = []
+    db = session_factory()
+    try:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            db.scalars(
+                select(Analysis).order_by(Analysis.created_at.desc(), Analysis.id.desc()).offset(offset).limit(limit)
+            ).all()
+            timings.append(time.perf_counter() - started)
+    finally:
+        db.close()
+    return {**summarize(timings), "queries": 1}
+
+
+def run_benchmark(count: int, limit: int, repeat: int):
+    """
+    Wypełnia bazę (DATABASE_URL) i mierzy endpointy historii analiz.
+
+    Args:
+        count: Liczba analiz w bazie
+        limit: Liczba analiz na stronie
+        repeat: Liczba powtórzeń każdego żądania
+    """
+    # Konfiguracja aplikacji (w tym DATABASE_URL) jest odczytywana przy imporcie app.main
+    from fastapi.testclient import TestClient
+    from sqlalchemy import event, func, select
+
+    from app.main import app
+    from app.models.database import SessionLocal, engine
+    from app.models.models import Analysis, Base
+    from app.api.analyses import encode_analyses_cursor
+
+    Base.metadata.create_all(engine)
+    db = SessionLocal()
+    try:
+        seeded = db.scalar(select(func.count()).select_from(Analysis).where(Analysis.cv_filename.like(f"{FILENAME_PREFIX}%")))
+    finally:
+        db.close()
+    if seeded < count:
+        started = time.perf_counter()
+        seed(SessionLocal, count - seeded)
+        print(f"Wypełnianie bazy: {time.perf_counter() - started:.1f} s")
+
+    # Kursory stron w połowie historii dla obu sortowań
+    middle = count // 2
+    db = SessionLocal()
+    try:
+        cursors = {}
+        for sort, column in (("created_at", Analysis.created_at), ("relevance_score", Analysis.relevance_score)):
+            analysis = db.scalars(select(Analysis).order_by(column.desc(), Analysis.id.desc()).offset(middle).limit(1)).one()
+            cursors[sort] = encode_analyses_cursor(sort, analysis)
+        total = db.scalar(select(func.count()).select_from(Analysis))
+        analysis_ids = db.scalars(select(Analysis.id).order_by(func.random()).limit(repeat)).all()
+    finally:
+        db.close()
+
+    queries = []
+    event.listen(engine, "before_cursor_execute", lambda *args: queries.append(args[2]))
+
+    results = {}
+    with TestClient(app) as client:
+        results["pierwsza strona"] = measure(client, queries, "/analyses", {"limit": limit}, repeat)
+        results[f"strona od {middle}"] = measure(client, queries, "/analyses", {"limit": limit, "cursor": cursors["created_at"]}, repeat)
+        results["wynik: pierwsza"] = measure(client, queries, "/analyses", {"limit": limit, "sort": "relevance_score"}, repeat)
+        results[f"wynik: od {middle}"] = measure(client, queries, "/analyses", {"limit": limit, "sort": "relevance_score", "cursor": cursors["relevance_score"]}, repeat)
+        results["filtr ogłoszenia"] = measure(client, queries, "/analyses", {"limit": limit, "job_description_filename": f"{FILENAME_PREFIX}job-7.pdf"}, repeat)
+        results["filtr wyniku"] = measure(client, queries, "/analyses", {"limit": limit, "min_score": 0.8}, repeat)
+
+        # Szczegóły losowych analiz
+        timings = []
+        for analysis_id in analysis_ids:
+            queries.clear()
+            started = time.perf_counter()
+            response = client.get(f"/analyses/{analysis_id}")
+            timings.append(time.perf_counter() - started)
+            if response.status_code != 200:
+                raise RuntimeError(f"/analyses/{analysis_id} zwróciło {response.status_code}")
+        results["szczegóły analizy"] = {**summarize(timings), "queries": len(queries)}
+
+    results[f"OFFSET {middle}"] = measure_offset(SessionLocal, middle, limit, repeat)
+
+    print(f"\n{total} analiz w bazie, {limit} na stronie, {repeat} powtórzeń")
+    print(f"{'żądanie':>20} {'p50 [ms]':>9} {'p95 [ms]':>9} {'zapytania':>10}")
+    for name, result in results.items():
+        print(f"{name:>20} {result['p50_ms']:9.2f} {result['p95_ms']:9.2f} {result['queries']:10d}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark endpointów historii analiz")
+    parser.add_argument("--database-url", default=None, help="Adres bazy danych (domyślnie tymczasowy plik SQLite)")
+    parser.add_argument("--count", type=int, default=1000000, help="Liczba analiz w bazie")
+    parser.add_argument("--limit", type=int, default=20, help="Liczba analiz na stronie")
+    parser.add_argument("--repeat", type=int, default=50, help="Liczba powtórzeń każdego żądania")
+    args = parser.parse_args()
+
+    # Benchmark mierzy odczyt - bez modelu, zapisu analiz i workerów zadań asynchronicznych
+    os.environ.setdefault("ENCODER_BACKEND", "hashing")
+    os.environ.setdefault("PERSIST_ANALYSES", "False")
+    os.environ.setdefault("JOB_WORKERS", "0")
+    os.environ.setdefault("JOB_QUEUE", "memory")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.environ["DATABASE_URL"] = args.database_url or f"sqlite:///{os.path.join(tmp_dir, 'benchmark.sqlite3')}"
+        run_benchmark(args.count, args.limit, args.repeat)
@@ -0,0 +1,201 @@
+"""
+Benchmark zapisu wyników analiz w bazie danych.
+Porównuje zapis obiektami ORM (crud.add_analysis - osobny INSERT dla każdego obiektu),
+zapis instrukcjami INSERT wielu wierszy (crud.save_analyses) oraz ten sam zapis przez
+AsyncSession (DATABASE_MODE=async; wymaga asyncpg lub aiosqlite) dla różnych rozmiarów
+transakcji. Jedna analiza to wiersze analyses, cv_data i job_data oraz dopasowania
+umiejętności i oceny sekcji; raportowana jest liczba wierszy i analiz na sekundę.
+Dla bazy innej niż tymczasowy plik SQLite tabele są tworzone, jeśli nie istnieją,
+a wstawione wiersze usuwane po pomiarze.
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+# Dodanie ścieżki do katalogu głównego projektu
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, delete, select
+from sqlalchemy.orm import sessionmaker
+
+from app.models import crud
+from app.models.database import async_database_url, pool_options
+from app.models.models import Analysis, Base, CVData, JobData, SectionScore, SkillMatch
+
+# Prefiks nazw plików wierszy wstawianych przez benchmark (usuwanych po pomiarze)
+FILENAME_PREFIX = "benchmark-"
+
+SECTION_WEIGHTS = {"skills": 0.5, "experience": 0.3, "education": 0.2, "full_text": 0.0}
+MODES = ["orm", "bulk", "bulk-async"]
+
+
+def build_records(count: int, skill_matches: int) -> list:
+    """
+    Tworzy syntetyczne rekordy analiz.
+
+    Args:
+        count: Liczba analiz
+        skill_matches: Liczba dopasowań umiejętności w analizie
+
+    Returns:
+        list: Rekordy w formacie crud.save_analyses
+    """
+    job_data = {
+        "job_title": "Senior Python Developer",
+        "company": "Tech Solutions",
+        "required_skills": [f"skill-{index}" for index in range(skill_matches)],
+        "responsibilities": ["Rozwój aplikacji webowych"] * 5,
+        "qualifications": ["Wykształcenie wyższe"],
+        "full_text": "Ogłoszenie o pracę. " * 100
+    }
+    records = []
+    for index in range(count):
+        cv_data = {
+            "contact_info": {"email": f"kandydat{index}@example.com"},
+            "skills": [f"skill-{skill}" for skill in range(skill_matches)],
+            "experience": [{"position": "Developer", "company": "Firma", "description": "Opis " * 20}] * 3,
+            "education": [{"degree": "Magister", "institution": "Politechnika"}],
+            "full_text": "Treść CV kandydata. " * 150
+        }
+        analysis = {
+            "relevance_score": 0.5,
+            "section_scores": {"skills": 0.6, "experience": 0.5, "education": 0.4, "full_text": 0.3},
+            "skill_matches": [
+                {"cv_skill": f"skill-{skill}", "job_skill": f"skill-{skill}", "similarity_score": 0.9}
+                for skill in range(skill_matches)
+            ]
+        }
+        records.append({
+            "cv_filename": f"{FILENAME_PREFIX}{index}.pdf",
+            "job_description_filename": f"{FILENAME_PREFIX}job.pdf",
+            "cv_data": cv_data,
+            "job_data": job_data,
+            "analysis": analysis
+        })
+    return records
+
+
+def save_orm(db, records: list):
+    """
+    Zapis obiektami ORM (jednostka pracy sesji) w jednej transakcji.
+    """
+    try:
+        for record in records:
+            crud.add_analysis(
+                db,
+                record["cv_filename"],
+                record["job_description_filename"],
+                record["cv_data"],
+                record["job_data"],
+                record["analysis"],
+                SECTION_WEIGHTS
+            )
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+
+def measure_sync(session_factory, records: list, batch_size: int, bulk: bool) -> float:
+    """
+    Zapisuje rekordy transakcjami po batch_size analiz i zwraca czas [s].
+    """
+    started = time.perf_counter()
+    for offset in range(0, len(records), batch_size):
+        db = session_factory()
+        try:
+            if bulk:
+                crud.save_analyses(db, records[offset:offset + batch_size], SECTION_WEIGHTS)
+            else:
+                save_orm(db, records[offset:offset + batch_size])
+        finally:
+            db.close()
+    return time.perf_counter() - started
+
+
+async def measure_async(url: str, records: list, batch_size: int) -> float:
+    """
+    Zapisuje rekordy przez AsyncSession transakcjami po batch_size analiz i zwraca czas [s].
+    """
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    engine = create_async_engine(async_database_url(url), **pool_options(url))
+    session_factory = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+    try:
+        started = time.perf_counter()
+        for offset in range(0, len(records), batch_size):
+            async with session_factory() as session:
+                await session.run_sync(crud.save_analyses, records[offset:offset + batch_size], SECTION_WEIGHTS)
+        return time.perf_counter() - started
+    finally:
+        await engine.dispose()
+
+
+def cleanup(session_factory):
+    """
+    Usuwa wiersze wstawione przez benchmark.
+    """
+    db = session_factory()
+    try:
+        analysis_ids = select(Analysis.id).where(Analysis.cv_filename.like(f"{FILENAME_PREFIX}%")).scalar_subquery()
+        for model in (SkillMatch, SectionScore, CVData, JobData):
+            db.execute(delete(model).where(model.analysis_id.in_(analysis_ids)))
+        db.execute(delete(Analysis).where(Analysis.cv_filename.like(f"{FILENAME_PREFIX}%")))
+        db.commit()
+    finally:
+        db.close()
+
+
+def run_benchmark(url: str, count: int, skill_matches: int, batch_sizes: list, modes: list):
+    """
+    Uruchamia pomiary dla jednej bazy danych i wypisuje tabelę wyników.
+
+    Args:
+        url: Adres bazy danych
+        count: Liczba analiz zapisywanych w każdym pomiarze
+        skill_matches: Liczba dopasowań umiejętności w analizie
+        batch_sizes: Liczby analiz w jednej transakcji
+        modes: Sposoby zapisu (orm, bulk, bulk-async)
+    """
+    engine = create_engine(url, **pool_options(url))
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    records = build_records(count, skill_matches)
+    rows = count * (3 + skill_matches + len(SECTION_WEIGHTS))
+
+    print(f"\n{url.split('://', 1)[0]}: {count} analiz, {rows} wierszy na pomiar")
+    print(f"{'tryb':>12} {'transakcja':>11} {'czas [s]':>9} {'wiersze/s':>11} {'analizy/s':>10}")
+    try:
+        for mode in modes:
+            for batch_size in batch_sizes:
+                try:
+                    if mode == "bulk-async":
+                        elapsed = asyncio.run(measure_async(url, records, batch_size))
+                    else:
+                        elapsed = measure_sync(session_factory, records, batch_size, bulk=mode == "bulk")
+                except ImportError as e:
+                    print(f"{mode:>12} {batch_size:>11} pominięto: {e}")
+                    break
+                finally:
+                    cleanup(session_factory)
+                print(f"{mode:>12} {batch_size:>11} {elapsed:9.2f} {rows / elapsed:11.0f} {count / elapsed:10.1f}")
+    finally:
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark zapisu wyników analiz w bazie danych")
+    parser.add_argument("--database-url", nargs="+", default=None, help="Adresy baz danych (domyślnie tymczasowy plik SQLite)")
+    parser.add_argument("--count", type=int, default=1000, help="Liczba analiz w pomiarze")
+    parser.add_argument("--skill-matches", type=int, default=8, help="Liczba dopasowań umiejętności w analizie")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 100, 500], help="Liczby analiz w jednej transakcji")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=MODES, help="Sposoby zapisu")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        urls = args.database_url or [f"sqlite:///{os.path.join(tmp_dir, 'benchmark.sqlite3')}"]
+        for url in urls:
+            run_benchmark(url, args.count, args.skill_matches, args.batch_sizes, args.modes)
@@ -0,0 +1,125 @@
+"""
+Benchmark mikro-batchowania kodowania przy równoległych analizach (/analyze).
+Porównuje przepustowość i średni rozmiar batcha modelu dla zadanej liczby równoległych żądań:
+- bez batchowania - każda analiza koduje teksty w swoim wątku puli,
+- wątki - harmonogram, na którego wynik czeka wątek puli analiz (InferenceScheduler.encode),
+  więc batch łączy najwyżej ANALYSIS_WORKERS analiz,
+- pętla - run_analysis_async: teksty trafiają do harmonogramu z pętli zdarzeń, a wątki puli
+  wykonują tylko parsowanie i ocenę.
+Liczba analiz w toku jest ograniczona jak w aplikacji (ANALYSIS_WORKERS + ANALYSIS_MAX_PENDING).
+Koder (ENCODER_BACKEND, domyślnie hashing) jest opóźniany o stały koszt wywołania i koszt
+tekstu, jak model na CPU; cache embeddingów jest wyłączony, więc każda analiza koduje teksty.
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Dodanie ścieżki do katalogu głównego projektu
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SAMPLE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "sample_data")
+MODES = ["bez batchowania", "wątki", "pętla"]
+
+
+class LatencyEncoder:
+    """
+    Koder opóźniający wywołania modelu o koszt stały i koszt każdego tekstu
+    (time.sleep zwalnia GIL, jak obliczenia PyTorch).
+    """
+
+    def __init__(self, model, call_ms: float, text_ms: float):
+        self.model = model
+        self.call_ms = call_ms
+        self.text_ms = text_ms
+
+    def encode(self, texts, **kwargs):
+        time.sleep((self.call_ms + self.text_ms * len(texts)) / 1000.0)
+        return self.model.encode(texts, **kwargs)
+
+
+async def run_mode(mode: str, analyzer, parse_cache, encoder, cv_path: str, job_path: str, concurrency: int, requests: int, workers: int, max_pending: int, max_batch: int) -> dict:
+    """
+    Wykonuje requests analiz, z których concurrency jest zgłaszanych równolegle.
+
+    Returns:
+        dict: Przepustowość [analizy/s] i średni rozmiar batcha modelu
+    """
+    from app.nlp.batching import InferenceScheduler
+    from app.pipeline import run_analysis, run_analysis_async
+
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="analysis")
+    scheduler = None
+    analyzer.encoder = encoder
+    if mode != "bez batchowania":
+        scheduler = InferenceScheduler(encoder, max_batch_size=max_batch)
+        await scheduler.start()
+        analyzer.encoder = scheduler
+
+    loop = asyncio.get_running_loop()
+    slots = asyncio.Semaphore(workers + max_pending)
+    queue = asyncio.Queue()
+    for _ in range(requests):
+        queue.put_nowait(None)
+
+    async def client():
+        while not queue.empty():
+            queue.get_nowait()
+            async with slots:
+                if mode == "pętla":
+                    await run_analysis_async(analyzer, parse_cache, executor, scheduler, cv_path, job_path)
+                else:
+                    await loop.run_in_executor(executor, run_analysis, analyzer, parse_cache, cv_path, job_path)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    seconds = time.perf_counter() - started
+
+    batch_size = scheduler.stats()["avg_batch_size"] if scheduler is not None else None
+    if scheduler is not None:
+        await scheduler.stop()
+    executor.shutdown()
+    return {"throughput": requests / seconds, "batch_size": batch_size}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark mikro-batchowania kodowania przy równoległych analizach")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 20, 50], help="Liczby równoległych żądań")
+    parser.add_argument("--requests", type=int, default=200, help="Liczba analiz w pomiarze")
+    parser.add_argument("--workers", type=int, default=2, help="Liczba wątków puli analiz (ANALYSIS_WORKERS)")
+    parser.add_argument("--max-pending", type=int, default=16, help="ANALYSIS_MAX_PENDING")
+    parser.add_argument("--max-batch", type=int, default=256, help="Maksymalny rozmiar batcha (INFERENCE_MAX_BATCH)")
+    parser.add_argument("--call-ms", type=float, default=50.0, help="Stały koszt wywołania modelu [ms]")
+    parser.add_argument("--text-ms", type=float, default=0.2, help="Koszt kodowania jednego tekstu [ms]")
+    args = parser.parse_args()
+
+    os.environ.setdefault("ENCODER_BACKEND", "hashing")
+    os.environ.setdefault("INFERENCE_BATCHING", "False")
+
+    from app.main import build_analyzer
+    from app.nlp.parse_cache import ParseCache
+
+    analyzer = build_analyzer()
+    analyzer.cache = None
+    encoder = LatencyEncoder(analyzer.model, args.call_ms, args.text_ms)
+
+    print(f"Koder: {analyzer.model_name}, wywołanie {args.call_ms} ms + {args.text_ms} ms/tekst, "
+          f"wątki analizy: {args.workers}, batch do {args.max_batch} tekstów, analiz: {args.requests}")
+    print(f"{'równolegle':>10} " + " ".join(f"{mode + ' [/s]':>22}" for mode in MODES) + f" {'batch: wątki':>13} {'batch: pętla':>13}")
+
+    # Wyniki parsowania z cache - pomiar dotyczy kodowania i oceny
+    parse_cache = ParseCache(max_entries=16)
+    cv_path = os.path.join(SAMPLE_DIR, "przyklad_cv.txt")
+    job_path = os.path.join(SAMPLE_DIR, "przyklad_ogloszenie.txt")
+
+    for concurrency in args.concurrency:
+        results = {
+            mode: asyncio.run(run_mode(
+                mode, analyzer, parse_cache, encoder, cv_path, job_path, concurrency, args.requests, args.workers, args.max_pending, args.max_batch
+            ))
+            for mode in MODES
+        }
+        throughput = " ".join(f"{results[mode]['throughput']:22.1f}" for mode in MODES)
+        print(f"{concurrency:>10} {throughput} {results['wątki']['batch_size']:13.1f} {results['pętla']['batch_size']:13.1f}")
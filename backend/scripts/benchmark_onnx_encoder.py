@@ -0,0 +1,177 @@
+"""
+Porównanie backendu ONNX Runtime (fp32 i int8) z backendem PyTorch (SentenceTransformer).
+Raportuje rozbieżność embeddingów i wyników podobieństwa na przykładowych danych,
+zmianę wyników analizy oraz opóźnienie pojedynczego kodowania i przepustowość batchy.
+Wymaga eksportu modelu (scripts/export_onnx.py) oraz zainstalowanych torch i onnxruntime.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+# Dodanie ścieżki do katalogu głównego projektu
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sentence_transformers import SentenceTransformer
+
+from app.main import MODEL_NAME, ONNX_MODEL_PATH
+from app.nlp.onnx_encoder import OnnxSentenceEncoder
+from app.nlp.parser import CVParser, JobDescriptionParser
+from app.nlp.scoring import RelevanceAnalyzer
+
+SAMPLE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "sample_data")
+
+# Próg podobieństwa używany przy dopasowaniu umiejętności (RelevanceAnalyzer._match_skills)
+SKILL_THRESHOLD = 0.7
+
+
+def load_samples() -> tuple:
+    """
+    Wczytuje przykładowe CV i ogłoszenie oraz zbiera teksty kodowane podczas analizy.
+
+    Returns:
+        tuple: Dane CV, dane ogłoszenia, lista unikalnych tekstów
+    """
+    cv_data = CVParser(os.path.join(SAMPLE_DIR, "przyklad_cv.txt")).parse_cv()
+    job_data = JobDescriptionParser(os.path.join(SAMPLE_DIR, "przyklad_ogloszenie.txt")).parse_job_description()
+
+    texts = []
+    texts.extend(skill.lower() for skill in cv_data["skills"])
+    texts.extend(skill.lower() for skill in job_data["required_skills"])
+    for data in (cv_data, job_data):
+        texts.extend(line.strip() for line in data["full_text"].split("\n") if line.strip())
+
+    return cv_data, job_data, list(dict.fromkeys(texts))
+
+
+def normalize(matrix: np.ndarray) -> np.ndarray:
+    """
+    Normalizuje wiersze macierzy do długości jednostkowej.
+    """
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0, 1.0, norms)
+
+
+def parity(reference: np.ndarray, candidate: np.ndarray, skill_rows: int, skill_cols: int) -> dict:
+    """
+    Porównuje embeddingi dwóch backendów.
+
+    Args:
+        reference: Embeddingi backendu PyTorch
+        candidate: Embeddingi porównywanego backendu
+        skill_rows: Liczba umiejętności z CV (początek listy tekstów)
+        skill_cols: Liczba wymaganych umiejętności (kolejne teksty)
+
+    Returns:
+        dict: Miary rozbieżności
+    """
+    reference, candidate = normalize(reference), normalize(candidate)
+    cosine = np.sum(reference * candidate, axis=1)
+
+    # Rozbieżność wyników podobieństwa między wszystkimi parami tekstów
+    drift = np.abs(reference @ reference.T - candidate @ candidate.T)
+
+    # Zmiany decyzji progu dopasowania umiejętności (CV x wymagania)
+    skills = slice(0, skill_rows)
+    required = slice(skill_rows, skill_rows + skill_cols)
+    reference_matches = (reference[skills] @ reference[required].T) > SKILL_THRESHOLD
+    candidate_matches = (candidate[skills] @ candidate[required].T) > SKILL_THRESHOLD
+
+    return {
+        "cosine_mean": float(cosine.mean()),
+        "cosine_min": float(cosine.min()),
+        "drift_mean": float(drift.mean()),
+        "drift_max": float(drift.max()),
+        "threshold_flips": int(np.sum(reference_matches != candidate_matches)),
+        "skill_pairs": int(reference_matches.size)
+    }
+
+
+def latency(model, texts: list, repeat: int, batch_size: int) -> dict:
+    """
+    Mierzy opóźnienie kodowania pojedynczego tekstu i przepustowość kodowania batchami.
+
+    Args:
+        model: Koder o interfejsie SentenceTransformer
+        texts: Teksty testowe
+        repeat: Liczba pomiarów pojedynczego kodowania
+        batch_size: Rozmiar batcha przy pomiarze przepustowości
+
+    Returns:
+        dict: Percentyle opóźnienia [ms] i przepustowość [teksty/s]
+    """
+    model.encode(texts[:batch_size], batch_size=batch_size)
+
+    timings = []
+    for i in range(repeat):
+        started = time.perf_counter()
+        model.encode([texts[i % len(texts)]], batch_size=1)
+        timings.append((time.perf_counter() - started) * 1000)
+
+    corpus = texts * max(1, 512 // len(texts))
+    started = time.perf_counter()
+    model.encode(corpus, batch_size=batch_size)
+    elapsed = time.perf_counter() - started
+
+    return {
+        "p50_ms": float(np.percentile(timings, 50)),
+        "p95_ms": float(np.percentile(timings, 95)),
+        "texts_per_s": len(corpus) / elapsed
+    }
+
+
+def run(model_dir: str, repeat: int, batch_size: int):
+    """
+    Uruchamia porównanie i wypisuje wyniki.
+
+    Args:
+        model_dir: Katalog z eksportem ONNX
+        repeat: Liczba pomiarów pojedynczego kodowania
+        batch_size: Rozmiar batcha przy pomiarze przepustowości
+    """
+    cv_data, job_data, texts = load_samples()
+    skill_rows = len(cv_data["skills"])
+    skill_cols = len(job_data["required_skills"])
+
+    backends = {"torch": SentenceTransformer(MODEL_NAME, device="cpu")}
+    probe = OnnxSentenceEncoder(model_dir)
+    for variant in probe.config["variants"]:
+        backends[f"onnx-{variant}"] = probe if variant == probe.variant else OnnxSentenceEncoder(model_dir, variant=variant)
+
+    print(f"Model: {MODEL_NAME}, tekstów: {len(texts)}")
+    reference = np.asarray(backends["torch"].encode(texts, batch_size=batch_size))
+    reference_analysis = RelevanceAnalyzer(MODEL_NAME, model=backends["torch"]).analyze_relevance(cv_data, job_data)
+
+    print(f"\n{'backend':>12} {'cos śr.':>8} {'cos min':>8} {'dryf śr.':>9} {'dryf max':>9} {'zmiany progu':>13} {'Δ wynik':>8} {'Δ sekcje max':>13}")
+    for name, model in backends.items():
+        if name == "torch":
+            continue
+        result = parity(reference, model.encode(texts, batch_size=batch_size), skill_rows, skill_cols)
+        analysis = RelevanceAnalyzer(model.model_name, model=model).analyze_relevance(cv_data, job_data)
+        section_delta = max(
+            abs(analysis["section_scores"][section] - reference_analysis["section_scores"][section])
+            for section in reference_analysis["section_scores"]
+        )
+        print(
+            f"{name:>12} {result['cosine_mean']:8.4f} {result['cosine_min']:8.4f} "
+            f"{result['drift_mean']:9.4f} {result['drift_max']:9.4f} "
+            f"{result['threshold_flips']:>6}/{result['skill_pairs']:<6} "
+            f"{analysis['relevance_score'] - reference_analysis['relevance_score']:8.2f} {section_delta:13.4f}"
+        )
+
+    print(f"\n{'backend':>12} {'p50 [ms]':>9} {'p95 [ms]':>9} {'teksty/s':>10}")
+    for name, model in backends.items():
+        result = latency(model, texts, repeat, batch_size)
+        print(f"{name:>12} {result['p50_ms']:9.2f} {result['p95_ms']:9.2f} {result['texts_per_s']:10.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Porównanie backendów kodowania PyTorch i ONNX Runtime")
+    parser.add_argument("--model-dir", default=ONNX_MODEL_PATH, help="Katalog z eksportem ONNX")
+    parser.add_argument("--repeat", type=int, default=200, help="Liczba pomiarów pojedynczego kodowania")
+    parser.add_argument("--batch-size", type=int, default=32, help="Rozmiar batcha")
+    args = parser.parse_args()
+
+    run(args.model_dir, args.repeat, args.batch_size)
@@ -0,0 +1,77 @@
+"""
+Benchmark silników ekstrakcji tekstu z PDF.
+Porównuje przepustowość (strony na sekundę) silnika "fast" (pypdfium2) i pdfplumber
+oraz zgodność wyodrębnionego tekstu na przykładowych danych powielonych do zadanej liczby stron.
+"""
+import argparse
+import difflib
+import os
+import sys
+import tempfile
+import time
+
+# Dodanie ścieżki do katalogu głównego projektu
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.nlp.parser import DocumentParser
+from scripts.sample_pdf import SAMPLE_DIR, layout_pages, write_text_pdf
+
+ENGINES = ["fast", "pdfplumber", "auto"]
+
+
+def measure(path: str, engine: str, repeat: int) -> tuple:
+    """
+    Zwraca medianę czasu ekstrakcji w sekundach, tekst i faktycznie użyty silnik.
+    """
+    timings = []
+    for _ in range(repeat):
+        parser = DocumentParser(path, pdf_engine=engine)
+        started = time.perf_counter()
+        text = parser.extract_content()
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    return timings[len(timings) // 2], text, parser.pdf_engine_used
+
+
+def run_benchmark(page_counts: list, repeat: int):
+    """
+    Uruchamia benchmark i wypisuje tabelę wyników.
+
+    Args:
+        page_counts: Docelowe liczby stron dokumentów testowych
+        repeat: Liczba powtórzeń pomiaru
+    """
+    samples = sorted(name for name in os.listdir(SAMPLE_DIR) if name.endswith(".txt"))
+
+    print(f"Powtórzeń: {repeat}")
+    print(f"{'plik':>24} {'strony':>7} " + " ".join(f"{engine + ' [str/s]':>18}" for engine in ENGINES) + f" {'auto ->':>11} {'zgodność':>9}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name in samples:
+            with open(os.path.join(SAMPLE_DIR, name), "r", encoding="utf-8") as f:
+                text = f.read()
+            pages_per_copy = len(layout_pages(text))
+
+            for page_count in page_counts:
+                copies = max(1, page_count // pages_per_copy)
+                path = os.path.join(tmp_dir, f"{os.path.splitext(name)[0]}_{page_count}.pdf")
+                write_text_pdf(path, "\n".join([text] * copies))
+                pages = len(layout_pages("\n".join([text] * copies)))
+
+                results = {engine: measure(path, engine, repeat) for engine in ENGINES}
+                # Zgodność tekstu szybkiego silnika z pdfplumber (1.0 = identyczny tekst)
+                parity = difflib.SequenceMatcher(
+                    None, results["fast"][1], results["pdfplumber"][1], autojunk=False
+                ).ratio()
+
+                throughput = " ".join(f"{pages / results[engine][0]:18.1f}" for engine in ENGINES)
+                print(f"{name:>24} {pages:>7} {throughput} {results['auto'][2]:>11} {parity:9.4f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark silników ekstrakcji tekstu z PDF")
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 10, 50], help="Liczby stron dokumentów")
+    parser.add_argument("--repeat", type=int, default=3, help="Liczba powtórzeń pomiaru")
+    args = parser.parse_args()
+
+    run_benchmark(args.pages, args.repeat)
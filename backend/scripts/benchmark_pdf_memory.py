@@ -0,0 +1,144 @@
+"""
+Benchmark pamięci i przepustowości ekstrakcji tekstu z dużych plików PDF.
+Dla wygenerowanych dokumentów o zadanej liczbie stron porównuje:
+- lista - dotychczasową ekstrakcję pdfplumber (wszystkie strony z zapamiętanym układem
+  pozostają w pamięci do końca dokumentu),
+- tekst - DocumentParser.extract_content (strony zwalniane po odczytaniu, pełny tekst w pamięci),
+- strumień - DocumentParser.iter_pdf_pages (tekst kolejnych stron bez składania całości).
+Każdy pomiar działa w osobnym procesie, a szczytowy RSS (ru_maxrss) jest raportowany
+razem z przyrostem względem stanu po imporcie modułów. Wymaga Linuksa.
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+# Dodanie ścieżki do katalogu głównego projektu
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scripts.sample_pdf import SAMPLE_DIR, layout_pages, write_text_pdf
+
+MODES = [("pdfplumber", "lista"), ("pdfplumber", "tekst"), ("pdfplumber", "strumień"), ("fast", "tekst"), ("fast", "strumień")]
+
+
+def peak_rss() -> float:
+    """
+    Zwraca szczytowy RSS bieżącego procesu w MB (ru_maxrss w Linuksie jest w kB).
+    """
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def legacy_extract(path: str) -> int:
+    """
+    Dotychczasowa ekstrakcja pdfplumber: lista tekstu stron bez zwalniania pamięci stron.
+    """
+    import pdfplumber
+
+    pages = []
+    with pdfplumber.open(path) as pdf:
+        for page in pdf.pages:
+            pages.append(page.extract_text() or "")
+    return len("".join(page + "\n" for page in pages))
+
+
+def run_child(path: str, engine: str, mode: str):
+    """
+    Wykonuje jeden pomiar (w procesie potomnym) i wypisuje wynik w formacie JSON.
+    """
+    import pdfplumber  # noqa: F401 - import przed pomiarem, aby nie zawyżał przyrostu pamięci
+
+    from app.nlp.parser import DocumentParser
+
+    parser = DocumentParser(path, pdf_engine=engine)
+    baseline = peak_rss()
+    started = time.perf_counter()
+    if mode == "lista":
+        chars = legacy_extract(path)
+    elif mode == "tekst":
+        chars = len(parser.extract_content())
+    else:
+        chars = sum(len(page) + 1 for page in parser.iter_pdf_pages())
+    seconds = time.perf_counter() - started
+    print(json.dumps({"seconds": seconds, "peak": peak_rss(), "growth": peak_rss() - baseline, "chars": chars}))
+
+
+def measure(path: str, engine: str, mode: str, repeat: int) -> dict:
+    """
+    Uruchamia pomiar w osobnych procesach i zwraca medianę czasu oraz największy szczytowy RSS.
+
+    Args:
+        path: Ścieżka do pliku PDF
+        engine: Silnik ekstrakcji
+        mode: Tryb ekstrakcji (lista, tekst, strumień)
+        repeat: Liczba powtórzeń pomiaru
+
+    Returns:
+        dict: Czas [s], szczytowy RSS i jego przyrost [MB] oraz liczba znaków tekstu
+    """
+    results = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--child", path, engine, mode],
+            check=True, capture_output=True, text=True
+        ).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+    results.sort(key=lambda result: result["seconds"])
+    median = results[len(results) // 2]
+    return {
+        "seconds": median["seconds"],
+        "peak": max(result["peak"] for result in results),
+        "growth": max(result["growth"] for result in results),
+        "chars": median["chars"]
+    }
+
+
+def run_benchmark(page_counts: list, repeat: int):
+    """
+    Generuje dokumenty testowe, uruchamia benchmark i wypisuje tabelę wyników.
+
+    Args:
+        page_counts: Docelowe liczby stron dokumentów testowych
+        repeat: Liczba powtórzeń pomiaru
+    """
+    with open(os.path.join(SAMPLE_DIR, "przyklad_cv.txt"), "r", encoding="utf-8") as f:
+        text = f.read()
+    pages_per_copy = len(layout_pages(text))
+
+    print(f"Powtórzeń: {repeat}")
+    print(f"{'strony':>7} {'silnik':>11} {'tryb':>9} {'str/s':>9} {'szczyt RSS [MB]':>16} {'przyrost [MB]':>14} {'znaki':>10}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for page_count in page_counts:
+            # Tekst powielony do co najmniej page_count stron i przycięty do page_count stron
+            copies = max(1, page_count // pages_per_copy)
+            while len(layout_pages("\n".join([text] * copies))) < page_count:
+                copies += 1
+            page_lines = layout_pages("\n".join([text] * copies))[:page_count]
+            document = "\n".join(line for lines in page_lines for line in lines)
+            path = os.path.join(tmp_dir, f"cv_{page_count}.pdf")
+            write_text_pdf(path, document)
+            pages = len(layout_pages(document))
+
+            for engine, mode in MODES:
+                result = measure(path, engine, mode, repeat)
+                print(
+                    f"{pages:>7} {engine:>11} {mode:>9} {pages / result['seconds']:9.1f} "
+                    f"{result['peak']:16.1f} {result['growth']:14.1f} {result['chars']:>10}"
+                )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 5 and sys.argv[1] == "--child":
+        run_child(*sys.argv[2:])
+        sys.exit(0)
+
+    parser = argparse.ArgumentParser(description="Benchmark pamięci i przepustowości ekstrakcji z dużych PDF")
+    parser.add_argument("--pages", type=int, nargs="+", default=[10, 100, 500], help="Liczby stron dokumentów")
+    parser.add_argument("--repeat", type=int, default=3, help="Liczba powtórzeń pomiaru")
+    args = parser.parse_args()
+
+    run_benchmark(args.pages, args.repeat)
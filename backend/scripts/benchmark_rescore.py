@@ -0,0 +1,149 @@
+"""
+Benchmark przeliczania wyników zapisanych analiz po zmianie wag sekcji (crud.rescore_analyses).
+Wstawia --count syntetycznych analiz z ocenami sekcji, mierzy czas przeliczenia dla kilku
+szerokości zakresów identyfikatorów (--batch-sizes) i sprawdza wyniki z obliczeniem w NumPy.
+Dla bazy innej niż tymczasowy plik SQLite tabele są tworzone, jeśli nie istnieją,
+a wstawione wiersze usuwane po pomiarze (oraz przeliczane są tylko one).
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+# Dodanie ścieżki do katalogu głównego projektu
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, delete, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from app.models import crud
+from app.models.database import pool_options
+from app.models.models import Analysis, Base, SectionScore
+from app.nlp.scoring import DEFAULT_SECTION_WEIGHTS, SCORED_SECTIONS
+
+# Nazwa pliku ogłoszenia wierszy wstawianych przez benchmark (usuwanych po pomiarze)
+JOB_FILENAME = "benchmark-rescore-job.pdf"
+
+NEW_WEIGHTS = {"skills": 0.4, "experience": 0.35, "education": 0.1, "full_text": 0.15}
+
+
+def insert_analyses(session_factory, scores: np.ndarray, chunk_size: int = 10000) -> np.ndarray:
+    """
+    Wstawia analizy z ocenami sekcji (wagi domyślne).
+
+    Args:
+        session_factory: Fabryka sesji
+        scores: Macierz ocen sekcji (analiza x SCORED_SECTIONS)
+        chunk_size: Liczba analiz w jednej transakcji
+
+    Returns:
+        np.ndarray: Identyfikatory wstawionych analiz
+    """
+    default_weights = np.array([DEFAULT_SECTION_WEIGHTS.get(section, 0.0) for section in SCORED_SECTIONS])
+    relevance_scores = np.round(scores @ default_weights, 2)
+    analysis_ids = []
+    db = session_factory()
+    try:
+        for offset in range(0, len(scores), chunk_size):
+            chunk = range(offset, min(offset + chunk_size, len(scores)))
+            ids = db.scalars(
+                insert(Analysis).returning(Analysis.id, sort_by_parameter_order=True),
+                [
+                    {"cv_filename": f"benchmark-{index}.pdf", "job_description_filename": JOB_FILENAME, "relevance_score": float(relevance_scores[index])}
+                    for index in chunk
+                ]
+            ).all()
+            db.execute(insert(SectionScore), [
+                {"analysis_id": analysis_id, "section_name": section, "score": float(scores[index, position]), "weight": DEFAULT_SECTION_WEIGHTS.get(section, 0.0)}
+                for analysis_id, index in zip(ids, chunk)
+                for position, section in enumerate(SCORED_SECTIONS)
+            ])
+            db.commit()
+            analysis_ids.extend(ids)
+    finally:
+        db.close()
+    return np.array(analysis_ids)
+
+
+def check_scores(session_factory, analysis_ids: np.ndarray, expected: np.ndarray) -> float:
+    """
+    Zwraca największą różnicę między zapisanymi a oczekiwanymi wynikami analiz.
+    """
+    db = session_factory()
+    try:
+        rows = db.execute(
+            select(Analysis.id, Analysis.relevance_score).where(Analysis.job_description_filename == JOB_FILENAME)
+        ).all()
+    finally:
+        db.close()
+    stored = dict(rows)
+    return float(np.max(np.abs(np.array([stored[int(analysis_id)] for analysis_id in analysis_ids]) - expected)))
+
+
+def cleanup(session_factory):
+    """
+    Usuwa wiersze wstawione przez benchmark.
+    """
+    db = session_factory()
+    try:
+        analysis_ids = select(Analysis.id).where(Analysis.job_description_filename == JOB_FILENAME).scalar_subquery()
+        db.execute(delete(SectionScore).where(SectionScore.analysis_id.in_(analysis_ids)))
+        db.execute(delete(Analysis).where(Analysis.job_description_filename == JOB_FILENAME))
+        db.commit()
+    finally:
+        db.close()
+
+
+def run_benchmark(url: str, count: int, batch_sizes: list, seed: int = 0):
+    """
+    Uruchamia pomiary dla jednej bazy danych i wypisuje tabelę wyników.
+
+    Args:
+        url: Adres bazy danych
+        count: Liczba analiz
+        batch_sizes: Szerokości zakresów identyfikatorów w jednej transakcji
+        seed: Ziarno generatora ocen sekcji
+    """
+    engine = create_engine(url, **pool_options(url))
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    scores = np.random.default_rng(seed).random((count, len(SCORED_SECTIONS)))
+
+    try:
+        started = time.perf_counter()
+        analysis_ids = insert_analyses(session_factory, scores)
+        print(f"\n{url.split('://', 1)[0]}: {count} analiz, {count * len(SCORED_SECTIONS)} ocen sekcji (wstawiono w {time.perf_counter() - started:.1f} s)")
+        print(f"{'zakres':>8} {'wagi':>10} {'czas [s]':>9} {'analizy/s':>11} {'maks. błąd':>11}")
+
+        for batch_size in batch_sizes:
+            # Na przemian nowe i domyślne wagi - każdy pomiar zmienia wszystkie wyniki
+            for label, weights in (("nowe", NEW_WEIGHTS), ("domyślne", DEFAULT_SECTION_WEIGHTS)):
+                expected = np.round(scores @ np.array([weights.get(section, 0.0) for section in SCORED_SECTIONS]), 2)
+                db = session_factory()
+                try:
+                    started = time.perf_counter()
+                    rescored = crud.rescore_analyses(db, weights, JOB_FILENAME, batch_size)
+                    elapsed = time.perf_counter() - started
+                finally:
+                    db.close()
+                error = check_scores(session_factory, analysis_ids, expected)
+                print(f"{batch_size:>8} {label:>10} {elapsed:9.2f} {rescored / elapsed:11.0f} {error:11.3f}")
+    finally:
+        cleanup(session_factory)
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark przeliczania wyników analiz dla nowych wag sekcji")
+    parser.add_argument("--database-url", nargs="+", default=None, help="Adresy baz danych (domyślnie tymczasowy plik SQLite)")
+    parser.add_argument("--count", type=int, default=200000, help="Liczba analiz")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[10000, 100000], help="Liczby identyfikatorów analiz w jednej transakcji")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        urls = args.database_url or [f"sqlite:///{os.path.join(tmp_dir, 'benchmark.sqlite3')}"]
+        for url in urls:
+            run_benchmark(url, args.count, args.batch_sizes)
@@ -0,0 +1,111 @@
+"""
+Benchmark wyznaczania sekcji dokumentu.
+Porównuje dotychczasowe wyszukiwanie regex (osobny przebieg re.DOTALL dla każdej sekcji)
+z jednoprzebiegowym SectionSegmenter na dokumentach o rosnącym rozmiarze, w tym
+na danych nietypowych (jedna długa linia, tysiące nagłówków, długie ciągi spacji).
+Czas na kilobajt powinien pozostawać stały - oznacza to złożoność liniową.
+"""
+import argparse
+import os
+import re
+import sys
+
+# Dodanie ścieżki do katalogu głównego projektu
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.nlp.parser import CV_SECTION_HEADINGS, JOB_SECTION_HEADINGS
+from app.nlp.sections import SectionSegmenter, section_text
+from scripts.benchmark_suite import median_ms
+
+SAMPLE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "sample_data")
+
+# Terminatory sekcji w dotychczasowej implementacji
+LEGACY_TERMINATORS = {"experience": r"\n\n\n", "education": r"\n\n\n"}
+
+
+def legacy_sections(text: str, headings: dict) -> dict:
+    """
+    Dotychczasowa metoda: osobne wyszukiwanie regex dla każdej sekcji i grupy słów kluczowych.
+    """
+    sections = {}
+    for section, groups in headings.items():
+        terminator = LEGACY_TERMINATORS.get(section, r"\n\n")
+        for pattern in groups:
+            match = re.search(f"({pattern}).*?(\n|$)(.*?)({terminator}|\\Z)", text, re.DOTALL | re.IGNORECASE)
+            if match:
+                sections[section] = match.group(3)
+                break
+    return sections
+
+
+def segmented_sections(segmenter: SectionSegmenter, text: str) -> dict:
+    """
+    Nowa metoda: jeden przebieg wyznaczający zakresy sekcji i wycinanie ich treści.
+    """
+    spans = segmenter.segment(text)
+    return {section: section_text(text, span) for section, span in spans.items()}
+
+
+def build_inputs(size_kb: int) -> dict:
+    """
+    Buduje dokumenty testowe o rozmiarze około size_kb kilobajtów.
+
+    Args:
+        size_kb: Docelowy rozmiar dokumentu
+
+    Returns:
+        dict: Nazwa przypadku -> (tekst, słowa kluczowe nagłówków)
+    """
+    size = size_kb * 1024
+    with open(os.path.join(SAMPLE_DIR, "przyklad_cv.txt"), "r", encoding="utf-8") as f:
+        cv = f.read()
+    with open(os.path.join(SAMPLE_DIR, "przyklad_ogloszenie.txt"), "r", encoding="utf-8") as f:
+        job = f.read()
+
+    def repeat(chunk: str) -> str:
+        return (chunk * (size // len(chunk) + 1))[:size]
+
+    return {
+        "cv (powielone)": (repeat(cv + "\n\n"), CV_SECTION_HEADINGS),
+        "ogłoszenie (powielone)": (repeat(job + "\n\n"), JOB_SECTION_HEADINGS),
+        "jedna linia bez nagłówków": (repeat("lorem ipsum dolor sit amet "), CV_SECTION_HEADINGS),
+        "same nagłówki": (repeat("Umiejętności:\nDoświadczenie\n"), CV_SECTION_HEADINGS),
+        "długie ciągi spacji": (repeat("Skills" + " " * 2000 + "x\n"), CV_SECTION_HEADINGS),
+        "tytuły z dwukropkiem": (repeat("Pozycja numer jeden:" + " " * 500 + "\n"), JOB_SECTION_HEADINGS)
+    }
+
+
+def run_benchmark(sizes: list, repeat: int):
+    """
+    Uruchamia benchmark i wypisuje tabelę wyników.
+
+    Args:
+        sizes: Rozmiary dokumentów w kilobajtach
+        repeat: Liczba powtórzeń pomiaru
+    """
+    segmenters = {
+        id(CV_SECTION_HEADINGS): SectionSegmenter(CV_SECTION_HEADINGS),
+        id(JOB_SECTION_HEADINGS): SectionSegmenter(JOB_SECTION_HEADINGS)
+    }
+
+    print(f"Powtórzeń: {repeat}")
+    print(f"{'przypadek':>26} {'KB':>6} {'regex [ms]':>11} {'segmenter [ms]':>15} {'regex [ms/KB]':>14} {'segmenter [ms/KB]':>18}")
+
+    for size_kb in sizes:
+        for name, (text, headings) in build_inputs(size_kb).items():
+            segmenter = segmenters[id(headings)]
+            legacy_ms = median_ms(lambda: legacy_sections(text, headings), repeat)
+            segmented_ms = median_ms(lambda: segmented_sections(segmenter, text), repeat)
+            print(
+                f"{name:>26} {size_kb:>6} {legacy_ms:11.2f} {segmented_ms:15.2f} "
+                f"{legacy_ms / size_kb:14.4f} {segmented_ms / size_kb:18.4f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark wyznaczania sekcji dokumentu")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[4, 64, 1024], help="Rozmiary dokumentów [KB]")
+    parser.add_argument("--repeat", type=int, default=3, help="Liczba powtórzeń pomiaru")
+    args = parser.parse_args()
+
+    run_benchmark(args.sizes, args.repeat)
@@ -0,0 +1,101 @@
+"""
+Benchmark dopasowania umiejętności na macierzy podobieństwa (RelevanceAnalyzer._match_skills).
+Porównuje dotychczasową pętlę po umiejętnościach z CV (np.argmax dla każdego wiersza)
+z trybami wektorowymi: top-k z progiem (SKILL_MATCHING=topk) oraz optymalnym przypisaniem
+jeden do jednego (SKILL_MATCHING=assignment) dla macierzy o zadanych rozmiarach
+(domyślnie 500 umiejętności z CV x 200 wymagań). Część umiejętności z CV to zaszumione
+kopie wymagań, więc macierz zawiera podobieństwa powyżej progu.
+"""
+import argparse
+import os
+import sys
+
+import numpy as np
+
+# Dodanie ścieżki do katalogu głównego projektu
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.nlp.hashing_encoder import HashingSentenceEncoder
+from app.nlp.scoring import RelevanceAnalyzer
+from scripts.benchmark_suite import median_ms
+
+
+def build_similarity(cv_count: int, job_count: int, dimension: int = 512, matched: float = 0.6, seed: int = 42) -> np.ndarray:
+    """
+    Tworzy macierz podobieństwa cosinusowego syntetycznych embeddingów umiejętności.
+
+    Args:
+        cv_count: Liczba umiejętności z CV
+        job_count: Liczba wymaganych umiejętności
+        dimension: Wymiar embeddingów
+        matched: Odsetek umiejętności z CV będących zaszumionymi kopiami wymagań
+        seed: Ziarno generatora liczb losowych
+
+    Returns:
+        np.ndarray: Macierz podobieństwa (umiejętności z CV x wymagania), float32
+    """
+    rng = np.random.default_rng(seed)
+    job = rng.standard_normal((job_count, dimension)).astype(np.float32)
+    cv = rng.standard_normal((cv_count, dimension)).astype(np.float32)
+    copies = rng.random(cv_count) < matched
+    sources = rng.integers(0, job_count, cv_count)
+    cv[copies] = job[sources[copies]] + 0.6 * cv[copies]
+    job /= np.linalg.norm(job, axis=1, keepdims=True)
+    cv /= np.linalg.norm(cv, axis=1, keepdims=True)
+    return cv @ job.T
+
+
+def legacy_match(similarity_matrix: np.ndarray, cv_skills: list, job_skills: list) -> tuple:
+    """
+    Dotychczasowa metoda: pętla po umiejętnościach z CV i np.argmax dla każdego wiersza.
+    """
+    skill_matches = []
+    matched_job_skills = set()
+    total_similarity = 0.0
+    for i, cv_skill in enumerate(cv_skills):
+        best_match_idx = np.argmax(similarity_matrix[i])
+        best_match_score = similarity_matrix[i][best_match_idx]
+        if best_match_score > 0.7:
+            skill_matches.append({
+                "cv_skill": cv_skill,
+                "job_skill": job_skills[best_match_idx],
+                "similarity_score": float(best_match_score)
+            })
+            matched_job_skills.add(best_match_idx)
+            total_similarity += best_match_score
+    if not skill_matches:
+        return 0.0, skill_matches
+    return (total_similarity / len(skill_matches) + len(matched_job_skills) / len(job_skills)) / 2, skill_matches
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark dopasowania umiejętności na macierzy podobieństwa")
+    parser.add_argument("--sizes", nargs="+", default=["50x20", "500x200", "2000x500"], help="Rozmiary macierzy (umiejętności z CV x wymagania)")
+    parser.add_argument("--top-k", type=int, default=3, help="k dla trybu topk (obok k=1)")
+    parser.add_argument("--repeat", type=int, default=20, help="Liczba powtórzeń pomiaru")
+    args = parser.parse_args()
+
+    model = HashingSentenceEncoder()
+    modes = {
+        "topk k=1": RelevanceAnalyzer(model.model_name, model=model),
+        f"topk k={args.top_k}": RelevanceAnalyzer(model.model_name, model=model, skill_top_k=args.top_k),
+        "assignment": RelevanceAnalyzer(model.model_name, model=model, skill_matching="assignment")
+    }
+
+    print(f"{'macierz':>10} {'metoda':>12} {'czas [ms]':>10} {'przyspieszenie':>15} {'dopasowania':>12} {'wynik':>7}")
+    for size in args.sizes:
+        cv_count, job_count = (int(value) for value in size.split("x"))
+        similarity = build_similarity(cv_count, job_count)
+        cv_skills = [f"cv-skill-{index}" for index in range(cv_count)]
+        job_skills = [f"job-skill-{index}" for index in range(job_count)]
+
+        legacy_score, legacy_matches = legacy_match(similarity, cv_skills, job_skills)
+        legacy_ms = median_ms(lambda: legacy_match(similarity, cv_skills, job_skills), args.repeat)
+        print(f"{size:>10} {'pętla':>12} {legacy_ms:10.2f} {'1.0x':>15} {len(legacy_matches):12d} {legacy_score:7.3f}")
+
+        for name, analyzer in modes.items():
+            score, matches = analyzer._match_skills(similarity, cv_skills, job_skills)
+            if name == "topk k=1" and (matches != legacy_matches or abs(score - legacy_score) > 1e-6):
+                raise RuntimeError("Wynik trybu topk k=1 różni się od dotychczasowej metody")
+            elapsed = median_ms(lambda: analyzer._match_skills(similarity, cv_skills, job_skills), args.repeat)
+            print(f"{size:>10} {name:>12} {elapsed:10.2f} {legacy_ms / elapsed:14.1f}x {len(matches):12d} {score:7.3f}")
@@ -0,0 +1,98 @@
+"""
+Benchmark wyszukiwania umiejętności w tekście CV.
+Porównuje dotychczasową pętlę re.search (jedno przeszukanie tekstu na umiejętność)
+z automatem Aho-Corasick (SkillMatcher) dla słowników o rosnącym rozmiarze.
+"""
+import argparse
+import os
+import random
+import re
+import string
+import sys
+import time
+
+# Dodanie ścieżki do katalogu głównego projektu
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.nlp.skill_matcher import SkillMatcher, load_taxonomy
+from scripts.benchmark_suite import median_ms
+
+SAMPLE_CV_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "sample_data", "przyklad_cv.txt")
+
+
+def build_taxonomy(size: int, seed: int = 42) -> dict:
+    """
+    Buduje słownik umiejętności o zadanym rozmiarze: taksonomia bazowa
+    uzupełniona losowymi nazwami z aliasami.
+
+    Args:
+        size: Liczba nazw kanonicznych
+        seed: Ziarno generatora liczb losowych
+
+    Returns:
+        dict: Słownik nazwa kanoniczna -> lista aliasów
+    """
+    rng = random.Random(seed)
+    taxonomy = dict(list(load_taxonomy().items())[:size])
+    while len(taxonomy) < size:
+        name = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 12)))
+        taxonomy[name.capitalize()] = [f"{name}-{rng.randint(1, 9)}", f"{name}.js"]
+    return taxonomy
+
+
+def legacy_extract(skills: list, text: str) -> list:
+    """
+    Dotychczasowa metoda: osobne wyszukiwanie regex dla każdej umiejętności.
+    """
+    return [skill for skill in skills if re.search(r'\b' + re.escape(skill) + r'\b', text, re.IGNORECASE)]
+
+
+def run_benchmark(sizes: list, text_multiplier: int, repeat: int, legacy_limit: int):
+    """
+    Uruchamia benchmark i wypisuje tabelę wyników.
+
+    Args:
+        sizes: Rozmiary słownika do sprawdzenia
+        text_multiplier: Ile razy powielić przykładowe CV (długość tekstu)
+        repeat: Liczba powtórzeń pomiaru
+        legacy_limit: Maksymalny rozmiar słownika mierzony metodą regex (wolną)
+    """
+    with open(SAMPLE_CV_PATH, "r", encoding="utf-8") as f:
+        text = f.read() * text_multiplier
+
+    print(f"Długość tekstu: {len(text)} znaków, powtórzeń: {repeat}")
+    print(f"{'słownik':>10} {'wzorce':>10} {'budowa [ms]':>12} {'automat [ms]':>13} {'regex [ms]':>11} {'zgodność':>9}")
+
+    for size in sizes:
+        taxonomy = build_taxonomy(size)
+        patterns = sum(1 + len(aliases) for aliases in taxonomy.values())
+
+        started = time.perf_counter()
+        matcher = SkillMatcher(taxonomy)
+        build_ms = (time.perf_counter() - started) * 1000
+
+        automaton_ms = median_ms(lambda: matcher.extract(text), repeat)
+
+        if size <= legacy_limit:
+            regex_ms = median_ms(lambda: legacy_extract(list(taxonomy.keys()), text), repeat)
+            # Zgodność liczona dla nazw kanonicznych (regex nie obsługuje aliasów)
+            canonical_only = SkillMatcher({name: [] for name in taxonomy})
+            parity = set(canonical_only.extract(text)) >= set(legacy_extract(list(taxonomy.keys()), text))
+            regex_column = f"{regex_ms:11.2f}"
+            parity_column = "tak" if parity else "nie"
+        else:
+            regex_column = f"{'-':>11}"
+            parity_column = "-"
+
+        print(f"{size:>10} {patterns:>10} {build_ms:12.1f} {automaton_ms:13.2f} {regex_column} {parity_column:>9}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark wyszukiwania umiejętności")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[26, 250, 1000, 5000, 20000], help="Rozmiary słownika")
+    parser.add_argument("--text-multiplier", type=int, default=3, help="Powielenie przykładowego CV")
+    parser.add_argument("--repeat", type=int, default=5, help="Liczba powtórzeń pomiaru")
+    parser.add_argument("--legacy-limit", type=int, default=5000, help="Maksymalny słownik dla metody regex")
+    args = parser.parse_args()
+
+    run_benchmark(args.sizes, args.text_multiplier, args.repeat, args.legacy_limit)
@@ -0,0 +1,126 @@
+"""
+Benchmark tabeli embeddingów kanonicznych umiejętności (SKILL_TABLE_PATH).
+Buduje tabelę z taksonomii w katalogu tymczasowym, mierzy czas jej wczytania (mmap)
+oraz kodowanie umiejętności --count syntetycznych CV bez pamięci podręcznej embeddingów:
+wszystkie umiejętności kodowane modelem vs rozwiązywane przez tabelę (nazwa kanoniczna
+lub alias, a tylko pozostałe przez model). Umiejętności CV to nazwy
+kanoniczne i aliasy z taksonomii w losowej wielkości liter oraz --unknown nazw spoza niej.
+Koder wybiera ENCODER_BACKEND (domyślnie hashing - bez modelu).
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+# Dodanie ścieżki do katalogu głównego projektu
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def build_skill_lists(taxonomy: dict, count: int, skills: int, unknown: float, seed: int = 0) -> list:
+    """
+    Tworzy listy umiejętności syntetycznych CV.
+
+    Args:
+        taxonomy: Słownik nazwa kanoniczna -> lista aliasów
+        count: Liczba CV
+        skills: Liczba umiejętności w CV
+        unknown: Odsetek umiejętności spoza taksonomii
+        seed: Ziarno generatora liczb losowych
+
+    Returns:
+        list: Listy umiejętności
+    """
+    rng = random.Random(seed)
+    variants = [name for name in taxonomy] + [alias for aliases in taxonomy.values() for alias in aliases]
+    skill_lists = []
+    for index in range(count):
+        skill_list = []
+        for position in range(skills):
+            if rng.random() < unknown:
+                skill_list.append(f"narzędzie wewnętrzne {index}-{position}")
+            else:
+                variant = rng.choice(variants)
+                skill_list.append(variant.upper() if rng.random() < 0.2 else variant)
+        skill_lists.append(skill_list)
+    return skill_lists
+
+
+class CountingEncoder:
+    """
+    Koder zliczający teksty przekazane do modelu.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.texts = 0
+
+    def encode(self, texts, **kwargs):
+        self.texts += len(texts)
+        return self.model.encode(texts, **kwargs)
+
+
+def measure(analyzer, skill_lists: list, job_skills: list) -> tuple:
+    """
+    Koduje umiejętności wszystkich CV (po jednym CV, jak w /analyze) i oblicza wyniki umiejętności.
+
+    Returns:
+        tuple: Czas [s], liczba tekstów zakodowanych modelem i lista wyników umiejętności
+    """
+    analyzer.encoder = CountingEncoder(analyzer.model)
+    job_embeddings = analyzer._encode_sections({"skills": [skill.lower() for skill in job_skills]})["skills"]
+    scores = []
+    started = time.perf_counter()
+    for skill_list in skill_lists:
+        cv_embeddings = analyzer._encode_sections({("cv", "skills"): [skill.lower() for skill in skill_list]})[("cv", "skills")]
+        score, _ = analyzer._analyze_skills(skill_list, job_skills, cv_embeddings, job_embeddings)
+        scores.append(score)
+    return time.perf_counter() - started, analyzer.encoder.texts, scores
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark tabeli embeddingów kanonicznych umiejętności")
+    parser.add_argument("--count", type=int, default=500, help="Liczba CV")
+    parser.add_argument("--skills", type=int, default=20, help="Liczba umiejętności w CV")
+    parser.add_argument("--unknown", type=float, default=0.1, help="Odsetek umiejętności spoza taksonomii")
+    args = parser.parse_args()
+
+    os.environ.setdefault("ENCODER_BACKEND", "hashing")
+
+    from app.main import load_encoder
+    from app.nlp.scoring import RelevanceAnalyzer
+    from app.nlp.skill_matcher import load_taxonomy
+    from app.nlp.skill_table import build_skill_table, load_skill_table
+
+    taxonomy = load_taxonomy()
+    model, model_name = load_encoder()
+    skill_lists = build_skill_lists(taxonomy, args.count, args.skills, args.unknown)
+    job_skills = list(taxonomy)[:15]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "skill_table.npy")
+        started = time.perf_counter()
+        build_skill_table(model, model_name, taxonomy, path)
+        build_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        table = load_skill_table(path)
+        load_ms = (time.perf_counter() - started) * 1000
+
+        resolved = np.mean([(table.lookup([skill.lower() for skill in skill_list]) >= 0).mean() for skill_list in skill_lists])
+        print(f"Tabela: {len(table)} umiejętności, budowa {build_seconds:.2f} s, wczytanie {load_ms:.2f} ms")
+        print(f"Umiejętności rozwiązane nazwą lub aliasem: {resolved:.1%}")
+
+        baseline = RelevanceAnalyzer(model_name, model=model)
+        with_table = RelevanceAnalyzer(model_name, model=model, skill_table=table)
+        baseline_seconds, baseline_texts, baseline_scores = measure(baseline, skill_lists, job_skills)
+        table_seconds, table_texts, table_scores = measure(with_table, skill_lists, job_skills)
+
+    print(f"\n{model_name}: {args.count} CV po {args.skills} umiejętności, bez pamięci podręcznej embeddingów")
+    print(f"{'tryb':>10} {'czas [s]':>9} {'CV/s':>9} {'teksty w modelu':>16} {'śr. wynik':>10}")
+    print(f"{'model':>10} {baseline_seconds:9.2f} {args.count / baseline_seconds:9.1f} {baseline_texts:16d} {np.mean(baseline_scores):10.3f}")
+    print(f"{'tabela':>10} {table_seconds:9.2f} {args.count / table_seconds:9.1f} {table_texts:16d} {np.mean(table_scores):10.3f}")
+    print(f"Przyspieszenie: {baseline_seconds / table_seconds:.1f}x")
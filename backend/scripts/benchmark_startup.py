@@ -0,0 +1,123 @@
+"""
+Pomiar czasu startu aplikacji.
+Mierzy czas importu modułu app.main w nowym procesie oraz - po uruchomieniu serwera uvicorn -
+czas do pierwszej odpowiedzi /health (serwer przyjmuje połączenia) i do odpowiedzi 200
+z /ready (model załadowany i rozgrzany). Wzrost czasu importu oznacza, że ciężka
+biblioteka trafiła z powrotem do importów na poziomie modułu.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_SNIPPET = "import time; started = time.perf_counter(); import app.main; print(time.perf_counter() - started)"
+
+
+def measure_import() -> float:
+    """
+    Mierzy czas importu app.main w nowym interpreterze.
+
+    Returns:
+        float: Czas importu [s]
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_SNIPPET],
+        cwd=BACKEND_DIR,
+        check=True,
+        capture_output=True,
+        text=True
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def probe(url: str) -> int:
+    """
+    Zwraca kod odpowiedzi HTTP lub 0, jeśli serwer nie przyjmuje jeszcze połączeń.
+    """
+    try:
+        with urllib.request.urlopen(url, timeout=1) as response:
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+    except (urllib.error.URLError, ConnectionError, OSError):
+        return 0
+
+
+def measure_server(port: int, timeout: float, interval: float) -> dict:
+    """
+    Uruchamia serwer uvicorn i mierzy czas do gotowości.
+
+    Args:
+        port: Port serwera
+        timeout: Maksymalny czas oczekiwania na gotowość [s]
+        interval: Odstęp między kolejnymi zapytaniami [s]
+
+    Returns:
+        dict: Czas do odpowiedzi /health i do gotowości /ready [s] (None po przekroczeniu limitu)
+    """
+    base_url = f"http://127.0.0.1:{port}"
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR
+    )
+
+    result = {"health": None, "ready": None}
+    try:
+        while time.perf_counter() - started < timeout and server.poll() is None:
+            if result["health"] is None and probe(f"{base_url}/health") == 200:
+                result["health"] = time.perf_counter() - started
+            if result["health"] is not None and probe(f"{base_url}/ready") == 200:
+                result["ready"] = time.perf_counter() - started
+                break
+            time.sleep(interval)
+    finally:
+        server.terminate()
+        server.wait()
+
+    return result
+
+
+def run_benchmark(repeat: int, port: int, timeout: float, interval: float):
+    """
+    Uruchamia pomiary i wypisuje mediany.
+
+    Args:
+        repeat: Liczba powtórzeń każdego pomiaru
+        port: Port serwera
+        timeout: Maksymalny czas oczekiwania na gotowość [s]
+        interval: Odstęp między kolejnymi zapytaniami [s]
+    """
+    imports = [measure_import() for _ in range(repeat)]
+    servers = [measure_server(port, timeout, interval) for _ in range(repeat)]
+
+    def median(values: list) -> str:
+        values = [value for value in values if value is not None]
+        if not values:
+            return "   brak"
+        return f"{statistics.median(values):7.2f}"
+
+    print(f"Powtórzeń: {repeat}")
+    print(f"{'import app.main [s]':>24} {median(imports)}")
+    print(f"{'do odpowiedzi /health [s]':>24} {median([server['health'] for server in servers])}")
+    print(f"{'do gotowości /ready [s]':>24} {median([server['ready'] for server in servers])}")
+    failed = sum(server["ready"] is None for server in servers)
+    if failed:
+        print(f"Serwer nie osiągnął gotowości w {failed} z {repeat} prób (limit {timeout} s)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pomiar czasu startu aplikacji")
+    parser.add_argument("--repeat", type=int, default=3, help="Liczba powtórzeń pomiaru")
+    parser.add_argument("--port", type=int, default=8765, help="Port serwera testowego")
+    parser.add_argument("--timeout", type=float, default=300, help="Maksymalny czas oczekiwania na gotowość [s]")
+    parser.add_argument("--interval", type=float, default=0.05, help="Odstęp między zapytaniami [s]")
+    args = parser.parse_args()
+
+    run_benchmark(args.repeat, args.port, args.timeout, args.interval)
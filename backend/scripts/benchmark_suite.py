@@ -0,0 +1,300 @@
+"""
+Zestaw benchmarków wydajności na syntetycznym korpusie (scripts/generate_corpus.py).
+Mierzy kolejne etapy przetwarzania:
+- extract_<format> - DocumentParser.extract_content dla plików PDF, DOCX i TXT,
+- parse_cv - CVParser.parse_cv (pliki TXT, więc czas ekstrakcji jest pomijalny),
+- segment_sections, extract_skills, tokenize - kroki parsowania na treści CV: podział na sekcje
+  (SectionSegmenter), wyszukiwanie umiejętności (SkillMatcher) i tokenizacja (Document),
+- analyze_relevance - RelevanceAnalyzer.analyze_relevance na sparsowanych parach CV i ogłoszeń,
+- api_analyze - pełne żądanie POST /analyze (TestClient, bez zapisu w bazie danych).
+Dla każdego etapu raportowana jest przepustowość oraz opóźnienia p50/p95/p99.
+Domyślnie używany jest koder zastępczy ENCODER_BACKEND=hashing, więc zestaw działa offline
+i mierzy kod aplikacji, a nie model. Z --baseline wyniki są porównywane z zapisanymi
+(--save-baseline); wzrost p95 lub spadek przepustowości ponad --tolerance kończy skrypt
+kodem 1. Wartości bazowe zależą od maszyny - należy je zapisywać na tej, na której są sprawdzane.
+Pliki wysyłane do /analyze trafiają do katalogu uploads.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+import numpy as np
+
+# Dodanie ścieżki do katalogu głównego projektu
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scripts.generate_corpus import CORPUS_DIR
+
+STAGES = [
+    "extract_pdf", "extract_docx", "extract_txt", "parse_cv", "segment_sections", "extract_skills", "tokenize",
+    "analyze_relevance", "api_analyze"
+]
+
+# Typy MIME wysyłanych plików
+CONTENT_TYPES = {
+    "pdf": "application/pdf",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "txt": "text/plain"
+}
+
+
+def summarize(timings: list) -> dict:
+    """
+    Wyznacza przepustowość i percentyle opóźnień.
+
+    Args:
+        timings: Czasy pojedynczych operacji [s]
+
+    Returns:
+        dict: Liczba operacji, operacje na sekundę i percentyle [ms]
+    """
+    values = np.array(timings) * 1000
+    return {
+        "n": len(timings),
+        "throughput": len(timings) / sum(timings),
+        "p50_ms": float(np.percentile(values, 50)),
+        "p95_ms": float(np.percentile(values, 95)),
+        "p99_ms": float(np.percentile(values, 99))
+    }
+
+
+def measure(items: list, operation, warmup: int) -> dict:
+    """
+    Wykonuje operację dla kolejnych elementów i mierzy czas każdego wywołania.
+    Pierwsze warmup wywołań nie jest wliczane do wyników.
+
+    Args:
+        items: Argumenty kolejnych wywołań
+        operation: Mierzona funkcja
+        warmup: Liczba wywołań rozgrzewających
+
+    Returns:
+        dict: Podsumowanie pomiarów (summarize)
+    """
+    timings = []
+    for index, item in enumerate(items):
+        started = time.perf_counter()
+        operation(item)
+        elapsed = time.perf_counter() - started
+        if index >= warmup:
+            timings.append(elapsed)
+    return summarize(timings)
+
+
+def median_ms(function, repeat: int) -> float:
+    """
+    Zwraca medianę czasu wykonania funkcji w milisekundach (wspólna dla benchmarków
+    porównujących implementacje w scripts/benchmark_*.py).
+
+    Args:
+        function: Mierzona funkcja bez argumentów
+        repeat: Liczba powtórzeń pomiaru
+
+    Returns:
+        float: Mediana czasu wykonania [ms]
+    """
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    return timings[len(timings) // 2]
+
+
+def documents(corpus: str, manifest: dict, kind: str, file_format: str = None, limit: int = None) -> list:
+    """
+    Zwraca ścieżki dokumentów korpusu danego rodzaju (i formatu).
+    """
+    paths = [
+        os.path.join(corpus, document["path"])
+        for document in manifest[kind]
+        if file_format is None or document["format"] == file_format
+    ]
+    return paths[:limit]
+
+
+def run_suite(corpus: str, stages: list, limit: int, warmup: int) -> dict:
+    """
+    Uruchamia wybrane etapy zestawu.
+
+    Args:
+        corpus: Katalog korpusu z plikiem manifest.json
+        stages: Nazwy etapów
+        limit: Maksymalna liczba dokumentów na etap
+        warmup: Liczba wywołań rozgrzewających na etap
+
+    Returns:
+        dict: Nazwa etapu -> podsumowanie pomiarów
+    """
+    # Konfiguracja aplikacji jest odczytywana przy imporcie app.main
+    from app.main import app, build_analyzer
+    from app.nlp.document import Document
+    from app.nlp.parser import CVParser, DocumentParser, JobDescriptionParser
+    from app.nlp.skill_matcher import get_skill_matcher
+
+    with open(os.path.join(corpus, "manifest.json"), "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    results = {}
+    for file_format in ("pdf", "docx", "txt"):
+        stage = f"extract_{file_format}"
+        paths = documents(corpus, manifest, "cv", file_format, limit + warmup)
+        if stage in stages and paths:
+            results[stage] = measure(paths, lambda path: DocumentParser(path).extract_content(), warmup)
+
+    # Parsowanie i analiza na plikach TXT; przy korpusie bez nich - na wszystkich formatach
+    cv_paths = documents(corpus, manifest, "cv", "txt", limit + warmup) or documents(corpus, manifest, "cv", limit=limit + warmup)
+    job_paths = documents(corpus, manifest, "job", "txt") or documents(corpus, manifest, "job")
+
+    if "parse_cv" in stages:
+        results["parse_cv"] = measure(cv_paths, lambda path: CVParser(path).parse_cv(), warmup)
+
+    # Kroki parsowania mierzone na treści dokumentów (bez odczytu pliku)
+    contents = [DocumentParser(path).extract_content() for path in cv_paths]
+    if "segment_sections" in stages:
+        results["segment_sections"] = measure(contents, CVParser.segmenter.segment, warmup)
+
+    if "extract_skills" in stages:
+        matcher = get_skill_matcher()
+        results["extract_skills"] = measure(contents, matcher.extract, warmup)
+
+    if "tokenize" in stages:
+        results["tokenize"] = measure(contents, lambda text: Document(text).terms, warmup)
+
+    if "analyze_relevance" in stages:
+        analyzer = build_analyzer()
+        jobs = [JobDescriptionParser(path).parse_job_description() for path in job_paths]
+        pairs = [(CVParser(path).parse_cv(), jobs[index % len(jobs)]) for index, path in enumerate(cv_paths)]
+        results["analyze_relevance"] = measure(pairs, lambda pair: analyzer.analyze_relevance(*pair), warmup)
+
+    if "api_analyze" in stages:
+        from fastapi.testclient import TestClient
+
+        # Każde CV jest wysyłane raz - wynik nie pochodzi z cache parsowania
+        pairs = [(path, job_paths[index % len(job_paths)]) for index, path in enumerate(documents(corpus, manifest, "cv", limit=limit + warmup))]
+        with TestClient(app) as client:
+            wait_ready(client)
+
+            def analyze(pair: tuple):
+                files = {}
+                for field, path in zip(("cv_file", "job_description_file"), pair):
+                    with open(path, "rb") as f:
+                        files[field] = (os.path.basename(path), f.read(), CONTENT_TYPES[path.rsplit(".", 1)[-1]])
+                response = client.post("/analyze", files=files)
+                if response.status_code != 200:
+                    raise RuntimeError(f"/analyze zwróciło {response.status_code}: {response.text}")
+
+            results["api_analyze"] = measure(pairs, analyze, warmup)
+
+    return results
+
+
+def wait_ready(client, timeout: float = 300):
+    """
+    Czeka, aż aplikacja załaduje model (/ready zwraca 200).
+    """
+    started = time.perf_counter()
+    while time.perf_counter() - started < timeout:
+        response = client.get("/ready")
+        if response.status_code == 200:
+            return
+        if response.json().get("status") == "failed":
+            raise RuntimeError(f"Nie udało się załadować modelu: {response.json()}")
+        time.sleep(0.1)
+    raise RuntimeError(f"Aplikacja nie osiągnęła gotowości w {timeout} s")
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> dict:
+    """
+    Porównuje wyniki z wartościami bazowymi.
+
+    Args:
+        results: Wyniki bieżącego uruchomienia
+        baseline: Wyniki bazowe (etap -> podsumowanie)
+        tolerance: Dopuszczalne pogorszenie (ułamek wartości bazowej)
+
+    Returns:
+        dict: Etap -> "OK", "REGRESJA" lub "brak bazy"
+    """
+    statuses = {}
+    for stage, result in results.items():
+        base = baseline.get(stage)
+        if base is None:
+            statuses[stage] = "brak bazy"
+        elif result["p95_ms"] > base["p95_ms"] * (1 + tolerance) or result["throughput"] < base["throughput"] * (1 - tolerance):
+            statuses[stage] = "REGRESJA"
+        else:
+            statuses[stage] = "OK"
+    return statuses
+
+
+def print_results(results: dict, baseline: dict, statuses: dict):
+    """
+    Wypisuje tabelę wyników (z wartościami bazowymi p95 i przepustowości, jeśli są).
+    """
+    print(f"{'etap':>18} {'n':>6} {'op/s':>9} {'p50 [ms]':>9} {'p95 [ms]':>9} {'p99 [ms]':>9} {'baza p95':>9} {'baza op/s':>10} {'status':>10}")
+    for stage, result in results.items():
+        base = baseline.get(stage)
+        base_columns = f"{base['p95_ms']:9.2f} {base['throughput']:10.1f}" if base else f"{'-':>9} {'-':>10}"
+        print(
+            f"{stage:>18} {result['n']:6d} {result['throughput']:9.1f} {result['p50_ms']:9.2f} "
+            f"{result['p95_ms']:9.2f} {result['p99_ms']:9.2f} {base_columns} {statuses.get(stage, '-'):>10}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Zestaw benchmarków wydajności na syntetycznym korpusie")
+    parser.add_argument("--corpus", default=CORPUS_DIR, help="Katalog korpusu (scripts/generate_corpus.py)")
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=STAGES, help="Mierzone etapy")
+    parser.add_argument("--limit", type=int, default=200, help="Maksymalna liczba mierzonych dokumentów na etap")
+    parser.add_argument("--warmup", type=int, default=3, help="Liczba wywołań rozgrzewających na etap")
+    parser.add_argument("--encoder", default="hashing", help="Backend kodowania (ENCODER_BACKEND)")
+    parser.add_argument("--baseline", default=None, help="Plik JSON z wynikami bazowymi")
+    parser.add_argument("--save-baseline", action="store_true", help="Zapisuje wyniki jako bazowe w pliku --baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Dopuszczalne pogorszenie względem bazy (ułamek)")
+    args = parser.parse_args()
+    if args.save_baseline and not args.baseline:
+        parser.error("--save-baseline wymaga --baseline")
+
+    # Zestaw mierzy przetwarzanie żądań - bez zapisu analiz i workerów zadań asynchronicznych
+    os.environ["ENCODER_BACKEND"] = args.encoder
+    os.environ.setdefault("PERSIST_ANALYSES", "False")
+    os.environ.setdefault("JOB_WORKERS", "0")
+    os.environ.setdefault("JOB_QUEUE", "memory")
+
+    results = run_suite(args.corpus, args.stages, args.limit, args.warmup)
+
+    baseline = {}
+    if args.baseline and os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            saved = json.load(f)
+        if saved["meta"]["encoder"] != args.encoder:
+            print(f"Uwaga: wartości bazowe zmierzono z koderem {saved['meta']['encoder']}")
+        baseline = saved["stages"]
+    elif args.baseline and not args.save_baseline:
+        print(f"Brak pliku wartości bazowych {args.baseline} - wyniki nie są porównywane")
+
+    statuses = compare(results, baseline, args.tolerance) if baseline else {}
+    print_results(results, baseline, statuses)
+
+    if args.save_baseline:
+        meta = {
+            "encoder": args.encoder,
+            "limit": args.limit,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count()
+        }
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({"meta": meta, "stages": results}, f, indent=2)
+        print(f"Wartości bazowe zapisane w {args.baseline}")
+
+    regressions = [stage for stage, status in statuses.items() if status == "REGRESJA"]
+    if regressions:
+        print(f"Regresja wydajności (tolerancja {args.tolerance:.0%}): {', '.join(regressions)}")
+        sys.exit(1)
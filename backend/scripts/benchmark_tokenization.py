@@ -0,0 +1,74 @@
+"""
+Benchmark wspólnej tokenizacji dokumentu (app.nlp.document.Document).
+Porównuje dotychczasowe osobne przebiegi po pełnym tekście CV i ogłoszenia - wyszukiwanie
+umiejętności z taksonomii (lower() tekstu), TF-IDF pary (analizator sklearn) i słowa kluczowe
+(re.findall) - z jednym obiektem Document na tekst, którego tokeny i terminy używają wszystkie
+trzy etapy. Ogłoszenie jest analizowane z wieloma CV (jak profil ogłoszenia), więc jego
+Document jest tworzony raz. Tekst CV to przykładowe CV powtórzone --repeat-text razy.
+"""
+import argparse
+import os
+import re
+import sys
+
+# Dodanie ścieżki do katalogu głównego projektu
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+
+from app.nlp.document import STOP_WORDS, Document, document_terms
+from app.nlp.skill_matcher import get_skill_matcher
+from scripts.benchmark_suite import median_ms
+
+SAMPLE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "sample_data")
+
+
+def legacy_pipeline(cv_text: str, job_text: str) -> tuple:
+    """
+    Dotychczasowe przetwarzanie: każdy etap normalizuje i tokenizuje teksty osobno.
+    """
+    skills = get_skill_matcher().extract(cv_text)
+    tfidf_matrix = TfidfVectorizer(min_df=1, stop_words=list(STOP_WORDS)).fit_transform([cv_text, job_text])
+    score = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
+    cv_tokens = set(re.findall(r'\b\w+\b', cv_text.lower())) - STOP_WORDS
+    job_tokens = set(re.findall(r'\b\w+\b', job_text.lower())) - STOP_WORDS
+    keywords = [token for token in cv_tokens & job_tokens if len(token) > 2]
+    return skills, score, keywords
+
+
+def document_pipeline(cv_text: str, job_document: Document) -> tuple:
+    """
+    Przetwarzanie z jednym obiektem Document na tekst (bez pozycji słów kluczowych).
+    """
+    cv_document = Document(cv_text)
+    skills = get_skill_matcher().extract(cv_document)
+    tfidf_matrix = TfidfVectorizer(min_df=1, analyzer=document_terms).fit_transform([cv_document, job_document])
+    score = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
+    keywords = [term for term in cv_document.term_set & job_document.term_set if len(term) > 2]
+    return skills, score, keywords
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark wspólnej tokenizacji dokumentu")
+    parser.add_argument("--repeat-text", type=int, nargs="+", default=[1, 10, 50], help="Krotności przykładowego CV")
+    parser.add_argument("--repeat", type=int, default=50, help="Liczba powtórzeń pomiaru")
+    args = parser.parse_args()
+
+    with open(os.path.join(SAMPLE_DIR, "przyklad_cv.txt"), "r", encoding="utf-8") as f:
+        sample_cv = f.read()
+    with open(os.path.join(SAMPLE_DIR, "przyklad_ogloszenie.txt"), "r", encoding="utf-8") as f:
+        job_text = f.read()
+    job_document = Document(job_text)
+
+    print(f"{'tekst CV':>10} {'osobno [ms]':>12} {'Document [ms]':>14} {'przyspieszenie':>15}")
+    for multiplier in args.repeat_text:
+        cv_text = "\n".join([sample_cv] * multiplier)
+        legacy = legacy_pipeline(cv_text, job_text)
+        shared = document_pipeline(cv_text, job_document)
+        if legacy[0] != shared[0] or abs(legacy[1] - shared[1]) > 1e-9 or sorted(legacy[2]) != sorted(shared[2]):
+            raise RuntimeError("Wyniki przetwarzania z Document różnią się od dotychczasowych")
+
+        legacy_ms = median_ms(lambda: legacy_pipeline(cv_text, job_text), args.repeat)
+        shared_ms = median_ms(lambda: document_pipeline(cv_text, job_document), args.repeat)
+        print(f"{len(cv_text):>10} {legacy_ms:12.2f} {shared_ms:14.2f} {legacy_ms / shared_ms:14.1f}x")
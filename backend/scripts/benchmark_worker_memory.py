@@ -0,0 +1,140 @@
+"""
+Pomiar pamięci workerów gunicorn przy 1, 4 i 8 procesach.
+Porównuje tryb ze współdzielonymi wagami modelu (PRELOAD_MODEL=True - model ładowany raz
+przed fork) z ładowaniem modelu w każdym workerze (PRELOAD_MODEL=False).
+Dla każdego procesu raportowane są z /proc/<pid>/smaps_rollup:
+- RSS - strony obecne w pamięci, w tym współdzielone (sumowanie RSS zawyża zużycie),
+- PSS - strony współdzielone podzielone proporcjonalnie między procesy,
+- USS - strony prywatne procesu.
+Suma PSS wszystkich procesów odpowiada rzeczywistemu zużyciu pamięci. Wymaga Linuksa.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def memory(pid: int) -> dict:
+    """
+    Odczytuje RSS, PSS i USS procesu.
+
+    Args:
+        pid: Identyfikator procesu
+
+    Returns:
+        dict: Wartości w MB
+    """
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup", "r") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                values[parts[0].rstrip(":")] = int(parts[1]) / 1024
+    return {
+        "rss": values["Rss"],
+        "pss": values["Pss"],
+        "uss": values["Private_Clean"] + values["Private_Dirty"]
+    }
+
+
+def children(pid: int) -> list:
+    """
+    Zwraca identyfikatory procesów potomnych.
+    """
+    with open(f"/proc/{pid}/task/{pid}/children", "r") as f:
+        return [int(child) for child in f.read().split()]
+
+
+def ready_pid(url: str):
+    """
+    Zwraca pid workera, który odpowiedział gotowością, lub None.
+    """
+    try:
+        with urllib.request.urlopen(url, timeout=1) as response:
+            return json.loads(response.read())["pid"]
+    except (urllib.error.URLError, ConnectionError, OSError, KeyError, ValueError):
+        return None
+
+
+def measure(workers: int, preload: bool, port: int, timeout: float) -> dict:
+    """
+    Uruchamia gunicorn, czeka na gotowość wszystkich workerów i mierzy ich pamięć.
+
+    Args:
+        workers: Liczba workerów
+        preload: Czy ładować model przed fork
+        port: Port serwera
+        timeout: Maksymalny czas oczekiwania na gotowość [s]
+
+    Returns:
+        dict: Pamięć procesu nadrzędnego i workerów [MB] (None po przekroczeniu limitu)
+    """
+    env = dict(os.environ, WEB_CONCURRENCY=str(workers), PRELOAD_MODEL=str(preload), PORT=str(port), API_HOST="127.0.0.1")
+    env.pop("TORCH_THREADS", None)
+    server = subprocess.Popen([sys.executable, "-m", "gunicorn", "app.main:app"], cwd=BACKEND_DIR, env=env)
+
+    try:
+        started = time.perf_counter()
+        ready = set()
+        # Połączenia trafiają do losowych workerów - odpytywanie aż każdy zgłosi gotowość
+        while len(ready) < workers and time.perf_counter() - started < timeout:
+            pid = ready_pid(f"http://127.0.0.1:{port}/ready")
+            if pid is None:
+                time.sleep(0.1)
+            else:
+                ready.add(pid)
+        if len(ready) < workers:
+            return None
+
+        return {
+            "master": memory(server.pid),
+            "workers": [memory(pid) for pid in children(server.pid)]
+        }
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def run_benchmark(worker_counts: list, port: int, timeout: float):
+    """
+    Uruchamia pomiary i wypisuje tabelę wyników.
+
+    Args:
+        worker_counts: Liczby workerów
+        port: Port serwera
+        timeout: Maksymalny czas oczekiwania na gotowość [s]
+    """
+    print(f"{'workery':>8} {'tryb':>12} {'RSS worker [MB]':>16} {'PSS worker [MB]':>16} {'USS worker [MB]':>16} {'suma PSS [MB]':>14}")
+    for workers in worker_counts:
+        for preload in (True, False):
+            mode = "współdzielony" if preload else "osobny"
+            result = measure(workers, preload, port, timeout)
+            if result is None:
+                print(f"{workers:>8} {mode:>12} brak gotowości w limicie {timeout} s")
+                continue
+
+            per_worker = result["workers"]
+            total_pss = result["master"]["pss"] + sum(worker["pss"] for worker in per_worker)
+            print(
+                f"{workers:>8} {mode:>12} "
+                f"{sum(worker['rss'] for worker in per_worker) / len(per_worker):16.1f} "
+                f"{sum(worker['pss'] for worker in per_worker) / len(per_worker):16.1f} "
+                f"{sum(worker['uss'] for worker in per_worker) / len(per_worker):16.1f} "
+                f"{total_pss:14.1f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pomiar pamięci workerów gunicorn")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8], help="Liczby workerów")
+    parser.add_argument("--port", type=int, default=8766, help="Port serwera testowego")
+    parser.add_argument("--timeout", type=float, default=600, help="Maksymalny czas oczekiwania na gotowość [s]")
+    args = parser.parse_args()
+
+    run_benchmark(args.workers, args.port, args.timeout)
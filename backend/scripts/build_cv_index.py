@@ -0,0 +1,91 @@
+"""
+Skrypt do budowy indeksu wektorowego CV na podstawie danych zapisanych w bazie.
+Używany przy pierwszym uruchomieniu indeksu, zmianie modelu lub typu indeksu.
+"""
+import argparse
+import os
+import shutil
+import sys
+
+# Dodanie ścieżki do katalogu głównego projektu
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.main import build_analyzer
+from app.models.database import SessionLocal
+from app.models.models import Analysis, CVData
+from app.nlp.scoring import SCORED_SECTIONS
+from app.nlp.vector_index import content_key, create_index
+from app.persistence import CV_INDEX_PATH, CV_INDEX_TYPE
+
+
+def build_index(kind: str, path: str, batch_size: int = 256):
+    """
+    Przebudowuje indeks wektorowy CV z rekordów CVData. Każdy plik CV (skrót treści)
+    jest indeksowany raz - z danymi jego najnowszej analizy, jak przy zapisie analiz.
+
+    Args:
+        kind: Typ indeksu ("bruteforce" lub "hnsw")
+        path: Katalog z plikami indeksu
+        batch_size: Liczba CV kodowanych w jednym wywołaniu modelu
+    """
+    # Ten sam model i backend kodowania co w aplikacji
+    analyzer = build_analyzer()
+    dim = analyzer.model.get_sentence_embedding_dimension() * len(SCORED_SECTIONS)
+
+    # Indeks budowany od zera w katalogu tymczasowym i podmieniany po zakończeniu -
+    # działające workery wykrywają nowy dziennik i wczytują go w całości
+    build_path = f"{path.rstrip(os.sep)}.build"
+    if os.path.exists(build_path):
+        shutil.rmtree(build_path)
+    index = create_index(kind, build_path, dim, analyzer.model_name, SCORED_SECTIONS)
+
+    db = SessionLocal()
+    try:
+        last_id = None
+        indexed = set()
+        while True:
+            # Analizy od najnowszej - starsze analizy tego samego pliku CV są pomijane
+            query = db.query(Analysis.id, Analysis.cv_filename, CVData).join(CVData, CVData.analysis_id == Analysis.id)
+            if last_id is not None:
+                query = query.filter(Analysis.id < last_id)
+            rows = query.order_by(Analysis.id.desc()).limit(batch_size).all()
+            if not rows:
+                break
+
+            keys = []
+            cv_data_list = []
+            for _, cv_filename, row in rows:
+                key = content_key(cv_filename)
+                if key in indexed:
+                    continue
+                indexed.add(key)
+                keys.append(key)
+                cv_data_list.append({
+                    "skills": row.skills or [],
+                    "experience": row.experience or [],
+                    "education": row.education or [],
+                    "full_text": row.full_text or ""
+                })
+            if keys:
+                index.add(keys, analyzer.index_vectors(cv_data_list, "cv"))
+
+            last_id = rows[-1][0]
+            print(f"Zaindeksowano {len(indexed)} CV")
+    finally:
+        db.close()
+
+    index.save()
+    if os.path.exists(path):
+        shutil.rmtree(path)
+    os.rename(build_path, path)
+    print(f"Indeks {kind} zapisany w katalogu: {path}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Budowa indeksu wektorowego zapisanych CV")
+    parser.add_argument("--type", default=CV_INDEX_TYPE, choices=["bruteforce", "hnsw"], help="Typ indeksu")
+    parser.add_argument("--path", default=CV_INDEX_PATH, help="Katalog indeksu")
+    parser.add_argument("--batch-size", type=int, default=256, help="Liczba CV w jednym batchu")
+    args = parser.parse_args()
+
+    build_index(args.type, args.path, args.batch_size)
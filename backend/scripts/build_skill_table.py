@@ -0,0 +1,48 @@
+"""
+Skrypt do budowy tabeli embeddingów kanonicznych umiejętności z taksonomii (skills.json).
+Należy go uruchomić ponownie po zmianie taksonomii, modelu lub backendu kodowania;
+aplikacja wczytuje tabelę przy starcie.
+"""
+import argparse
+import os
+import sys
+import time
+
+# Dodanie ścieżki do katalogu głównego projektu
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.main import SKILL_TABLE_PATH, load_encoder
+from app.nlp.skill_matcher import load_taxonomy
+from app.nlp.skill_table import build_skill_table
+
+
+def build(path: str, taxonomy_path: str = None, batch_size: int = 256):
+    """
+    Koduje taksonomię modelem aplikacji (ENCODER_BACKEND, MODEL_NAME) i zapisuje tabelę.
+
+    Args:
+        path: Ścieżka do pliku macierzy (.npy)
+        taxonomy_path: Ścieżka do taksonomii (domyślnie SKILL_TAXONOMY_PATH)
+        batch_size: Liczba nazw w jednym wywołaniu modelu
+    """
+    taxonomy = load_taxonomy(taxonomy_path)
+    model, model_name = load_encoder()
+
+    started = time.perf_counter()
+    table = build_skill_table(model, model_name, taxonomy, path, batch_size)
+    aliases = sum(len(aliases) for aliases in taxonomy.values())
+    print(
+        f"Zakodowano {len(table)} umiejętności ({aliases} aliasów) modelem {model_name} "
+        f"w {time.perf_counter() - started:.1f} s, wymiar: {table.dimension}"
+    )
+    print(f"Tabela zapisana: {path} (wymaga ponownego uruchomienia aplikacji)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Budowa tabeli embeddingów kanonicznych umiejętności")
+    parser.add_argument("--path", default=SKILL_TABLE_PATH, help="Ścieżka do pliku macierzy (.npy)")
+    parser.add_argument("--taxonomy", default=None, help="Ścieżka do taksonomii umiejętności (JSON)")
+    parser.add_argument("--batch-size", type=int, default=256, help="Liczba nazw w jednym wywołaniu modelu")
+    args = parser.parse_args()
+
+    build(args.path, args.taxonomy, args.batch_size)
@@ -0,0 +1,98 @@
+"""
+Skrypt do eksportu modelu SentenceTransformer do ONNX i kwantyzacji int8.
+Eksportowany jest cały potok modelu (transformer, pooling, ewentualna warstwa Dense),
+więc koder ONNX (app/nlp/onnx_encoder.py) zwraca gotowe embeddingi zdań.
+Wymaga: torch, sentence-transformers, onnx, onnxruntime.
+"""
+import argparse
+import json
+import os
+import sys
+
+# Dodanie ścieżki do katalogu głównego projektu
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import torch
+from onnxruntime.quantization import QuantType, quantize_dynamic
+from sentence_transformers import SentenceTransformer
+
+from app.main import MODEL_NAME, ONNX_MODEL_PATH
+from app.nlp.onnx_encoder import ENCODER_CONFIG_FILE
+
+
+class SentenceEmbeddingModule(torch.nn.Module):
+    """
+    Opakowanie modelu SentenceTransformer przyjmujące tensory wejściowe tokenizera
+    i zwracające embeddingi zdań (postać wymagana przez torch.onnx.export).
+    """
+
+    def __init__(self, model: SentenceTransformer, input_names: list):
+        super().__init__()
+        self.model = model
+        self.input_names = input_names
+
+    def forward(self, *inputs):
+        features = dict(zip(self.input_names, inputs))
+        return self.model(features)["sentence_embedding"]
+
+
+def export(model_name: str, output_dir: str, opset: int = 14):
+    """
+    Eksportuje model do ONNX (fp32), kwantyzuje wagi do int8 i zapisuje tokenizer.
+
+    Args:
+        model_name: Nazwa modelu SentenceTransformer
+        output_dir: Katalog wynikowy
+        opset: Wersja zestawu operatorów ONNX
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    model = SentenceTransformer(model_name, device="cpu")
+    model.eval()
+
+    tokenizer = model.tokenizer
+    input_names = [name for name in tokenizer.model_input_names if name in ("input_ids", "attention_mask", "token_type_ids")]
+    sample = tokenizer(["Przykładowy tekst do eksportu modelu"], padding=True, return_tensors="pt")
+
+    fp32_path = os.path.join(output_dir, "model.onnx")
+    int8_path = os.path.join(output_dir, "model.int8.onnx")
+
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["sentence_embedding"] = {0: "batch"}
+    with torch.no_grad():
+        torch.onnx.export(
+            SentenceEmbeddingModule(model, input_names),
+            tuple(sample[name] for name in input_names),
+            fp32_path,
+            input_names=input_names,
+            output_names=["sentence_embedding"],
+            dynamic_axes=dynamic_axes,
+            opset_version=opset,
+            do_constant_folding=True
+        )
+    print(f"Model fp32 zapisany: {fp32_path}")
+
+    # Dynamiczna kwantyzacja: wagi int8, aktywacje kwantyzowane w trakcie działania
+    quantize_dynamic(fp32_path, int8_path, weight_type=QuantType.QInt8)
+    print(f"Model int8 zapisany: {int8_path}")
+
+    tokenizer.save_pretrained(output_dir)
+    config = {
+        "source_model": model_name,
+        "max_seq_length": model.max_seq_length,
+        "dimension": model.get_sentence_embedding_dimension(),
+        "variants": {"fp32": "model.onnx", "int8": "model.int8.onnx"},
+        "default_variant": "int8"
+    }
+    with open(os.path.join(output_dir, ENCODER_CONFIG_FILE), "w", encoding="utf-8") as f:
+        json.dump(config, f, indent=2)
+    print(f"Eksport zakończony: {output_dir}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Eksport modelu SentenceTransformer do ONNX (int8)")
+    parser.add_argument("--model", default=MODEL_NAME, help="Nazwa modelu SentenceTransformer")
+    parser.add_argument("--output-dir", default=ONNX_MODEL_PATH, help="Katalog wynikowy")
+    parser.add_argument("--opset", type=int, default=14, help="Wersja zestawu operatorów ONNX")
+    args = parser.parse_args()
+
+    export(args.model, args.output_dir, args.opset)
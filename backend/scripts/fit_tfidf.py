@@ -0,0 +1,103 @@
+"""
+Skrypt do dopasowania modelu TF-IDF do korpusu zapisanych CV i ogłoszeń o pracę.
+Należy go uruchamiać ponownie wraz ze wzrostem korpusu; aplikacja wczytuje model przy starcie.
+"""
+import argparse
+import os
+import sys
+import time
+
+# Dodanie ścieżki do katalogu głównego projektu
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.main import TFIDF_MODEL_PATH
+from app.models.database import SessionLocal
+from app.models.models import CVData, JobData, JobProfile
+from app.nlp.tfidf_model import fit_tfidf_model, save_tfidf_model
+
+
+def iter_corpus(db, batch_size: int = 1000):
+    """
+    Zwraca kolejno pełne teksty CV, ogłoszeń i profili ogłoszeń.
+    Rekordy są czytane partiami (paginacja po kluczu), więc korpus nie jest ładowany w całości.
+
+    Args:
+        db: Sesja bazy danych
+        batch_size: Liczba rekordów w jednym zapytaniu
+
+    Yields:
+        str: Pełny tekst dokumentu
+    """
+    for model in (CVData, JobData, JobProfile):
+        last_id = 0
+        while True:
+            rows = (
+                db.query(model.id, model.full_text)
+                .filter(model.id > last_id)
+                .order_by(model.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not rows:
+                break
+
+            for row in rows:
+                if row.full_text:
+                    yield row.full_text
+
+            last_id = rows[-1].id
+
+
+def fit(path: str, min_df: int, max_df: float, max_features: int, batch_size: int):
+    """
+    Dopasowuje model TF-IDF do korpusu z bazy danych i zapisuje go.
+
+    Args:
+        path: Ścieżka do pliku modelu
+        min_df: Minimalna liczba dokumentów zawierających termin
+        max_df: Maksymalny odsetek dokumentów zawierających termin
+        max_features: Maksymalny rozmiar słownika (0 - bez limitu)
+        batch_size: Liczba rekordów w jednym zapytaniu
+    """
+    db = SessionLocal()
+    documents = 0
+
+    def counted(texts):
+        nonlocal documents
+        for text in texts:
+            documents += 1
+            yield text
+
+    started = time.perf_counter()
+    try:
+        vectorizer = fit_tfidf_model(
+            counted(iter_corpus(db, batch_size)),
+            min_df=min_df,
+            max_df=max_df,
+            max_features=max_features or None
+        )
+    except ValueError as e:
+        # Zbyt mały korpus (np. pusta baza lub min_df większe niż liczba dokumentów)
+        print(f"Nie udało się dopasować modelu ({documents} dokumentów): {e}")
+        return
+    finally:
+        db.close()
+
+    save_tfidf_model(vectorizer, path)
+    print(
+        f"Model TF-IDF dopasowany do {documents} dokumentów w {time.perf_counter() - started:.1f} s, "
+        f"słownik: {len(vectorizer.vocabulary_)} terminów"
+    )
+    print(f"Model zapisany: {path} (wymaga ponownego uruchomienia aplikacji)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Dopasowanie modelu TF-IDF do korpusu zapisanych dokumentów")
+    parser.add_argument("--path", default=TFIDF_MODEL_PATH, help="Ścieżka do pliku modelu")
+    parser.add_argument("--min-df", type=int, default=2, help="Minimalna liczba dokumentów zawierających termin")
+    parser.add_argument("--max-df", type=float, default=0.95, help="Maksymalny odsetek dokumentów zawierających termin")
+    parser.add_argument("--max-features", type=int, default=0, help="Maksymalny rozmiar słownika (0 - bez limitu)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Liczba rekordów w jednym zapytaniu")
+    args = parser.parse_args()
+
+    fit(args.path, args.min_df, args.max_df, args.max_features, args.batch_size)
@@ -0,0 +1,285 @@
+"""
+Generator syntetycznego korpusu CV i ogłoszeń o pracę do benchmarków.
+Dokumenty są składane z losowych stanowisk, firm, obowiązków i umiejętności z taksonomii
+(app/nlp/data/skills.json) pod nagłówkami rozpoznawanymi przez parser, z wariantami
+polskimi i angielskimi. Rozmiar tekstu jest sterowany liczbą pozycji doświadczenia
+(CV) i obowiązków (ogłoszenia). Pliki są zapisywane w formatach PDF, DOCX i TXT,
+a manifest.json opisuje korpus (ziarno, format i rozmiar każdego dokumentu).
+Przy tym samym ziarnie generator tworzy identyczny korpus.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import unicodedata
+
+# Dodanie ścieżki do katalogu głównego projektu
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.nlp.skill_matcher import load_taxonomy
+from scripts.sample_pdf import write_text_pdf
+
+# Domyślny katalog korpusu (poza repozytorium - patrz .gitignore)
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "corpus")
+
+FORMATS = ["pdf", "docx", "txt"]
+
+FIRST_NAMES = ["Jan", "Anna", "Piotr", "Katarzyna", "Tomasz", "Magdalena", "Michał", "Agnieszka", "Paweł", "Joanna", "Krzysztof", "Ewa"]
+LAST_NAMES = ["Kowalski", "Nowak", "Wiśniewska", "Wójcik", "Kamińska", "Lewandowski", "Zielińska", "Szymański", "Woźniak", "Dąbrowska"]
+POSITIONS = [
+    "Full-Stack Developer", "Backend Developer", "Frontend Developer", "Data Engineer", "DevOps Engineer",
+    "Python Developer", "Java Developer", "QA Engineer", "Machine Learning Engineer", "Team Leader"
+]
+SENIORITY = ["Junior", "Mid", "Senior", "Lead"]
+COMPANIES = [
+    "Tech Solutions Sp. z o.o.", "WebDev Agency", "DataSoft S.A.", "CloudWorks Sp. z o.o.", "FinApp Group",
+    "Software House Kraków", "Analytics Lab", "E-commerce Systems S.A.", "MedTech Polska", "Logistics IT"
+]
+DUTIES = [
+    "Rozwój aplikacji webowych z wykorzystaniem {skill} i {skill}",
+    "Projektowanie i implementacja API REST w {skill}",
+    "Optymalizacja wydajności aplikacji i zapytań do bazy danych {skill}",
+    "Utrzymanie infrastruktury w oparciu o {skill}",
+    "Code review i mentoring młodszych programistów",
+    "Automatyzacja testów z użyciem {skill}",
+    "Migracja systemu do architektury mikroserwisowej",
+    "Współpraca z zespołem produktowym przy planowaniu sprintów",
+    "Wdrażanie procesów CI/CD z wykorzystaniem {skill}",
+    "Analiza danych i przygotowanie raportów w {skill}"
+]
+SUMMARIES = [
+    "Doświadczony programista z ponad {years}-letnim doświadczeniem w tworzeniu aplikacji.",
+    "Specjalizuję się w technologiach {skill} i {skill} oraz pracy w środowisku Agile.",
+    "Posiadam doświadczenie w prowadzeniu małych zespołów i projektowaniu systemów rozproszonych."
+]
+UNIVERSITIES = ["Politechnika Warszawska", "Uniwersytet Jagielloński", "Politechnika Wrocławska", "AGH w Krakowie", "Uniwersytet Gdański"]
+DEGREES = ["Magister Informatyki", "Inżynier Informatyki", "Licencjat z Matematyki Stosowanej", "Magister Automatyki i Robotyki"]
+COMPANY_INTROS = [
+    "Jesteśmy dynamicznie rozwijającą się firmą technologiczną.",
+    "Tworzymy produkty wykorzystywane przez klientów w całej Europie.",
+    "Nasz zespół liczy ponad stu inżynierów pracujących w modelu hybrydowym."
+]
+REQUIREMENTS = [
+    "Minimum {years} lata doświadczenia w programowaniu w {skill}",
+    "Dobra znajomość {skill}",
+    "Doświadczenie w pracy z {skill}",
+    "Znajomość języka angielskiego na poziomie B2",
+    "Umiejętność pracy w zespole"
+]
+BENEFITS = ["Prywatna opieka medyczna", "Karta sportowa", "Elastyczne godziny pracy", "Budżet szkoleniowy", "Praca zdalna"]
+
+# Warianty nagłówków (wszystkie rozpoznawane przez CV_SECTION_HEADINGS i JOB_SECTION_HEADINGS)
+CV_HEADINGS = {
+    "experience": ["Doświadczenie zawodowe:", "Work Experience:", "Doświadczenie:"],
+    "education": ["Wykształcenie:", "Education:", "Edukacja:"],
+    "skills": ["Umiejętności techniczne:", "Skills:", "Umiejętności:"]
+}
+JOB_HEADINGS = {
+    "responsibilities": ["Obowiązki:", "Responsibilities:", "Zakres obowiązków:"],
+    "required_skills": ["Wymagania:", "Requirements:", "Oczekujemy:"]
+}
+
+
+def fill(rng: random.Random, template: str, skills: list) -> str:
+    """
+    Uzupełnia szablon zdania losowymi umiejętnościami i liczbą lat.
+    """
+    while "{skill}" in template:
+        template = template.replace("{skill}", rng.choice(skills), 1)
+    return template.replace("{years}", str(rng.randint(2, 8)))
+
+
+def ascii_name(name: str) -> str:
+    """
+    Usuwa znaki diakrytyczne z nazwy (adres e-mail).
+    """
+    name = name.replace("ł", "l").replace("Ł", "L")
+    return unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii").lower()
+
+
+def target_size(rng: random.Random, size_kb: float) -> int:
+    """
+    Zwraca docelowy rozmiar dokumentu w znakach (rozrzut +/- 30%).
+    """
+    return int(size_kb * 1024 * rng.uniform(0.7, 1.3))
+
+
+def generate_cv(rng: random.Random, skills: list, size_kb: float) -> str:
+    """
+    Składa tekst CV o rozmiarze około size_kb kilobajtów.
+
+    Args:
+        rng: Generator liczb losowych
+        skills: Nazwy umiejętności z taksonomii
+        size_kb: Docelowy rozmiar tekstu
+
+    Returns:
+        str: Tekst CV
+    """
+    first_name = rng.choice(FIRST_NAMES)
+    last_name = rng.choice(LAST_NAMES)
+    header = [
+        f"{first_name} {last_name}",
+        f"{rng.choice(SENIORITY)} {rng.choice(POSITIONS)}",
+        "",
+        "Kontakt:",
+        f"Email: {ascii_name(first_name)}.{ascii_name(last_name)}@example.com",
+        f"Telefon: +48 {rng.randint(500, 899)} {rng.randint(100, 999)} {rng.randint(100, 999)}",
+        "",
+        "Podsumowanie zawodowe:",
+        " ".join(fill(rng, sentence, skills) for sentence in SUMMARIES),
+        ""
+    ]
+
+    graduated = rng.randint(2005, 2018)
+    education = [
+        rng.choice(CV_HEADINGS["education"]),
+        "",
+        rng.choice(DEGREES),
+        rng.choice(UNIVERSITIES),
+        f"{graduated - 5} - {graduated}",
+        ""
+    ]
+    skill_lines = [rng.choice(CV_HEADINGS["skills"])] + [
+        "- " + ", ".join(rng.sample(skills, rng.randint(3, 6))) for _ in range(rng.randint(3, 5))
+    ]
+
+    # Pozycje doświadczenia dodawane od najnowszej, dopóki tekst nie osiągnie docelowego rozmiaru
+    size = target_size(rng, size_kb)
+    experience = [rng.choice(CV_HEADINGS["experience"]), ""]
+    length = sum(len(line) + 1 for line in header + experience + education + skill_lines)
+    end = None
+    while length < size:
+        start = (end or 2025) - rng.randint(1, 4)
+        entry = [
+            f"{rng.choice(SENIORITY)} {rng.choice(POSITIONS)}",
+            rng.choice(COMPANIES),
+            f"{start} - {end}" if end else f"{start} - obecnie"
+        ] + ["- " + fill(rng, rng.choice(DUTIES), skills) for _ in range(rng.randint(3, 6))] + [""]
+        experience.extend(entry)
+        length += sum(len(line) + 1 for line in entry)
+        end = start if start > 1980 else 2025
+
+    return "\n".join(header + experience + education + skill_lines) + "\n"
+
+
+def generate_job(rng: random.Random, skills: list, size_kb: float) -> str:
+    """
+    Składa tekst ogłoszenia o pracę o rozmiarze około size_kb kilobajtów.
+
+    Args:
+        rng: Generator liczb losowych
+        skills: Nazwy umiejętności z taksonomii
+        size_kb: Docelowy rozmiar tekstu
+
+    Returns:
+        str: Tekst ogłoszenia
+    """
+    required = rng.sample(skills, rng.randint(4, 8))
+    header = [
+        f"{rng.choice(SENIORITY)} {rng.choice(POSITIONS)}",
+        rng.choice(COMPANIES),
+        "",
+        "O firmie:",
+        " ".join(rng.sample(COMPANY_INTROS, 2)),
+        ""
+    ]
+    requirements = [rng.choice(JOB_HEADINGS["required_skills"])] + [
+        "- " + fill(rng, template, required) for template in REQUIREMENTS
+    ] + ["- " + skill for skill in required] + [""]
+    benefits = ["Oferujemy:"] + ["- " + benefit for benefit in rng.sample(BENEFITS, 3)]
+
+    # Obowiązki dodawane, dopóki tekst nie osiągnie docelowego rozmiaru
+    size = target_size(rng, size_kb)
+    responsibilities = [rng.choice(JOB_HEADINGS["responsibilities"])]
+    length = sum(len(line) + 1 for line in header + responsibilities + requirements + benefits)
+    while length < size:
+        responsibilities.append("- " + fill(rng, rng.choice(DUTIES), required))
+        length += len(responsibilities[-1]) + 1
+
+    return "\n".join(header + responsibilities + [""] + requirements + benefits) + "\n"
+
+
+def write_docx(path: str, text: str):
+    """
+    Zapisuje tekst jako dokument DOCX (jeden akapit na linię).
+    """
+    from docx import Document
+
+    document = Document()
+    for line in text.splitlines():
+        document.add_paragraph(line)
+    document.save(path)
+
+
+def write_document(path: str, text: str, file_format: str):
+    """
+    Zapisuje tekst w zadanym formacie.
+
+    Args:
+        path: Ścieżka do pliku wynikowego
+        text: Tekst dokumentu
+        file_format: Format pliku (pdf, docx lub txt)
+    """
+    if file_format == "pdf":
+        write_text_pdf(path, text)
+    elif file_format == "docx":
+        write_docx(path, text)
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+
+def generate_corpus(output_dir: str, count: int, job_count: int, formats: list, cv_kb: float, job_kb: float, seed: int) -> dict:
+    """
+    Generuje korpus i zapisuje manifest.
+
+    Args:
+        output_dir: Katalog wynikowy (podkatalogi cv i job)
+        count: Liczba CV
+        job_count: Liczba ogłoszeń
+        formats: Formaty plików przydzielane dokumentom kolejno
+        cv_kb: Średni rozmiar tekstu CV w kilobajtach
+        job_kb: Średni rozmiar tekstu ogłoszenia w kilobajtach
+        seed: Ziarno generatora liczb losowych
+
+    Returns:
+        dict: Manifest korpusu
+    """
+    rng = random.Random(seed)
+    skills = sorted(load_taxonomy())
+    manifest = {"seed": seed, "cv_kb": cv_kb, "job_kb": job_kb, "cv": [], "job": []}
+
+    for kind, total, generate, size_kb in (("cv", count, generate_cv, cv_kb), ("job", job_count, generate_job, job_kb)):
+        os.makedirs(os.path.join(output_dir, kind), exist_ok=True)
+        for index in range(total):
+            file_format = formats[index % len(formats)]
+            text = generate(rng, skills, size_kb)
+            relative_path = os.path.join(kind, f"{kind}_{index:06d}.{file_format}")
+            write_document(os.path.join(output_dir, relative_path), text, file_format)
+            manifest[kind].append({"path": relative_path, "format": file_format, "chars": len(text)})
+
+    with open(os.path.join(output_dir, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    return manifest
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generator syntetycznego korpusu CV i ogłoszeń")
+    parser.add_argument("--output", default=CORPUS_DIR, help="Katalog wynikowy")
+    parser.add_argument("--count", type=int, default=1000, help="Liczba CV")
+    parser.add_argument("--jobs", type=int, default=None, help="Liczba ogłoszeń (domyślnie 1/10 liczby CV)")
+    parser.add_argument("--formats", nargs="+", choices=FORMATS, default=FORMATS, help="Formaty plików")
+    parser.add_argument("--cv-kb", type=float, default=3.0, help="Średni rozmiar tekstu CV [KB]")
+    parser.add_argument("--job-kb", type=float, default=2.0, help="Średni rozmiar tekstu ogłoszenia [KB]")
+    parser.add_argument("--seed", type=int, default=42, help="Ziarno generatora liczb losowych")
+    args = parser.parse_args()
+
+    job_count = args.jobs if args.jobs is not None else max(1, args.count // 10)
+    manifest = generate_corpus(args.output, args.count, job_count, args.formats, args.cv_kb, args.job_kb, args.seed)
+    for kind in ("cv", "job"):
+        documents = manifest[kind]
+        average = sum(document["chars"] for document in documents) / max(1, len(documents))
+        print(f"{kind}: {len(documents)} plików, średnio {average / 1024:.1f} KB tekstu")
+    print(f"Korpus zapisany w {args.output}")
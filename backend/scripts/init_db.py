@@ -12,11 +12,19 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from app.models.models import Base, Analysis, CVData, JobData, SkillMatch, SectionScore
 from app.models.database import engine, SessionLocal
 
+# Konfiguracja migracji bazy danych (alembic)
+ALEMBIC_CONFIG = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "alembic.ini")
+
 def create_tables():
     """
-    Tworzy tabele w bazie danych na podstawie modeli ORM.
+    Tworzy tabele w bazie danych na podstawie modeli ORM i oznacza bazę najnowszą
+    wersją migracji, aby kolejne zmiany schematu wprowadzać przez alembic upgrade head.
     """
+    from alembic import command
+    from alembic.config import Config
+    
     Base.metadata.create_all(bind=engine)
+    command.stamp(Config(ALEMBIC_CONFIG), "head")
     print("Tabele zostały utworzone.")
 
 def insert_sample_data():
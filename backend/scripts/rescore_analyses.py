@@ -0,0 +1,53 @@
+"""
+Skrypt do przeliczenia wyników zapisanych analiz po zmianie wag sekcji.
+Wyniki są obliczane w bazie danych z zapisanych ocen sekcji (crud.rescore_analyses),
+bez ponownego parsowania i kodowania dokumentów. Odpowiednik endpointu POST /analyses/rescore
+dla dużych baz, w których przeliczenie nie powinno być ograniczone czasem żądania HTTP.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+# Dodanie ścieżki do katalogu głównego projektu
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models import crud
+from app.models.database import SessionLocal
+from app.nlp.scoring import DEFAULT_SECTION_WEIGHTS, validate_section_weights
+
+
+def rescore(section_weights: dict, job_description_filename: str = None, batch_size: int = 50000):
+    """
+    Przelicza wyniki analiz i wypisuje liczbę przeliczonych analiz.
+
+    Args:
+        section_weights: Nowe wagi sekcji
+        job_description_filename: Przelicza tylko analizy względem tego ogłoszenia (opcjonalnie)
+        batch_size: Szerokość zakresu identyfikatorów analiz w jednej transakcji
+    """
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        rescored = crud.rescore_analyses(db, section_weights, job_description_filename, batch_size)
+        elapsed = time.perf_counter() - started
+    finally:
+        db.close()
+
+    print(f"Przeliczono {rescored} analiz w {elapsed:.1f} s (wagi: {section_weights})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Przeliczenie wyników zapisanych analiz dla nowych wag sekcji")
+    parser.add_argument("--weights", default=json.dumps(DEFAULT_SECTION_WEIGHTS), help="Wagi sekcji w formacie JSON")
+    parser.add_argument("--job-description-filename", default=None, help="Nazwa pliku ogłoszenia (domyślnie wszystkie analizy)")
+    parser.add_argument("--batch-size", type=int, default=50000, help="Liczba identyfikatorów analiz w jednej transakcji")
+    args = parser.parse_args()
+
+    try:
+        weights = validate_section_weights(json.loads(args.weights))
+    except ValueError as e:
+        parser.error(f"Nieprawidłowe wagi sekcji: {e}")
+
+    rescore(weights, args.job_description_filename, args.batch_size)
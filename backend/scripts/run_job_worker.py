@@ -0,0 +1,33 @@
+"""
+Dedykowany proces workera zadań asynchronicznych analiz (bez serwera HTTP).
+Ładuje model i wykonuje zadania z trwałej kolejki JOB_QUEUE ("database" lub "sqlite"),
+dzięki czemu instancje API mogą działać z JOB_WORKERS=0, a analizy - na osobnych maszynach.
+"""
+import asyncio
+import os
+import sys
+
+# Dodanie ścieżki do katalogu głównego projektu
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.main import JOB_QUEUE, JOB_WORKERS, app, lifespan
+
+
+async def run():
+    """
+    Uruchamia cykl życia aplikacji (model, kolejka, workery) do czasu przerwania procesu.
+    """
+    async with lifespan(app):
+        await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    if JOB_QUEUE == "memory":
+        sys.exit("Kolejka JOB_QUEUE=memory nie jest współdzielona z API - użyj \"database\" lub \"sqlite\"")
+    if JOB_WORKERS < 1:
+        sys.exit("Ustaw JOB_WORKERS na co najmniej 1")
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
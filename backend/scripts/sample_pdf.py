@@ -0,0 +1,150 @@
+"""
+Skrypt do tworzenia prostych plików PDF z tekstem (bez zewnętrznych zależności).
+Używany do przygotowania danych testowych i benchmarków ekstrakcji tekstu z PDF.
+"""
+import argparse
+import os
+import textwrap
+import unicodedata
+from typing import List
+
+# Ścieżka do katalogu z przykładowymi danymi
+SAMPLE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "sample_data")
+
+# Parametry strony A4 (w punktach) i składu tekstu
+PAGE_WIDTH = 595
+PAGE_HEIGHT = 842
+MARGIN = 56
+FONT_SIZE = 10
+LINE_HEIGHT = 13
+LINE_WIDTH = 95
+
+# Znaki spoza kodowania WinAnsi bez rozkładu Unicode na literę bazową
+TRANSLITERATION = {"ł": "l", "Ł": "L", "•": "-"}
+
+
+def to_win_ansi(text: str) -> bytes:
+    """
+    Koduje tekst w WinAnsiEncoding (standardowy font Helvetica).
+    Znaki spoza kodowania są zastępowane literą bazową (np. "ą" -> "a").
+
+    Args:
+        text: Tekst do zakodowania
+
+    Returns:
+        bytes: Tekst w kodowaniu cp1252
+    """
+    chars = []
+    for char in text:
+        char = TRANSLITERATION.get(char, char)
+        try:
+            char.encode("cp1252")
+        except UnicodeEncodeError:
+            char = unicodedata.normalize("NFKD", char)[0]
+            if not char.isascii():
+                char = "?"
+        chars.append(char)
+    return "".join(chars).encode("cp1252")
+
+
+def layout_pages(text: str) -> List[List[str]]:
+    """
+    Dzieli tekst na linie o stałej szerokości i strony o stałej liczbie linii.
+
+    Args:
+        text: Tekst dokumentu
+
+    Returns:
+        List[List[str]]: Linie kolejnych stron
+    """
+    lines = []
+    for paragraph in text.split("\n"):
+        lines.extend(textwrap.wrap(paragraph, LINE_WIDTH) or [""])
+
+    lines_per_page = (PAGE_HEIGHT - 2 * MARGIN) // LINE_HEIGHT
+    return [lines[start:start + lines_per_page] for start in range(0, len(lines), lines_per_page)] or [[]]
+
+
+def escape(data: bytes) -> bytes:
+    """
+    Escapuje znaki specjalne łańcucha PDF.
+    """
+    return data.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+
+
+def write_text_pdf(path: str, text: str):
+    """
+    Zapisuje tekst jako dokument PDF (font Helvetica, strony A4).
+
+    Args:
+        path: Ścieżka do pliku wynikowego
+        text: Tekst dokumentu
+    """
+    pages = layout_pages(text)
+    first_page_id = 4
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # Drzewo stron uzupełniane po wyznaczeniu identyfikatorów stron
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>"
+    ]
+
+    page_ids = []
+    for index, lines in enumerate(pages):
+        page_id = first_page_id + 2 * index
+        page_ids.append(page_id)
+
+        stream = [b"BT", f"/F1 {FONT_SIZE} Tf {LINE_HEIGHT} TL {MARGIN} {PAGE_HEIGHT - MARGIN} Td".encode()]
+        for line in lines:
+            stream.append(b"(" + escape(to_win_ansi(line)) + b") Tj T*")
+        stream.append(b"ET")
+        content = b"\n".join(stream)
+
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {PAGE_WIDTH} {PAGE_HEIGHT}] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {page_id + 1} 0 R >>".encode()
+        )
+        objects.append(f"<< /Length {len(content)} >>\nstream\n".encode() + content + b"\nendstream")
+
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+    objects[1] = f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>".encode()
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for object_id, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += f"{object_id} 0 obj\n".encode() + body + b"\nendobj\n"
+
+    xref_offset = len(output)
+    output += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for offset in offsets:
+        output += f"{offset:010d} 00000 n \n".encode()
+    output += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n".encode()
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(output)
+
+
+def convert_samples(output_dir: str):
+    """
+    Tworzy wersje PDF przykładowych plików TXT z katalogu sample_data.
+
+    Args:
+        output_dir: Katalog na pliki PDF
+    """
+    for name in sorted(os.listdir(SAMPLE_DIR)):
+        if not name.endswith(".txt"):
+            continue
+        with open(os.path.join(SAMPLE_DIR, name), "r", encoding="utf-8") as f:
+            text = f.read()
+        path = os.path.join(output_dir, os.path.splitext(name)[0] + ".pdf")
+        write_text_pdf(path, text)
+        print(f"Utworzono plik: {path}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Tworzenie przykładowych plików PDF")
+    parser.add_argument("--output-dir", default=SAMPLE_DIR, help="Katalog na pliki PDF")
+    args = parser.parse_args()
+
+    convert_samples(args.output_dir)
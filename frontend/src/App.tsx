@@ -18,6 +18,10 @@ interface AnalysisResult {
     similarity_score: number;
   }>;
   highlighted_keywords: string[];
+  highlight_spans?: {
+    cv: [number, number][];
+    job: [number, number][];
+  };
 }
 
 function App() {
@@ -24,6 +24,11 @@ interface AnalysisResult {
   };
   skill_matches: SkillMatch[];
   highlighted_keywords: string[];
+  // Pozycje słów kluczowych w tekstach (indeksy znaków Unicode: [początek, koniec])
+  highlight_spans?: {
+    cv: [number, number][];
+    job: [number, number][];
+  };
 }
 
 interface ResultsViewProps {
@@ -46,7 +51,25 @@ const ResultsView: React.FC<ResultsViewProps> = ({ result, cvText, jobText, onRe
     return 'score-low';
   };
 
-  // Funkcja do podświetlania słów kluczowych w tekście
+  // Funkcja do podświetlania fragmentów tekstu na podstawie pozycji zwróconych przez API
+  const highlightSpans = (text: string, spans: [number, number][]): JSX.Element => {
+    // Pozycje z backendu liczą znaki Unicode, a nie jednostki UTF-16
+    const chars = Array.from(text);
+    const parts: JSX.Element[] = [];
+    let position = 0;
+
+    spans.forEach(([start, end], i) => {
+      if (start < position) return;
+      parts.push(<span key={`text-${i}`}>{chars.slice(position, start).join('')}</span>);
+      parts.push(<span key={`keyword-${i}`} className="highlighted-keyword">{chars.slice(start, end).join('')}</span>);
+      position = end;
+    });
+    parts.push(<span key="text-end">{chars.slice(position).join('')}</span>);
+
+    return <>{parts}</>;
+  };
+
+  // Funkcja do podświetlania słów kluczowych w tekście (wyniki bez pozycji słów kluczowych)
   const highlightKeywords = (text: string, keywords: string[]): JSX.Element => {
     if (!keywords.length) return <>{text}</>;
 
@@ -158,14 +181,18 @@ const ResultsView: React.FC<ResultsViewProps> = ({ result, cvText, jobText, onRe
           <div className="document-preview">
             <h4>CV</h4>
             <div className="document-content">
-              {highlightKeywords(cvText, result.highlighted_keywords)}
+              {result.highlight_spans
+                ? highlightSpans(cvText, result.highlight_spans.cv)
+                : highlightKeywords(cvText, result.highlighted_keywords)}
             </div>
           </div>
           
           <div className="document-preview">
             <h4>Ogłoszenie o pracę</h4>
             <div className="document-content">
-              {highlightKeywords(jobText, result.highlighted_keywords)}
+              {result.highlight_spans
+                ? highlightSpans(jobText, result.highlight_spans.job)
+                : highlightKeywords(jobText, result.highlighted_keywords)}
             </div>
           </div>
         </div>
@@ -23,6 +23,10 @@ interface AnalysisResult {
   };
   skill_matches: SkillMatch[];
   highlighted_keywords: string[];
+  highlight_spans?: {
+    cv: [number, number][];
+    job: [number, number][];
+  };
 }
 
 interface ApiResponse {